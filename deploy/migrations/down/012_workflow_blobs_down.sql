@@ -0,0 +1,12 @@
+-- Migration Rollback: 012_workflow_blobs
+-- Description: Inline blob-backed workflows back into job_queue, then drop blobs
+
+UPDATE job_queue q
+SET workflow_json = b.workflow_json
+FROM workflow_blobs b
+WHERE q.workflow_hash = b.content_hash;
+
+DROP INDEX IF EXISTS idx_job_queue_workflow_hash;
+ALTER TABLE job_queue DROP COLUMN IF EXISTS workflow_hash;
+
+DROP TABLE IF EXISTS workflow_blobs;
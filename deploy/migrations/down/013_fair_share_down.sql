@@ -0,0 +1,6 @@
+-- Migration Rollback: 013_fair_share
+-- Description: Drop tenant ownership from queued jobs
+
+DROP INDEX IF EXISTS idx_job_queue_tenant_running;
+DROP INDEX IF EXISTS idx_job_queue_tenant_pending;
+ALTER TABLE job_queue DROP COLUMN IF EXISTS tenant_id;
@@ -0,0 +1,6 @@
+-- Migration Rollback: 014_keyset_pagination
+-- Description: Drop keyset pagination indexes
+
+DROP INDEX IF EXISTS idx_job_queue_history;
+DROP INDEX IF EXISTS idx_robot_logs_tenant_robot_time_id;
+DROP INDEX IF EXISTS idx_robot_logs_tenant_time_id;
@@ -0,0 +1,32 @@
+-- Migration: 012_workflow_blobs
+-- Description: Content-addressed workflow blobs so jobs reference workflows by hash
+-- Created: 2026-10-16
+
+-- =============================================================================
+-- WORKFLOW BLOBS TABLE
+-- =============================================================================
+-- One row per distinct workflow_json, keyed by its SHA-256. The producer
+-- upserts a blob once and every job for that workflow stores only the hash.
+CREATE TABLE IF NOT EXISTS workflow_blobs (
+    content_hash VARCHAR(64) PRIMARY KEY,
+    workflow_json TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL
+);
+
+-- Used by blob garbage collection (unreferenced blobs past a grace period)
+CREATE INDEX IF NOT EXISTS idx_workflow_blobs_created
+    ON workflow_blobs (created_at);
+
+-- =============================================================================
+-- JOB QUEUE REFERENCE
+-- =============================================================================
+-- Blob-backed jobs store workflow_json = '' and set workflow_hash.
+-- Jobs with a NULL workflow_hash keep their workflow inline (legacy/DLQ retries).
+ALTER TABLE job_queue
+    ADD COLUMN IF NOT EXISTS workflow_hash VARCHAR(64)
+    REFERENCES workflow_blobs (content_hash);
+
+CREATE INDEX IF NOT EXISTS idx_job_queue_workflow_hash
+    ON job_queue (workflow_hash)
+    WHERE workflow_hash IS NOT NULL;
@@ -0,0 +1,21 @@
+-- Migration: 013_fair_share
+-- Description: Tenant ownership on queued jobs for weighted fair-share claiming
+-- Created: 2026-10-16
+
+-- =============================================================================
+-- JOB QUEUE TENANT
+-- =============================================================================
+-- Jobs enqueued without a tenant share the 'default' tenant, so existing rows
+-- and producers keep working unchanged.
+ALTER TABLE job_queue
+    ADD COLUMN IF NOT EXISTS tenant_id VARCHAR(255) DEFAULT 'default' NOT NULL;
+
+-- Fair-share claims rank pending jobs within each tenant
+CREATE INDEX IF NOT EXISTS idx_job_queue_tenant_pending
+    ON job_queue (tenant_id, priority DESC, created_at ASC)
+    WHERE status = 'pending';
+
+-- Running-job counts per tenant (and per workflow) feed the virtual time
+CREATE INDEX IF NOT EXISTS idx_job_queue_tenant_running
+    ON job_queue (tenant_id, workflow_id)
+    WHERE status = 'running';
@@ -0,0 +1,20 @@
+-- Migration: 014_keyset_pagination
+-- Description: Indexes for keyset pagination of log and job history
+-- Created: 2026-10-16
+
+-- =============================================================================
+-- ROBOT LOGS
+-- =============================================================================
+-- Pages seek with (timestamp, id) < (cursor) ORDER BY timestamp DESC, id DESC.
+-- The id tie-breaker makes the seek exact when timestamps collide.
+CREATE INDEX IF NOT EXISTS idx_robot_logs_tenant_time_id
+    ON robot_logs (tenant_id, timestamp DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_robot_logs_tenant_robot_time_id
+    ON robot_logs (tenant_id, robot_id, timestamp DESC, id DESC);
+
+-- =============================================================================
+-- JOB HISTORY
+-- =============================================================================
+CREATE INDEX IF NOT EXISTS idx_job_queue_history
+    ON job_queue (created_at DESC, id DESC);
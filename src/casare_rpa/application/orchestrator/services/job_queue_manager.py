@@ -15,6 +15,7 @@ from typing import Any
 from loguru import logger
 
 from casare_rpa.domain.orchestrator.entities import Job, JobPriority, JobStatus, Robot
+from casare_rpa.utils.performance.deadline_heap import DeadlineHeap
 
 
 class JobStateError(Exception):
@@ -228,6 +229,9 @@ class JobTimeoutManager:
     """
     Manages job timeouts.
     Tracks running jobs and marks them as timed out if exceeded.
+
+    Deadlines live in a DeadlineHeap, so a sweep only touches jobs that
+    actually timed out instead of every tracked job.
     """
 
     def __init__(self, default_timeout_seconds: int = 3600):
@@ -238,42 +242,35 @@ class JobTimeoutManager:
             default_timeout_seconds: Default timeout (1 hour)
         """
         self._default_timeout = timedelta(seconds=default_timeout_seconds)
-        self._job_timeouts: dict[str, tuple[datetime, timedelta]] = {}
+        self._deadlines = DeadlineHeap()
         self._lock = threading.Lock()
 
     def start_tracking(self, job_id: str, timeout_seconds: int | None = None):
         """Start tracking a job's timeout."""
         timeout = timedelta(seconds=timeout_seconds) if timeout_seconds else self._default_timeout
         with self._lock:
-            self._job_timeouts[job_id] = (datetime.now(UTC), timeout)
+            self._deadlines.schedule_in(job_id, timeout.total_seconds())
         logger.debug(f"Tracking timeout for job {job_id[:8]}: {timeout}")
 
     def stop_tracking(self, job_id: str):
         """Stop tracking a job's timeout."""
         with self._lock:
-            self._job_timeouts.pop(job_id, None)
+            self._deadlines.cancel(job_id)
 
     def get_timed_out_jobs(self) -> list[str]:
-        """Get list of job IDs that have timed out."""
-        now = datetime.now(UTC)
-        timed_out = []
+        """
+        Get list of job IDs that have timed out.
 
+        Returned jobs stop being tracked, so each timeout is reported once.
+        """
         with self._lock:
-            for job_id, (start_time, timeout) in self._job_timeouts.items():
-                if now - start_time > timeout:
-                    timed_out.append(job_id)
-
-        return timed_out
+            return self._deadlines.pop_expired()
 
     def get_remaining_time(self, job_id: str) -> timedelta | None:
         """Get remaining time before timeout."""
         with self._lock:
-            if job_id not in self._job_timeouts:
-                return None
-            start_time, timeout = self._job_timeouts[job_id]
-            elapsed = datetime.now(UTC) - start_time
-            remaining = timeout - elapsed
-            return remaining if remaining.total_seconds() > 0 else timedelta(0)
+            remaining = self._deadlines.remaining(job_id)
+        return timedelta(seconds=remaining) if remaining is not None else None
 
 
 class JobQueue:
@@ -286,6 +283,17 @@ class JobQueue:
     - Deduplication
     - Timeout management
     - Robot assignment
+
+    Queued jobs are partitioned into one heap per (target robot, environment).
+    Untargeted jobs live under target None, so a robot only inspects the heads
+    of its own and the untargeted heaps in its environment (every environment
+    for robots in "default") instead of scanning jobs pinned to other robots.
+
+    In fair-share mode partitions are further split per tenant (or per tenant
+    workflow). Within a priority, the head with the lowest virtual time
+    (running jobs of its share + 1) / tenant weight wins, and tenants at
+    their running cap are skipped, so one tenant's backlog cannot starve the
+    others.
     """
 
     def __init__(
@@ -293,6 +301,12 @@ class JobQueue:
         dedup_window_seconds: int = 300,
         default_timeout_seconds: int = 3600,
         on_state_change: Callable[[Job, JobStatus, JobStatus], None] | None = None,
+        fair_share: bool = False,
+        fair_share_per_workflow: bool = False,
+        tenant_weights: dict[str, float] | None = None,
+        tenant_max_running: dict[str, int] | None = None,
+        default_tenant_weight: float = 1.0,
+        default_tenant_max_running: int = 0,
     ):
         """
         Initialize job queue.
@@ -301,8 +315,16 @@ class JobQueue:
             dedup_window_seconds: Deduplication time window
             default_timeout_seconds: Default job timeout
             on_state_change: Callback for state changes (job, old_state, new_state)
+            fair_share: Share claims across tenants instead of strictly oldest first
+            fair_share_per_workflow: Use (tenant, workflow) as the fair-share unit
+            tenant_weights: Relative share per tenant (default_tenant_weight otherwise)
+            tenant_max_running: Running-job cap per tenant, 0 = no cap
+            default_tenant_weight: Weight of tenants not in tenant_weights
+            default_tenant_max_running: Cap of tenants not in tenant_max_running
         """
-        self._queue: list[PriorityQueueItem] = []
+        # (target robot, environment, share) -> heap; share is "" without fair share
+        self._heaps: dict[tuple[str | None, str, str], list[PriorityQueueItem]] = {}
+        self._partitions: dict[str | None, dict[str, set[str]]] = {}  # target -> env -> shares
         self._jobs: dict[str, Job] = {}  # job_id -> Job
         self._running_jobs: dict[str, str] = {}  # job_id -> robot_id
         self._robot_jobs: dict[str, set[str]] = defaultdict(set)  # robot_id -> {job_ids}
@@ -310,10 +332,19 @@ class JobQueue:
         self._deduplicator = JobDeduplicator(dedup_window_seconds)
         self._timeout_manager = JobTimeoutManager(default_timeout_seconds)
 
+        self._fair_share = fair_share
+        self._fair_share_per_workflow = fair_share_per_workflow
+        self._tenant_weights = tenant_weights or {}
+        self._tenant_max_running = tenant_max_running or {}
+        self._default_tenant_weight = default_tenant_weight
+        self._default_tenant_max_running = default_tenant_max_running
+        self._share_running: dict[str, int] = defaultdict(int)
+        self._tenant_running: dict[str, int] = defaultdict(int)
+
         self._on_state_change = on_state_change
         self._lock = threading.Lock()
 
-        logger.info("JobQueue initialized")
+        logger.info(f"JobQueue initialized (fair_share={fair_share})")
 
     def enqueue(
         self, job: Job, check_duplicate: bool = True, params: dict | None = None
@@ -349,7 +380,7 @@ class JobQueue:
 
             # Add to queue
             item = PriorityQueueItem.from_job(job)
-            heapq.heappush(self._queue, item)
+            self._push(item)
             self._jobs[job.id] = job
 
             # Record for deduplication
@@ -376,44 +407,23 @@ class JobQueue:
             return None
 
         with self._lock:
-            # Find suitable job
-            suitable_items = []
+            # Pick the best head among the robot's candidate partitions
             selected_item = None
-
-            while self._queue:
-                item = heapq.heappop(self._queue)
-                job = self._jobs.get(item.job_id)
-
-                if not job or job.status != JobStatus.QUEUED:
-                    # Job was cancelled or already processed
-                    continue
-
-                # Check if job is targeted to specific robot
-                if job.robot_id and job.robot_id != robot.id:
-                    suitable_items.append(item)
-                    continue
-
-                # Check environment match
-                # Job environment must match robot environment, or robot must be in "default"
-                # which can accept jobs from any environment
-                if job.environment != robot.environment and robot.environment != "default":
-                    logger.debug(
-                        f"Job {job.id[:8]} requires environment '{job.environment}' "
-                        f"but robot {robot.name} is in '{robot.environment}'"
-                    )
-                    suitable_items.append(item)
+            selected_key = None
+            selected_order = None
+            for key in self._candidate_partitions(robot):
+                item = self._peek(key)
+                if item is None:
                     continue
-
-                selected_item = item
-                break
-
-            # Put back unsuitable items
-            for item in suitable_items:
-                heapq.heappush(self._queue, item)
+                order = self._claim_order(item)
+                if order is not None and (selected_order is None or order < selected_order):
+                    selected_item, selected_key, selected_order = item, key, order
 
             if not selected_item:
                 return None
 
+            self._pop(selected_key)
+
             job = self._jobs[selected_item.job_id]
             old_status = job.status
 
@@ -424,11 +434,12 @@ class JobQueue:
                 job.robot_name = robot.name
             except JobStateError:
                 # Put job back
-                heapq.heappush(self._queue, selected_item)
+                self._push(selected_item)
                 return None
 
             # Track running job
             self._running_jobs[job.id] = robot.id
+            self._count_running(job, 1)
             self._robot_jobs[robot.id].add(job.id)
             self._timeout_manager.start_tracking(job.id)
 
@@ -439,6 +450,115 @@ class JobQueue:
         logger.info(f"Job {job.id[:8]} assigned to robot {robot.name}")
         return job
 
+    def _partition(self, job: Job) -> tuple[str | None, str, str]:
+        """Queue partition key: (target robot ID or None, environment, share)."""
+        return (job.robot_id or None, job.environment, self._share_of(job))
+
+    def _share_of(self, job: Job) -> str:
+        """Fair-share unit of a job ("" when fair share is off)."""
+        if not self._fair_share:
+            return ""
+        if self._fair_share_per_workflow:
+            return f"{job.tenant_id}/{job.workflow_id}"
+        return job.tenant_id
+
+    def _count_running(self, job: Job, delta: int) -> None:
+        """Adjust fair-share running counts. Caller must hold the lock."""
+        if not self._fair_share:
+            return
+        for counts, key in (
+            (self._share_running, self._share_of(job)),
+            (self._tenant_running, job.tenant_id),
+        ):
+            counts[key] += delta
+            if counts[key] <= 0:
+                del counts[key]
+
+    def _claim_order(self, item: PriorityQueueItem) -> tuple[int, float, datetime] | None:
+        """
+        Get the dequeue order of a partition head, or None if its tenant is
+        at its running cap. Caller must hold the lock.
+        """
+        if not self._fair_share:
+            return (item.priority, 0.0, item.created_at)
+
+        job = item.job
+        tenant = job.tenant_id
+        cap = self._tenant_max_running.get(tenant, self._default_tenant_max_running)
+        if cap > 0 and self._tenant_running.get(tenant, 0) >= cap:
+            return None
+        weight = self._tenant_weights.get(tenant, self._default_tenant_weight)
+        virtual_time = (self._share_running.get(self._share_of(job), 0) + 1) / weight
+        return (item.priority, virtual_time, item.created_at)
+
+    def _push(self, item: PriorityQueueItem) -> None:
+        """Push an item onto its partition heap. Caller must hold the lock."""
+        key = self._partition(item.job)
+        heap = self._heaps.get(key)
+        if heap is None:
+            heap = self._heaps[key] = []
+            target, env, share = key
+            self._partitions.setdefault(target, {}).setdefault(env, set()).add(share)
+        heapq.heappush(heap, item)
+
+    def _pop(self, key: tuple[str | None, str, str]) -> PriorityQueueItem:
+        """Pop the head of a partition, dropping it once empty. Caller must hold the lock."""
+        heap = self._heaps[key]
+        item = heapq.heappop(heap)
+        if not heap:
+            del self._heaps[key]
+            target, env, share = key
+            envs = self._partitions[target]
+            envs[env].discard(share)
+            if not envs[env]:
+                del envs[env]
+                if not envs:
+                    del self._partitions[target]
+        return item
+
+    def _peek(self, key: tuple[str | None, str, str]) -> PriorityQueueItem | None:
+        """
+        Get the head of a partition, discarding cancelled or processed jobs.
+
+        Caller must hold the lock.
+        """
+        while key in self._heaps:
+            item = self._heaps[key][0]
+            job = self._jobs.get(item.job_id)
+            if job and job.status == JobStatus.QUEUED:
+                return item
+            self._pop(key)
+        return None
+
+    def _candidate_partitions(self, robot: Robot) -> list[tuple[str | None, str, str]]:
+        """
+        Get the partitions a robot may take jobs from.
+
+        Job environment must match robot environment, or robot must be in
+        "default" which can accept jobs from any environment.
+        """
+        keys = []
+        for target in (None, robot.id):
+            envs = self._partitions.get(target)
+            if not envs:
+                continue
+            if robot.environment == "default":
+                env_shares = envs.items()
+            else:
+                env_shares = [(robot.environment, envs.get(robot.environment, ()))]
+            for env, shares in env_shares:
+                keys.extend((target, env, share) for share in shares)
+        return keys
+
+    def _queued_jobs(self) -> list[Job]:
+        """Get queued jobs across all partitions. Caller must hold the lock."""
+        return [
+            self._jobs[item.job_id]
+            for heap in self._heaps.values()
+            for item in heap
+            if item.job_id in self._jobs and self._jobs[item.job_id].status == JobStatus.QUEUED
+        ]
+
     def complete(self, job_id: str, result: dict | None = None) -> tuple[bool, str]:
         """
         Mark a job as completed.
@@ -509,6 +629,7 @@ class JobQueue:
                 robot_id = self._running_jobs.pop(job_id)
                 self._robot_jobs[robot_id].discard(job_id)
                 self._timeout_manager.stop_tracking(job_id)
+                self._count_running(job, -1)
 
             # Notify state change (inside lock to prevent race conditions)
             if self._on_state_change:
@@ -550,6 +671,7 @@ class JobQueue:
                 robot_id = self._running_jobs.pop(job_id)
                 self._robot_jobs[robot_id].discard(job_id)
                 self._timeout_manager.stop_tracking(job_id)
+                self._count_running(job, -1)
 
             # Notify state change (inside lock to prevent race conditions)
             if self._on_state_change:
@@ -602,11 +724,7 @@ class JobQueue:
     def get_queued_jobs(self) -> list[Job]:
         """Get all queued jobs."""
         with self._lock:
-            return [
-                self._jobs[item.job_id]
-                for item in self._queue
-                if item.job_id in self._jobs and self._jobs[item.job_id].status == JobStatus.QUEUED
-            ]
+            return self._queued_jobs()
 
     def get_running_jobs(self) -> list[Job]:
         """Get all running jobs."""
@@ -625,23 +743,12 @@ class JobQueue:
     def get_queue_depth(self) -> int:
         """Get number of jobs in queue."""
         with self._lock:
-            return len(
-                [
-                    1
-                    for item in self._queue
-                    if item.job_id in self._jobs
-                    and self._jobs[item.job_id].status == JobStatus.QUEUED
-                ]
-            )
+            return len(self._queued_jobs())
 
     def get_queue_stats(self) -> dict[str, Any]:
         """Get queue statistics."""
         with self._lock:
-            queued = [
-                self._jobs[item.job_id]
-                for item in self._queue
-                if item.job_id in self._jobs and self._jobs[item.job_id].status == JobStatus.QUEUED
-            ]
+            queued = self._queued_jobs()
 
             running = len(self._running_jobs)
 
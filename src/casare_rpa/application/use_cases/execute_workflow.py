@@ -16,6 +16,7 @@ from casare_rpa.application.use_cases.execution_handlers import ExecutionResultH
 
 # Strategies & Helpers
 from casare_rpa.application.use_cases.execution_state_manager import (
+    ExecutedNodeSet,
     ExecutionSettings,
     ExecutionStateManager,
 )
@@ -30,6 +31,7 @@ from casare_rpa.application.use_cases.variable_resolver import (
     TryCatchErrorHandler,
     VariableResolver,
 )
+from casare_rpa.domain.entities.node_run_state import isolated_node_state
 from casare_rpa.domain.entities.workflow import WorkflowSchema
 from casare_rpa.domain.errors import (
     Err,
@@ -45,8 +47,13 @@ from casare_rpa.domain.events import (
     WorkflowStarted,
     WorkflowStopped,
 )
-from casare_rpa.domain.interfaces import IExecutionContext, IExecutionContextFactory
+from casare_rpa.domain.interfaces import (
+    ICpuOffloader,
+    IExecutionContext,
+    IExecutionContextFactory,
+)
 from casare_rpa.domain.services.execution_orchestrator import ExecutionOrchestrator
+from casare_rpa.domain.services.execution_plan import ExecutionPlan
 from casare_rpa.domain.value_objects.types import ExecutionMode, NodeId
 from casare_rpa.nodes import get_node_class
 from casare_rpa.utils.performance.performance_metrics import get_metrics
@@ -103,6 +110,9 @@ class ExecuteWorkflowUseCase:
         project_context: Any | None = None,
         pause_event: asyncio.Event | None = None,
         execution_context_factory: IExecutionContextFactory | None = None,
+        execution_plan: ExecutionPlan | None = None,
+        isolate_node_state: bool = False,
+        cpu_offloader: ICpuOffloader | None = None,
     ) -> None:
         self.workflow = workflow
         self.settings = settings or ExecutionSettings()
@@ -115,10 +125,16 @@ class ExecuteWorkflowUseCase:
             event_bus = get_event_bus()
         self.event_bus = event_bus
 
-        self.orchestrator = ExecutionOrchestrator(workflow)
+        # A cached plan (see WorkflowCache.get_plan_for) skips routing compilation
+        self.orchestrator = ExecutionOrchestrator(workflow, plan=execution_plan)
         self.pause_event = pause_event or asyncio.Event()
         self.pause_event.set()
         self._context_factory = _resolve_execution_context_factory(execution_context_factory)
+        # Keep node status/port values in a per-run store so shared (cached)
+        # node instances can back several concurrent executions
+        self._isolate_node_state = isolate_node_state
+        # Worker pool for cpu_bound nodes (see NodeExecutor)
+        self._cpu_offloader = cpu_offloader
 
         self.state_manager = ExecutionStateManager(
             workflow=workflow,
@@ -141,7 +157,7 @@ class ExecuteWorkflowUseCase:
 
     # --- Backward Compat Properties ---
     @property
-    def executed_nodes(self) -> set[NodeId]:
+    def executed_nodes(self) -> ExecutedNodeSet:
         return self.state_manager.executed_nodes
 
     @property
@@ -194,6 +210,12 @@ class ExecuteWorkflowUseCase:
 
     async def execute(self, run_all: bool = False) -> bool:
         """Executes the workflow."""
+        if self._isolate_node_state:
+            with isolated_node_state():
+                return await self._execute(run_all)
+        return await self._execute(run_all)
+
+    async def _execute(self, run_all: bool) -> bool:
         self.state_manager.start_execution()
 
         # 1. Setup Infrastructure
@@ -213,6 +235,7 @@ class ExecuteWorkflowUseCase:
             node_timeout=self.settings.node_timeout,
             progress_calculator=self.state_manager.calculate_progress,
             error_capturer=self._error_handler.capture_error,
+            cpu_offloader=self._cpu_offloader,
         )
         self._parallel_strategy = ParallelExecutionStrategy(
             context=self.context,
@@ -221,7 +244,10 @@ class ExecuteWorkflowUseCase:
             state_manager=self.state_manager,
             variable_resolver=self._variable_resolver,
             node_executor_factory=lambda ctx: NodeExecutor(
-                ctx, self.event_bus, self.settings.node_timeout
+                ctx,
+                self.event_bus,
+                self.settings.node_timeout,
+                cpu_offloader=self._cpu_offloader,
             ),
             orchestrator=self.orchestrator,
         )
@@ -241,6 +267,7 @@ class ExecuteWorkflowUseCase:
             context=self.context,
             result_handler=self._result_handler,
             parallel_strategy=self._parallel_strategy,
+            plan=self.orchestrator.plan,
         )
 
         # 3. Start
@@ -263,14 +290,14 @@ class ExecuteWorkflowUseCase:
                 if len(start_nodes) > 1:
                     await self._parallel_strategy.execute_parallel_workflows(start_nodes)
                 elif start_nodes:
-                    await self._engine.run_from_node(start_nodes[0])
+                    await self._run_engine(start_nodes[0])
                 else:
                     raise ValueError("No StartNode found")
             else:
                 start_id = self.orchestrator.find_start_node()
                 if not start_id:
                     raise ValueError("No StartNode found")
-                await self._engine.run_from_node(start_id)
+                await self._run_engine(start_id)
 
             return self._finalize_execution()
 
@@ -300,11 +327,20 @@ class ExecuteWorkflowUseCase:
         else:
             self.state_manager.mark_failed(result.result.get("error", "Execution failed"))
 
+    async def _run_engine(self, start_id: NodeId) -> None:
+        """Run the engine loop selected by the execution settings."""
+        if self.settings.parallel_dataflow:
+            await self._engine.run_dataflow_from_node(
+                start_id, max_parallel=self.settings.max_parallel_nodes
+            )
+        else:
+            await self._engine.run_from_node(start_id)
+
     async def _execute_from_node(self, start_id: NodeId) -> None:
         """Execute workflow from a specific start node."""
         if self._engine is None:
             raise RuntimeError("Engine not initialized. Call execute() first.")
-        await self._engine.run_from_node(start_id)
+        await self._run_engine(start_id)
 
     def _finalize_execution(self) -> bool:
         self.state_manager.mark_completed()
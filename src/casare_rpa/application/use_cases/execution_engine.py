@@ -5,13 +5,18 @@ A reusable execution engine that handles the core workflow execution loop.
 Consolidates logic from ExecuteWorkflowUseCase and SubflowExecutor.
 """
 
+import asyncio
+from collections import Counter, deque
 from collections.abc import Callable
 from typing import Any, Protocol
 
 from loguru import logger
 
+from casare_rpa.application.use_cases.execution_state_manager import ExecutedNodeSet
+from casare_rpa.domain.entities.base_node import EXCLUSIVE_AFFINITY, VARIABLES_EFFECT
 from casare_rpa.domain.interfaces import IExecutionContext
 from casare_rpa.domain.services.execution_orchestrator import ExecutionOrchestrator
+from casare_rpa.domain.services.execution_plan import ExecutionPlan
 from casare_rpa.domain.value_objects.types import NodeId
 
 
@@ -33,7 +38,7 @@ class IExecutionStateManager(Protocol):
     async def pause_checkpoint(self) -> None: ...
     def set_current_node(self, node_id: NodeId | None) -> None: ...
     @property
-    def executed_nodes(self) -> set[NodeId]: ...
+    def executed_nodes(self) -> ExecutedNodeSet | set[NodeId]: ...
 
 
 class BaseExecutionStateManager:
@@ -41,7 +46,7 @@ class BaseExecutionStateManager:
 
     def __init__(self, context: IExecutionContext):
         self.context = context
-        self._executed_nodes: set[NodeId] = set()
+        self._executed_nodes = ExecutedNodeSet()
 
     @property
     def is_stopped(self) -> bool:
@@ -66,7 +71,7 @@ class BaseExecutionStateManager:
         pass
 
     @property
-    def executed_nodes(self) -> set[NodeId]:
+    def executed_nodes(self) -> ExecutedNodeSet:
         return self._executed_nodes
 
 
@@ -74,8 +79,12 @@ class WorkflowExecutionEngine:
     """
     Core engine for executing workflows.
 
-    This class encapsulates the sequential execution loop, routing,
-    and coordination between state management, node execution, and variable resolution.
+    This class encapsulates the sequential execution loop (and the opt-in
+    dataflow-parallel loop), routing, and coordination between state
+    management, node execution, and variable resolution.
+
+    When a compiled ExecutionPlan is supplied, routing and control-flow checks
+    are served from its immutable tables instead of going through the orchestrator.
     """
 
     def __init__(
@@ -88,6 +97,7 @@ class WorkflowExecutionEngine:
         context: IExecutionContext,
         result_handler: Any | None = None,
         parallel_strategy: Any | None = None,
+        plan: ExecutionPlan | None = None,
     ) -> None:
         self.orchestrator = orchestrator
         self.node_executor = node_executor
@@ -97,22 +107,31 @@ class WorkflowExecutionEngine:
         self.context = context
         self.result_handler = result_handler
         self.parallel_strategy = parallel_strategy
+        self.plan = plan
+
+        # Bind routing callables once instead of resolving them per step
+        if plan is not None:
+            self._is_control_flow: Callable[[NodeId], bool] = plan.is_control_flow
+            self._next_nodes: Callable[[NodeId, Any], list[NodeId]] = plan.next_nodes
+        else:
+            self._is_control_flow = orchestrator.is_control_flow_node
+            self._next_nodes = orchestrator.get_next_nodes
 
     async def run_from_node(self, start_id: NodeId) -> None:
         """Main Loop: Sequential execution from start node."""
-        queue: list[NodeId] = [start_id]
+        queue: deque[NodeId] = deque([start_id])
+        is_control_flow = self._is_control_flow
 
         while queue and not self.state_manager.is_stopped:
             await self.state_manager.pause_checkpoint()
             if self.state_manager.is_stopped:
                 break
 
-            curr_id = queue.pop(0)
+            curr_id = queue.popleft()
             self.state_manager.set_current_node(curr_id)
 
             # Skip if executed (unless loop)
-            is_loop = self.orchestrator.is_control_flow_node(curr_id)
-            if curr_id in self.state_manager.executed_nodes and not is_loop:
+            if curr_id in self.state_manager.executed_nodes and not is_control_flow(curr_id):
                 continue
 
             # Run-to-Node Check
@@ -128,50 +147,198 @@ class WorkflowExecutionEngine:
             self.variable_resolver.transfer_inputs_to_node(curr_id)
             exec_result = await self.node_executor.execute(node)
 
-            if not exec_result.success:
-                if self.result_handler and self.result_handler.handle_execution_failure(
-                    curr_id, exec_result.result, queue
-                ):
-                    continue
+            if not await self._process_result(curr_id, node, exec_result, queue):
                 break
 
-            self.state_manager.mark_node_executed(curr_id)
-            self.store_node_outputs(curr_id, node)
-
-            if exec_result.result:
-                self.variable_resolver.validate_output_ports(node, exec_result.result)
-
-            if self.state_manager.mark_target_reached(curr_id):
+    async def run_dataflow_from_node(self, start_id: NodeId, max_parallel: int = 8) -> None:
+        """
+        Dataflow loop: run independent ready nodes concurrently.
+
+        Routing is identical to run_from_node; the difference is that up to
+        max_parallel queued nodes execute at once. A queued node is held back
+        while any node it depends on (data or exec connection) is still
+        queued or running, while another node with the same resource
+        affinity is running (e.g. two nodes driving the browser page), while
+        a running node declares an overlapping side effect, or - for
+        control-flow/exclusive nodes - while anything else is running. Nodes
+        that do not declare their side effects (or that write variables) run
+        alone. Results are routed one at a time by this coordinator, so result
+        handlers and the queue are never touched concurrently.
+
+        Args:
+            start_id: Node to start from
+            max_parallel: Maximum number of nodes in flight
+        """
+        dependencies = self.orchestrator.build_dependency_graph()
+        is_control_flow = self._is_control_flow
+        queue: deque[NodeId] = deque([start_id])
+        running: dict[asyncio.Task, tuple[NodeId, Any, str | None, frozenset[str] | None]] = {}
+        # Kept in step with running/queue so each check is O(dependencies + effects)
+        in_flight: Counter[NodeId] = Counter()
+        waiting: Counter[NodeId] = Counter()
+        busy_affinities: set[str] = set()
+        busy_effects: Counter[str] = Counter()
+        solo_running = 0
+        keep_going = True
+        raised: BaseException | None = None
+
+        def _runs_alone(effects: frozenset[str] | None) -> bool:
+            return effects is None or VARIABLES_EFFECT in effects
+
+        def _blocked(node_id: NodeId, affinity: str | None, effects: frozenset[str] | None) -> bool:
+            if affinity is not None and affinity in busy_affinities:
+                return True
+            if _runs_alone(effects):
+                if running:
+                    return True
+            elif solo_running or any(busy_effects[effect] for effect in effects):
+                return True
+            return any(in_flight[dep] or waiting[dep] for dep in dependencies.get(node_id, ()))
+
+        while keep_going and (queue or running) and not self.state_manager.is_stopped:
+            await self.state_manager.pause_checkpoint()
+            if self.state_manager.is_stopped:
                 break
 
-            # Routing & Special Results
-            if exec_result.result:
-                # Handle Parallel Branches
-                if "parallel_branches" in exec_result.result and self.parallel_strategy:
-                    await self.parallel_strategy.execute_parallel_branches(exec_result.result)
-                    join_id = exec_result.result.get("paired_join_id")
-                    if join_id:
-                        queue.insert(0, join_id)
+            # Schedule as many ready nodes as allowed, keeping queue order.
+            # Result handlers may edit the queue freely, so queued counts are
+            # taken once per pass and then updated per pop/defer.
+            waiting.clear()
+            waiting.update(queue)
+            deferred: deque[NodeId] = deque()
+            while queue and len(running) < max_parallel:
+                curr_id = queue.popleft()
+                waiting[curr_id] -= 1
+
+                if curr_id in self.state_manager.executed_nodes and not is_control_flow(curr_id):
+                    continue
+                if in_flight[curr_id]:
+                    continue
+                if not self.state_manager.should_execute_node(curr_id):
                     continue
 
-                # Handle Parallel Foreach
-                if "parallel_foreach_batch" in exec_result.result and self.parallel_strategy:
-                    if hasattr(self.parallel_strategy, "execute_parallel_foreach_batch"):
-                        await self.parallel_strategy.execute_parallel_foreach_batch(
-                            exec_result.result, curr_id
-                        )
-                    queue.insert(0, curr_id)
+                try:
+                    node = self.node_getter(curr_id)
+                except Exception as e:
+                    logger.error(f"Failed to get node {curr_id}: {e}")
                     continue
 
-                # Handle other special results (Subflows, etc.)
-                if self.result_handler and self.result_handler.handle_special_results(
-                    curr_id, exec_result, queue
-                ):
+                affinity = (
+                    EXCLUSIVE_AFFINITY
+                    if is_control_flow(curr_id)
+                    else getattr(node, "get_resource_affinity", lambda: None)()
+                )
+                effects = getattr(node, "get_side_effects", lambda: None)()
+                if affinity == EXCLUSIVE_AFFINITY and (running or deferred):
+                    # Barrier: wait until everything before it has finished
+                    deferred.append(curr_id)
+                    break
+                # With nothing in flight, a node only waiting on queued nodes
+                # (e.g. a cycle) must still make progress
+                if _blocked(curr_id, affinity, effects) and (running or deferred):
+                    deferred.append(curr_id)
+                    waiting[curr_id] += 1
                     continue
 
-            # Default Routing
-            next_ids = self.orchestrator.get_next_nodes(curr_id, exec_result.result)
-            queue.extend(next_ids)
+                self.state_manager.set_current_node(curr_id)
+                self.variable_resolver.transfer_inputs_to_node(curr_id)
+                task = asyncio.create_task(self.node_executor.execute(node))
+                running[task] = (curr_id, node, affinity, effects)
+                in_flight[curr_id] += 1
+                if affinity is not None:
+                    busy_affinities.add(affinity)
+                if _runs_alone(effects):
+                    solo_running += 1
+                else:
+                    busy_effects.update(effects)
+                if affinity == EXCLUSIVE_AFFINITY:
+                    break
+            queue.extendleft(reversed(deferred))
+
+            if not running:
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            # Route in scheduling order so queue order matches the sequential loop
+            for task in [t for t in running if t in done]:
+                curr_id, node, affinity, effects = running.pop(task)
+                in_flight[curr_id] -= 1
+                if affinity is not None:
+                    busy_affinities.discard(affinity)
+                if _runs_alone(effects):
+                    solo_running -= 1
+                else:
+                    busy_effects.subtract(effects)
+                if not keep_going:
+                    continue
+                try:
+                    exec_result = task.result()
+                except Exception as e:
+                    raised = e
+                    keep_going = False
+                    continue
+                if not await self._process_result(curr_id, node, exec_result, queue):
+                    keep_going = False
+
+        # Let in-flight nodes finish before returning (e.g. after a failure)
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        if raised is not None:
+            raise raised
+
+    async def _process_result(
+        self, curr_id: NodeId, node: Any, exec_result: Any, queue: deque[NodeId]
+    ) -> bool:
+        """
+        Record a node result and queue its successors.
+
+        Returns:
+            False if execution must stop, True to continue
+        """
+        if not exec_result.success:
+            if self.result_handler and self.result_handler.handle_execution_failure(
+                curr_id, exec_result.result, queue
+            ):
+                return True
+            return False
+
+        self.state_manager.mark_node_executed(curr_id)
+        self.store_node_outputs(curr_id, node)
+
+        if exec_result.result:
+            self.variable_resolver.validate_output_ports(node, exec_result.result)
+
+        if self.state_manager.mark_target_reached(curr_id):
+            return False
+
+        # Routing & Special Results
+        if exec_result.result:
+            # Handle Parallel Branches
+            if "parallel_branches" in exec_result.result and self.parallel_strategy:
+                await self.parallel_strategy.execute_parallel_branches(exec_result.result)
+                join_id = exec_result.result.get("paired_join_id")
+                if join_id:
+                    queue.appendleft(join_id)
+                return True
+
+            # Handle Parallel Foreach
+            if "parallel_foreach_batch" in exec_result.result and self.parallel_strategy:
+                if hasattr(self.parallel_strategy, "execute_parallel_foreach_batch"):
+                    await self.parallel_strategy.execute_parallel_foreach_batch(
+                        exec_result.result, curr_id
+                    )
+                queue.appendleft(curr_id)
+                return True
+
+            # Handle other special results (Subflows, etc.)
+            if self.result_handler and self.result_handler.handle_special_results(
+                curr_id, exec_result, queue
+            ):
+                return True
+
+        # Default Routing
+        queue.extend(self._next_nodes(curr_id, exec_result.result))
+        return True
 
     def store_node_outputs(self, node_id: str, node: Any) -> None:
         """Store node output values in context for variable resolution."""
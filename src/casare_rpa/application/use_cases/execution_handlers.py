@@ -3,10 +3,12 @@ CasareRPA - Execution Handlers
 Encapsulates routing logic, error recovery, and special result handling.
 """
 
+from collections.abc import MutableSequence
 from typing import Any
 
 from loguru import logger
 
+from casare_rpa.application.use_cases.execution_state_manager import ExecutedNodeSet
 from casare_rpa.domain.value_objects.types import NodeId
 
 
@@ -31,7 +33,7 @@ class ExecutionResultHandler:
         self,
         node_id: NodeId,
         result: dict[str, Any] | None,
-        nodes_to_execute: list[NodeId],
+        nodes_to_execute: MutableSequence[NodeId],
     ) -> bool:
         """
         Routes execution on failure (Try-Catch or Stop).
@@ -60,7 +62,7 @@ class ExecutionResultHandler:
         self,
         current_node_id: NodeId,
         exec_result: Any,
-        nodes_to_execute: list[NodeId],
+        nodes_to_execute: MutableSequence[NodeId],
     ) -> bool:
         """
         Handles LoopBack, CatchRouting, and Parallel Forks.
@@ -103,13 +105,20 @@ class ExecutionResultHandler:
 
         return False
 
-    def _handle_loop_back(self, loop_start_id: str, current_node_id: str, queue: list[str]) -> None:
+    def _handle_loop_back(
+        self, loop_start_id: str, current_node_id: str, queue: MutableSequence[str]
+    ) -> None:
         """Clears executed nodes in loop body and the start node itself to allow re-execution."""
         body_nodes = self.orchestrator.find_loop_body_nodes(loop_start_id, current_node_id)
+        executed_nodes = self.state_manager.executed_nodes
         # MUST clear the loop start node as well, otherwise execute_workflow skips it on next pop
-        self.state_manager.executed_nodes.discard(loop_start_id)
-
-        for nid in body_nodes:
-            self.state_manager.executed_nodes.discard(nid)
+        executed_nodes.discard(loop_start_id)
+
+        if isinstance(executed_nodes, ExecutedNodeSet):
+            # O(1) generation bump instead of discarding every body node
+            executed_nodes.reset_scope((loop_start_id, current_node_id), body_nodes)
+        else:
+            for nid in body_nodes:
+                executed_nodes.discard(nid)
 
         queue.insert(0, loop_start_id)
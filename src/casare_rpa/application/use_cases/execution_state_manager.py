@@ -11,6 +11,7 @@ Extracted from ExecuteWorkflowUseCase for Single Responsibility.
 """
 
 import asyncio
+from collections.abc import Hashable, Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
@@ -36,6 +37,8 @@ class ExecutionSettings:
         node_timeout: float = 120.0,
         target_node_id: NodeId | None = None,
         single_node: bool = False,
+        parallel_dataflow: bool = False,
+        max_parallel_nodes: int = 8,
     ) -> None:
         """
         Initialize execution settings.
@@ -45,11 +48,96 @@ class ExecutionSettings:
             node_timeout: Timeout for individual node execution in seconds
             target_node_id: Optional target node for Run-To-Node (F4) or Run-Single-Node (F5)
             single_node: If True, execute only target_node_id (F5 mode)
+            parallel_dataflow: If True, run independent ready nodes concurrently
+                (see WorkflowExecutionEngine.run_dataflow_from_node)
+            max_parallel_nodes: Maximum nodes in flight in dataflow mode
         """
         self.continue_on_error = continue_on_error
         self.node_timeout = node_timeout
         self.target_node_id = target_node_id
         self.single_node = single_node
+        self.parallel_dataflow = parallel_dataflow
+        self.max_parallel_nodes = max(1, max_parallel_nodes)
+
+
+class ExecutedNodeSet:
+    """
+    Set of executed node IDs with O(1) loop-body reset.
+
+    Looping back used to discard every body node from a plain set on each
+    iteration. Here each reset scope (a loop body) carries a generation
+    stamp instead: reset_scope() bumps the stamp, and a node only counts as
+    executed if it was marked after the latest reset of every scope it
+    belongs to. Scope membership is registered once per scope key.
+
+    Membership (``in``) reflects the current iteration. len() and iteration
+    cover every node executed at least once during the run, so progress
+    stays monotonic across loop iterations.
+    """
+
+    __slots__ = ("_marks", "_generation", "_scope_resets", "_node_scopes")
+
+    def __init__(self, node_ids: Iterable[NodeId] = ()) -> None:
+        self._marks: dict[NodeId, int] = {}
+        self._generation = 0
+        self._scope_resets: dict[Hashable, int] = {}
+        self._node_scopes: dict[NodeId, list[Hashable]] = {}
+        for node_id in node_ids:
+            self._marks[node_id] = 0
+
+    def __contains__(self, node_id: object) -> bool:
+        marked_at = self._marks.get(node_id)  # type: ignore[call-overload]
+        if marked_at is None:
+            return False
+        scopes = self._node_scopes.get(node_id)  # type: ignore[call-overload]
+        if scopes:
+            scope_resets = self._scope_resets
+            for scope in scopes:
+                if scope_resets[scope] > marked_at:
+                    return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._marks)
+
+    def __iter__(self) -> Iterator[NodeId]:
+        return iter(self._marks)
+
+    def __repr__(self) -> str:
+        return f"ExecutedNodeSet({len(self._marks)} nodes, generation={self._generation})"
+
+    def add(self, node_id: NodeId) -> None:
+        """Mark a node as executed in the current generation."""
+        self._marks[node_id] = self._generation
+
+    def discard(self, node_id: NodeId) -> None:
+        """Forget a single node (e.g. the loop start on loop-back)."""
+        self._marks.pop(node_id, None)
+
+    def clear(self) -> None:
+        """Reset all tracking."""
+        self._marks.clear()
+        self._generation = 0
+        self._scope_resets.clear()
+        self._node_scopes.clear()
+
+    def reset_scope(self, scope: Hashable, node_ids: Iterable[NodeId]) -> None:
+        """
+        Mark every node in a scope as not executed.
+
+        node_ids is only read the first time a scope key is seen, so callers
+        must pass the same (memoized) node set for a given key.
+
+        Args:
+            scope: Stable key for the scope, e.g. (loop_start_id, loop_end_id)
+            node_ids: Nodes belonging to the scope
+        """
+        if scope not in self._scope_resets:
+            node_scopes = self._node_scopes
+            for node_id in node_ids:
+                node_scopes.setdefault(node_id, []).append(scope)
+        self._generation += 1
+        self._scope_resets[scope] = self._generation
 
 
 class ExecutionStateManager:
@@ -92,7 +180,7 @@ class ExecutionStateManager:
         self.pause_event.set()  # Initially not paused
 
         # Execution tracking
-        self.executed_nodes: set[NodeId] = set()
+        self.executed_nodes = ExecutedNodeSet()
         self.current_node_id: NodeId | None = None
         self.start_time: datetime | None = None
         self.end_time: datetime | None = None
@@ -9,6 +9,8 @@ from typing import Any
 
 from loguru import logger
 
+from casare_rpa.domain.entities.layered_variables import LayeredVariables
+from casare_rpa.domain.entities.node_run_state import isolated_node_state
 from casare_rpa.domain.events import EventBus, WorkflowProgress
 from casare_rpa.domain.interfaces import IExecutionContext
 from casare_rpa.domain.value_objects.types import NodeId
@@ -145,7 +147,12 @@ class ParallelExecutionStrategy:
                 # Run until Join
                 await self._run_until_join(target, branch_ctx, fork_result.get("paired_join_id"))
 
-                return port, branch_ctx.variables, True
+                # Only what the branch wrote; inherited parent variables
+                # are already in the main context
+                variables = branch_ctx.variables
+                if isinstance(variables, LayeredVariables):
+                    variables = dict(variables.local)
+                return port, variables, True
             except Exception as e:
                 return port, {"_error": str(e)}, False
 
@@ -165,48 +172,146 @@ class ParallelExecutionStrategy:
     async def execute_parallel_foreach_batch(
         self, result_data: dict[str, Any], node_id: str
     ) -> None:
-        """Executes a batch of items for ParallelForEachNode."""
-        items = result_data.get("parallel_foreach_batch", [])
-        if not items:
+        """
+        Runs the ParallelForEachNode body for one chunk of items.
+
+        A pool of at most max_concurrency workers pulls items lazily from the
+        node's source (list, iterator or async iterator), so at most
+        chunk_size items are consumed per pass. Every item runs in a fresh
+        layered branch context and its own node state store, so variables,
+        body nodes and the current_item/current_index outputs never leak
+        between items. Results are appended in item order to the node's run
+        state and the progress variable is replaced (never mutated in place);
+        the engine then re-runs the node.
+        """
+        batch = result_data.get("parallel_foreach_batch") or {}
+        progress = batch.get("progress")
+        run = batch.get("run")
+        if not progress or progress["exhausted"] or run is None:
             return
 
-        async def _process_item(item: Any, idx: int) -> Any:
-            try:
-                # Isolate context
-                item_ctx = self.context.clone_for_branch(f"item_{idx}")
-                item_ctx.set_variable("item", item)
-                item_ctx.set_variable("index", idx)
-
-                # Execute Body (one node or chain?)
-                # ParallelForEach usually executes a body chain.
-                # Here we assume the node logic gives us the body items or we loop back?
-                # Actually, the Node returns 'parallel_foreach_batch' implies IT wants the caching/orchestrator to run them.
-                # But Orchestrator usually loops back to the generic body.
-                # If we run parallel, we must run the body for each item concurrently.
-                # We need to know the 'body_start_node'.
-                # Assuming result_data has it.
-                body_start = result_data.get("body_start_id")
-                if not body_start:
+        body_start = self.orchestrator.find_target_node(node_id, batch.get("body_port", "body"))
+        foreach_node = self.get_node(node_id)
+        source = run["source"]
+        is_async = hasattr(source, "__anext__")
+        chunk_size = max(1, int(batch.get("chunk_size", 100)))
+        fail_fast = bool(result_data.get("fail_fast", False))
+        skip_failed = result_data.get("on_item_error") == "skip"
+        timeout = result_data.get("timeout_per_item")
+
+        chunk_start = progress["index"]
+        total = progress["total"]
+        exhausted = False
+        failed: str | None = None
+        chunk_results: list[Any] = []
+        failed_offsets: set[int] = set()
+        pull_lock = asyncio.Lock()
+
+        async def _next_item() -> tuple[int, Any] | None:
+            nonlocal exhausted
+            # Serialized so an async source is never awaited concurrently
+            async with pull_lock:
+                if (
+                    failed is not None
+                    or exhausted
+                    or len(chunk_results) >= chunk_size
+                    or self.state_manager.is_stopped
+                ):
                     return None
+                try:
+                    item = await source.__anext__() if is_async else next(source)
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    return None
+                chunk_results.append(None)
+                return len(chunk_results) - 1, item
+
+        async def _worker() -> None:
+            nonlocal failed
+            while (pulled := await _next_item()) is not None:
+                offset, item = pulled
+                index = chunk_start + offset
+                try:
+                    item_ctx = self.context.clone_for_branch(f"{node_id}_item_{index}")
+                    with isolated_node_state():
+                        foreach_node.set_output_value("current_item", item)
+                        foreach_node.set_output_value("current_index", index)
+                        item_ctx.set_variable("item", item, publish=False)
+                        item_ctx.set_variable("index", index, publish=False)
+                        item_ctx.set_variable(
+                            node_id,
+                            {"current_item": item, "current_index": index},
+                            publish=False,
+                        )
+                        if body_start is None:
+                            continue
+                        body = self._run_until_join(body_start, item_ctx, node_id)
+                        success, last_id = await (
+                            asyncio.wait_for(body, timeout) if timeout else body
+                        )
+                        if not success:
+                            raise RuntimeError(f"body node {last_id} failed")
+                        chunk_results[offset] = self._collect_outputs(last_id)
+                except Exception as e:
+                    message = (
+                        f"timed out after {timeout}s"
+                        if isinstance(e, asyncio.TimeoutError)
+                        else str(e)
+                    )
+                    logger.error(f"Parallel item {index} failed: {message}")
+                    failed_offsets.add(offset)
+                    run["errors"].append({"index": index, "error": message})
+                    if fail_fast and failed is None:
+                        failed = f"item {index}: {message}"
+
+        workers = max(1, int(batch.get("max_concurrency", 5)))
+        if total is not None:
+            workers = min(workers, total - chunk_start)
+        workers = max(1, min(workers, chunk_size))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+
+        index = chunk_start + len(chunk_results)
+        run["results"].extend(
+            value
+            for offset, value in enumerate(chunk_results)
+            if not (skip_failed and offset in failed_offsets)
+        )
+        self.context.set_variable(
+            batch.get("state_key", f"{node_id}_parallel_foreach"),
+            {
+                "total": total,
+                "index": index,
+                "exhausted": exhausted or (total is not None and index >= total),
+                "errors": len(run["errors"]),
+                "failed": failed,
+            },
+            publish=False,
+        )
 
-                # Execute chain
-                await self._run_until_join(body_start, item_ctx, None)  # Run until end of chain
-                return item_ctx.variables
-            except Exception as e:
-                logger.error(f"Parallel Item {idx} failed: {e}")
-                return None
-
-        tasks = [_process_item(item, i) for i, item in enumerate(items)]
-        await asyncio.gather(*tasks, return_exceptions=True)
-        # Results handling? Usually aggregated or just side effects.
+    def _collect_outputs(self, node_id: NodeId | None) -> Any:
+        """Data output values of a node in the current run state (None if no node)."""
+        if node_id is None:
+            return None
+        node = self.get_node(node_id)
+        return {
+            name: port.get_value()
+            for name, port in getattr(node, "output_ports", {}).items()
+            if not name.startswith("exec") and port.get_value() is not None
+        }
 
     async def _run_until_join(
         self, start_id: str, ctx: IExecutionContext, join_id: str | None
-    ) -> None:
-        """Runs chain until JoinNode."""
+    ) -> tuple[bool, NodeId | None]:
+        """
+        Runs chain until JoinNode (or join_id, e.g. the loop node itself).
+
+        Returns:
+            Tuple of (success, id of the last node that ran)
+        """
         queue = [start_id]
         executor = self.create_executor(ctx)
         visited = set()
+        last_id: NodeId | None = None
 
         while queue:
             curr = queue.pop(0)
@@ -216,14 +321,17 @@ class ParallelExecutionStrategy:
             if curr in visited:
                 continue
 
+            last_id = curr
             try:
                 node = self.get_node(curr)
                 self.variable_resolver.transfer_inputs_to_node(curr, context_override=ctx)
                 res = await executor.execute(node)
                 if not res.success:
-                    break
+                    return False, curr
 
                 visited.add(curr)
                 queue.extend(self.orchestrator.get_next_nodes(curr, res.result))
             except Exception:
-                break
+                return False, curr
+
+        return True, last_id
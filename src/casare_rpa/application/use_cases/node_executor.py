@@ -65,10 +65,12 @@ from casare_rpa.domain.events import (
 from casare_rpa.domain.interfaces import (
     ICacheKeyGenerator,
     ICacheManager,
+    ICpuOffloader,
     IExecutionContext,
     INode,
 )
 from casare_rpa.domain.services.cache_keys import StableCacheKeyGenerator
+from casare_rpa.domain.services.cpu_offload import bind_cpu_offloader
 from casare_rpa.domain.value_objects.types import DataType, NodeStatus
 from casare_rpa.utils.performance.performance_metrics import get_metrics
 
@@ -118,6 +120,7 @@ class NodeExecutor:
         progress_calculator: Callable[[], float] | None = None,
         cache_manager: ICacheManager | None = None,
         cache_key_generator: type[ICacheKeyGenerator] | None = None,
+        cpu_offloader: ICpuOffloader | None = None,
     ) -> None:
         """
         Initialize node executor.
@@ -127,6 +130,8 @@ class NodeExecutor:
             event_bus: Optional event bus for lifecycle events
             node_timeout: Timeout for individual node execution in seconds
             progress_calculator: Optional callable to calculate progress percentage
+            cpu_offloader: Worker pool bound while ``cpu_bound`` nodes execute
+                (their run_cpu_bound() work uses a thread when None)
 
         Related:
             See domain.interfaces.IExecutionContext for context protocol
@@ -137,6 +142,7 @@ class NodeExecutor:
         self._calculate_progress = progress_calculator or (lambda: 0.0)
         self.cache_manager = cache_manager
         self._cache_key_generator = cache_key_generator or StableCacheKeyGenerator
+        self.cpu_offloader = cpu_offloader
 
         # PERFORMANCE: Cache metrics instance to avoid singleton lookup on every call
         # Related: See utils.performance.performance_metrics for metrics tracking
@@ -446,10 +452,14 @@ class NodeExecutor:
             if hasattr(node, "set_execution_context"):
                 node.set_execution_context(self.context)
 
+            # CPU OFFLOAD: cpu_bound nodes ship their heavy work to the worker
+            # pool; the node timeout also withdraws work still queued there
+            offloader = self.cpu_offloader if getattr(node, "cpu_bound", False) else None
             try:
-                result = await asyncio.wait_for(
-                    node.execute(self.context), timeout=self.node_timeout
-                )
+                with bind_cpu_offloader(offloader):
+                    result = await asyncio.wait_for(
+                        node.execute(self.context), timeout=self.node_timeout
+                    )
             finally:
                 # Clear context to prevent memory leaks and stale references
                 if hasattr(node, "set_execution_context"):
@@ -692,10 +702,14 @@ class NodeExecutor:
             if hasattr(node, "set_execution_context"):
                 node.set_execution_context(self.context)
 
+            # CPU OFFLOAD: cpu_bound nodes ship their heavy work to the worker
+            # pool; the node timeout also withdraws work still queued there
+            offloader = self.cpu_offloader if getattr(node, "cpu_bound", False) else None
             try:
-                result = await asyncio.wait_for(
-                    node.execute(self.context), timeout=self.node_timeout
-                )
+                with bind_cpu_offloader(offloader):
+                    result = await asyncio.wait_for(
+                        node.execute(self.context), timeout=self.node_timeout
+                    )
             finally:
                 # Clear context to prevent memory leaks
                 if hasattr(node, "set_execution_context"):
@@ -774,6 +788,7 @@ class NodeExecutorWithTryCatch(NodeExecutor):
         node_timeout: float = 120.0,
         progress_calculator: Callable[[], float] | None = None,
         error_capturer: Callable[..., bool] | None = None,
+        cpu_offloader: ICpuOffloader | None = None,
     ) -> None:
         """
         Initialize node executor with try-catch support.
@@ -785,8 +800,15 @@ class NodeExecutorWithTryCatch(NodeExecutor):
             progress_calculator: Optional callable for progress
             error_capturer: Callable to capture errors in try blocks
                            Returns True if error was captured, False otherwise
+            cpu_offloader: Worker pool for ``cpu_bound`` nodes
         """
-        super().__init__(context, event_bus, node_timeout, progress_calculator)
+        super().__init__(
+            context,
+            event_bus,
+            node_timeout,
+            progress_calculator,
+            cpu_offloader=cpu_offloader,
+        )
         # ERROR CAPTURE: This callable checks if we're in a try block
         # and stores the error in the try_state variable if so
         self._capture_error = error_capturer or (lambda *args: False)
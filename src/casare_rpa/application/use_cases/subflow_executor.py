@@ -385,6 +385,7 @@ class SubflowExecutor:
                 context=internal_context,
                 result_handler=result_handler,
                 parallel_strategy=parallel_strategy,
+                plan=orchestrator.plan,
             )
 
             state_manager.start_execution()
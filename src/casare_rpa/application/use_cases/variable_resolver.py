@@ -478,6 +478,8 @@ class TryCatchErrorHandler:
                 value["error_type"] = error_type
                 value["error_message"] = error_msg
                 value["stack_trace"] = stack_trace
+                # Re-set so checkpoint deltas see the captured error
+                self.context.set_variable(key, value, publish=False)
                 logger.debug(f"Error captured in try block: {key}")
                 return True
 
@@ -558,6 +560,8 @@ class TryCatchErrorHandler:
                 value["error_type"] = error_type
                 value["error_message"] = error_msg
                 value["stack_trace"] = stack_trace
+                # Re-set so checkpoint deltas see the captured error
+                self.context.set_variable(key, value, publish=False)
                 logger.debug(f"Error captured in try block: {key}")
                 return Ok(True)
 
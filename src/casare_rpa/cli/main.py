@@ -114,6 +114,112 @@ def cache_clear():
     asyncio.run(_clear())
 
 
+# Benchmark CLI Group
+bench_app = typer.Typer(name="bench", help="Engine overhead benchmarks")
+app.add_typer(bench_app, name="bench")
+
+
+@bench_app.command("run")
+def bench_run(
+    scenario: list[str] | None = typer.Option(
+        None, "--scenario", "-s", help="Scenario to run (repeatable, default: all)"
+    ),
+    quick: bool = typer.Option(False, "--quick", "-q", help="Use small CI sizes"),
+    baseline: Path | None = typer.Option(
+        None, "--baseline", "-b", help="Baseline JSON (default: .benchmarks/engine_overhead.json)"
+    ),
+    threshold: float = typer.Option(
+        0.25, "--threshold", "-t", help="Allowed relative regression (0.25 = 25%)"
+    ),
+    save: bool = typer.Option(False, "--save-baseline", help="Store results as the baseline"),
+    output: Path | None = typer.Option(
+        None, "--output", "-o", help="Also write results to this JSON file (for bench compare)"
+    ),
+):
+    """Run engine benchmarks and fail on regressions against the baseline."""
+    import asyncio
+
+    from loguru import logger
+
+    from casare_rpa.testing.engine_benchmark import (
+        DEFAULT_BASELINE_PATH,
+        SCENARIOS,
+        compare_to_baseline,
+        format_results,
+        load_baseline,
+        run_suite,
+        save_baseline,
+    )
+
+    unknown = [name for name in scenario or [] if name not in SCENARIOS]
+    if unknown:
+        typer.echo(f"Unknown scenario(s): {', '.join(unknown)}", err=True)
+        typer.echo(f"Available: {', '.join(SCENARIOS)}", err=True)
+        raise typer.Exit(2)
+
+    baseline_path = baseline or DEFAULT_BASELINE_PATH
+    # Per-node INFO/DEBUG logging would dominate the measurements
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    results = asyncio.run(run_suite(scenario, quick=quick))
+    typer.echo(format_results(results))
+
+    if output:
+        save_baseline(results, output)
+        typer.echo(f"Results saved to {output}")
+
+    if save:
+        save_baseline(results, baseline_path)
+        typer.echo(f"Baseline saved to {baseline_path}")
+        return
+
+    regressions = compare_to_baseline(results, load_baseline(baseline_path), threshold)
+    if regressions:
+        typer.echo("Regressions:", err=True)
+        for message in regressions:
+            typer.echo(f"  - {message}", err=True)
+        raise typer.Exit(1)
+
+
+@bench_app.command("compare")
+def bench_compare(
+    results_path: Path = typer.Argument(..., help="Results JSON (from bench run --output)"),
+    baseline: Path | None = typer.Option(
+        None, "--baseline", "-b", help="Baseline JSON (default: .benchmarks/engine_overhead.json)"
+    ),
+    threshold: float = typer.Option(
+        0.25, "--threshold", "-t", help="Allowed relative regression (0.25 = 25%)"
+    ),
+):
+    """Compare stored benchmark results against the baseline without re-running."""
+    from casare_rpa.testing.engine_benchmark import (
+        DEFAULT_BASELINE_PATH,
+        compare_to_baseline,
+        format_results,
+        load_baseline,
+    )
+
+    baseline_path = baseline or DEFAULT_BASELINE_PATH
+    results = list(load_baseline(results_path).values())
+    if not results:
+        typer.echo(f"No benchmark results in {results_path}", err=True)
+        raise typer.Exit(2)
+    reference = load_baseline(baseline_path)
+    if not reference:
+        typer.echo(f"No baseline at {baseline_path}", err=True)
+        raise typer.Exit(2)
+
+    typer.echo(format_results(results))
+    regressions = compare_to_baseline(results, reference, threshold)
+    if regressions:
+        typer.echo("Regressions:", err=True)
+        for message in regressions:
+            typer.echo(f"  - {message}", err=True)
+        raise typer.Exit(1)
+    typer.echo(f"No regressions against {baseline_path}")
+
+
 @tunnel_app.command("start")
 def tunnel_start(
     port: int = typer.Option(8000, "--port", "-p", help="Port to expose"),
@@ -22,10 +22,16 @@ Related:
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 logger = logging.getLogger(__name__)
 
+from casare_rpa.domain.entities.node_run_state import NodeRunState, get_active_store
+from casare_rpa.domain.services.cpu_offload import run_cpu_bound
+from casare_rpa.domain.services.variable_resolver import (
+    compile_template,
+    has_template_markers,
+)
 from casare_rpa.domain.value_objects import Port
 from casare_rpa.domain.value_objects.types import (
     DataType,
@@ -40,6 +46,29 @@ from casare_rpa.domain.value_objects.types import (
 if TYPE_CHECKING:
     from casare_rpa.domain.interfaces import IExecutionContext
 
+# Resource affinity that keeps a node from running alongside any other node
+EXCLUSIVE_AFFINITY = "exclusive"
+
+# Default resource affinity per node category for dataflow-parallel scheduling.
+# Browser/desktop/system nodes drive one shared page, screen or clipboard;
+# flow-shaping categories must not overlap anything.
+CATEGORY_RESOURCE_AFFINITY: dict[str, str] = {
+    "browser": "browser",
+    "desktop": "desktop",
+    "system": "system",
+    "control_flow": EXCLUSIVE_AFFINITY,
+    "error_handling": EXCLUSIVE_AFFINITY,
+    "workflow": EXCLUSIVE_AFFINITY,
+    "triggers": EXCLUSIVE_AFFINITY,
+}
+
+# Side-effect declarations for dataflow-parallel scheduling (see
+# BaseNode.side_effects). PURE nodes only read inputs/variables and write
+# their output ports; VARIABLES_EFFECT marks nodes that write workflow
+# variables, which every other node may read while resolving templates.
+PURE: frozenset[str] = frozenset()
+VARIABLES_EFFECT = "variables"
+
 
 class BaseNode(ABC):
     """
@@ -57,8 +86,28 @@ class BaseNode(ABC):
     - Use add_exec_input()/add_exec_output() for execution ports
     - Use get_parameter() for dual-source config (port OR config)
     - Return ExecutionResult dict from execute(), don't raise exceptions
+
+    Run state (status, error_message, port values, execution_count,
+    last_execution_time, last_output, execution context) is kept in a
+    NodeRunState rather than on the node. Outside an isolated run the node's
+    own local state is used; inside one (see isolated_node_state) each
+    execution gets its own state, so a cached node instance can be shared.
     """
 
+    # Dataflow-parallel scheduling hint: nodes sharing an affinity never run at
+    # the same time. None derives it from the node category (see
+    # CATEGORY_RESOURCE_AFFINITY); override on nodes bound to a shared resource.
+    resource_affinity: ClassVar[str | None] = None
+
+    # Effects beyond the node's output ports (e.g. {"file"}, {"http"}), used by
+    # the dataflow-parallel scheduler: nodes with overlapping effects never
+    # overlap. None (undeclared) is conservative - the node runs alone.
+    side_effects: ClassVar[frozenset[str] | None] = None
+
+    # Nodes whose heavy work is CPU-bound: NodeExecutor binds its worker pool
+    # while they run, and they ship that work through run_cpu_bound()
+    cpu_bound: ClassVar[bool] = False
+
     def __init__(self, node_id: NodeId, config: NodeConfig | None = None) -> None:
         """
         Initialize base node.
@@ -67,10 +116,12 @@ class BaseNode(ABC):
             node_id: Unique identifier for this node instance
             config: Node configuration dictionary
         """
+        # Per-run state used when no isolated NodeStateStore is bound
+        self._local_state = NodeRunState()
+        self._port_count = 0
+
         self.node_id = node_id
         self.config = config or {}
-        self.status = NodeStatus.IDLE
-        self.error_message: str | None = None
 
         # Ports
         self.input_ports: dict[str, Port] = {}
@@ -83,21 +134,81 @@ class BaseNode(ABC):
 
         # Debug support
         self.breakpoint_enabled: bool = False
-        self.execution_count: int = 0
-        self.last_execution_time: float | None = None
-        self.last_output: dict[str, Any] | None = None
 
         # Caching support
         self.cacheable: bool = False
         self.cache_ttl: int = 3600  # 1 hour default
 
-        # Execution context reference for auto-resolution in get_parameter()
-        # Set during execute() lifecycle, cleared after execution
-        self._execution_context: IExecutionContext | None = None
-
         # Initialize ports
         self._define_ports()
 
+    # --- Per-run state (delegates to NodeRunState) ---
+
+    @property
+    def _run_state(self) -> NodeRunState:
+        """Run state for the current execution (isolated store or local)."""
+        store = get_active_store()
+        if store is None:
+            return self._local_state
+        return store.state_for(self)
+
+    @property
+    def status(self) -> NodeStatus:
+        return self._run_state.status
+
+    @status.setter
+    def status(self, value: NodeStatus) -> None:
+        self._run_state.status = value
+
+    @property
+    def error_message(self) -> str | None:
+        return self._run_state.error_message
+
+    @error_message.setter
+    def error_message(self, value: str | None) -> None:
+        self._run_state.error_message = value
+
+    @property
+    def execution_count(self) -> int:
+        return self._run_state.execution_count
+
+    @execution_count.setter
+    def execution_count(self, value: int) -> None:
+        self._run_state.execution_count = value
+
+    @property
+    def last_execution_time(self) -> float | None:
+        return self._run_state.last_execution_time
+
+    @last_execution_time.setter
+    def last_execution_time(self, value: float | None) -> None:
+        self._run_state.last_execution_time = value
+
+    @property
+    def last_output(self) -> dict[str, Any] | None:
+        return self._run_state.last_output
+
+    @last_output.setter
+    def last_output(self, value: dict[str, Any] | None) -> None:
+        self._run_state.last_output = value
+
+    @property
+    def _execution_context(self) -> Optional["IExecutionContext"]:
+        # Set during execute() lifecycle for auto-resolution in get_parameter()
+        return self._run_state.execution_context
+
+    @_execution_context.setter
+    def _execution_context(self, value: Optional["IExecutionContext"]) -> None:
+        self._run_state.execution_context = value
+
+    @property
+    def _runtime(self) -> dict[str, Any]:
+        """Per-run scratch objects (open iterators) kept out of workflow variables."""
+        state = self._run_state
+        if state.runtime is None:
+            state.runtime = {}
+        return state.runtime
+
     @abstractmethod
     def _define_ports(self) -> None:
         """
@@ -200,7 +311,7 @@ class BaseNode(ABC):
     ) -> None:
         """Add an input port to the node."""
         port = Port(name, PortType.INPUT, data_type, label, required)
-        self.input_ports[name] = port
+        self.input_ports[name] = self._bind_port(port)
 
     def add_output_port(
         self,
@@ -211,17 +322,23 @@ class BaseNode(ABC):
     ) -> None:
         """Add an output port to the node."""
         port = Port(name, PortType.OUTPUT, data_type, label, required)
-        self.output_ports[name] = port
+        self.output_ports[name] = self._bind_port(port)
 
     def add_exec_input(self, name: str = "exec_in") -> None:
         """Add an execution input port for flow control."""
         port = Port(name, PortType.EXEC_INPUT, DataType.EXEC, "Execute", required=False)
-        self.input_ports[name] = port
+        self.input_ports[name] = self._bind_port(port)
 
     def add_exec_output(self, name: str = "exec_out") -> None:
         """Add an execution output port for flow control."""
         port = Port(name, PortType.EXEC_OUTPUT, DataType.EXEC, "Next", required=False)
-        self.output_ports[name] = port
+        self.output_ports[name] = self._bind_port(port)
+
+    def _bind_port(self, port: Port) -> Port:
+        """Assign the next port ordinal so the value is stored in run state."""
+        port.bind(self, self._port_count)
+        self._port_count += 1
+        return port
 
     def set_input_value(self, port_name: str, value: Any) -> None:
         """Set the value of an input port."""
@@ -292,6 +409,13 @@ class BaseNode(ABC):
 
         # Auto-resolve {{variables}} if context is available and resolve=True
         if resolve and value is not None and self._execution_context is not None:
+            # Plain strings never reach the template cache; compiled templates
+            # are memoized per string so marker-only values skip the context
+            if isinstance(value, str):
+                if not has_template_markers(value):
+                    return value
+                if not compile_template(value).has_variables and "{{$secret:" not in value:
+                    return value
             if hasattr(self._execution_context, "resolve_value"):
                 value = self._execution_context.resolve_value(value)
 
@@ -325,6 +449,45 @@ class BaseNode(ABC):
         """
         self._execution_context = context
 
+    def get_resource_affinity(self) -> str | None:
+        """
+        Get the resource this node must not share with concurrently running nodes.
+
+        Returns:
+            Affinity key, EXCLUSIVE_AFFINITY, or None if the node is independent
+        """
+        if self.resource_affinity is not None:
+            return self.resource_affinity
+        meta = getattr(type(self), "__node_meta__", None)
+        category = getattr(meta, "category", None) or self.category
+        return CATEGORY_RESOURCE_AFFINITY.get(category)
+
+    def get_side_effects(self) -> frozenset[str] | None:
+        """
+        Get the side effects this node declares for dataflow scheduling.
+
+        Returns:
+            Effect keys (PURE if none), or None when undeclared
+        """
+        return self.side_effects
+
+    async def run_cpu_bound(self, func: Any, *args: Any, timeout: float | None = None) -> Any:
+        """
+        Run CPU-heavy work off the event loop.
+
+        Uses the worker process pool bound by NodeExecutor for ``cpu_bound``
+        nodes, or a worker thread otherwise.
+
+        Args:
+            func: Module-level function (must be picklable, as must args/result)
+            *args: Positional arguments for func
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The function result
+        """
+        return await run_cpu_bound(func, *args, timeout=timeout)
+
     def serialize(self) -> SerializedNode:
         """
         Serialize node to dictionary for saving workflows.
@@ -368,15 +531,17 @@ class BaseNode(ABC):
 
     def reset(self) -> None:
         """Reset node to initial state."""
-        self.status = NodeStatus.IDLE
-        self.error_message = None
+        state = self._run_state
+        state.status = NodeStatus.IDLE
+        state.error_message = None
         for port in self.input_ports.values():
             port.value = None
         for port in self.output_ports.values():
             port.value = None
-        self.execution_count = 0
-        self.last_execution_time = None
-        self.last_output = None
+        state.execution_count = 0
+        state.last_execution_time = None
+        state.last_output = None
+        state.runtime = None
 
     def set_breakpoint(self, enabled: bool = True) -> None:
         """
@@ -0,0 +1,213 @@
+"""
+CasareRPA - Domain Entity: Layered Variables
+
+Copy-on-write variable scope for branch, item and subflow contexts.
+
+Entry Points:
+    - LayeredVariables: Mapping overlay that reads through to a parent scope
+    - MergePolicy: How a layer's writes are folded back into a parent
+
+Key Patterns:
+    - Reads fall through to the parent without copying it (zero-copy)
+    - Writes and deletes stay local; deletes of parent keys are recorded as
+      tombstones so the parent is never modified by the child
+    - Only the layer's own writes are merged back (see merge_into)
+    - Values themselves are shared, exactly like the shallow copy the
+      branch contexts used before: mutating a parent list in place is
+      visible to the parent
+
+Related:
+    - See infrastructure.execution.execution_context (clone_for_branch)
+"""
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from enum import Enum
+from typing import Any
+
+
+class MergePolicy(Enum):
+    """Policy for folding a child layer's writes into a target mapping."""
+
+    # Write every key as "<prefix>_<key>" (Fork/Join legacy behaviour)
+    NAMESPACED = "namespaced"
+    # Child writes win; child deletes are applied to the target
+    OVERWRITE = "overwrite"
+    # Only keys the target does not have yet are written
+    KEEP_EXISTING = "keep_existing"
+
+
+class LayeredVariables(MutableMapping[str, Any]):
+    """
+    Write-local overlay over a parent variable mapping.
+
+    Behaves like a dict for the execution context. Creating one is O(1)
+    regardless of the parent size; memory grows only with local writes.
+    """
+
+    __slots__ = ("_parent", "_local", "_deleted")
+
+    def __init__(self, parent: Mapping[str, Any] | None = None) -> None:
+        """
+        Initialize a layer.
+
+        Args:
+            parent: Mapping to read through to (not copied, never modified)
+        """
+        self._parent: Mapping[str, Any] = parent if parent is not None else {}
+        self._local: dict[str, Any] = {}
+        self._deleted: set[str] = set()
+
+    @classmethod
+    def from_writes(
+        cls, writes: Mapping[str, Any], parent: Mapping[str, Any] | None = None
+    ) -> "LayeredVariables":
+        """Create a layer holding the given writes (e.g. a branch result dict)."""
+        layer = cls(parent)
+        layer._local.update(writes)
+        return layer
+
+    @property
+    def parent(self) -> Mapping[str, Any]:
+        """The mapping this layer reads through to."""
+        return self._parent
+
+    @property
+    def local(self) -> dict[str, Any]:
+        """Variables written in this layer (live dict, do not mutate)."""
+        return self._local
+
+    @property
+    def deleted(self) -> frozenset[str]:
+        """Parent keys hidden by deletes in this layer."""
+        return frozenset(self._deleted)
+
+    def __getitem__(self, key: str) -> Any:
+        local = self._local
+        if key in local:
+            return local[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        return self._parent[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._local[key] = value
+        if self._deleted:
+            self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._local.pop(key, None)
+        if key in self._parent:
+            self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._local:
+            return True
+        return key not in self._deleted and key in self._parent
+
+    def __iter__(self) -> Iterator[str]:
+        local = self._local
+        deleted = self._deleted
+        yield from local
+        for key in self._parent:
+            if key not in local and key not in deleted:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # PERFORMANCE: avoid the KeyError round-trip of Mapping.get
+        local = self._local
+        if key in local:
+            return local[key]
+        if key in self._deleted:
+            return default
+        return self._parent.get(key, default)
+
+    def clear(self) -> None:
+        """Hide every variable without touching the parent."""
+        self._local.clear()
+        self._deleted = set(self._parent)
+
+    def copy(self) -> dict[str, Any]:
+        """Flatten into a plain dict (like dict.copy on the old snapshot)."""
+        return dict(self.items())
+
+    def new_child(self) -> "LayeredVariables":
+        """Create a nested layer reading through to this one."""
+        return LayeredVariables(self)
+
+    def merge_changes(
+        self,
+        target: Mapping[str, Any],
+        policy: MergePolicy = MergePolicy.OVERWRITE,
+        prefix: str = "",
+        skip_private: bool = True,
+    ) -> tuple[dict[str, Any], list[str]]:
+        """
+        Compute what folding this layer into a target would change.
+
+        Lets callers apply the result through their own setter (e.g. one
+        that publishes events) instead of writing the mapping directly.
+
+        Args:
+            target: Mapping the writes would be applied to
+            policy: Conflict/namespace policy
+            prefix: Key prefix for MergePolicy.NAMESPACED
+            skip_private: Skip variables starting with "_"
+
+        Returns:
+            Tuple of (keys to write with their values, keys to delete)
+        """
+        writes: dict[str, Any] = {}
+        for key, value in self._local.items():
+            if skip_private and key.startswith("_"):
+                continue
+            if policy is MergePolicy.NAMESPACED:
+                writes[f"{prefix}_{key}"] = value
+            elif policy is MergePolicy.KEEP_EXISTING and key in target:
+                continue
+            else:
+                writes[key] = value
+
+        deletes: list[str] = []
+        if policy is MergePolicy.OVERWRITE:
+            deletes = [
+                key
+                for key in self._deleted
+                if key in target and not (skip_private and key.startswith("_"))
+            ]
+        return writes, deletes
+
+    def merge_into(
+        self,
+        target: MutableMapping[str, Any],
+        policy: MergePolicy = MergePolicy.OVERWRITE,
+        prefix: str = "",
+        skip_private: bool = True,
+    ) -> int:
+        """
+        Fold this layer's own writes (and deletes) into a target mapping.
+
+        Args:
+            target: Mapping to update (typically the parent scope)
+            policy: Conflict/namespace policy
+            prefix: Key prefix for MergePolicy.NAMESPACED
+            skip_private: Skip variables starting with "_"
+
+        Returns:
+            Number of keys written or deleted in the target
+        """
+        writes, deletes = self.merge_changes(target, policy, prefix, skip_private)
+        target.update(writes)
+        for key in deletes:
+            del target[key]
+        return len(writes) + len(deletes)
+
+    def __repr__(self) -> str:
+        return (
+            f"LayeredVariables(local={len(self._local)}, deleted={len(self._deleted)}, "
+            f"parent={type(self._parent).__name__})"
+        )
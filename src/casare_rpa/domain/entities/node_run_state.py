@@ -0,0 +1,160 @@
+"""
+CasareRPA - Per-Run Node State
+
+Separates what a node *is* (config, port schema) from what happened to it
+during one execution (status, port values, outputs, execution context).
+
+Entry Points:
+    - NodeRunState: Slotted per-run state for a single node
+    - NodeStateStore: Per-execution mapping of node -> NodeRunState
+    - isolated_node_state(): Bind a fresh store for the current task
+
+Key Patterns:
+    - BaseNode keeps a local NodeRunState used when no store is bound
+      (canvas, tests, single runs) - behaviour is unchanged there.
+    - When a store is bound (ContextVar), every node touched by the run reads
+      and writes state in that store instead. One cached WorkflowSchema can
+      therefore back many concurrent executions without re-instantiation.
+    - Port values live in a flat list indexed by the port ordinal assigned
+      by BaseNode when the port is added.
+
+Related:
+    - See domain.entities.base_node for the delegating attributes
+    - See application.use_cases.execute_workflow (isolate_node_state)
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from casare_rpa.domain.value_objects.types import NodeStatus
+
+if TYPE_CHECKING:
+    from casare_rpa.domain.interfaces import IExecutionContext
+
+
+class NodeRunState:
+    """
+    Mutable state of one node during one execution.
+
+    PERFORMANCE: __slots__ plus a flat port value list keeps the per-run
+    footprint to a single small object per node actually executed.
+    """
+
+    __slots__ = (
+        "status",
+        "error_message",
+        "execution_count",
+        "last_execution_time",
+        "last_output",
+        "execution_context",
+        "port_values",
+        "runtime",
+    )
+
+    def __init__(self, port_values: list[Any] | None = None) -> None:
+        self.status: NodeStatus = NodeStatus.IDLE
+        self.error_message: str | None = None
+        self.execution_count: int = 0
+        self.last_execution_time: float | None = None
+        self.last_output: dict[str, Any] | None = None
+        self.execution_context: IExecutionContext | None = None
+        self.port_values: list[Any] = port_values if port_values is not None else []
+        # Live objects a node keeps between passes (open iterators) that must
+        # not enter workflow variables; created on first use
+        self.runtime: dict[str, Any] | None = None
+
+    def get_port_value(self, ordinal: int) -> Any:
+        """Get the value stored for a port ordinal (None if never set)."""
+        values = self.port_values
+        return values[ordinal] if ordinal < len(values) else None
+
+    def set_port_value(self, ordinal: int, value: Any) -> None:
+        """Store a value for a port ordinal, growing storage for late-added ports."""
+        values = self.port_values
+        if ordinal >= len(values):
+            values.extend([None] * (ordinal + 1 - len(values)))
+        values[ordinal] = value
+
+
+class NodeStateStore:
+    """
+    Per-execution node state, keyed by node instance.
+
+    A new run state is seeded with the port values the node has in the
+    parent store (nested runs such as parallel items), or else its local
+    port values, so defaults assigned while the node was built and values
+    produced upstream stay visible.
+    """
+
+    __slots__ = ("_states", "_parent")
+
+    def __init__(self, parent: "NodeStateStore | None" = None) -> None:
+        # Keyed by the node object itself (identity hash) so ids cannot be reused
+        self._states: dict[Any, NodeRunState] = {}
+        self._parent = parent
+
+    def _seed_values(self, node: Any) -> list[Any]:
+        store: NodeStateStore | None = self._parent
+        while store is not None:
+            state = store._states.get(node)
+            if state is not None:
+                return list(state.port_values)
+            store = store._parent
+        return list(node._local_state.port_values)
+
+    def state_for(self, node: Any) -> NodeRunState:
+        """
+        Get (or create) the run state for a node.
+
+        Args:
+            node: Node instance exposing ``_local_state``
+
+        Returns:
+            NodeRunState owned by this store
+        """
+        state = self._states.get(node)
+        if state is None:
+            state = NodeRunState(self._seed_values(node))
+            self._states[node] = state
+        return state
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+_active_store: ContextVar[NodeStateStore | None] = ContextVar(
+    "casare_node_state_store", default=None
+)
+
+
+def get_active_store() -> NodeStateStore | None:
+    """Get the node state store bound to the current context, if any."""
+    return _active_store.get()
+
+
+@contextmanager
+def isolated_node_state(
+    store: NodeStateStore | None = None,
+) -> Iterator[NodeStateStore]:
+    """
+    Route node state for the current context into a dedicated store.
+
+    Tasks spawned inside the block inherit the binding (contextvars are
+    copied on task creation), so parallel branches share the run's store
+    while concurrent runs stay isolated from each other. Nesting creates a
+    child store seeded from the enclosing one.
+
+    Args:
+        store: Store to bind (a fresh child of the active store if omitted)
+
+    Yields:
+        The bound NodeStateStore
+    """
+    store = store if store is not None else NodeStateStore(_active_store.get())
+    token = _active_store.set(store)
+    try:
+        yield store
+    finally:
+        _active_store.reset(token)
@@ -141,6 +141,10 @@ class EventBus:
             else:
                 self._handlers.clear()
 
+    def has_subscribers(self, event_type: type[DomainEvent]) -> bool:
+        """Whether publishing event_type would reach any handler (typed or wildcard)."""
+        return bool(self._handlers.get(event_type) or self._wildcard_handlers)
+
     def get_handler_count(self, event_type: type[DomainEvent]) -> int:
         """Get handler count for event type."""
         with self._lock:
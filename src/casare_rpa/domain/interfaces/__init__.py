@@ -12,6 +12,7 @@ Entry Points:
     - IExecutionContextFactory: Factory for execution contexts
     - ICacheManager: Protocol for cache invalidation operations
     - ICacheKeyGenerator: Protocol for cache key generation
+    - ICpuOffloader: Protocol for running CPU-bound work in worker processes
     - IBrowserRecorder: Protocol for browser recording
     - IBrowserRecorderFactory: Factory for browser recorders
     - IBrowserWorkflowGenerator: Protocol for workflow generation from browser actions
@@ -46,6 +47,7 @@ from casare_rpa.domain.interfaces.browser import (
 )
 from casare_rpa.domain.interfaces.cache import ICacheManager
 from casare_rpa.domain.interfaces.cache_keys import ICacheKeyGenerator
+from casare_rpa.domain.interfaces.cpu_offload import ICpuOffloader
 from casare_rpa.domain.interfaces.execution_context import IExecutionContext
 from casare_rpa.domain.interfaces.execution_context_factory import IExecutionContextFactory
 from casare_rpa.domain.interfaces.llm import ILLMManager, ILLMResponse
@@ -66,6 +68,7 @@ __all__ = [
     "IExecutionContextFactory",
     "ICacheManager",
     "ICacheKeyGenerator",
+    "ICpuOffloader",
     "IBrowserRecorder",
     "IBrowserRecorderFactory",
     "IBrowserWorkflowGenerator",
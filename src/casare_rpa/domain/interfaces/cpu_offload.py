@@ -0,0 +1,15 @@
+"""CPU offload interface for CPU-bound node work."""
+
+from collections.abc import Callable
+from typing import Any, Protocol
+
+
+class ICpuOffloader(Protocol):
+    """Protocol for running picklable CPU-bound callables off the event loop."""
+
+    async def run(self, func: Callable[..., Any], *args: Any, timeout: float | None = None) -> Any:
+        """
+        Run a module-level function with picklable arguments and result.
+
+        Cancelling the awaiting task withdraws work that has not started yet.
+        """
@@ -95,13 +95,14 @@ class IExecutionContext(Protocol):
     # VARIABLE MANAGEMENT
     # ========================================================================
 
-    def set_variable(self, name: str, value: Any) -> None:
+    def set_variable(self, name: str, value: Any, *, publish: bool = True) -> None:
         """
         Set a variable in the context.
 
         Args:
             name: Variable name
             value: Variable value
+            publish: Publish a VARIABLE_SET event (False for per-iteration writes)
         """
         ...
 
@@ -53,6 +53,7 @@ class Job:
     error_message: str = ""
     created_at: datetime | None = None
     created_by: str = ""
+    tenant_id: str = "default"
 
     # State machine transitions
     VALID_TRANSITIONS = {
@@ -197,6 +198,7 @@ class Job:
             error_message=data.get("error_message", ""),
             created_at=parse_datetime(data.get("created_at")),
             created_by=data.get("created_by", ""),
+            tenant_id=data.get("tenant_id") or "default",
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -227,4 +229,5 @@ class Job:
             "error_message": self.error_message,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "created_by": self.created_by,
+            "tenant_id": self.tenant_id,
         }
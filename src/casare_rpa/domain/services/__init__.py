@@ -12,6 +12,7 @@ from casare_rpa.domain.services.agent_scheduler import (
 )
 from casare_rpa.domain.services.decomposition_engine import DecompositionEngine
 from casare_rpa.domain.services.execution_orchestrator import ExecutionOrchestrator
+from casare_rpa.domain.services.execution_plan import ExecutionPlan, compile_execution_plan
 from casare_rpa.domain.services.expression_evaluator import (
     ExpressionError,
     ExpressionEvaluator,
@@ -23,7 +24,10 @@ from casare_rpa.domain.services.project_context import ProjectContext
 from casare_rpa.domain.services.task_analyzer import TaskAnalyzer, WorkItem
 from casare_rpa.domain.services.variable_resolver import (
     VARIABLE_PATTERN,
+    CompiledTemplate,
+    compile_template,
     extract_variable_names,
+    has_template_markers,
     has_variables,
     resolve_dict_variables,
     resolve_variables,
@@ -41,6 +45,8 @@ from casare_rpa.domain.validation import (
 
 __all__ = [
     "ExecutionOrchestrator",
+    "ExecutionPlan",
+    "compile_execution_plan",
     "ProjectContext",
     # Parallel agent framework
     "TaskAnalyzer",
@@ -53,7 +59,10 @@ __all__ = [
     "VARIABLE_PATTERN",
     "resolve_variables",
     "resolve_dict_variables",
+    "CompiledTemplate",
+    "compile_template",
     "extract_variable_names",
+    "has_template_markers",
     "has_variables",
     # Expression evaluator (Power Automate style)
     "ExpressionEvaluator",
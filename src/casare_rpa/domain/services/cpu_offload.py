@@ -0,0 +1,80 @@
+"""
+CasareRPA - CPU Offload Binding
+
+Routes CPU-bound node work (PDF text extraction, XML parsing, archive and
+image processing) away from the event loop so heartbeats, lease extension
+and concurrent jobs keep running.
+
+Entry Points:
+    - bind_cpu_offloader(): Bind an ICpuOffloader for the current task
+    - run_cpu_bound(): Run a picklable function via the bound offloader
+
+Key Patterns:
+    - Nodes declare ``cpu_bound = True`` and call ``await self.run_cpu_bound(...)``
+      with a module-level function; NodeExecutor binds its offloader while
+      such a node executes
+    - Without a bound offloader the function runs in the default thread
+      executor, which still keeps the event loop responsive
+    - The function, its arguments and its result must be picklable
+
+Related:
+    - See domain.interfaces.cpu_offload.ICpuOffloader
+    - See infrastructure.execution.cpu_worker_pool.CpuWorkerPool
+    - See application.use_cases.node_executor (cpu_offloader)
+"""
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from casare_rpa.domain.interfaces.cpu_offload import ICpuOffloader
+
+_active_offloader: ContextVar[ICpuOffloader | None] = ContextVar(
+    "casare_cpu_offloader", default=None
+)
+
+
+def get_cpu_offloader() -> ICpuOffloader | None:
+    """Get the CPU offloader bound to the current context, if any."""
+    return _active_offloader.get()
+
+
+@contextmanager
+def bind_cpu_offloader(offloader: ICpuOffloader | None) -> Iterator[None]:
+    """
+    Bind an offloader for the current context (no-op when None).
+
+    Args:
+        offloader: Offloader used by run_cpu_bound() inside the block
+    """
+    if offloader is None:
+        yield
+        return
+    token = _active_offloader.set(offloader)
+    try:
+        yield
+    finally:
+        _active_offloader.reset(token)
+
+
+async def run_cpu_bound(func: Callable[..., Any], *args: Any, timeout: float | None = None) -> Any:
+    """
+    Run a CPU-bound function off the event loop.
+
+    Args:
+        func: Module-level (picklable) function
+        *args: Picklable positional arguments
+        timeout: Optional timeout in seconds
+
+    Returns:
+        The function result
+
+    Raises:
+        TimeoutError: If the work did not finish within timeout
+    """
+    offloader = _active_offloader.get()
+    if offloader is not None:
+        return await offloader.run(func, *args, timeout=timeout)
+    return await asyncio.wait_for(asyncio.to_thread(func, *args), timeout=timeout)
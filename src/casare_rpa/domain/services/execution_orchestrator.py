@@ -22,24 +22,12 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 from casare_rpa.domain.entities.workflow import WorkflowSchema
-from casare_rpa.domain.value_objects.types import NodeId
-
-# Pre-computed set of control flow node types (module-level constant for O(1) lookup)
-CONTROL_FLOW_TYPES = frozenset(
-    {
-        "IfNode",
-        "SwitchNode",
-        "ForLoopStartNode",
-        "ForLoopEndNode",
-        "WhileLoopStartNode",
-        "WhileLoopEndNode",
-        "BreakNode",
-        "ContinueNode",
-        "TryNode",
-        "CatchNode",
-        "RetryNode",
-    }
+from casare_rpa.domain.services.execution_plan import (
+    CONTROL_FLOW_TYPES,  # noqa: F401 - re-exported for backward compatibility
+    ExecutionPlan,
+    compile_execution_plan,
 )
+from casare_rpa.domain.value_objects.types import NodeId
 
 
 class ExecutionOrchestrator:
@@ -58,15 +46,23 @@ class ExecutionOrchestrator:
     - Emit events (that's application layer)
     """
 
-    def __init__(self, workflow: WorkflowSchema) -> None:
+    def __init__(self, workflow: WorkflowSchema, plan: ExecutionPlan | None = None) -> None:
         """
         Initialize execution orchestrator.
 
         Args:
             workflow: Workflow schema with nodes and connections
+            plan: Pre-compiled execution plan for this workflow (e.g. from
+                WorkflowCache). Compiled on the fly if not provided.
         """
         self.workflow = workflow
         self._execution_graph: dict[NodeId, list[NodeId]] | None = None
+        self._plan = plan if plan is not None else compile_execution_plan(workflow)
+
+        # Memoized body sets for pairs the plan did not pre-compute
+        # (e.g. loop-back from a node without pairing config)
+        self._loop_body_cache: dict[tuple[NodeId, NodeId], frozenset[NodeId]] = {}
+        self._try_body_cache: dict[NodeId, frozenset[NodeId]] = {}
 
         # PERFORMANCE: Build connection index maps for O(1) lookups
         # Instead of O(n) scans through all connections for every node execution
@@ -102,6 +98,11 @@ class ExecutionOrchestrator:
                 self._port_connections[port_key] = []
             self._port_connections[port_key].append(conn)
 
+    @property
+    def plan(self) -> ExecutionPlan:
+        """Compiled, immutable routing tables for the workflow."""
+        return self._plan
+
     def find_start_node(self) -> NodeId | None:
         """
         Find the workflow entry point (StartNode or TriggerNode).
@@ -209,6 +210,9 @@ class ExecutionOrchestrator:
         - Control flow (break, continue)
         - Default routing (all exec_out connections)
 
+        Routing tables come from the compiled ExecutionPlan, so this is a
+        couple of tuple/dict lookups rather than a scan of connections.
+
         Args:
             current_node_id: ID of current node
             execution_result: Result from node execution
@@ -216,56 +220,31 @@ class ExecutionOrchestrator:
         Returns:
             List of next node IDs to execute
         """
-        next_nodes: list[NodeId] = []
-
-        # Check for dynamic routing (control flow nodes return next_nodes)
-        if execution_result and "next_nodes" in execution_result:
-            next_port_names = execution_result["next_nodes"]
-            logger.debug(f"Dynamic routing from {current_node_id}: ports={next_port_names}")
-
-            # Find connections from specified ports with validation
-            for port_name in next_port_names:
-                connections = self._get_connections_from_port(current_node_id, port_name)
-
-                if not connections:
-                    # Log warning for missing connections
-                    if port_name == "exec_out":
-                        logger.debug(
-                            f"Node {current_node_id} exec_out has no connections - "
-                            f"execution path ends here"
-                        )
-                    else:
-                        logger.warning(
-                            f"Node {current_node_id} specified next port '{port_name}' "
-                            f"but no connections found. Workflow may have incomplete connections."
-                        )
-                    continue
-
-                # Add connected node IDs
-                for connection in connections:
-                    if connection.target_node not in next_nodes:
-                        next_nodes.append(connection.target_node)
-                        logger.debug(
-                            f"  Route: {current_node_id}.{port_name} -> {connection.target_node}"
-                        )
-
-            if not next_nodes and next_port_names:
-                logger.info(
-                    f"Node {current_node_id} completed with no next nodes to execute "
-                    f"(end of branch)"
-                )
-
-            return next_nodes
-
-        # Default routing: follow all exec_out connections (using pre-built index)
-        for connection in self._outgoing_connections.get(current_node_id, []):
-            # Only follow execution connections (not data connections)
-            if "exec" in connection.source_port.lower():
-                next_nodes.append(connection.target_node)
-                logger.debug(f"Exec connection: {current_node_id} -> {connection.target_node}")
+        next_nodes = self._plan.next_nodes(current_node_id, execution_result)
+
+        if not next_nodes and execution_result and execution_result.get("next_nodes"):
+            logger.info(
+                f"Node {current_node_id} completed with no next nodes to execute (end of branch)"
+            )
 
         return next_nodes
 
+    def find_target_node(self, node_id: NodeId, port_name: str) -> NodeId | None:
+        """
+        Get the first node connected to an output port.
+
+        Used by parallel strategies to find where a branch or item body starts.
+
+        Args:
+            node_id: Source node ID
+            port_name: Source port name
+
+        Returns:
+            Target node ID, or None if the port is not connected
+        """
+        targets = self._plan.port_targets(node_id, port_name)
+        return targets[0] if targets else None
+
     def _get_connections_from_port(self, node_id: NodeId, port_name: str) -> list:
         """
         Get all connections originating from a specific port.
@@ -536,11 +515,12 @@ class ExecutionOrchestrator:
         logger.debug("Workflow execution order validated: no circular dependencies")
         return True, []
 
-    def find_try_body_nodes(self, try_node_id: NodeId) -> set[NodeId]:
+    def find_try_body_nodes(self, try_node_id: NodeId) -> frozenset[NodeId]:
         """
         Find all nodes reachable from a try node's try_body output.
 
         Used to track which nodes are inside a try block for error routing.
+        Results are memoized for the lifetime of the orchestrator.
 
         Args:
             try_node_id: ID of try node
@@ -548,6 +528,14 @@ class ExecutionOrchestrator:
         Returns:
             Set of node IDs in try body
         """
+        compiled = self._plan.get_try_body(try_node_id)
+        if compiled is not None:
+            return compiled
+
+        cached = self._try_body_cache.get(try_node_id)
+        if cached is not None:
+            return cached
+
         body_nodes: set[NodeId] = set()
         queue: deque[NodeId] = deque()
 
@@ -570,7 +558,9 @@ class ExecutionOrchestrator:
                     queue.append(connection.target_node)
 
         logger.debug(f"Try {try_node_id} body: {len(body_nodes)} nodes")
-        return body_nodes
+        frozen = frozenset(body_nodes)
+        self._try_body_cache[try_node_id] = frozen
+        return frozen
 
     def get_node_type(self, node_id: NodeId) -> str:
         """
@@ -602,8 +592,7 @@ class ExecutionOrchestrator:
         - BreakNode, ContinueNode
         - TryNode, CatchNode
 
-        Uses module-level CONTROL_FLOW_TYPES frozenset for O(1) lookup
-        without recreating the set on every call.
+        Uses the compiled plan's pre-classified flags (see CONTROL_FLOW_TYPES).
 
         Args:
             node_id: Node ID
@@ -611,15 +600,16 @@ class ExecutionOrchestrator:
         Returns:
             True if node is a control flow node
         """
-        node_type = self.get_node_type(node_id)
-        return node_type in CONTROL_FLOW_TYPES
+        return self._plan.is_control_flow(node_id)
 
-    def find_loop_body_nodes(self, loop_start_id: NodeId, loop_end_id: NodeId) -> set[NodeId]:
+    def find_loop_body_nodes(self, loop_start_id: NodeId, loop_end_id: NodeId) -> frozenset[NodeId]:
         """
         Find all nodes in a loop body between start and end nodes.
 
         Used to clear executed_nodes when looping back so body nodes
-        can re-execute on each iteration.
+        can re-execute on each iteration. Called on every iteration, so
+        results are memoized per (loop_start_id, loop_end_id) for the
+        lifetime of the orchestrator.
 
         Args:
             loop_start_id: ForLoopStartNode or WhileLoopStartNode ID
@@ -628,6 +618,15 @@ class ExecutionOrchestrator:
         Returns:
             Set of node IDs that are inside the loop body
         """
+        compiled = self._plan.get_loop_body(loop_start_id, loop_end_id)
+        if compiled is not None:
+            return compiled
+
+        cache_key = (loop_start_id, loop_end_id)
+        cached = self._loop_body_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         body_nodes: set[NodeId] = set()
 
         # BFS from loop start's body port to find all reachable nodes
@@ -662,7 +661,9 @@ class ExecutionOrchestrator:
         logger.debug(
             f"Found {len(body_nodes)} loop body nodes between {loop_start_id} and {loop_end_id}"
         )
-        return body_nodes
+        frozen = frozenset(body_nodes)
+        self._loop_body_cache[cache_key] = frozen
+        return frozen
 
     def get_all_nodes(self) -> list[NodeId]:
         """
@@ -0,0 +1,354 @@
+"""
+CasareRPA - Domain Service: Execution Plan
+Compiled, immutable routing tables for a WorkflowSchema.
+
+This is a PURE domain module with NO infrastructure dependencies.
+
+The plan is produced once per workflow by compile_execution_plan() and then
+shared read-only by every execution of that workflow. It replaces per-step
+work in the execution loop (connection scans, port-name string checks,
+node-type resolution, loop/try body BFS) with tuple and dict lookups:
+
+- Nodes get dense integer ordinals; per-node data lives in tuples indexed by ordinal
+- Default exec successors are pre-filtered (data connections removed)
+- Per-port successors are pre-deduplicated for dynamic routing
+- Control-flow classification is pre-computed
+- Loop bodies (start -> end/break/continue) and try bodies are pre-computed
+"""
+
+import logging
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from casare_rpa.domain.entities.workflow import WorkflowSchema
+from casare_rpa.domain.value_objects.types import NodeId
+
+logger = logging.getLogger(__name__)
+
+# Node types that affect execution routing (re-executed on loop-back)
+CONTROL_FLOW_TYPES = frozenset(
+    {
+        "IfNode",
+        "SwitchNode",
+        "ForLoopStartNode",
+        "ForLoopEndNode",
+        "WhileLoopStartNode",
+        "WhileLoopEndNode",
+        "BreakNode",
+        "ContinueNode",
+        "TryNode",
+        "CatchNode",
+        "RetryNode",
+        # Re-queued after every chunk until its items are exhausted
+        "ParallelForEachNode",
+    }
+)
+
+# Node types that loop back to a paired loop start, and the config key holding it
+LOOP_BACK_PAIR_KEYS: Mapping[str, str] = MappingProxyType(
+    {
+        "ForLoopEndNode": "paired_start_id",
+        "WhileLoopEndNode": "paired_start_id",
+        "BreakNode": "paired_loop_start_id",
+        "ContinueNode": "paired_loop_start_id",
+    }
+)
+
+_EMPTY: tuple[NodeId, ...] = ()
+
+
+def _node_type_of(node_data: Any) -> str:
+    """Get node type from a serialized dict or a node instance."""
+    if isinstance(node_data, dict):
+        return node_data.get("node_type", "") or ""
+    return getattr(node_data, "node_type", "") or ""
+
+
+def _node_config_of(node_data: Any) -> dict[str, Any]:
+    """Get node config from a serialized dict or a node instance."""
+    if isinstance(node_data, dict):
+        config = node_data.get("config")
+    else:
+        config = getattr(node_data, "config", None)
+    return config if isinstance(config, dict) else {}
+
+
+def _dedupe(items: Iterable[NodeId]) -> tuple[NodeId, ...]:
+    """Remove duplicates while keeping first-seen order."""
+    return tuple(dict.fromkeys(items))
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionPlan:
+    """
+    Immutable routing tables compiled from a WorkflowSchema.
+
+    Attributes:
+        node_ids: Node IDs in ordinal order
+        index: Node ID -> ordinal
+        node_types: Node type per ordinal
+        control_flow: Control-flow flag per ordinal
+        exec_successors: Default (exec port) successors per ordinal
+        port_successors: (ordinal, port name) -> deduplicated successors
+        loop_bodies: (loop start ID, loop-back node ID) -> loop body node IDs
+        try_bodies: Try node ID -> try body node IDs
+    """
+
+    node_ids: tuple[NodeId, ...]
+    index: Mapping[NodeId, int]
+    node_types: tuple[str, ...]
+    control_flow: tuple[bool, ...]
+    exec_successors: tuple[tuple[NodeId, ...], ...]
+    port_successors: Mapping[tuple[int, str], tuple[NodeId, ...]]
+    loop_bodies: Mapping[tuple[NodeId, NodeId], frozenset[NodeId]]
+    try_bodies: Mapping[NodeId, frozenset[NodeId]]
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.index
+
+    def get_node_type(self, node_id: NodeId) -> str:
+        """Get the node type, or empty string for unknown nodes."""
+        ordinal = self.index.get(node_id)
+        return "" if ordinal is None else self.node_types[ordinal]
+
+    def is_control_flow(self, node_id: NodeId) -> bool:
+        """Check whether a node is a control-flow node."""
+        ordinal = self.index.get(node_id)
+        return ordinal is not None and self.control_flow[ordinal]
+
+    def port_targets(self, node_id: NodeId, port_name: str) -> tuple[NodeId, ...]:
+        """Get the deduplicated targets connected to a node's output port."""
+        ordinal = self.index.get(node_id)
+        if ordinal is None:
+            return _EMPTY
+        return self.port_successors.get((ordinal, port_name), _EMPTY)
+
+    def next_nodes(
+        self, node_id: NodeId, execution_result: dict[str, Any] | None = None
+    ) -> list[NodeId]:
+        """
+        Resolve next nodes to execute after node_id.
+
+        Same semantics as ExecutionOrchestrator.get_next_nodes():
+        "next_nodes" in the result selects output ports (dynamic routing),
+        otherwise all exec connections are followed.
+
+        Args:
+            node_id: ID of the node that just executed
+            execution_result: Result returned by the node
+
+        Returns:
+            List of next node IDs
+        """
+        ordinal = self.index.get(node_id)
+        if ordinal is None:
+            return []
+
+        if execution_result and "next_nodes" in execution_result:
+            port_names = execution_result["next_nodes"]
+            if not port_names:
+                return []
+            port_successors = self.port_successors
+            if len(port_names) == 1:
+                port_name = port_names[0]
+                targets = port_successors.get((ordinal, port_name), _EMPTY)
+                if not targets and port_name != "exec_out":
+                    self._warn_unconnected_port(node_id, port_name)
+                return list(targets)
+
+            next_ids: dict[NodeId, None] = {}
+            for port_name in port_names:
+                targets = port_successors.get((ordinal, port_name), _EMPTY)
+                if not targets:
+                    if port_name != "exec_out":
+                        self._warn_unconnected_port(node_id, port_name)
+                    continue
+                for target in targets:
+                    next_ids[target] = None
+            return list(next_ids)
+
+        return list(self.exec_successors[ordinal])
+
+    def get_loop_body(self, loop_start_id: NodeId, loop_end_id: NodeId) -> frozenset[NodeId] | None:
+        """Get a pre-computed loop body, or None if the pair was not compiled."""
+        return self.loop_bodies.get((loop_start_id, loop_end_id))
+
+    def get_try_body(self, try_node_id: NodeId) -> frozenset[NodeId] | None:
+        """Get a pre-computed try body, or None if the node is not a compiled TryNode."""
+        return self.try_bodies.get(try_node_id)
+
+    @staticmethod
+    def _warn_unconnected_port(node_id: NodeId, port_name: str) -> None:
+        logger.warning(
+            f"Node {node_id} specified next port '{port_name}' "
+            f"but no connections found. Workflow may have incomplete connections."
+        )
+
+
+def collect_loop_body(
+    loop_start_id: NodeId,
+    loop_end_id: NodeId,
+    port_targets: Mapping[tuple[NodeId, str], Iterable[NodeId]],
+    successors: Mapping[NodeId, Iterable[NodeId]],
+) -> set[NodeId]:
+    """
+    BFS the nodes between a loop start's "body" port and a loop-back node.
+
+    Args:
+        loop_start_id: ForLoopStartNode or WhileLoopStartNode ID
+        loop_end_id: Node that loops back (end, break or continue)
+        port_targets: (node ID, port name) -> target node IDs
+        successors: Node ID -> all target node IDs
+
+    Returns:
+        Set of node IDs inside the loop body (loop_end_id excluded)
+    """
+    body_nodes: set[NodeId] = set()
+    queue: deque[NodeId] = deque()
+
+    # Note: ForLoopStartNode and WhileLoopStartNode use "body" as port name
+    for target in port_targets.get((loop_start_id, "body"), _EMPTY):
+        queue.append(target)
+        body_nodes.add(target)
+
+    while queue:
+        current = queue.popleft()
+
+        # Don't traverse past loop end
+        if current == loop_end_id:
+            continue
+
+        for target in successors.get(current, _EMPTY):
+            if target not in body_nodes:
+                body_nodes.add(target)
+                queue.append(target)
+
+    body_nodes.discard(loop_end_id)
+    return body_nodes
+
+
+def collect_try_body(
+    try_node_id: NodeId,
+    port_targets: Mapping[tuple[NodeId, str], Iterable[NodeId]],
+    successors: Mapping[NodeId, Iterable[NodeId]],
+) -> set[NodeId]:
+    """
+    BFS all nodes reachable from a try node's "try_body" port.
+
+    Args:
+        try_node_id: ID of try node
+        port_targets: (node ID, port name) -> target node IDs
+        successors: Node ID -> all target node IDs
+
+    Returns:
+        Set of node IDs in try body
+    """
+    body_nodes: set[NodeId] = set()
+    queue: deque[NodeId] = deque(port_targets.get((try_node_id, "try_body"), _EMPTY))
+
+    while queue:
+        node_id = queue.popleft()
+
+        if node_id == try_node_id or node_id in body_nodes:
+            continue
+
+        body_nodes.add(node_id)
+
+        for target in successors.get(node_id, _EMPTY):
+            if target != try_node_id:
+                queue.append(target)
+
+    return body_nodes
+
+
+def compile_execution_plan(workflow: WorkflowSchema) -> ExecutionPlan:
+    """
+    Compile a workflow into an immutable ExecutionPlan.
+
+    Runs in O(nodes + connections) plus one BFS per loop-back node and per
+    TryNode. The result is safe to share between concurrent executions.
+
+    Args:
+        workflow: Workflow schema with nodes (dicts or instances) and connections
+
+    Returns:
+        Compiled ExecutionPlan
+    """
+    # Ordinals: workflow nodes first, then any dangling connection endpoints
+    node_ids: list[NodeId] = list(workflow.nodes)
+    index: dict[NodeId, int] = {node_id: i for i, node_id in enumerate(node_ids)}
+    for conn in workflow.connections:
+        for endpoint in (conn.source_node, conn.target_node):
+            if endpoint not in index:
+                index[endpoint] = len(node_ids)
+                node_ids.append(endpoint)
+
+    node_types = tuple(_node_type_of(workflow.nodes.get(node_id)) for node_id in node_ids)
+    control_flow = tuple(node_type in CONTROL_FLOW_TYPES for node_type in node_types)
+
+    exec_successors: list[list[NodeId]] = [[] for _ in node_ids]
+    successors: dict[NodeId, list[NodeId]] = {}
+    port_targets: dict[tuple[NodeId, str], list[NodeId]] = {}
+
+    for conn in workflow.connections:
+        source, target, port = conn.source_node, conn.target_node, conn.source_port
+        successors.setdefault(source, []).append(target)
+        port_targets.setdefault((source, port), []).append(target)
+        # Only follow execution connections (not data connections) by default
+        if "exec" in port.lower():
+            exec_successors[index[source]].append(target)
+
+    port_successors = {
+        (index[source], port): _dedupe(targets) for (source, port), targets in port_targets.items()
+    }
+
+    loop_bodies: dict[tuple[NodeId, NodeId], frozenset[NodeId]] = {}
+    try_bodies: dict[NodeId, frozenset[NodeId]] = {}
+    for node_id, node_type in zip(node_ids, node_types, strict=True):
+        if node_type == "TryNode":
+            try_bodies[node_id] = frozenset(collect_try_body(node_id, port_targets, successors))
+            continue
+
+        pair_key = LOOP_BACK_PAIR_KEYS.get(node_type)
+        if pair_key is None:
+            continue
+        node_data = workflow.nodes.get(node_id)
+        loop_start_id = _node_config_of(node_data).get(pair_key)
+        if not loop_start_id and not isinstance(node_data, dict):
+            # Node instances mirror the pairing config as an attribute
+            loop_start_id = getattr(node_data, pair_key, "")
+        if loop_start_id and loop_start_id in index:
+            loop_bodies[(loop_start_id, node_id)] = frozenset(
+                collect_loop_body(loop_start_id, node_id, port_targets, successors)
+            )
+
+    logger.debug(
+        f"Compiled execution plan: {len(node_ids)} nodes, "
+        f"{len(loop_bodies)} loop bodies, {len(try_bodies)} try bodies"
+    )
+
+    return ExecutionPlan(
+        node_ids=tuple(node_ids),
+        index=MappingProxyType(index),
+        node_types=node_types,
+        control_flow=control_flow,
+        exec_successors=tuple(tuple(targets) for targets in exec_successors),
+        port_successors=MappingProxyType(port_successors),
+        loop_bodies=MappingProxyType(loop_bodies),
+        try_bodies=MappingProxyType(try_bodies),
+    )
+
+
+__all__ = [
+    "CONTROL_FLOW_TYPES",
+    "ExecutionPlan",
+    "collect_loop_body",
+    "collect_try_body",
+    "compile_execution_plan",
+]
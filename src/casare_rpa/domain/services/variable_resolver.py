@@ -3,10 +3,15 @@ Variable Resolution Utility for CasareRPA.
 
 Provides functionality to resolve {{variable_name}} patterns in strings
 with actual variable values from the execution context.
+
+Templates are compiled once per distinct string (see compile_template) into
+literal chunks and pre-split variable references, so repeated resolution
+inside loops does no regex work.
 """
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -60,71 +65,191 @@ def _resolve_system_variable(name: str) -> Any:
     return system_vars.get(name)
 
 
-def _resolve_nested_path(path: str, variables: dict[str, Any]) -> Any:
+# Maximum number of distinct template strings kept compiled
+TEMPLATE_CACHE_SIZE = 4096
+
+_MARKERS = ("{{", "${", "%")
+
+
+def has_template_markers(value: str) -> bool:
     """
-    Resolve a nested path like "node.output" or "data.field[0].name".
+    Cheap substring check for any variable syntax marker.
 
-    Args:
-        path: Path string like "read.content" or "users[0].name"
-        variables: Dict of variable name -> value
+    Strings without a marker can never contain a variable, so callers use
+    this to skip compile_template() and keep plain strings out of its cache.
+    """
+    return any(marker in value for marker in _MARKERS)
 
-    Returns:
-        The resolved value, or None if not found
+
+class VariableRef:
+    """
+    A single pre-parsed variable reference inside a template.
+
+    The dotted/indexed path is split once at compile time into a root
+    name and accessor segments (str = key access, int = list index).
     """
-    if "." not in path and "[" not in path:
-        # Simple variable, no nesting
-        return variables.get(path)
-
-    # Split the path into root and remainder
-    # For "read.content", root = "read", remainder = ".content"
-    first_dot = path.find(".")
-    first_bracket = path.find("[")
-
-    if first_dot == -1 and first_bracket == -1:
-        return variables.get(path)
-
-    # Find the first separator
-    if first_dot == -1:
-        split_pos = first_bracket
-    elif first_bracket == -1:
-        split_pos = first_dot
-    else:
-        split_pos = min(first_dot, first_bracket)
-
-    root = path[:split_pos]
-    remainder = path[split_pos:]
-
-    # Get the root object
-    if root not in variables:
-        return None
-
-    current = variables[root]
-
-    # Navigate the path
-    for match in PATH_SEGMENT_PATTERN.finditer(remainder):
-        if current is None:
-            return None
-
-        key = match.group(1)  # .key accessor
-        index = match.group(2)  # [index] accessor
-
-        if key is not None:
-            # Dict access
-            if isinstance(current, dict):
-                current = current.get(key)
-            elif hasattr(current, key):
-                current = getattr(current, key)
+
+    __slots__ = ("path", "root", "segments", "source", "is_system")
+
+    def __init__(self, path: str, source: str) -> None:
+        self.path = path
+        self.source = source
+        self.is_system = path.startswith("$")
+
+        split_pos = len(path)
+        for separator in (".", "["):
+            pos = path.find(separator)
+            if pos != -1 and pos < split_pos:
+                split_pos = pos
+        self.root = path[:split_pos]
+
+        segments: list[str | int] = []
+        for match in PATH_SEGMENT_PATTERN.finditer(path[split_pos:]):
+            key, index = match.group(1), match.group(2)
+            segments.append(key if key is not None else int(index))
+        self.segments: tuple[str | int, ...] = tuple(segments)
+
+    def lookup(self, variables: dict[str, Any]) -> tuple[bool, Any]:
+        """
+        Resolve the reference against variables.
+
+        Same precedence as resolve_variables(): system variable, direct
+        lookup of the full path, then nested path navigation.
+
+        Returns:
+            Tuple of (found, value). A direct hit may legitimately be None.
+        """
+        if self.is_system:
+            resolved = _resolve_system_variable(self.path)
+            if resolved is not None:
+                return True, resolved
+
+        path = self.path
+        if path in variables:
+            return True, variables[path]
+
+        if not self.segments or self.root not in variables:
+            return False, None
+
+        current = variables[self.root]
+        for segment in self.segments:
+            if current is None:
+                return False, None
+            if isinstance(segment, int):
+                if isinstance(current, list | tuple) and 0 <= segment < len(current):
+                    current = current[segment]
+                else:
+                    return False, None
+            elif isinstance(current, dict):
+                current = current.get(segment)
+            elif hasattr(current, segment):
+                current = getattr(current, segment)
             else:
-                return None
-        elif index is not None:
-            # List access
-            idx = int(index)
-            if isinstance(current, list | tuple) and 0 <= idx < len(current):
-                current = current[idx]
+                return False, None
+
+        return current is not None, current
+
+
+class CompiledTemplate:
+    """
+    A template string parsed once into literal chunks and variable references.
+
+    Attributes:
+        raw: Original template string
+        single: Reference when the whole (stripped) string is one variable;
+            rendering then preserves the value's type
+        parts: Literal strings and VariableRef objects in order
+    """
+
+    __slots__ = ("raw", "single", "parts")
+
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+        self.single: VariableRef | None = None
+        self.parts: tuple[str | VariableRef, ...] = ()
+
+        if not has_template_markers(raw):
+            return
+
+        stripped = raw.strip()
+        for pattern in SINGLE_VAR_PATTERNS:
+            match = pattern.match(stripped)
+            if match:
+                self.single = VariableRef(match.group(1), raw)
+                return
+
+        parts: list[str | VariableRef] = []
+        last = 0
+        for match in VARIABLE_PATTERN.finditer(raw):
+            var_path = match.group(1) or match.group(2) or match.group(3)
+            if not var_path:
+                continue
+            if match.start() > last:
+                parts.append(raw[last : match.start()])
+            parts.append(VariableRef(var_path, match.group(0)))
+            last = match.end()
+        if parts:
+            if last < len(raw):
+                parts.append(raw[last:])
+            self.parts = tuple(parts)
+
+    @property
+    def has_variables(self) -> bool:
+        """True if the template references at least one variable."""
+        return self.single is not None or bool(self.parts)
+
+    @property
+    def variable_paths(self) -> list[str]:
+        """Referenced variable paths in order of appearance."""
+        if self.single is not None:
+            return [self.single.path]
+        return [part.path for part in self.parts if isinstance(part, VariableRef)]
+
+    def render(self, variables: dict[str, Any]) -> Any:
+        """
+        Resolve the template against variables.
+
+        Returns:
+            The raw value for single-variable templates (type preserved),
+            otherwise the interpolated string. Unresolved references are
+            left as written.
+        """
+        single = self.single
+        if single is not None:
+            found, resolved = single.lookup(variables)
+            if found:
+                return resolved
+            logger.warning(f"Variable '{single.path}' not found")
+            return self.raw
+
+        if not self.parts:
+            return self.raw
+
+        chunks: list[str] = []
+        for part in self.parts:
+            if part.__class__ is str:
+                chunks.append(part)  # type: ignore[arg-type]
+                continue
+            found, resolved = part.lookup(variables)  # type: ignore[union-attr]
+            if found:
+                chunks.append("" if resolved is None else str(resolved))
             else:
-                return None
+                chunks.append(part.source)  # type: ignore[union-attr]
+        return "".join(chunks)
 
-    return current
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Compile a template string, memoized by the raw string.
+
+    Args:
+        template: String potentially containing variable patterns
+
+    Returns:
+        CompiledTemplate (shared; treat as immutable)
+    """
+    return CompiledTemplate(template)
 
 
 def resolve_variables(value: Any, variables: dict[str, Any]) -> Any:
@@ -153,67 +278,10 @@ def resolve_variables(value: Any, variables: dict[str, Any]) -> Any:
         return value
 
     # Fast path check for any of the supported markers
-    if not any(marker in value for marker in ("{{", "${", "%")):
-        return value
-
-    # Check if the entire value is a single variable reference
-    # This allows preserving the original type (bool, int, dict, etc.)
-    stripped = value.strip()
-    var_path = None
-
-    for pattern in SINGLE_VAR_PATTERNS:
-        match = pattern.match(stripped)
-        if match:
-            var_path = match.group(1)
-            break
-
-    if var_path:
-        # Check system variables first (e.g., $currentDate)
-        if var_path.startswith("$"):
-            resolved = _resolve_system_variable(var_path)
-            if resolved is not None:
-                return resolved
-
-        # Try direct lookup first
-        if var_path in variables:
-            return variables[var_path]
-
-        # Try nested path resolution
-        resolved = _resolve_nested_path(var_path, variables)
-        if resolved is not None:
-            return resolved
-
-        # Variable not found - return original string
-        logger.warning(f"Variable '{var_path}' not found")
+    if not has_template_markers(value):
         return value
 
-    # Multiple variables or text around variable - do string replacement
-    def replace_match(match: re.Match) -> str:
-        # Find which group matched (1, 2, or 3)
-        var_path = match.group(1) or match.group(2) or match.group(3)
-        if not var_path:
-            return match.group(0)
-
-        # Check system variables first
-        if var_path.startswith("$"):
-            resolved = _resolve_system_variable(var_path)
-            if resolved is not None:
-                return str(resolved)
-
-        # Try direct lookup
-        if var_path in variables:
-            resolved = variables[var_path]
-            return str(resolved) if resolved is not None else ""
-
-        # Try nested path resolution
-        resolved = _resolve_nested_path(var_path, variables)
-        if resolved is not None:
-            return str(resolved)
-
-        # Keep original if variable not found
-        return match.group(0)
-
-    return VARIABLE_PATTERN.sub(replace_match, value)
+    return compile_template(value).render(variables)
 
 
 def resolve_any(value: Any, variables: dict[str, Any]) -> Any:
@@ -19,11 +19,25 @@ class Port:
 
     This is a value object - once created, its core properties are immutable.
     Only the value can be changed during workflow execution.
+
+    Once added to a node, the value is not stored on the port itself but in
+    the owning node's run state at the port's ordinal (see
+    domain.entities.node_run_state), so a port definition can be shared by
+    concurrent executions.
     """
 
     # PERFORMANCE: __slots__ reduces memory per instance by ~40%
     # With many nodes each having multiple ports, this adds up significantly
-    __slots__ = ("_name", "_port_type", "_data_type", "_label", "_required", "value")
+    __slots__ = (
+        "_name",
+        "_port_type",
+        "_data_type",
+        "_label",
+        "_required",
+        "_value",
+        "_owner",
+        "_ordinal",
+    )
 
     def __init__(
         self,
@@ -54,8 +68,10 @@ class Port:
         self._label = label or name
         self._required = required
 
-        # Mutable state (value can change during execution)
-        self.value: Any = None
+        # Value storage for ports not (yet) attached to a node
+        self._value: Any = None
+        self._owner: Any = None
+        self._ordinal: int = -1
 
     @staticmethod
     def _validate_name(name: str) -> None:
@@ -95,6 +111,38 @@ class Port:
         """Check if port is required (immutable)."""
         return self._required
 
+    def bind(self, owner: Any, ordinal: int) -> None:
+        """
+        Attach the port to a node so its value lives in the node's run state.
+
+        Args:
+            owner: Node exposing ``_run_state`` (a NodeRunState)
+            ordinal: Index of this port in the node's port value storage
+        """
+        value = self._value
+        self._owner = owner
+        self._ordinal = ordinal
+        self._value = None
+        if value is not None:
+            owner._run_state.set_port_value(ordinal, value)
+
+    @property
+    def value(self) -> Any:
+        """Get the port's value for the current execution."""
+        owner = self._owner
+        if owner is None:
+            return self._value
+        return owner._run_state.get_port_value(self._ordinal)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        """Set the port's value for the current execution."""
+        owner = self._owner
+        if owner is None:
+            self._value = value
+        else:
+            owner._run_state.set_port_value(self._ordinal, value)
+
     def set_value(self, value: Any) -> None:
         """Set the port's value."""
         self.value = value
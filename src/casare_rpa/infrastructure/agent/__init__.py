@@ -6,6 +6,7 @@ Provides execution infrastructure for workflow jobs.
 Components:
     JobExecutor: Workflow execution engine with progress tracking
     HeartbeatService: System metrics and heartbeat monitoring
+    ProgressAggregator: Coalesced, batched job progress reporting
 
 For the main RobotAgent, import from casare_rpa.robot.agent directly:
     from casare_rpa.robot.agent import RobotAgent, RobotConfig
@@ -17,6 +18,7 @@ from casare_rpa.infrastructure.agent.job_executor import (
     JobExecutionResult,
     JobExecutor,
 )
+from casare_rpa.infrastructure.agent.progress_aggregator import ProgressAggregator
 
 __all__ = [
     # Execution
@@ -25,4 +27,5 @@ __all__ = [
     "JobExecutionResult",
     # Services
     "HeartbeatService",
+    "ProgressAggregator",
 ]
@@ -58,6 +58,8 @@ class JobExecutor:
         continue_on_error: bool = False,
         job_timeout: float = 3600.0,
         node_timeout: float = 120.0,
+        cpu_offloader: Any | None = None,
+        workflow_blob_fetcher: Callable[[str], Awaitable[str | None]] | None = None,
     ):
         """
         Initialize job executor.
@@ -67,16 +69,127 @@ class JobExecutor:
             continue_on_error: Continue workflow execution on node errors
             job_timeout: Maximum execution time in seconds (default: 1 hour)
             node_timeout: Maximum execution time per node in seconds (default: 2 minutes)
+            cpu_offloader: Worker pool for cpu_bound nodes (default: the shared
+                CpuWorkerPool, whose processes start on first use)
+            workflow_blob_fetcher: Async callback(content_hash) returning the
+                workflow JSON of a content-addressed workflow blob, used for
+                jobs that reference their workflow by hash
         """
         self.progress_callback = progress_callback
         self.continue_on_error = continue_on_error
         self.job_timeout = job_timeout
         self.node_timeout = node_timeout
+        self._cpu_offloader = cpu_offloader
+        self._owns_cpu_pool = False
+        self._workflow_blob_fetcher = workflow_blob_fetcher
 
         # Track active executions
         self._active_jobs: dict[str, asyncio.Task] = {}
         self._job_results: dict[str, dict[str, Any]] = {}
 
+    def _get_cpu_offloader(self) -> Any:
+        """Get the worker pool used for cpu_bound nodes."""
+        if self._cpu_offloader is None:
+            from casare_rpa.infrastructure.execution.cpu_worker_pool import (
+                get_cpu_worker_pool,
+            )
+
+            self._cpu_offloader = get_cpu_worker_pool()
+            self._owns_cpu_pool = True
+        return self._cpu_offloader
+
+    def shutdown(self) -> None:
+        """
+        Release executor resources.
+
+        Shuts down the shared CPU worker pool if this executor started it;
+        an injected cpu_offloader is left to its owner.
+        """
+        if self._owns_cpu_pool:
+            from casare_rpa.infrastructure.execution.cpu_worker_pool import (
+                reset_cpu_worker_pool,
+            )
+
+            reset_cpu_worker_pool()
+            self._owns_cpu_pool = False
+        self._cpu_offloader = None
+
+    async def load_workflow(
+        self,
+        workflow_json: str | dict[str, Any] | None,
+        workflow_hash: str | None = None,
+    ) -> tuple[Any, Any | None]:
+        """
+        Load a job's workflow and its compiled execution plan.
+
+        Jobs stored as content-addressed blobs carry workflow_hash and no
+        inline JSON. A workflow already cached under that hash is returned
+        without fetching or parsing anything; otherwise the blob is fetched,
+        verified against the hash, loaded and linked in the cache.
+
+        Args:
+            workflow_json: Inline workflow definition (str or dict), may be empty
+                for blob-backed jobs
+            workflow_hash: SHA-256 content hash of the workflow blob (optional)
+
+        Returns:
+            Tuple of (WorkflowSchema, ExecutionPlan or None)
+
+        Raises:
+            JobExecutionError: If the workflow cannot be resolved or parsed
+        """
+        from casare_rpa.infrastructure.caching.workflow_cache import (
+            get_workflow_cache,
+        )
+        from casare_rpa.utils.workflow.workflow_loader import (
+            load_workflow_from_dict,
+        )
+
+        cache = get_workflow_cache()
+        if workflow_hash:
+            workflow = cache.get_by_content_hash(workflow_hash)
+            if workflow is not None:
+                return workflow, cache.get_plan_for(workflow)
+            if not workflow_json:
+                workflow_json = await self._fetch_workflow_blob(workflow_hash)
+
+        if isinstance(workflow_json, str):
+            try:
+                workflow_dict = json.loads(workflow_json)
+            except json.JSONDecodeError as e:
+                raise JobExecutionError(f"Invalid workflow JSON: {e}") from e
+        elif isinstance(workflow_json, dict):
+            workflow_dict = workflow_json
+        else:
+            raise JobExecutionError(f"workflow_json must be str or dict, got {type(workflow_json)}")
+
+        workflow = load_workflow_from_dict(workflow_dict)
+        if workflow_hash:
+            cache.link_content_hash(workflow_hash, workflow)
+        return workflow, cache.get_plan_for(workflow)
+
+    async def _fetch_workflow_blob(self, workflow_hash: str) -> str:
+        """Fetch a workflow blob and verify it matches its content hash."""
+        from casare_rpa.infrastructure.queue.workflow_blobs import (
+            workflow_content_hash,
+        )
+
+        if self._workflow_blob_fetcher is None:
+            raise JobExecutionError(
+                f"Job references workflow blob {workflow_hash[:12]} but no blob fetcher is configured"
+            )
+        try:
+            workflow_json = await self._workflow_blob_fetcher(workflow_hash)
+        except Exception as e:
+            raise JobExecutionError(
+                f"Failed to fetch workflow blob {workflow_hash[:12]}: {e}"
+            ) from e
+        if workflow_json is None:
+            raise JobExecutionError(f"Workflow blob {workflow_hash[:12]} not found")
+        if workflow_content_hash(workflow_json) != workflow_hash:
+            raise JobExecutionError(f"Workflow blob {workflow_hash[:12]} failed hash verification")
+        return workflow_json
+
     async def execute(
         self,
         job_data: dict[str, Any],
@@ -89,6 +202,8 @@ class JobExecutor:
             job_data: Job data containing:
                 - job_id: Unique job identifier
                 - workflow_json: Serialized workflow definition (str or dict)
+                - workflow_hash: Content hash of a workflow blob (optional,
+                  replaces workflow_json for blob-backed jobs)
                 - workflow_name: Name of the workflow
                 - priority: Job priority (optional)
                 - payload: Additional job payload (optional)
@@ -123,30 +238,15 @@ class JobExecutor:
         }
 
         try:
-            # Parse workflow JSON
-            workflow_json = job_data.get("workflow_json", "{}")
-            if isinstance(workflow_json, str):
-                try:
-                    workflow_dict = json.loads(workflow_json)
-                except json.JSONDecodeError as e:
-                    raise JobExecutionError(f"Invalid workflow JSON: {e}") from e
-            elif isinstance(workflow_json, dict):
-                workflow_dict = workflow_json
-            else:
-                raise JobExecutionError(
-                    f"workflow_json must be str or dict, got {type(workflow_json)}"
-                )
-
             # Report initial progress
             await self._report_progress(job_id, 0, "Loading workflow...")
 
-            # Load workflow using workflow loader
-            from casare_rpa.utils.workflow.workflow_loader import (
-                load_workflow_from_dict,
+            # Load workflow (from the cache by content hash when possible)
+            workflow, execution_plan = await self.load_workflow(
+                job_data.get("workflow_json", "{}"),
+                job_data.get("workflow_hash"),
             )
 
-            workflow = load_workflow_from_dict(workflow_dict)
-
             await self._report_progress(job_id, 5, "Workflow loaded, starting execution...")
 
             # Merge job payload into initial variables
@@ -187,6 +287,11 @@ class JobExecutor:
                 event_bus=event_bus,
                 settings=settings,
                 initial_variables=combined_variables,
+                execution_plan=execution_plan,
+                # Cached node instances are shared with concurrent jobs
+                isolate_node_state=True,
+                # Keep CPU-heavy nodes off the loop that runs heartbeats/leases
+                cpu_offloader=self._get_cpu_offloader(),
             )
 
             # Execute with timeout
@@ -268,6 +373,7 @@ class JobExecutor:
         initial_variables: dict[str, Any] | None = None,
         wait_for_result: bool = True,
         on_progress: Callable[[int, str], Awaitable[None]] | None = None,
+        workflow_hash: str | None = None,
     ) -> JobExecutionResult:
         """
         Execute a workflow with DBOS-like semantics.
@@ -281,6 +387,7 @@ class JobExecutor:
             initial_variables: Initial execution variables
             wait_for_result: Wait for execution to complete (always True for now)
             on_progress: Optional callback for progress updates (progress%, node_id)
+            workflow_hash: Content hash of the workflow blob, for blob-backed jobs
 
         Returns:
             JobExecutionResult with execution outcome
@@ -312,6 +419,7 @@ class JobExecutor:
             job_data = {
                 "job_id": workflow_id,
                 "workflow_json": workflow_json,
+                "workflow_hash": workflow_hash,
                 "workflow_name": f"Job-{workflow_id[:8]}",
             }
 
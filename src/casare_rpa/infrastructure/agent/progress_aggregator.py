@@ -0,0 +1,190 @@
+"""
+Progress Aggregator for Robot Agent.
+
+Coalesces per-node job progress callbacks into periodic batched writes.
+Only the latest progress per job is kept; pending updates are flushed in a
+single call every flush interval, immediately when a job's progress moved by
+at least the delta threshold since its last write, and on demand when a job
+finishes so its final state is never lost.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from loguru import logger
+
+from casare_rpa.infrastructure.queue.types import ProgressUpdate
+
+
+class ProgressAggregator:
+    """
+    Latest-value-wins buffer for job progress updates.
+
+    Attributes:
+        flush_interval: Seconds between periodic flushes
+        min_delta_percent: Progress change that triggers an immediate flush
+        on_flush: Async callback receiving one batch of (job_id, progress, current_node)
+    """
+
+    def __init__(
+        self,
+        on_flush: Callable[[list[ProgressUpdate]], Awaitable[Any]],
+        flush_interval: float = 1.0,
+        min_delta_percent: int = 10,
+    ):
+        """
+        Initialize progress aggregator.
+
+        Args:
+            on_flush: Async callback that writes a batch of progress updates
+            flush_interval: Seconds between periodic flushes (default: 1.0)
+            min_delta_percent: Flush immediately once a job's progress moved by
+                this many percent since its last write (default: 10)
+        """
+        self.on_flush = on_flush
+        self.flush_interval = flush_interval
+        self.min_delta_percent = min_delta_percent
+
+        self._pending: dict[str, ProgressUpdate] = {}
+        self._last_written: dict[str, int] = {}
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._running = False
+        self._task: asyncio.Task | None = None
+
+        # Metrics
+        self._recorded = 0
+        self._suppressed = 0
+        self._written = 0
+        self._flushes = 0
+        self._failures = 0
+
+    def record(self, job_id: str, progress: int, current_node: str = "") -> None:
+        """
+        Record the latest progress of a job.
+
+        Replaces any unflushed update for the same job.
+
+        Args:
+            job_id: Job identifier
+            progress: Progress percentage (0-100)
+            current_node: Currently executing node ID
+        """
+        self._recorded += 1
+        if job_id in self._pending:
+            self._suppressed += 1
+        self._pending[job_id] = (job_id, progress, current_node)
+
+        if abs(progress - self._last_written.get(job_id, 0)) >= self.min_delta_percent:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """
+        Write all pending updates in one batch.
+
+        Failed batches are put back (unless newer updates arrived meanwhile)
+        and retried on the next flush.
+
+        Returns:
+            Number of updates written
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch = list(self._pending.values())
+            self._pending.clear()
+
+            try:
+                await self.on_flush(batch)
+            except Exception as e:
+                self._failures += 1
+                for update in batch:
+                    self._pending.setdefault(update[0], update)
+                logger.warning(f"Failed to flush {len(batch)} progress update(s): {e}")
+                return 0
+
+            for job_id, progress, _ in batch:
+                self._last_written[job_id] = progress
+            self._written += len(batch)
+            self._flushes += 1
+            return len(batch)
+
+    async def flush_job(self, job_id: str) -> None:
+        """
+        Flush a finished job's final progress and forget the job.
+
+        Any other pending updates ride along in the same batch.
+
+        Args:
+            job_id: Job identifier
+        """
+        if job_id in self._pending:
+            await self.flush()
+        self.forget(job_id)
+
+    def forget(self, job_id: str) -> None:
+        """Drop all state for a job without writing it."""
+        self._pending.pop(job_id, None)
+        self._last_written.pop(job_id, None)
+
+    async def start(self) -> None:
+        """Start the periodic flush loop."""
+        if self._running:
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.debug(
+            f"Progress aggregator started (interval: {self.flush_interval}s, "
+            f"delta: {self.min_delta_percent}%)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write anything still pending."""
+        self._running = False
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        """Flush on interval, or early when a job crosses the delta threshold."""
+        while self._running:
+            try:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Progress flush loop error: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get aggregator statistics.
+
+        Returns:
+            Dictionary with recorded, written, suppressed, pending, flushes and
+            failures counters
+        """
+        return {
+            "recorded": self._recorded,
+            "written": self._written,
+            "suppressed": self._suppressed,
+            "pending": len(self._pending),
+            "flushes": self._flushes,
+            "failures": self._failures,
+        }
+
+
+__all__ = ["ProgressAggregator"]
@@ -3,6 +3,13 @@ Workflow Cache for CasareRPA.
 
 Caches parsed workflow schemas to avoid redundant parsing.
 Uses content fingerprinting for cache invalidation.
+
+Each cached schema can carry its compiled ExecutionPlan so repeated
+executions of the same workflow skip routing compilation as well.
+
+Queued jobs that reference a workflow blob by content hash can be resolved
+straight from the cache (get_by_content_hash) without fetching or parsing
+the workflow JSON at all.
 """
 
 import hashlib
@@ -19,20 +26,34 @@ class WorkflowCache:
     LRU cache for parsed workflow schemas.
 
     Cache key: SHA-256 hash of workflow JSON content (first 16 chars)
-    Cache value: Parsed WorkflowSchema
+    Cache value: Parsed WorkflowSchema (plus optional compiled ExecutionPlan)
 
-    Thread-safe with configurable max size.
+    Thread-safe with configurable max size. Memory is bounded by entry count
+    and by max_bytes, measured as the serialized size of each workflow (a
+    proxy for the size of its parsed form).
     """
 
-    def __init__(self, max_size: int = 20) -> None:
+    def __init__(self, max_size: int = 20, max_bytes: int = 256 * 1024 * 1024) -> None:
         """
         Initialize workflow cache.
 
         Args:
             max_size: Maximum number of workflows to cache (default 20)
+            max_bytes: Maximum total serialized size of cached workflows (default 256 MB)
         """
         self._max_size = max_size
+        self._max_bytes = max_bytes
         self._cache: OrderedDict[str, Any] = OrderedDict()
+        # Compiled execution plans, evicted together with their workflow
+        self._plans: dict[str, Any] = {}
+        # id(workflow) -> fingerprint (valid while the workflow is cached)
+        self._fingerprints_by_workflow: dict[int, str] = {}
+        # Serialized size per fingerprint, and their total
+        self._sizes: dict[str, int] = {}
+        self._total_bytes = 0
+        # Workflow blob content hash -> fingerprint, and the reverse for eviction
+        self._content_hashes: dict[str, str] = {}
+        self._content_hashes_by_fingerprint: dict[str, set[str]] = {}
         self._lock = threading.RLock()
         self._hits = 0
         self._misses = 0
@@ -54,12 +75,25 @@ class WorkflowCache:
         Returns:
             16-character hex fingerprint
         """
+        return WorkflowCache.fingerprint_with_size(workflow_data)[0]
+
+    @staticmethod
+    def fingerprint_with_size(workflow_data: dict[str, Any]) -> tuple[str, int]:
+        """
+        Compute the content fingerprint and serialized size of workflow data.
+
+        Args:
+            workflow_data: Workflow dictionary to fingerprint
+
+        Returns:
+            Tuple of (16-character hex fingerprint, serialized size in bytes)
+        """
         # Filter out internal keys that would change fingerprint
         clean_data = {
             k: v for k, v in workflow_data.items() if k not in WorkflowCache._INTERNAL_KEYS
         }
         content = orjson.dumps(clean_data, option=orjson.OPT_SORT_KEYS)
-        return hashlib.sha256(content).hexdigest()[:16]
+        return hashlib.sha256(content).hexdigest()[:16], len(content)
 
     def get(self, fingerprint: str) -> Any | None:
         """
@@ -80,21 +114,120 @@ class WorkflowCache:
             self._misses += 1
             return None
 
-    def put(self, fingerprint: str, workflow: Any) -> None:
+    def put(
+        self,
+        fingerprint: str,
+        workflow: Any,
+        plan: Any | None = None,
+        size_bytes: int = 0,
+    ) -> None:
         """
         Cache a parsed workflow.
 
         Args:
             fingerprint: Content fingerprint from compute_fingerprint()
             workflow: Parsed workflow schema to cache
+            plan: Optional compiled ExecutionPlan for the workflow
+            size_bytes: Serialized size of the workflow, counted against max_bytes
         """
         with self._lock:
-            if len(self._cache) >= self._max_size:
-                evicted_key, _ = self._cache.popitem(last=False)
+            if fingerprint in self._cache:
+                self._drop(fingerprint)
+            while self._cache and (
+                len(self._cache) >= self._max_size
+                or self._total_bytes + size_bytes > self._max_bytes
+            ):
+                evicted_key = next(iter(self._cache))
+                self._drop(evicted_key)
                 logger.debug(f"Workflow cache evicted: {evicted_key}")
             self._cache[fingerprint] = workflow
+            self._fingerprints_by_workflow[id(workflow)] = fingerprint
+            self._sizes[fingerprint] = size_bytes
+            self._total_bytes += size_bytes
+            if plan is not None:
+                self._plans[fingerprint] = plan
             logger.debug(f"Workflow cached: {fingerprint}")
 
+    def link_content_hash(self, content_hash: str, workflow: Any) -> bool:
+        """
+        Make a cached workflow reachable by its workflow blob content hash.
+
+        The link is dropped when the workflow is evicted.
+
+        Args:
+            content_hash: Blob hash the workflow was loaded from
+            workflow: Workflow schema previously returned by get()/load
+
+        Returns:
+            True if linked, False if the workflow is not cached
+        """
+        with self._lock:
+            fingerprint = self._fingerprints_by_workflow.get(id(workflow))
+            if fingerprint is None or self._cache.get(fingerprint) is not workflow:
+                return False
+            self._content_hashes[content_hash] = fingerprint
+            self._content_hashes_by_fingerprint.setdefault(fingerprint, set()).add(content_hash)
+            return True
+
+    def get_by_content_hash(self, content_hash: str) -> Any | None:
+        """
+        Get a cached workflow by workflow blob content hash.
+
+        Misses are not counted; the caller falls back to a fingerprint load.
+
+        Args:
+            content_hash: Blob hash linked with link_content_hash()
+
+        Returns:
+            Cached workflow schema or None if not linked
+        """
+        with self._lock:
+            fingerprint = self._content_hashes.get(content_hash)
+            if fingerprint is None:
+                return None
+            self._hits += 1
+            self._cache.move_to_end(fingerprint)
+            return self._cache[fingerprint]
+
+    def get_plan(self, fingerprint: str) -> Any | None:
+        """
+        Get the compiled execution plan cached next to a workflow.
+
+        Args:
+            fingerprint: Content fingerprint from compute_fingerprint()
+
+        Returns:
+            Cached ExecutionPlan or None if not found
+        """
+        with self._lock:
+            return self._plans.get(fingerprint)
+
+    def get_plan_for(self, workflow: Any) -> Any | None:
+        """
+        Get the compiled execution plan for a workflow instance returned by this cache.
+
+        Args:
+            workflow: Workflow schema previously returned by get()/load
+
+        Returns:
+            Cached ExecutionPlan or None if the workflow is not cached
+        """
+        with self._lock:
+            fingerprint = self._fingerprints_by_workflow.get(id(workflow))
+            if fingerprint is None or self._cache.get(fingerprint) is not workflow:
+                return None
+            return self._plans.get(fingerprint)
+
+    def _drop(self, fingerprint: str) -> None:
+        """Remove an entry, its plan and its content hash links. Caller must hold the lock."""
+        workflow = self._cache.pop(fingerprint, None)
+        self._plans.pop(fingerprint, None)
+        self._total_bytes -= self._sizes.pop(fingerprint, 0)
+        for content_hash in self._content_hashes_by_fingerprint.pop(fingerprint, ()):
+            self._content_hashes.pop(content_hash, None)
+        if workflow is not None:
+            self._fingerprints_by_workflow.pop(id(workflow), None)
+
     def invalidate(self, fingerprint: str) -> None:
         """
         Invalidate a specific cache entry.
@@ -104,13 +237,19 @@ class WorkflowCache:
         """
         with self._lock:
             if fingerprint in self._cache:
-                del self._cache[fingerprint]
+                self._drop(fingerprint)
                 logger.debug(f"Workflow cache invalidated: {fingerprint}")
 
     def clear(self) -> None:
         """Clear all cached workflows and reset statistics."""
         with self._lock:
             self._cache.clear()
+            self._plans.clear()
+            self._fingerprints_by_workflow.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+            self._content_hashes.clear()
+            self._content_hashes_by_fingerprint.clear()
             self._hits = 0
             self._misses = 0
             logger.debug("Workflow cache cleared")
@@ -120,13 +259,18 @@ class WorkflowCache:
         Get cache statistics.
 
         Returns:
-            Dictionary with size, max_size, hits, misses, hit_rate
+            Dictionary with size, plans, max_size, bytes, max_bytes,
+            content_hashes, hits, misses, hit_rate
         """
         with self._lock:
             total = self._hits + self._misses
             return {
                 "size": len(self._cache),
+                "plans": len(self._plans),
                 "max_size": self._max_size,
+                "bytes": self._total_bytes,
+                "max_bytes": self._max_bytes,
+                "content_hashes": len(self._content_hashes),
                 "hits": self._hits,
                 "misses": self._misses,
                 "hit_rate": self._hits / total if total > 0 else 0.0,
@@ -7,6 +7,7 @@ Entry Points:
     - ExecutionContext: Runtime context for workflow execution
     - RetryHandler: Exponential backoff retry logic
     - HookRunner: Lifecycle hook execution
+    - CpuWorkerPool: Process pool for cpu_bound node work
 
 Key Patterns:
     - Retry with exponential backoff and jitter
@@ -14,6 +15,11 @@ Key Patterns:
     - Singleton accessors via get_*() functions
 """
 
+from casare_rpa.infrastructure.execution.cpu_worker_pool import (
+    CpuWorkerPool,
+    get_cpu_worker_pool,
+    reset_cpu_worker_pool,
+)
 from casare_rpa.infrastructure.execution.execution_context import ExecutionContext
 from casare_rpa.infrastructure.execution.hook_runner import (
     HookContext,
@@ -39,4 +45,8 @@ __all__ = [
     "HookRunner",
     "get_hook_runner",
     "reset_hook_runner",
+    # CPU-bound node work
+    "CpuWorkerPool",
+    "get_cpu_worker_pool",
+    "reset_cpu_worker_pool",
 ]
@@ -0,0 +1,279 @@
+"""
+CasareRPA - CPU Worker Pool
+
+Managed process pool for CPU-bound node work, implementing ICpuOffloader.
+
+Entry Points:
+    - CpuWorkerPool: Warm ProcessPoolExecutor with timeouts and metrics
+    - get_cpu_worker_pool(): Shared pool for the robot process
+
+Key Patterns:
+    - Workers are started (and optionally warmed) once and reused; the
+      "spawn" start method avoids forking a process that runs an event loop
+    - Work must be a module-level function with picklable args and result
+    - Timeout or cancellation withdraws work that has not started; work
+      already running finishes in its worker and is discarded ("abandoned")
+    - A broken pool (worker crash) is recreated on the next submit
+    - Queue wait and busy time are recorded per task (see CpuPoolStats and
+      the cpu_pool_* timings in PerformanceMetrics)
+
+Related:
+    - See domain.services.cpu_offload for how nodes reach the pool
+    - See application.use_cases.node_executor (cpu_offloader)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+from casare_rpa.utils.performance.performance_metrics import get_metrics
+
+
+def _invoke(func: Callable[..., Any], args: tuple[Any, ...]) -> tuple[float, float, Any]:
+    """Worker-side wrapper returning (start wall time, busy seconds, result)."""
+    started = time.time()
+    begin = time.perf_counter()
+    result = func(*args)
+    return started, time.perf_counter() - begin, result
+
+
+def _warm_up() -> int:
+    """No-op task used to start worker processes ahead of real work."""
+    return os.getpid()
+
+
+@dataclass
+class CpuPoolStats:
+    """Counters for CPU pool monitoring."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    cancelled: int = 0
+    abandoned: int = 0
+    queue_wait_total_ms: float = 0.0
+    queue_wait_max_ms: float = 0.0
+    busy_seconds: float = 0.0
+
+    @property
+    def avg_queue_wait_ms(self) -> float:
+        """Average time tasks waited for a free worker."""
+        return self.queue_wait_total_ms / self.completed if self.completed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for reporting."""
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "cancelled": self.cancelled,
+            "abandoned": self.abandoned,
+            "avg_queue_wait_ms": self.avg_queue_wait_ms,
+            "max_queue_wait_ms": self.queue_wait_max_ms,
+            "busy_seconds": self.busy_seconds,
+        }
+
+
+class CpuWorkerPool:
+    """
+    Process pool for CPU-bound callables, awaited from the event loop.
+
+    Example:
+        pool = CpuWorkerPool(max_workers=2)
+        text = await pool.run(extract_text, "/tmp/a.pdf", timeout=60)
+        pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        start_method: str = "spawn",
+        warm: bool = True,
+    ) -> None:
+        """
+        Initialize the pool (workers start on first use or start()).
+
+        Args:
+            max_workers: Worker processes (default: CPU count - 1, at least 1)
+            start_method: multiprocessing start method
+            warm: Start every worker up front instead of on demand
+        """
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._start_method = start_method
+        self._warm = warm
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._started_at: float | None = None
+        self._in_flight = 0
+        self.stats = CpuPoolStats()
+        self._metrics = get_metrics()
+
+    @property
+    def in_flight(self) -> int:
+        """Tasks submitted and not yet finished."""
+        return self._in_flight
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of worker capacity spent running tasks since start (0..1)."""
+        if self._started_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self._started_at
+        if elapsed <= 0:
+            return 0.0
+        return min(1.0, self.stats.busy_seconds / (elapsed * self.max_workers))
+
+    def start(self) -> ProcessPoolExecutor:
+        """
+        Start the worker processes if not running.
+
+        Returns:
+            The underlying executor
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self._start_method),
+                )
+                self._started_at = time.monotonic()
+                if self._warm:
+                    for _ in range(self.max_workers):
+                        self._executor.submit(_warm_up)
+                logger.debug(f"CPU worker pool started ({self.max_workers} workers)")
+            return self._executor
+
+    def _discard_broken(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _withdraw(self, future: Future) -> None:
+        if not future.cancel() and not future.done():
+            self.stats.abandoned += 1
+
+    async def run(self, func: Callable[..., Any], *args: Any, timeout: float | None = None) -> Any:
+        """
+        Run a function in a worker process.
+
+        Args:
+            func: Module-level function (picklable)
+            *args: Picklable positional arguments
+            timeout: Optional timeout in seconds, including queue wait
+
+        Returns:
+            The function result
+
+        Raises:
+            TimeoutError: If the task did not finish in time
+            BrokenProcessPool: If a worker died (the pool is recreated next time)
+            Exception: Whatever func raised
+        """
+        executor = self.start()
+        name = getattr(func, "__qualname__", repr(func))
+        submitted = time.time()
+        future = executor.submit(_invoke, func, args)
+        self.stats.submitted += 1
+        self._in_flight += 1
+        self._metrics.set_gauge("cpu_pool_in_flight", self._in_flight)
+        try:
+            started, busy, result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            self.stats.timed_out += 1
+            self._withdraw(future)
+            raise TimeoutError(f"CPU-bound task {name} timed out after {timeout}s") from None
+        except asyncio.CancelledError:
+            self.stats.cancelled += 1
+            self._withdraw(future)
+            raise
+        except BrokenProcessPool:
+            self.stats.failed += 1
+            logger.warning(f"CPU worker pool broken while running {name}; recreating")
+            self._discard_broken(executor)
+            raise
+        except Exception:
+            self.stats.failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            self._metrics.set_gauge("cpu_pool_in_flight", self._in_flight)
+
+        queue_wait_ms = max(0.0, started - submitted) * 1000
+        self.stats.completed += 1
+        self.stats.busy_seconds += busy
+        self.stats.queue_wait_total_ms += queue_wait_ms
+        self.stats.queue_wait_max_ms = max(self.stats.queue_wait_max_ms, queue_wait_ms)
+        labels = {"task": name}
+        self._metrics.record_timing("cpu_pool_queue_wait", queue_wait_ms, labels)
+        self._metrics.record_timing("cpu_pool_task", busy * 1000, labels)
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Counters plus worker count, in-flight tasks and utilization
+        """
+        return {
+            **self.stats.to_dict(),
+            "max_workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "utilization": self.utilization,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes, cancelling queued work.
+
+        Args:
+            wait: Wait for running tasks to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.debug("CPU worker pool shut down")
+
+
+_cpu_worker_pool: CpuWorkerPool | None = None
+
+
+def get_cpu_worker_pool() -> CpuWorkerPool:
+    """Get the shared CPU worker pool (singleton).
+
+    Returns:
+        Global CpuWorkerPool instance.
+    """
+    global _cpu_worker_pool
+    if _cpu_worker_pool is None:
+        _cpu_worker_pool = CpuWorkerPool()
+    return _cpu_worker_pool
+
+
+def reset_cpu_worker_pool() -> None:
+    """Shut down and reset the CPU worker pool singleton."""
+    global _cpu_worker_pool
+    if _cpu_worker_pool is not None:
+        _cpu_worker_pool.shutdown(wait=False)
+    _cpu_worker_pool = None
+
+
+__all__ = [
+    "CpuPoolStats",
+    "CpuWorkerPool",
+    "get_cpu_worker_pool",
+    "reset_cpu_worker_pool",
+]
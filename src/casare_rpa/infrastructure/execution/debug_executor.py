@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from casare_rpa.domain.value_objects.types import NodeId, NodeStatus
+from casare_rpa.infrastructure.execution.variable_snapshots import VariableSnapshotStore
 
 if TYPE_CHECKING:
     from casare_rpa.domain.entities.workflow import WorkflowSchema
@@ -51,6 +52,10 @@ class NodeExecutionRecord:
     """
     Record of a node's execution during debug session.
 
+    Variable and port values are kept as versions in the session's
+    VariableSnapshotStore and rebuilt on access, so each property returns a
+    fresh dict.
+
     Attributes:
         node_id: ID of the executed node
         node_type: Type name of the node
@@ -63,6 +68,11 @@ class NodeExecutionRecord:
         variables_before: Variable state before execution
         variables_after: Variable state after execution
         error_message: Error message if execution failed
+        snapshots: Snapshot store holding the values of this record
+        before_version: Snapshot version before execution
+        after_version: Snapshot version after execution (None if not reached)
+        frozen_inputs: Interned input port values (see input_values)
+        frozen_outputs: Interned output port values (see output_values)
     """
 
     node_id: str
@@ -71,11 +81,48 @@ class NodeExecutionRecord:
     end_time: datetime | None = None
     duration_ms: float = 0.0
     status: NodeStatus = NodeStatus.IDLE
-    input_values: dict[str, Any] = field(default_factory=dict)
-    output_values: dict[str, Any] = field(default_factory=dict)
-    variables_before: dict[str, Any] = field(default_factory=dict)
-    variables_after: dict[str, Any] = field(default_factory=dict)
     error_message: str | None = None
+    snapshots: VariableSnapshotStore | None = field(default=None, repr=False, compare=False)
+    before_version: int | None = None
+    after_version: int | None = None
+    frozen_inputs: dict[str, Any] = field(default_factory=dict, repr=False)
+    frozen_outputs: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def _variables(self, version: int | None) -> dict[str, Any]:
+        if self.snapshots is None or version is None:
+            return {}
+        return self.snapshots.materialize(version)
+
+    @property
+    def variables_before(self) -> dict[str, Any]:
+        """Variable state before execution."""
+        return self._variables(self.before_version)
+
+    @property
+    def variables_after(self) -> dict[str, Any]:
+        """Variable state after execution (empty if the node did not finish)."""
+        return self._variables(self.after_version)
+
+    @property
+    def input_values(self) -> dict[str, Any]:
+        """Input port values at execution time."""
+        return VariableSnapshotStore.thaw_values(self.frozen_inputs)
+
+    @property
+    def output_values(self) -> dict[str, Any]:
+        """Output port values after execution."""
+        return VariableSnapshotStore.thaw_values(self.frozen_outputs)
+
+    def get_variable_changes(self) -> tuple[dict[str, Any], set[str]]:
+        """
+        Get the variables this node wrote and removed.
+
+        Returns:
+            Tuple of (changed variables with new values, removed names)
+        """
+        if self.snapshots is None or self.before_version is None or self.after_version is None:
+            return {}, set()
+        return self.snapshots.changes(self.before_version, self.after_version)
 
 
 @dataclass
@@ -89,6 +136,7 @@ class DebugSession:
         start_time: When debug session started
         end_time: When debug session ended
         execution_records: List of node execution records
+        snapshots: Shared variable/port value snapshots of the records
         breakpoints_hit: Set of node IDs where breakpoints were hit
         step_count: Number of steps taken
         state: Current debug state
@@ -99,6 +147,7 @@ class DebugSession:
     start_time: datetime = field(default_factory=datetime.now)
     end_time: datetime | None = None
     execution_records: list[NodeExecutionRecord] = field(default_factory=list)
+    snapshots: VariableSnapshotStore = field(default_factory=VariableSnapshotStore, repr=False)
     breakpoints_hit: set[str] = field(default_factory=set)
     step_count: int = 0
     state: DebugState = DebugState.IDLE
@@ -302,7 +351,6 @@ class DebugExecutor:
         Returns:
             Tuple of (success, result)
         """
-        import copy
         import time
 
         if node.config.get("_disabled", False):
@@ -312,15 +360,20 @@ class DebugExecutor:
         self._current_node_id = node_id
         node_type = node.__class__.__name__
 
+        # PERFORMANCE: snapshots store only what changed since the previous
+        # capture (shared, interned values) instead of deep-copying every
+        # variable twice per node
+        snapshots = self._session.snapshots
         self._current_record = NodeExecutionRecord(
             node_id=node_id,
             node_type=node_type,
             start_time=datetime.now(),
-            variables_before=copy.deepcopy(self.context.variables),
+            snapshots=snapshots,
+            before_version=snapshots.capture(self.context.variables),
         )
 
         if hasattr(node, "input_values"):
-            self._current_record.input_values = copy.deepcopy(
+            self._current_record.frozen_inputs = snapshots.freeze_values(
                 dict(getattr(node, "input_values", {}))
             )
 
@@ -349,10 +402,10 @@ class DebugExecutor:
             duration_ms = (time.perf_counter() - start_time) * 1000
             self._current_record.duration_ms = duration_ms
             self._current_record.end_time = datetime.now()
-            self._current_record.variables_after = copy.deepcopy(self.context.variables)
+            self._current_record.after_version = snapshots.capture(self.context.variables)
 
             if hasattr(node, "output_values"):
-                self._current_record.output_values = copy.deepcopy(
+                self._current_record.frozen_outputs = snapshots.freeze_values(
                     dict(getattr(node, "output_values", {}))
                 )
 
@@ -477,9 +530,14 @@ class DebugExecutor:
         if not self._session:
             return history
 
+        snapshots = self._session.snapshots
+        missing = object()
         for record in self._session.execution_records:
-            if variable_name in record.variables_after:
-                history.append((record.node_id, record.variables_after[variable_name]))
+            if record.after_version is None:
+                continue
+            value = snapshots.get(record.after_version, variable_name, missing)
+            if value is not missing:
+                history.append((record.node_id, value))
 
         return history
 
@@ -18,11 +18,14 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from casare_rpa.domain.entities.execution_state import ExecutionState
-from casare_rpa.domain.value_objects.types import ExecutionMode, NodeId
-from casare_rpa.infrastructure.execution.variable_cache import (
-    CacheStats,
-    VariableResolutionCache,
+from casare_rpa.domain.entities.layered_variables import LayeredVariables, MergePolicy
+from casare_rpa.domain.services.variable_resolver import (
+    CompiledTemplate,
+    compile_template,
+    has_template_markers,
 )
+from casare_rpa.domain.value_objects.types import ExecutionMode, NodeId
+from casare_rpa.infrastructure.execution.variable_cache import CacheStats
 from casare_rpa.infrastructure.resources.browser_resource_manager import (
     BrowserResourceManager,
 )
@@ -81,9 +84,6 @@ class ExecutionContext:
         # Infrastructure resources (Playwright)
         self._resources = BrowserResourceManager()
 
-        # Variable resolution cache for performance
-        self._var_cache = VariableResolutionCache(max_size=500)
-
         # Desktop context (lazy-initialized, not managed by domain or infrastructure layers)
         self.desktop_context: Any = None
 
@@ -97,36 +97,46 @@ class ExecutionContext:
         # Credential provider (lazy-initialized)
         self._credential_provider: VaultCredentialProvider | None = None
 
+        # Variables changed through set_variable()/delete_variable()
+        # (see consume_variable_changes)
+        self._dirty_variables: set[str] = set()
+        self._deleted_variables: set[str] = set()
+        self._variables_reset = False
+
     # ========================================================================
     # VARIABLE MANAGEMENT - Delegate to ExecutionState (domain)
     # ========================================================================
 
-    def set_variable(self, name: str, value: Any) -> None:
+    def set_variable(self, name: str, value: Any, *, publish: bool = True) -> None:
         """
         Set a variable in the context.
 
-        Publishes VARIABLE_SET event after successfully setting the variable.
-        Notifies the resolution cache of the change for invalidation.
+        Publishes a VARIABLE_SET event after setting the variable, but only
+        when something subscribes to it (the canvas does, headless robots
+        usually do not), so writes never pay for unobserved events.
 
         Args:
             name: Variable name
             value: Variable value
+            publish: False for per-iteration writes (loop item/index) that
+                would otherwise emit one event per iteration
         """
         self._state.set_variable(name, value)
-
-        # Notify cache of variable change for invalidation
-        self._var_cache.notify_variable_changed(name)
+        self._dirty_variables.add(name)
+        self._deleted_variables.discard(name)
 
         # Publish VARIABLE_SET event (skip internal variables starting with _)
-        if not name.startswith("_"):
+        if publish and not name.startswith("_"):
             try:
                 from casare_rpa.domain.events import VariableSet, get_event_bus
 
                 event_bus = get_event_bus()
+                if not event_bus.has_subscribers(VariableSet):
+                    return
                 event_bus.publish(
                     VariableSet(
                         variable_name=name,
-                        value=value,
+                        variable_value=value,
                         workflow_id=self._state.workflow_name,
                     )
                 )
@@ -153,12 +163,34 @@ class ExecutionContext:
     def delete_variable(self, name: str) -> None:
         """Delete a variable from the context."""
         self._state.delete_variable(name)
-        self._var_cache.notify_variable_changed(name)
+        self._dirty_variables.discard(name)
+        self._deleted_variables.add(name)
 
     def clear_variables(self) -> None:
-        """Clear all variables and reset resolution cache."""
+        """Clear all variables."""
         self._state.clear_variables()
-        self._var_cache.clear()
+        self._variables_reset = True
+
+    def consume_variable_changes(self) -> tuple[set[str], set[str]] | None:
+        """
+        Return and reset the variables changed since the previous call.
+
+        Tracks writes made through set_variable()/delete_variable(). Writes
+        that bypass them (context.variables[...] = ..., in-place container
+        mutation) are not seen, so consumers should take a full snapshot
+        periodically.
+
+        Returns:
+            Tuple of (set variable names, deleted variable names), or None
+            if the variables were cleared and a full snapshot is required
+        """
+        dirty, deleted = self._dirty_variables, self._deleted_variables
+        self._dirty_variables = set()
+        self._deleted_variables = set()
+        if self._variables_reset:
+            self._variables_reset = False
+            return None
+        return dirty, deleted
 
     def resolve_value(self, value: Any) -> Any:
         """
@@ -166,7 +198,9 @@ class ExecutionContext:
         Supports {{var}}, ${var}, %var%, and {{$secret:id}}.
         Handles strings, dictionaries, and lists recursively.
 
-        Uses caching for improved performance on repeated resolutions (strings only).
+        Strings are resolved through compiled templates (parsed once per
+        distinct string), so repeated resolution does no regex work and
+        always reflects the current variable values.
 
         Args:
             value: The value to resolve
@@ -181,24 +215,20 @@ class ExecutionContext:
         # For strings, check for secret patterns first
         if isinstance(value, str):
             # Resolve {{$secret:id}} patterns
+            raw = value
             value = self._resolve_secrets(value)
 
             # No markers? Skip resolution
-            if not any(m in value for m in ("{{", "${", "%")):
+            if not has_template_markers(value):
                 return value
 
-            found, cached_result = self._var_cache.get_cached(value, self._state.variables)
-            if found:
-                return cached_result
+            # Never let decrypted secrets become keys of the shared cache
+            if value != raw:
+                return CompiledTemplate(value).render(self._state.variables)
+            return compile_template(value).render(self._state.variables)
 
-        # Resolve using domain state
-        result = self._state.resolve_value(value)
-
-        # Cache string results
-        if isinstance(value, str):
-            self._var_cache.cache_result(value, self._state.variables, result)
-
-        return result
+        # Resolve containers using domain state
+        return self._state.resolve_value(value)
 
     def _resolve_secrets(self, value: str) -> str:
         """
@@ -240,12 +270,16 @@ class ExecutionContext:
 
     def get_resolution_cache_stats(self) -> CacheStats:
         """
-        Get statistics from the variable resolution cache.
+        Get statistics from the compiled template cache.
+
+        The cache is process-wide (shared by all contexts) and keyed by the
+        raw template string; compiled templates never need invalidation.
 
         Returns:
-            CacheStats with hits, misses, invalidations, evictions
+            CacheStats with hits and misses (invalidations/evictions are 0)
         """
-        return self._var_cache.get_stats()
+        info = compile_template.cache_info()
+        return CacheStats(hits=info.hits, misses=info.misses)
 
     def resolve_credential_path(self, alias: str) -> str | None:
         """
@@ -536,26 +570,30 @@ class ExecutionContext:
 
     def clone_for_branch(self, branch_name: str) -> ExecutionContext:
         """
-        Create an isolated context copy for parallel branch execution.
+        Create an isolated context for parallel branch execution.
 
         Each parallel branch gets its own variable namespace to prevent
         conflicts during concurrent execution. Browser resources are shared
         (read-only) but each branch can create new pages.
 
+        PERFORMANCE: Variables are a copy-on-write LayeredVariables overlay
+        over this context's variables instead of a dict copy - the branch
+        reads the parent without copying and only stores what it writes.
+
         Args:
             branch_name: Name of the branch (used for variable namespacing)
 
         Returns:
-            New ExecutionContext with copied variables and shared resources
+            New ExecutionContext with layered variables and shared resources
         """
-        # Create new context with copied variables
         branch_context = ExecutionContext(
             workflow_name=f"{self._state.workflow_name}::{branch_name}",
             mode=self._state.mode,
-            initial_variables=self._state.variables.copy(),  # Snapshot
+            initial_variables=None,  # Layered over the parent below
             project_context=self._state.project_context,
             pause_event=self.pause_event,  # Share pause/resume control
         )
+        branch_context._state.variables = LayeredVariables(self._state.variables)
 
         # Share browser resources (read-only during parallel execution)
         # Branches can create new pages but shouldn't modify shared state
@@ -569,24 +607,37 @@ class ExecutionContext:
 
         return branch_context
 
-    def merge_branch_results(self, branch_name: str, branch_variables: dict[str, Any]) -> None:
+    def merge_branch_results(
+        self,
+        branch_name: str,
+        branch_variables: dict[str, Any] | LayeredVariables,
+        policy: MergePolicy = MergePolicy.NAMESPACED,
+    ) -> None:
         """
         Merge variables from a completed branch back to main context.
 
-        Variables are namespaced by branch name to avoid conflicts.
-        Special variables (starting with _) are not merged.
+        By default variables are namespaced by branch name to avoid conflicts.
+        Special variables (starting with _) are not merged. A LayeredVariables
+        branch scope contributes only its own writes (and, for OVERWRITE,
+        its deletes) - inherited parent variables are not copied back.
+
+        Merged writes go through set_variable()/delete_variable(), so they
+        publish VARIABLE_SET events and are seen by change tracking.
 
         Args:
             branch_name: Name of the branch
-            branch_variables: Variables from the branch context
+            branch_variables: Branch writes, or the branch's layered scope
+            policy: How branch writes are applied to this context
         """
-        for key, value in branch_variables.items():
-            # Skip internal variables
-            if key.startswith("_"):
-                continue
-            # Namespace by branch name
-            namespaced_key = f"{branch_name}_{key}"
-            self._state.set_variable(namespaced_key, value)
+        if not isinstance(branch_variables, LayeredVariables):
+            branch_variables = LayeredVariables.from_writes(branch_variables)
+        writes, deletes = branch_variables.merge_changes(
+            self._state.variables, policy, prefix=branch_name
+        )
+        for name, value in writes.items():
+            self.set_variable(name, value)
+        for name in deletes:
+            self.delete_variable(name)
 
     def create_workflow_context(self, workflow_name: str) -> ExecutionContext:
         """
@@ -793,9 +844,11 @@ class ExecutionContext:
                 cleanup_task = loop.create_task(self.cleanup())
                 # We can't await here, but we can at least log when it completes
                 cleanup_task.add_done_callback(
-                    lambda t: logger.info("Scheduled cleanup task completed")
-                    if not t.exception()
-                    else logger.error(f"Scheduled cleanup task failed: {t.exception()}")
+                    lambda t: (
+                        logger.info("Scheduled cleanup task completed")
+                        if not t.exception()
+                        else logger.error(f"Scheduled cleanup task failed: {t.exception()}")
+                    )
                 )
             except RuntimeError:
                 # No running loop - we can run cleanup synchronously
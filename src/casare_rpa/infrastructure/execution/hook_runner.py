@@ -59,15 +59,16 @@ class HookContext:
             return self.execution_context.get_variable(name, default)
         return default
 
-    def set_variable(self, name: str, value: Any) -> None:
+    def set_variable(self, name: str, value: Any, *, publish: bool = True) -> None:
         """Set variable in execution context.
 
         Args:
             name: Variable name.
             value: Variable value.
+            publish: Publish a VARIABLE_SET event.
         """
         if self.execution_context:
-            self.execution_context.set_variable(name, value)
+            self.execution_context.set_variable(name, value, publish=publish)
 
     @property
     def is_final_attempt(self) -> bool:
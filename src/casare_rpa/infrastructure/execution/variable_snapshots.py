@@ -0,0 +1,292 @@
+"""
+Structural-sharing variable snapshots for CasareRPA debug sessions.
+
+Records the variable state around each debugged node as a chain of
+per-node diffs instead of full deep copies. Each value is stored as its
+pickle encoding, which doubles as the change check: an unchanged variable
+encodes to the same bytes and keeps sharing the stored encoding. Pickling
+runs in C and is much faster than copy.deepcopy on large tables. Full
+snapshots are rebuilt (unpickled) only when requested.
+
+Only values that may have changed are encoded again: immutable scalars
+still bound to the same object are skipped, mutable values are re-encoded
+because they can be changed in place. A bounded LRU pool shares equal
+encodings between variables, versions and port values.
+
+Values that cannot be pickled (browser pages, handles) are deep-copied and
+compared by equality, or kept by reference (compared by identity) when
+they cannot be copied or have no value equality.
+"""
+
+import copy
+import pickle
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+
+_MISSING = object()
+
+# Values of these exact types cannot change without being rebound
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, bytes, complex, type(None)})
+
+# Containers are never remembered as unpicklable: it depends on their items
+_CONTAINER_TYPES = frozenset({list, dict, tuple, set, frozenset})
+
+
+class _Opaque:
+    """Copy of a value that cannot be pickled."""
+
+    __slots__ = ("value", "copied")
+
+    def __init__(self, source: Any) -> None:
+        try:
+            self.value = copy.deepcopy(source)
+            # Without value equality every later capture would see a change
+            self.copied = bool(self.value == source)
+        except Exception:
+            self.copied = False
+        if not self.copied:
+            self.value = source
+
+    def matches(self, value: Any) -> bool:
+        """Whether value still equals the copy (identity for uncopied references)."""
+        if not self.copied:
+            return self.value is value
+        if type(self.value) is not type(value):
+            return False
+        try:
+            return bool(self.value == value)
+        except Exception:
+            return False
+
+
+def _thaw(frozen: Any) -> Any:
+    """Rebuild a fresh, mutable value from its stored form."""
+    if type(frozen) is bytes:
+        return pickle.loads(frozen)
+    if frozen.copied:
+        return copy.deepcopy(frozen.value)
+    return frozen.value
+
+
+def _same(left: Any, right: Any) -> bool:
+    """Whether two stored values hold the same data."""
+    return left is right or (type(left) is bytes and left == right)
+
+
+class _Version:
+    """One snapshot: changes relative to the previous one, or a full keyframe."""
+
+    __slots__ = ("changes", "removed", "full")
+
+    def __init__(
+        self,
+        changes: dict[str, Any],
+        removed: frozenset[str],
+        full: dict[str, Any] | None,
+    ) -> None:
+        self.changes = changes
+        self.removed = removed
+        self.full = full
+
+
+class VariableSnapshotStore:
+    """
+    Append-only store of variable snapshots with structural sharing.
+
+    capture() returns a version number; consecutive captures of an
+    unchanged scope share the same version. materialize(), get() and
+    changes() rebuild state on demand.
+
+    Performance characteristics:
+    - Capture pickles only mutable or rebound values (C speed) and compares
+      bytes; nothing is stored for unchanged variables
+    - Memory grows with the distinct values that actually changed; the
+      interning pool holds at most ``pool_size`` encodings
+    - materialize()/get() replay at most ``keyframe_interval`` diffs
+    """
+
+    def __init__(self, keyframe_interval: int = 32, pool_size: int = 1024) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            keyframe_interval: Store a full (shallow, shared) snapshot every N
+                versions to bound reconstruction cost
+            pool_size: Maximum number of encodings kept for sharing
+        """
+        self._keyframe_interval = max(1, keyframe_interval)
+        self._pool_size = max(0, pool_size)
+        self._versions: list[_Version] = []
+        self._current: dict[str, Any] = {}
+        # Variable name -> immutable value object of the latest capture
+        self._bound: dict[str, Any] = {}
+        self._pool: OrderedDict[bytes, bytes] = OrderedDict()
+        self._unpicklable: set[type] = set()
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def _intern(self, value: Any, previous: Any = _MISSING) -> Any:
+        """Encode a value, reusing ``previous`` or a pooled equal encoding."""
+        value_type = type(value)
+        try:
+            if value_type in self._unpicklable:
+                raise TypeError(value_type.__name__)
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            if value_type not in _CONTAINER_TYPES:
+                self._unpicklable.add(value_type)
+            if type(previous) is _Opaque and previous.matches(value):
+                return previous
+            return _Opaque(value)
+        if type(previous) is bytes and previous == data:
+            return previous
+        return self._share(data)
+
+    def _share(self, data: bytes) -> bytes:
+        """Return the pooled encoding equal to data, evicting the least recent."""
+        pool = self._pool
+        pooled = pool.get(data)
+        if pooled is not None:
+            pool.move_to_end(data)
+            return pooled
+        if self._pool_size:
+            pool[data] = data
+            if len(pool) > self._pool_size:
+                pool.popitem(last=False)
+        return data
+
+    def freeze_values(self, values: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Freeze a mapping of values (e.g. port values) into the shared pool.
+
+        Args:
+            values: Mapping to freeze
+
+        Returns:
+            Frozen mapping to pass to thaw_values()
+        """
+        return {name: self._intern(value) for name, value in values.items()}
+
+    @staticmethod
+    def thaw_values(frozen: Mapping[str, Any]) -> dict[str, Any]:
+        """Rebuild a plain dict from the result of freeze_values()."""
+        return {name: _thaw(value) for name, value in frozen.items()}
+
+    def capture(self, variables: Mapping[str, Any]) -> int:
+        """
+        Record the current variable state.
+
+        Args:
+            variables: Variable scope to snapshot
+
+        Returns:
+            Version number identifying this snapshot
+        """
+        current = self._current
+        bound = self._bound
+        changes: dict[str, Any] = {}
+        for name, value in variables.items():
+            if type(value) in _IMMUTABLE_TYPES:
+                if bound.get(name, _MISSING) is value:
+                    continue
+                bound[name] = value
+            else:
+                bound.pop(name, None)
+            previous = current.get(name, _MISSING)
+            frozen = self._intern(value, previous)
+            if frozen is not previous:
+                changes[name] = frozen
+        removed = frozenset(name for name in current if name not in variables)
+
+        if self._versions and not changes and not removed:
+            return len(self._versions) - 1
+
+        current.update(changes)
+        for name in removed:
+            del current[name]
+            bound.pop(name, None)
+
+        full = None
+        if len(self._versions) % self._keyframe_interval == 0:
+            full = dict(current)
+        self._versions.append(_Version(changes, removed, full))
+        return len(self._versions) - 1
+
+    def _frozen_state(self, version: int) -> dict[str, Any]:
+        start = version
+        while self._versions[start].full is None:
+            start -= 1
+        state = dict(self._versions[start].full)
+        for entry in self._versions[start + 1 : version + 1]:
+            state.update(entry.changes)
+            for name in entry.removed:
+                state.pop(name, None)
+        return state
+
+    def materialize(self, version: int) -> dict[str, Any]:
+        """
+        Rebuild the full variable dict of a version.
+
+        Args:
+            version: Version returned by capture()
+
+        Returns:
+            Fresh dict (safe to mutate)
+        """
+        return self.thaw_values(self._frozen_state(version))
+
+    def get(self, version: int, name: str, default: Any = None) -> Any:
+        """
+        Get one variable as of a version without rebuilding the others.
+
+        Args:
+            version: Version returned by capture()
+            name: Variable name
+            default: Value returned when the variable did not exist
+
+        Returns:
+            The variable value or default
+        """
+        for index in range(version, -1, -1):
+            entry = self._versions[index]
+            if name in entry.changes:
+                return _thaw(entry.changes[name])
+            if name in entry.removed:
+                return default
+            if entry.full is not None:
+                if name in entry.full:
+                    return _thaw(entry.full[name])
+                return default
+        return default
+
+    def changes(self, before: int, after: int) -> tuple[dict[str, Any], set[str]]:
+        """
+        Get the variables written and removed between two versions.
+
+        Args:
+            before: Earlier version
+            after: Later version
+
+        Returns:
+            Tuple of (changed variables with their new values, removed names)
+        """
+        if before == after:
+            return {}, set()
+        old = self._frozen_state(before)
+        new = self._frozen_state(after)
+        changed = {
+            name: _thaw(value)
+            for name, value in new.items()
+            if not _same(old.get(name, _MISSING), value)
+        }
+        return changed, set(old) - set(new)
+
+    def clear(self) -> None:
+        """Drop every snapshot and the interning pool."""
+        self._versions.clear()
+        self._current.clear()
+        self._bound.clear()
+        self._pool.clear()
+        self._unpicklable.clear()
@@ -5,12 +5,15 @@ Provides log streaming, cleanup, and management services for the orchestrator.
 Includes:
 - LogStreamingService: Real-time log streaming via WebSocket
 - LogCleanup: Scheduled job for 30-day retention enforcement
+- LogIngestionBuffer: Bounded batching buffer for log persistence
 """
 
 from casare_rpa.infrastructure.logging.log_cleanup import LogCleanupJob
+from casare_rpa.infrastructure.logging.log_ingestion_buffer import LogIngestionBuffer
 from casare_rpa.infrastructure.logging.log_streaming_service import LogStreamingService
 
 __all__ = [
     "LogStreamingService",
     "LogCleanupJob",
+    "LogIngestionBuffer",
 ]
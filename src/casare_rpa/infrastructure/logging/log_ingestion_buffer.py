@@ -0,0 +1,158 @@
+"""
+LogIngestionBuffer - Bounded batching buffer for log persistence.
+
+Collects log entries from many robots and hands them to a flush callback in
+large batches, so the repository can use its bulk COPY path. A flush is
+triggered when flush_size entries are pending or flush_interval seconds
+have passed. When the database falls behind, the buffer holds at most
+max_entries and drops the oldest entries beyond that.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from loguru import logger
+
+from casare_rpa.domain.value_objects.log_entry import LogEntry
+
+DEFAULT_FLUSH_SIZE: int = 2000
+DEFAULT_FLUSH_INTERVAL: float = 1.0
+DEFAULT_MAX_ENTRIES: int = 50_000
+
+
+class LogIngestionBuffer:
+    """
+    Bounded in-memory buffer with size and time flush triggers.
+
+    Usage:
+        buffer = LogIngestionBuffer(repository.save_batch)
+        await buffer.start()
+        buffer.add(entries)  # never blocks
+        await buffer.stop()  # flushes what is left
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[LogEntry]], Awaitable[Any]],
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            flush: Async callback persisting one batch.
+            flush_size: Pending entries that trigger a flush (and max batch size).
+            flush_interval: Seconds after which pending entries are flushed anyway.
+            max_entries: Capacity; the oldest entries are dropped beyond it.
+        """
+        if flush_size <= 0 or max_entries < flush_size:
+            raise ValueError("flush_size must be positive and not exceed max_entries")
+
+        self._flush = flush
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._max_entries = max_entries
+
+        self._entries: deque[LogEntry] = deque()
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+
+        # Metrics
+        self._dropped = 0
+        self._flushed = 0
+        self._flushes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entries: Iterable[LogEntry]) -> int:
+        """
+        Add entries without blocking.
+
+        Args:
+            entries: Entries to persist.
+
+        Returns:
+            Number of entries dropped to stay within capacity.
+        """
+        self._entries.extend(entries)
+        dropped = len(self._entries) - self._max_entries
+        if dropped > 0:
+            for _ in range(dropped):
+                self._entries.popleft()
+            self._dropped += dropped
+            logger.warning(f"Log ingestion buffer full, dropped {dropped} oldest entries")
+        else:
+            dropped = 0
+
+        if len(self._entries) >= self._flush_size:
+            self._ready.set()
+        return dropped
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and flush remaining entries."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Flush all pending entries in batches of at most flush_size.
+
+        Returns:
+            Number of entries handed to the flush callback.
+        """
+        count = 0
+        async with self._flush_lock:
+            self._ready.clear()
+            while self._entries:
+                take = min(len(self._entries), self._flush_size)
+                batch = [self._entries.popleft() for _ in range(take)]
+                await self._flush(batch)
+                count += take
+                self._flushes += 1
+        self._flushed += count
+        return count
+
+    async def _run(self) -> None:
+        """Flush whenever flush_size entries are pending or the interval elapses."""
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._ready.wait(), timeout=self._flush_interval)
+                except TimeoutError:
+                    pass
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Log ingestion flush error: {e}")
+                await asyncio.sleep(1)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get buffer metrics."""
+        return {
+            "pending": len(self._entries),
+            "capacity": self._max_entries,
+            "flushed": self._flushed,
+            "flushes": self._flushes,
+            "dropped": self._dropped,
+        }
+
+
+__all__ = ["LogIngestionBuffer"]
@@ -6,23 +6,68 @@ Provides buffering for temporary disconnections and efficient batch processing.
 """
 
 import asyncio
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 from loguru import logger
 
 from casare_rpa.domain.value_objects.log_entry import (
-    MAX_LOG_BATCH_SIZE,
     OFFLINE_BUFFER_SIZE,
     LogBatch,
     LogEntry,
     LogLevel,
 )
+from casare_rpa.infrastructure.logging.log_ingestion_buffer import (
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_FLUSH_SIZE,
+    DEFAULT_MAX_ENTRIES,
+    LogIngestionBuffer,
+)
 from casare_rpa.infrastructure.persistence.repositories.log_repository import (
     LogRepository,
 )
 
+# Pending frames per subscriber before the oldest are dropped
+DEFAULT_SUBSCRIBER_QUEUE_SIZE: int = 100
+# Seconds a single WebSocket send may take before the subscriber is dropped
+DEFAULT_SEND_TIMEOUT: float = 5.0
+# Close code for dropped slow subscribers ("try again later")
+SLOW_SUBSCRIBER_CLOSE_CODE: int = 1013
+
+
+@dataclass
+class _SubscriberChannel:
+    """Bounded queue of pre-serialized frames for one subscriber."""
+
+    send: Callable[[str], Awaitable[Any]]
+    max_pending: int
+    # (enqueued_at, frame, entry_count)
+    frames: deque[tuple[float, str, int]] = field(default_factory=deque)
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task | None = None
+    sent_entries: int = 0
+    dropped_entries: int = 0
+    max_lag_seconds: float = 0.0
+
+    def push(self, frame: str, entry_count: int) -> int:
+        """Queue a frame, dropping the oldest beyond capacity. Returns entries dropped."""
+        dropped = 0
+        while len(self.frames) >= self.max_pending:
+            dropped += self.frames.popleft()[2]
+        self.frames.append((time.monotonic(), frame, entry_count))
+        self.dropped_entries += dropped
+        self.ready.set()
+        return dropped
+
+    def lag_seconds(self) -> float:
+        """Age of the oldest undelivered frame."""
+        return time.monotonic() - self.frames[0][0] if self.frames else 0.0
+
 
 class LogStreamingService:
     """
@@ -34,6 +79,8 @@ class LogStreamingService:
     - Buffer logs for temporary disconnections
     - Batch processing for efficiency
     - Level filtering per subscriber
+    - One serialized frame per filter group, delivered concurrently through
+      bounded per-subscriber queues so a slow client only delays itself
 
     Usage:
         service = LogStreamingService(log_repository)
@@ -53,6 +100,11 @@ class LogStreamingService:
         log_repository: LogRepository | None = None,
         persist_logs: bool = True,
         buffer_size: int = OFFLINE_BUFFER_SIZE,
+        persist_batch_size: int = DEFAULT_FLUSH_SIZE,
+        persist_interval: float = DEFAULT_FLUSH_INTERVAL,
+        persist_buffer_size: int = DEFAULT_MAX_ENTRIES,
+        subscriber_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
     ) -> None:
         """
         Initialize log streaming service.
@@ -61,15 +113,25 @@ class LogStreamingService:
             log_repository: Repository for persisting logs.
             persist_logs: Whether to persist logs to database.
             buffer_size: Size of offline buffer per robot.
+            persist_batch_size: Pending logs that trigger a database write.
+            persist_interval: Max seconds a log waits before being written.
+            persist_buffer_size: Max logs awaiting persistence before dropping.
+            subscriber_queue_size: Max frames queued per subscriber before dropping.
+            send_timeout: Max seconds per WebSocket send before disconnecting.
         """
         self._repository = log_repository
         self._persist_logs = persist_logs
         self._buffer_size = buffer_size
+        self._subscriber_queue_size = subscriber_queue_size
+        self._send_timeout = send_timeout
         self._running = False
 
         # Subscribers: websocket -> subscription config
         self._subscribers: dict[Any, dict[str, Any]] = {}
 
+        # Delivery queues: websocket -> channel
+        self._channels: dict[Any, _SubscriberChannel] = {}
+
         # Subscriber sets by robot (for efficient broadcast)
         # robot_id -> set of websockets
         self._robot_subscribers: dict[str, set[Any]] = defaultdict(set)
@@ -80,13 +142,18 @@ class LogStreamingService:
         # Offline buffers: robot_id -> list of LogEntry
         self._offline_buffers: dict[str, list[LogEntry]] = defaultdict(list)
 
-        # Batch queue for persistence
-        self._persist_queue: asyncio.Queue = asyncio.Queue()
-        self._persist_task: asyncio.Task | None = None
+        # Bounded batching buffer for persistence
+        self._persist_buffer = LogIngestionBuffer(
+            self._persist_batch,
+            flush_size=persist_batch_size,
+            flush_interval=persist_interval,
+            max_entries=persist_buffer_size,
+        )
 
         # Metrics
         self._logs_received = 0
         self._logs_broadcast = 0
+        self._logs_broadcast_dropped = 0
         self._logs_persisted = 0
         self._logs_dropped = 0
 
@@ -103,7 +170,7 @@ class LogStreamingService:
 
         # Start persistence worker if enabled
         if self._persist_logs and self._repository:
-            self._persist_task = asyncio.create_task(self._persist_worker())
+            await self._persist_buffer.start()
             logger.debug("Started log persistence worker")
 
         logger.info("LogStreamingService started")
@@ -112,17 +179,12 @@ class LogStreamingService:
         """Stop the log streaming service gracefully."""
         self._running = False
 
-        # Stop persistence worker
-        if self._persist_task:
-            self._persist_task.cancel()
-            try:
-                await self._persist_task
-            except asyncio.CancelledError:
-                pass
-            self._persist_task = None
+        # Stop subscriber delivery
+        for websocket in list(self._subscribers):
+            await self.unsubscribe(websocket)
 
-        # Flush any remaining logs
-        await self._flush_persist_queue()
+        # Stop persistence worker and flush any remaining logs
+        await self._persist_buffer.stop()
 
         logger.info(
             f"LogStreamingService stopped. "
@@ -160,6 +222,11 @@ class LogStreamingService:
             }
             self._subscribers[websocket] = config
 
+            send = getattr(websocket, "send_text", None) or websocket.send
+            channel = _SubscriberChannel(send=send, max_pending=self._subscriber_queue_size)
+            channel.task = asyncio.create_task(self._deliver(websocket, channel))
+            self._channels[websocket] = channel
+
             if robot_ids:
                 for robot_id in robot_ids:
                     self._robot_subscribers[robot_id].add(websocket)
@@ -179,6 +246,9 @@ class LogStreamingService:
         """
         async with self._lock:
             config = self._subscribers.pop(websocket, None)
+            channel = self._channels.pop(websocket, None)
+            if channel and channel.task and channel.task is not asyncio.current_task():
+                channel.task.cancel()
             if config:
                 robot_ids = config.get("robot_ids")
                 if robot_ids:
@@ -189,6 +259,10 @@ class LogStreamingService:
 
                 logger.debug("Log subscriber removed")
 
+    def is_subscribed(self, websocket: Any) -> bool:
+        """Check whether a WebSocket is still subscribed (False once dropped)."""
+        return websocket in self._subscribers
+
     async def receive_log_batch(
         self,
         robot_id: str,
@@ -215,8 +289,8 @@ class LogStreamingService:
         self._logs_received += len(batch.entries)
 
         # Persist logs
-        if self._persist_logs and batch.entries:
-            await self._persist_queue.put(batch.entries)
+        if self._persist_logs and self._repository and batch.entries:
+            self._logs_dropped += self._persist_buffer.add(batch.entries)
 
         # Broadcast to subscribers
         await self._broadcast_logs(robot_id, tenant_id, list(batch.entries))
@@ -258,8 +332,8 @@ class LogStreamingService:
         self._logs_received += 1
 
         # Persist
-        if self._persist_logs:
-            await self._persist_queue.put([entry])
+        if self._persist_logs and self._repository:
+            self._logs_dropped += self._persist_buffer.add([entry])
 
         # Broadcast
         await self._broadcast_logs(robot_id, tenant_id, [entry])
@@ -294,98 +368,90 @@ class LogStreamingService:
                 if config.get("tenant_id") == tenant_id or config.get("tenant_id") is None:
                     subscribers.add(ws)
 
-        # Broadcast to each subscriber
-        failed_sockets = []
+        # Serialize once per filter group, then queue the frame for each member
+        frames: dict[tuple[LogLevel, frozenset[str] | None], tuple[str, int] | None] = {}
         for ws in subscribers:
+            channel = self._channels.get(ws)
+            if channel is None:
+                continue
             config = self._subscribers.get(ws, {})
-            min_level = config.get("min_level", LogLevel.DEBUG)
             sources = config.get("sources")
-
-            # Filter entries for this subscriber
-            filtered = [
-                e
-                for e in entries
-                if e.level >= min_level and (sources is None or e.source in sources)
-            ]
-
-            if not filtered:
-                continue
-
-            try:
-                await self._send_to_subscriber(ws, robot_id, filtered)
-                self._logs_broadcast += len(filtered)
-            except Exception as e:
-                logger.warning(f"Failed to send logs to subscriber: {e}")
-                failed_sockets.append(ws)
-
-        # Clean up failed connections
-        for ws in failed_sockets:
-            await self.unsubscribe(ws)
-
-    async def _send_to_subscriber(
-        self,
-        websocket: Any,
+            key = (
+                config.get("min_level", LogLevel.DEBUG),
+                frozenset(sources) if sources is not None else None,
+            )
+            if key not in frames:
+                frames[key] = self._build_frame(robot_id, entries, *key)
+            frame = frames[key]
+            if frame is not None:
+                self._logs_broadcast_dropped += channel.push(*frame)
+
+    @staticmethod
+    def _build_frame(
         robot_id: str,
         entries: list[LogEntry],
-    ) -> None:
+        min_level: LogLevel,
+        sources: frozenset[str] | None,
+    ) -> tuple[str, int] | None:
         """
-        Send log entries to a subscriber.
+        Serialize the entries passing a filter group into one log_batch frame.
 
-        Args:
-            websocket: Subscriber's WebSocket.
-            robot_id: Robot ID.
-            entries: Filtered log entries.
+        Returns:
+            Tuple of (frame, entry_count), or None if no entry passes.
         """
-        import json
-
-        for entry in entries:
-            message = {
-                "type": "log_entry",
-                "robot_id": robot_id,
-                "timestamp": entry.timestamp.isoformat(),
-                "level": entry.level.value,
-                "message": entry.message,
-                "source": entry.source,
+        filtered = [
+            {
+                "timestamp": e.timestamp.isoformat(),
+                "level": e.level.value,
+                "message": e.message,
+                "source": e.source,
             }
-            await websocket.send(json.dumps(message))
+            for e in entries
+            if e.level >= min_level and (sources is None or e.source in sources)
+        ]
+        if not filtered:
+            return None
+        frame = orjson.dumps({"type": "log_batch", "robot_id": robot_id, "logs": filtered})
+        return frame.decode(), len(filtered)
+
+    async def _deliver(self, websocket: Any, channel: _SubscriberChannel) -> None:
+        """
+        Send queued frames to one subscriber until it disconnects.
 
-    async def _persist_worker(self) -> None:
-        """Background worker for persisting logs."""
-        batch: list[LogEntry] = []
-        last_persist = datetime.now(UTC)
+        A failed or timed-out send may have left a partial frame on the
+        socket, so the subscriber is dropped and its WebSocket closed.
 
-        while self._running:
-            try:
-                # Get entries with timeout for periodic flushes
+        Args:
+            websocket: Subscriber's WebSocket.
+            channel: Subscriber's frame queue.
+        """
+        while True:
+            await channel.ready.wait()
+            channel.ready.clear()
+            while channel.frames:
+                channel.max_lag_seconds = max(channel.max_lag_seconds, channel.lag_seconds())
+                _, frame, count = channel.frames.popleft()
                 try:
-                    entries = await asyncio.wait_for(
-                        self._persist_queue.get(),
-                        timeout=1.0,
-                    )
-                    batch.extend(entries)
-                except TimeoutError:
-                    pass
-
-                # Persist when batch is large enough or after timeout
-                now = datetime.now(UTC)
-                should_persist = len(batch) >= MAX_LOG_BATCH_SIZE or (
-                    batch and (now - last_persist).total_seconds() > 5.0
-                )
-
-                if should_persist and batch:
-                    await self._persist_batch(batch)
-                    batch = []
-                    last_persist = now
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Persist worker error: {e}")
-                await asyncio.sleep(1)
-
-        # Final flush
-        if batch:
-            await self._persist_batch(batch)
+                    await asyncio.wait_for(channel.send(frame), timeout=self._send_timeout)
+                except Exception as e:
+                    logger.warning(f"Failed to send logs to subscriber: {e}")
+                    await self.unsubscribe(websocket)
+                    await self._close_subscriber(websocket)
+                    return
+                channel.sent_entries += count
+                self._logs_broadcast += count
+
+    async def _close_subscriber(self, websocket: Any) -> None:
+        """Close a dropped subscriber's WebSocket, ignoring errors."""
+        close = getattr(websocket, "close", None)
+        if close is None:
+            return
+        try:
+            await asyncio.wait_for(
+                close(code=SLOW_SUBSCRIBER_CLOSE_CODE), timeout=self._send_timeout
+            )
+        except Exception as e:
+            logger.debug(f"Failed to close dropped log subscriber: {e}")
 
     async def _persist_batch(self, entries: list[LogEntry]) -> None:
         """
@@ -404,22 +470,6 @@ class LogStreamingService:
             logger.error(f"Failed to persist log batch: {e}")
             self._logs_dropped += len(entries)
 
-    async def _flush_persist_queue(self) -> None:
-        """Flush remaining entries in persist queue."""
-        if not self._repository:
-            return
-
-        batch = []
-        while not self._persist_queue.empty():
-            try:
-                entries = self._persist_queue.get_nowait()
-                batch.extend(entries)
-            except asyncio.QueueEmpty:
-                break
-
-        if batch:
-            await self._persist_batch(batch)
-
     def buffer_log(self, robot_id: str, entry: LogEntry) -> None:
         """
         Buffer a log entry for offline robot.
@@ -472,7 +522,14 @@ class LogStreamingService:
             "logs_broadcast": self._logs_broadcast,
             "logs_persisted": self._logs_persisted,
             "logs_dropped": self._logs_dropped,
-            "persist_queue_size": self._persist_queue.qsize(),
+            "logs_broadcast_dropped": self._logs_broadcast_dropped,
+            "subscriber_pending_frames": sum(len(c.frames) for c in self._channels.values()),
+            "subscriber_max_lag_seconds": max(
+                (max(c.max_lag_seconds, c.lag_seconds()) for c in self._channels.values()),
+                default=0.0,
+            ),
+            "persist_queue_size": len(self._persist_buffer),
+            "persist_buffer": self._persist_buffer.get_stats(),
             "offline_buffers": {
                 robot_id: len(buffer) for robot_id, buffer in self._offline_buffers.items()
             },
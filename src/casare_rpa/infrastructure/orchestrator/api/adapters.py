@@ -6,6 +6,7 @@ and API response models (Pydantic).
 """
 
 import json
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -18,6 +19,7 @@ from casare_rpa.infrastructure.analytics.metrics_aggregator import MetricsAggreg
 from casare_rpa.infrastructure.observability.metrics import (
     RPAMetricsCollector,
 )
+from casare_rpa.infrastructure.persistence.keyset_cursor import decode_cursor, encode_cursor
 
 # Valid job statuses for filtering
 VALID_JOB_STATUSES = frozenset({"pending", "claimed", "completed", "failed"})
@@ -431,9 +433,36 @@ class MonitoringDataAdapter:
         Returns:
             List of dicts matching JobSummary Pydantic model
         """
+        jobs, _ = await self.get_job_history_page(limit, status, workflow_id, robot_id)
+        return jobs
+
+    async def get_job_history_page(
+        self,
+        limit: int = 50,
+        status: str | None = None,
+        workflow_id: str | None = None,
+        robot_id: str | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Get one page of job history with keyset pagination on (created_at, id).
+
+        Args:
+            limit: Max jobs to return (1-500, default 50)
+            status: Filter by status (pending/claimed/completed/failed)
+            workflow_id: Filter by workflow ID
+            robot_id: Filter by robot ID (claimed_by column)
+            cursor: Continuation token from the previous page
+
+        Returns:
+            Tuple of (jobs, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         if not self._db_pool:
             logger.warning("Database pool not configured - returning empty job history")
-            return []
+            return [], None
 
         # Validate and clamp limit
         limit = max(1, min(500, limit))
@@ -441,14 +470,52 @@ class MonitoringDataAdapter:
         # Validate status filter
         if status and status not in VALID_JOB_STATUSES:
             logger.warning(f"Invalid status filter: {status}")
-            return []
+            return [], None
+
+        after = decode_cursor(cursor) if cursor else None
 
         try:
             async with self._db_pool.acquire() as conn:
-                return await self._query_job_history(conn, limit, status, workflow_id, robot_id)
+                jobs = await self._query_job_history(
+                    conn, limit + 1, status, workflow_id, robot_id, after
+                )
         except Exception as e:
             logger.error(f"Database error fetching job history: {e}")
-            return []
+            return [], None
+
+        next_cursor = None
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            next_cursor = encode_cursor(jobs[-1]["created_at"], jobs[-1]["job_id"])
+        return jobs, next_cursor
+
+    async def iter_job_history(
+        self,
+        status: str | None = None,
+        workflow_id: str | None = None,
+        robot_id: str | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream all matching job history rows through a server-side cursor.
+
+        Args:
+            status: Filter by status (pending/claimed/completed/failed)
+            workflow_id: Filter by workflow ID
+            robot_id: Filter by robot ID
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Dicts matching JobSummary Pydantic model, newest first
+        """
+        if not self._db_pool or (status and status not in VALID_JOB_STATUSES):
+            return
+
+        query, params = self._build_job_history_query(status, workflow_id, robot_id, None)
+        async with self._db_pool.acquire() as conn:
+            async with conn.transaction():
+                async for row in conn.cursor(query, *params, prefetch=chunk_size):
+                    yield self._row_to_job_summary(row)
 
     async def _query_job_history(
         self,
@@ -457,6 +524,7 @@ class MonitoringDataAdapter:
         status: str | None,
         workflow_id: str | None,
         robot_id: str | None,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Execute parameterized query for job history.
@@ -464,6 +532,31 @@ class MonitoringDataAdapter:
         Uses dynamic query building with proper parameterization.
         Extracts workflow_id and workflow_name from payload JSONB.
         """
+        query, params = self._build_job_history_query(status, workflow_id, robot_id, after)
+        query += f"\nLIMIT ${len(params) + 1}"
+        params.append(limit)
+
+        logger.debug(f"Executing job history query with {len(params)} params")
+        rows = await conn.fetch(query, *params)
+
+        return [self._row_to_job_summary(row) for row in rows]
+
+    @staticmethod
+    def _build_job_history_query(
+        status: str | None,
+        workflow_id: str | None,
+        robot_id: str | None,
+        after: tuple[datetime, str] | None,
+    ) -> tuple[str, list[Any]]:
+        """
+        Build the job history query, newest first, without LIMIT.
+
+        Args:
+            after: (created_at, id) of the last row already returned
+
+        Returns:
+            Tuple of (query, params)
+        """
         # Build query with parameterized filters
         query_parts = [
             """
@@ -503,15 +596,14 @@ class MonitoringDataAdapter:
             params.append(robot_id)
             param_idx += 1
 
-        query_parts.append(f"ORDER BY created_at DESC LIMIT ${param_idx}")
-        params.append(limit)
+        if after:
+            query_parts.append(f"AND (created_at, id) < (${param_idx}, ${param_idx + 1}::uuid)")
+            params.extend(after)
+            param_idx += 2
 
-        query = "\n".join(query_parts)
+        query_parts.append("ORDER BY created_at DESC, id DESC")
 
-        logger.debug(f"Executing job history query with {len(params)} params")
-        rows = await conn.fetch(query, *params)
-
-        return [self._row_to_job_summary(row) for row in rows]
+        return "\n".join(query_parts), params
 
     def _row_to_job_summary(self, row: Any) -> dict[str, Any]:
         """
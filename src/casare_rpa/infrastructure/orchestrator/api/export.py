@@ -0,0 +1,87 @@
+"""
+Streaming exports for the orchestrator API.
+
+Encodes rows from an async iterator as NDJSON or CSV while they arrive, so
+large exports are sent with constant memory instead of being built in full.
+"""
+
+import csv
+import io
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+import orjson
+from fastapi.responses import StreamingResponse
+from loguru import logger
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Rows encoded per response chunk
+EXPORT_CHUNK_ROWS = 500
+
+
+async def _encode(
+    rows: AsyncIterator[dict[str, Any]], fmt: str, columns: list[str]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    chunk: list[bytes] = []
+
+    if fmt == "csv":
+        writer.writeheader()
+        chunk.append(buffer.getvalue().encode())
+
+    try:
+        async for row in rows:
+            if fmt == "csv":
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerow(
+                    {k: v.isoformat() if isinstance(v, datetime) else v for k, v in row.items()}
+                )
+                chunk.append(buffer.getvalue().encode())
+            else:
+                chunk.append(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+
+            if len(chunk) >= EXPORT_CHUNK_ROWS:
+                yield b"".join(chunk)
+                chunk = []
+    except Exception as e:
+        # The 200 status is already sent: re-raise so the server aborts the
+        # connection and the client sees a truncated download, not a short one
+        logger.error(f"Export stream failed: {e}")
+        raise
+
+    if chunk:
+        yield b"".join(chunk)
+
+
+def streaming_export(
+    rows: AsyncIterator[dict[str, Any]], fmt: str, filename: str, columns: list[str]
+) -> StreamingResponse:
+    """
+    Build a streaming NDJSON or CSV download.
+
+    Args:
+        rows: Async iterator of flat row dicts.
+        fmt: "ndjson" or "csv".
+        filename: Download name without extension.
+        columns: CSV columns (and header order).
+
+    Returns:
+        StreamingResponse encoding rows as they are produced. If rows raises
+        mid-stream the error propagates and the connection is aborted
+        without a terminating chunk.
+    """
+    return StreamingResponse(
+        _encode(rows, fmt, columns),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
+
+
+__all__ = ["EXPORT_FORMATS", "streaming_export"]
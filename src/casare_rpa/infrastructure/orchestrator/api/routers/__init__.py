@@ -5,6 +5,7 @@ from casare_rpa.infrastructure.orchestrator.api.routers import (
     auth,
     dlq,
     jobs,
+    logs,
     metrics,
     robot_api_keys,
     robots,
@@ -18,6 +19,7 @@ __all__ = [
     "auth",
     "dlq",
     "jobs",
+    "logs",
     "metrics",
     "robot_api_keys",
     "robots",
@@ -18,7 +18,12 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from casare_rpa.infrastructure.orchestrator.api.auth import verify_robot_token
-from casare_rpa.infrastructure.queue import JobStatus, get_memory_queue
+from casare_rpa.infrastructure.queue import (
+    JobStatus,
+    JobSubmission,
+    PgQueuerProducer,
+    get_memory_queue,
+)
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -76,11 +81,25 @@ class JobProgressUpdate(BaseModel):
     message: str | None = None
 
 
+class JobProgressItem(BaseModel):
+    """Progress of a single job within a batch update."""
+
+    job_id: str = Field(..., min_length=1, max_length=64)
+    progress: int = Field(..., ge=0, le=100)
+    current_node: str | None = Field(default=None, max_length=255)
+
+
+class JobProgressBatchUpdate(BaseModel):
+    """Request model for updating the progress of several jobs at once."""
+
+    updates: list[JobProgressItem] = Field(..., min_length=1, max_length=500)
+
+
 class JobClaimRequest(BaseModel):
     """Request for robots to claim a job."""
 
     environment: str = Field(default="default", max_length=64)
-    limit: int = Field(default=1, ge=1, le=10)
+    limit: int = Field(default=1, ge=1, le=50)
     visibility_timeout_seconds: int = Field(default=30, ge=5, le=3600)
 
 
@@ -118,9 +137,137 @@ class JobExtendLeaseRequest(BaseModel):
     extension_seconds: int = Field(default=30, ge=5, le=3600)
 
 
+class JobExtendLeasesRequest(BaseModel):
+    """Request body for extending the leases of several running jobs."""
+
+    job_ids: list[str] = Field(..., min_length=1, max_length=500)
+    extension_seconds: int = Field(default=30, ge=5, le=3600)
+
+
+class JobExtendLeasesResponse(BaseModel):
+    """Response for bulk lease extension."""
+
+    extended: list[str]
+    lost: list[str]
+
+
 # ==================== ENDPOINTS ====================
 
 
+# Blob-backed jobs are resolved here: HTTP robots get the workflow inline
+_CLAIM_JOBS_SQL = """
+    WITH claimed AS (
+        UPDATE job_queue
+        SET status = 'running',
+            robot_id = $3,
+            started_at = NOW(),
+            visible_after = NOW() + INTERVAL '1 second' * $4
+        WHERE id IN (
+            SELECT id
+            FROM job_queue
+            WHERE status = 'pending'
+              AND visible_after <= NOW()
+              AND (environment = $1 OR environment = 'default' OR $1 = 'default')
+            ORDER BY priority DESC, created_at ASC
+            LIMIT $2
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING id,
+                  workflow_id,
+                  workflow_name,
+                  workflow_json,
+                  workflow_hash,
+                  priority,
+                  environment,
+                  variables,
+                  created_at,
+                  retry_count,
+                  max_retries,
+                  started_at
+    )
+    SELECT c.id,
+           c.workflow_id,
+           c.workflow_name,
+           COALESCE(b.workflow_json, c.workflow_json) AS workflow_json,
+           c.priority,
+           c.environment,
+           c.variables,
+           c.created_at,
+           c.retry_count,
+           c.max_retries,
+           c.started_at
+    FROM claimed c
+    LEFT JOIN workflow_blobs b ON b.content_hash = c.workflow_hash
+    ORDER BY c.priority DESC, c.created_at ASC;
+"""
+
+
+async def _claim_jobs(payload: JobClaimRequest, robot_id: str) -> list[JobClaimResponse]:
+    """Claim up to payload.limit jobs for a robot in a single statement."""
+    pool = get_db_pool()
+    if pool is None or _use_memory_queue():
+        queue = get_memory_queue(payload.visibility_timeout_seconds)
+        await queue.start()
+        claimed: list[JobClaimResponse] = []
+        for _ in range(payload.limit):
+            job = await queue.claim(robot_id=robot_id, execution_mode=payload.environment)
+            if job is None:
+                break
+            await queue.update_status(job.job_id, JobStatus.RUNNING)
+            workflow_name = (
+                (job.metadata.get("workflow_name") if isinstance(job.metadata, dict) else None)
+                or job.workflow_json.get("metadata", {}).get("name")
+                or "Untitled Workflow"
+            )
+            claimed.append(
+                JobClaimResponse(
+                    job_id=job.job_id,
+                    workflow_id=str(job.workflow_id or ""),
+                    workflow_name=str(workflow_name),
+                    workflow_json=orjson.dumps(job.workflow_json).decode(),
+                    priority=int(job.priority or 0),
+                    environment=payload.environment,
+                    variables=job.metadata.get("variables", {})
+                    if isinstance(job.metadata, dict)
+                    else {},
+                    created_at=job.created_at,
+                    claimed_at=job.claimed_at or job.created_at,
+                    retry_count=int(job.retry_count or 0),
+                    max_retries=int(job.max_retries or 0),
+                )
+            )
+        return claimed
+
+    args = (payload.environment, payload.limit, robot_id, payload.visibility_timeout_seconds)
+    try:
+        async with pool.acquire() as conn:
+            if payload.limit == 1:
+                row = await conn.fetchrow(_CLAIM_JOBS_SQL, *args)
+                rows = [row] if row is not None else []
+            else:
+                rows = await conn.fetch(_CLAIM_JOBS_SQL, *args)
+    except Exception as e:
+        logger.error(f"Failed to claim jobs for robot {robot_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to claim job: {e}") from e
+
+    return [
+        JobClaimResponse(
+            job_id=str(row["id"]),
+            workflow_id=str(row.get("workflow_id") or ""),
+            workflow_name=str(row.get("workflow_name") or ""),
+            workflow_json=str(row.get("workflow_json") or ""),
+            priority=int(row.get("priority") or 0),
+            environment=str(row.get("environment") or "default"),
+            variables=row.get("variables") or {},
+            created_at=row.get("created_at") or datetime.utcnow(),
+            claimed_at=row.get("started_at") or datetime.utcnow(),
+            retry_count=int(row.get("retry_count") or 0),
+            max_retries=int(row.get("max_retries") or 0),
+        )
+        for row in rows
+    ]
+
+
 @router.post(
     "/jobs/claim",
     response_model=JobClaimResponse | None,
@@ -137,92 +284,27 @@ async def claim_job(
     This endpoint allows robots to run without direct database access.
     It uses SKIP LOCKED semantics in a single UPDATE statement.
     """
-    pool = get_db_pool()
-    if pool is None or _use_memory_queue():
-        queue = get_memory_queue(payload.visibility_timeout_seconds)
-        await queue.start()
-        job = await queue.claim(robot_id=robot_id, execution_mode=payload.environment)
-        if job is None:
-            return None
-        await queue.update_status(job.job_id, JobStatus.RUNNING)
-        workflow_name = (
-            job.metadata.get("workflow_name")
-            if isinstance(job.metadata, dict)
-            else None
-        ) or job.workflow_json.get("metadata", {}).get("name") or "Untitled Workflow"
-        return JobClaimResponse(
-            job_id=job.job_id,
-            workflow_id=str(job.workflow_id or ""),
-            workflow_name=str(workflow_name),
-            workflow_json=orjson.dumps(job.workflow_json).decode(),
-            priority=int(job.priority or 0),
-            environment=payload.environment,
-            variables=job.metadata.get("variables", {}) if isinstance(job.metadata, dict) else {},
-            created_at=job.created_at,
-            claimed_at=job.claimed_at or job.created_at,
-            retry_count=int(job.retry_count or 0),
-            max_retries=int(job.max_retries or 0),
-        )
+    jobs = await _claim_jobs(payload.model_copy(update={"limit": 1}), robot_id)
+    return jobs[0] if jobs else None
 
-    try:
-        async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                UPDATE job_queue
-                SET status = 'running',
-                    robot_id = $3,
-                    started_at = NOW(),
-                    visible_after = NOW() + INTERVAL '1 second' * $4
-                WHERE id IN (
-                    SELECT id
-                    FROM job_queue
-                    WHERE status = 'pending'
-                      AND visible_after <= NOW()
-                      AND (environment = $1 OR environment = 'default' OR $1 = 'default')
-                    ORDER BY priority DESC, created_at ASC
-                    LIMIT $2
-                    FOR UPDATE SKIP LOCKED
-                )
-                RETURNING id,
-                          workflow_id,
-                          workflow_name,
-                          workflow_json,
-                          priority,
-                          environment,
-                          variables,
-                          created_at,
-                          retry_count,
-                          max_retries,
-                          started_at;
-                """,
-                payload.environment,
-                payload.limit,
-                robot_id,
-                payload.visibility_timeout_seconds,
-            )
 
-            if row is None:
-                return None
-
-            return JobClaimResponse(
-                job_id=str(row["id"]),
-                workflow_id=str(row.get("workflow_id") or ""),
-                workflow_name=str(row.get("workflow_name") or ""),
-                workflow_json=str(row.get("workflow_json") or ""),
-                priority=int(row.get("priority") or 0),
-                environment=str(row.get("environment") or "default"),
-                variables=row.get("variables") or {},
-                created_at=row.get("created_at") or datetime.utcnow(),
-                claimed_at=row.get("started_at") or datetime.utcnow(),
-                retry_count=int(row.get("retry_count") or 0),
-                max_retries=int(row.get("max_retries") or 0),
-            )
+@router.post(
+    "/jobs/claim-batch",
+    response_model=list[JobClaimResponse],
+    dependencies=[Depends(verify_robot_token)],
+)
+@limiter.limit("120/minute")
+async def claim_jobs(
+    request: Request,
+    payload: JobClaimRequest,
+    robot_id: str = Depends(verify_robot_token),
+):
+    """Claim up to `limit` jobs for an authenticated robot in one statement.
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to claim job for robot {robot_id}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to claim job: {e}") from e
+    Lets a robot fill all of its free execution slots (plus any prefetch
+    buffer) with a single round trip.
+    """
+    return await _claim_jobs(payload, robot_id)
 
 
 @router.post(
@@ -479,6 +561,71 @@ async def extend_job_lease(
         raise HTTPException(status_code=500, detail=f"Failed to extend lease: {e}") from e
 
 
+@router.post(
+    "/jobs/extend-leases",
+    response_model=JobExtendLeasesResponse,
+    dependencies=[Depends(verify_robot_token)],
+)
+@limiter.limit("240/minute")
+async def extend_job_leases(
+    request: Request,
+    payload: JobExtendLeasesRequest,
+    robot_id: str = Depends(verify_robot_token),
+):
+    """Extend the leases of all of a robot's running jobs in one statement.
+
+    Jobs that are no longer running for this robot are reported as lost so
+    the robot can stop executing them.
+    """
+    pool = get_db_pool()
+    if pool is None or _use_memory_queue():
+        queue = get_memory_queue()
+        extended: list[str] = []
+        for job_id in payload.job_ids:
+            job = await queue.get_job(job_id)
+            if (
+                job is not None
+                and job.robot_id == robot_id
+                and job.status == JobStatus.RUNNING
+                and await queue.extend_claim(job_id)
+            ):
+                extended.append(job_id)
+        lost = [job_id for job_id in payload.job_ids if job_id not in extended]
+        return JobExtendLeasesResponse(extended=extended, lost=lost)
+
+    # Malformed IDs can't match a row; report them as lost instead of failing the batch
+    job_uuids: dict[str, uuid.UUID] = {}
+    for job_id in payload.job_ids:
+        try:
+            job_uuids[job_id] = uuid.UUID(job_id)
+        except ValueError:
+            continue
+
+    try:
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                UPDATE job_queue
+                SET visible_after = NOW() + INTERVAL '1 second' * $2
+                WHERE id = ANY($1::uuid[])
+                  AND status = 'running'
+                  AND robot_id = $3
+                RETURNING id;
+                """,
+                list(job_uuids.values()),
+                payload.extension_seconds,
+                robot_id,
+            )
+    except Exception as e:
+        logger.error(f"Failed to extend {len(payload.job_ids)} leases (robot {robot_id}): {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to extend leases: {e}") from e
+
+    renewed = {row["id"] for row in rows}
+    extended = [job_id for job_id, job_uuid in job_uuids.items() if job_uuid in renewed]
+    lost = [job_id for job_id in payload.job_ids if job_id not in extended]
+    return JobExtendLeasesResponse(extended=extended, lost=lost)
+
+
 @router.post("/jobs/{job_id}/cancel", response_model=JobCancelResponse)
 @limiter.limit("60/minute")
 async def cancel_job(
@@ -605,9 +752,12 @@ async def retry_job(
                 # Try job_queue table
                 row = await conn.fetchrow(
                     """
-                    SELECT id as job_id, workflow_id, workflow_json as payload,
-                           environment, priority, status
-                    FROM job_queue WHERE id = $1
+                    SELECT q.id as job_id, q.workflow_id, q.workflow_name,
+                           COALESCE(b.workflow_json, q.workflow_json) as payload,
+                           q.environment, q.priority, q.status, q.tenant_id
+                    FROM job_queue q
+                    LEFT JOIN workflow_blobs b ON b.content_hash = q.workflow_hash
+                    WHERE q.id = $1
                     """,
                     job_id,
                 )
@@ -648,25 +798,27 @@ async def retry_job(
                 now,
             )
 
-            # Also enqueue to job_queue if using PgQueuer
+            # Also enqueue to job_queue if using PgQueuer (NOTIFYs waiting robots)
             try:
-                await conn.execute(
-                    """
-                    INSERT INTO job_queue (
-                        id, workflow_id, workflow_json, environment, priority, status
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, 'pending'
-                    )
-                    """,
-                    new_job_id,
-                    row.get("workflow_id"),
-                    row.get("payload"),
-                    row.get("environment", "default"),
-                    row.get("priority", 1),
+                payload = row.get("payload")
+                # The jobs table has no tenant; keep the queue row's owner
+                tenant_id = row.get("tenant_id") or await conn.fetchval(
+                    "SELECT tenant_id FROM job_queue WHERE id = $1", job_id
+                )
+                submission = JobSubmission(
+                    workflow_id=row.get("workflow_id"),
+                    workflow_name=row.get("workflow_name") or row.get("workflow_id"),
+                    workflow_json=(
+                        payload if isinstance(payload, str) else orjson.dumps(payload).decode()
+                    ),
+                    priority=row.get("priority", 1),
+                    environment=row.get("environment") or "default",
+                    tenant_id=tenant_id or "default",
                 )
-            except Exception:
+                await PgQueuerProducer.enqueue_on_connection(conn, submission, job_id=new_job_id)
+            except Exception as e:
                 # job_queue table might not exist or have different schema
-                pass
+                logger.debug(f"Retry of job {job_id} not added to job_queue: {e}")
 
             logger.info(f"Retried job {job_id} as new job {new_job_id}")
 
@@ -683,6 +835,56 @@ async def retry_job(
         raise HTTPException(status_code=500, detail=f"Failed to retry job: {e}") from e
 
 
+@router.put("/jobs/progress", dependencies=[Depends(verify_robot_token)])
+@limiter.limit("240/minute")
+async def update_jobs_progress(
+    request: Request,
+    payload: JobProgressBatchUpdate,
+):
+    """
+    Update the progress of several running jobs in one statement.
+
+    Used by robot agents, which coalesce per-node progress and flush it
+    periodically instead of writing once per node.
+
+    Rate Limit: 240 requests/minute per IP
+    """
+    pool = get_db_pool()
+    if pool is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+
+    # Last update wins if a job appears twice; malformed IDs can't match a row
+    latest: dict[uuid.UUID, JobProgressItem] = {}
+    for item in payload.updates:
+        try:
+            latest[uuid.UUID(item.job_id)] = item
+        except ValueError:
+            continue
+
+    try:
+        async with pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE jobs AS j
+                SET progress = u.progress,
+                    current_node = COALESCE(u.current_node, j.current_node),
+                    updated_at = NOW()
+                FROM unnest($1::uuid[], $2::int[], $3::text[])
+                    AS u(job_id, progress, current_node)
+                WHERE j.job_id = u.job_id
+                AND j.status = 'running'
+                """,
+                list(latest),
+                [item.progress for item in latest.values()],
+                [item.current_node for item in latest.values()],
+            )
+    except Exception as e:
+        logger.error(f"Failed to update progress for {len(payload.updates)} jobs: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to update progress: {e}") from e
+
+    return {"updated": int(result.split()[-1]) if result else 0}
+
+
 @router.put("/jobs/{job_id}/progress")
 @limiter.limit("600/minute")
 async def update_job_progress(
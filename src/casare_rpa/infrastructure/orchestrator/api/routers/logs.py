@@ -0,0 +1,182 @@
+"""
+REST API endpoints for robot log history.
+
+Provides keyset-paginated log queries and streaming NDJSON/CSV export.
+Live log streaming stays on the /ws/logs WebSocket.
+"""
+
+from datetime import datetime
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from loguru import logger
+from pydantic import BaseModel
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from casare_rpa.domain.value_objects.log_entry import LogLevel, LogQuery
+from casare_rpa.infrastructure.orchestrator.api.auth import AuthenticatedUser, get_current_user
+from casare_rpa.infrastructure.orchestrator.api.export import streaming_export
+from casare_rpa.infrastructure.orchestrator.server_lifecycle import get_log_repository
+
+router = APIRouter()
+limiter = Limiter(key_func=get_remote_address)
+
+LOG_EXPORT_COLUMNS = [
+    "id",
+    "robot_id",
+    "tenant_id",
+    "timestamp",
+    "level",
+    "message",
+    "source",
+    "extra",
+]
+
+
+# ==================== PYDANTIC MODELS ====================
+
+
+class LogEntryResponse(BaseModel):
+    """Response model for a log entry."""
+
+    id: str
+    robot_id: str
+    tenant_id: str
+    timestamp: datetime
+    level: str
+    message: str
+    source: str | None = None
+    extra: dict[str, Any] | None = None
+
+
+class LogPageResponse(BaseModel):
+    """Response model for one page of logs."""
+
+    entries: list[LogEntryResponse]
+    next_cursor: str | None = None
+
+
+# ==================== HELPERS ====================
+
+
+def _build_query(
+    user: AuthenticatedUser,
+    tenant_id: str | None,
+    robot_id: str | None,
+    start_time: datetime | None,
+    end_time: datetime | None,
+    min_level: str,
+    source: str | None,
+    search: str | None,
+    limit: int = 100,
+) -> LogQuery:
+    """Build a LogQuery scoped to the caller's tenant."""
+    if user.tenant_id and tenant_id and tenant_id != user.tenant_id:
+        raise HTTPException(status_code=403, detail="Cannot read logs of another tenant")
+    effective_tenant = user.tenant_id or tenant_id
+    if not effective_tenant:
+        raise HTTPException(status_code=400, detail="tenant_id is required")
+
+    return LogQuery(
+        tenant_id=effective_tenant,
+        robot_id=robot_id,
+        start_time=start_time,
+        end_time=end_time,
+        min_level=LogLevel.from_string(min_level),
+        source=source,
+        search_text=search,
+        limit=limit,
+    )
+
+
+def _get_repository():
+    repository = get_log_repository()
+    if repository is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Log service not available. Database may not be configured.",
+        )
+    return repository
+
+
+# ==================== ENDPOINTS ====================
+
+
+@router.get("/logs", response_model=LogPageResponse)
+@limiter.limit("60/minute")
+async def list_logs(
+    request: Request,
+    tenant_id: str | None = Query(None, description="Tenant (admins without a tenant only)"),
+    robot_id: str | None = Query(None, description="Filter by robot ID"),
+    start_time: datetime | None = Query(None, description="Earliest timestamp"),
+    end_time: datetime | None = Query(None, description="Latest timestamp"),
+    min_level: str = Query("DEBUG", description="Minimum log level"),
+    source: str | None = Query(None, description="Filter by source"),
+    search: str | None = Query(None, description="Substring search in message"),
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    List robot logs, newest first, with cursor pagination.
+
+    Pass the returned next_cursor to fetch the following page; it is null
+    on the last page.
+
+    Rate Limit: 60 requests/minute per IP
+    """
+    query = _build_query(
+        user, tenant_id, robot_id, start_time, end_time, min_level, source, search, limit
+    )
+    repository = _get_repository()
+
+    try:
+        entries, next_cursor = await repository.query_page(query, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Failed to query logs: {e}")
+        raise HTTPException(status_code=500, detail="Failed to query logs") from e
+
+    return LogPageResponse(
+        entries=[LogEntryResponse(**entry.to_dict()) for entry in entries],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/logs/export")
+@limiter.limit("5/minute")
+async def export_logs(
+    request: Request,
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson or csv"
+    ),
+    tenant_id: str | None = Query(None, description="Tenant (admins without a tenant only)"),
+    robot_id: str | None = Query(None, description="Filter by robot ID"),
+    start_time: datetime | None = Query(None, description="Earliest timestamp"),
+    end_time: datetime | None = Query(None, description="Latest timestamp"),
+    min_level: str = Query("DEBUG", description="Minimum log level"),
+    source: str | None = Query(None, description="Filter by source"),
+    search: str | None = Query(None, description="Substring search in message"),
+    user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Stream all matching robot logs as NDJSON or CSV.
+
+    Rows are read through a server-side cursor and encoded as they arrive.
+
+    Rate Limit: 5 requests/minute per IP
+    """
+    query = _build_query(user, tenant_id, robot_id, start_time, end_time, min_level, source, search)
+    repository = _get_repository()
+
+    async def rows():
+        async for entry in repository.iter_entries(query):
+            row = entry.to_dict()
+            if export_format == "csv":
+                row["extra"] = orjson.dumps(row.get("extra") or {}).decode()
+            yield row
+
+    return streaming_export(rows(), export_format, "robot_logs", LOG_EXPORT_COLUMNS)
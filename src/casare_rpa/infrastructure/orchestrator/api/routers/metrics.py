@@ -17,6 +17,7 @@ from fastapi import (
     Path,
     Query,
     Request,
+    Response,
     WebSocket,
     WebSocketDisconnect,
 )
@@ -35,6 +36,7 @@ from casare_rpa.infrastructure.observability.metrics import (
 from casare_rpa.infrastructure.orchestrator.api.dependencies import (
     get_metrics_collector,
 )
+from casare_rpa.infrastructure.orchestrator.api.export import streaming_export
 from casare_rpa.infrastructure.orchestrator.api.models import (
     ActivityEvent,
     ActivityResponse,
@@ -151,12 +153,14 @@ async def get_robot_details(
 @limiter.limit("50/minute")
 async def get_jobs(
     request: Request,
+    response: Response,
     limit: int = Query(50, ge=1, le=500, description="Number of jobs to return"),
     status: str | None = Query(
         None, description="Filter by status: pending, claimed, completed, failed"
     ),
     workflow_id: str | None = Query(None, description="Filter by workflow ID"),
     robot_id: str | None = Query(None, description="Filter by robot ID"),
+    cursor: str | None = Query(None, description="Continuation token from X-Next-Cursor"),
 ):
     """
     Get job execution history with filtering and pagination.
@@ -166,8 +170,11 @@ async def get_jobs(
         - status: Filter by job status
         - workflow_id: Filter by workflow
         - robot_id: Filter by robot
+        - cursor: Continuation token of the next page
 
     Returns paginated job history sorted by creation time (newest first).
+    The X-Next-Cursor response header carries the token for the next page
+    and is absent on the last page.
 
     Rate Limit: 50 requests/minute per IP (lower for database queries)
     """
@@ -179,17 +186,49 @@ async def get_jobs(
     collector = get_metrics_collector(request)
 
     try:
-        jobs = await collector.get_job_history(
+        jobs, next_cursor = await collector.get_job_history_page(
             limit=limit,
             status=status,
             workflow_id=workflow_id,
             robot_id=robot_id,
+            cursor=cursor,
         )
-        return [JobSummary(**job) for job in jobs]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Failed to fetch jobs: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch jobs") from e
 
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [JobSummary(**job) for job in jobs]
+
+
+@router.get("/metrics/jobs/export")
+@limiter.limit("5/minute")
+async def export_jobs(
+    request: Request,
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson or csv"
+    ),
+    status: str | None = Query(
+        None, description="Filter by status: pending, claimed, completed, failed"
+    ),
+    workflow_id: str | None = Query(None, description="Filter by workflow ID"),
+    robot_id: str | None = Query(None, description="Filter by robot ID"),
+):
+    """
+    Stream the full job history as NDJSON or CSV.
+
+    Rows are read through a server-side cursor and encoded as they arrive,
+    newest first.
+
+    Rate Limit: 5 requests/minute per IP
+    """
+    collector = get_metrics_collector(request)
+    rows = collector.iter_job_history(status=status, workflow_id=workflow_id, robot_id=robot_id)
+    return streaming_export(rows, export_format, "jobs", list(JobSummary.model_fields))
+
 
 @router.get("/metrics/jobs/{job_id}", response_model=JobDetails)
 @limiter.limit("200/minute")
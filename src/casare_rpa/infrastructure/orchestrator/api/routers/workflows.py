@@ -40,7 +40,10 @@ from casare_rpa.infrastructure.orchestrator.api.auth import (
     AuthenticatedUser,
     get_current_user,
 )
+from casare_rpa.infrastructure.orchestrator.server_lifecycle import get_job_producer
 from casare_rpa.infrastructure.queue import (
+    JobSubmission,
+    PgQueuerProducer,
     get_memory_queue,
 )
 
@@ -312,9 +315,14 @@ async def enqueue_job(
     priority: int,
     execution_mode: str,
     metadata: dict[str, Any],
+    tenant_id: str | None = None,
 ) -> str:
     """
-    Enqueue job to queue (PostgreSQL jobs table or MemoryQueue fallback).
+    Enqueue job to queue (PostgreSQL job_queue table or MemoryQueue fallback).
+
+    Goes through the orchestrator's PgQueuerProducer when it is running,
+    otherwise enqueues on a pooled connection. Either way the workflow is
+    stored as a content-addressed blob and listening robots are NOTIFYed.
 
     Args:
         workflow_id: Workflow identifier
@@ -322,6 +330,7 @@ async def enqueue_job(
         priority: Job priority
         execution_mode: lan or internet
         metadata: Additional job metadata
+        tenant_id: Submitting tenant, used for fair-share claiming
 
     Returns:
         job_id: Created job identifier
@@ -367,42 +376,46 @@ async def enqueue_job(
         )
 
     try:
-        job_id = str(uuid.uuid4())
-
         # Get workflow name from metadata or workflow_json
         workflow_name = (
             metadata.get("workflow_name")
             or workflow_json.get("metadata", {}).get("name")
             or "Untitled Workflow"
         )
+        submission = JobSubmission(
+            workflow_id=workflow_id,
+            workflow_name=workflow_name,
+            workflow_json=orjson.dumps(workflow_json).decode(),
+            priority=priority,
+            environment=execution_mode,  # Use execution_mode as environment
+            tenant_id=tenant_id or "default",
+            metadata=metadata,
+        )
 
-        async with pool.acquire() as conn:
-            # Insert into job_queue table (used by Robot's PgQueuerConsumer)
-            await conn.execute(
-                """
-                INSERT INTO job_queue (
-                    id, workflow_id, workflow_name, workflow_json,
-                    priority, status, environment, visible_after,
-                    created_at, retry_count, max_retries, metadata
-                ) VALUES ($1, $2, $3, $4, $5, 'pending', $6, NOW(), NOW(), 0, 3, $7)
-                """,
-                uuid.UUID(job_id),
-                workflow_id,
-                workflow_name,
-                orjson.dumps(workflow_json).decode(),  # Store as JSON text
-                priority,
-                execution_mode,  # Use execution_mode as environment
-                orjson.dumps(metadata).decode(),
+        producer = get_job_producer()
+        if producer is not None and producer.is_connected:
+            job = await producer.enqueue_job(
+                workflow_id=submission.workflow_id,
+                workflow_name=submission.workflow_name,
+                workflow_json=submission.workflow_json,
+                priority=submission.priority,
+                environment=submission.environment,
+                max_retries=submission.max_retries,
+                tenant_id=submission.tenant_id,
+                metadata=submission.metadata,
             )
+        else:
+            async with pool.acquire() as conn:
+                job = await PgQueuerProducer.enqueue_on_connection(conn, submission)
 
         logger.info(
             "Job enqueued to job_queue: {} (workflow={}, name={}, mode={})",
-            job_id,
+            job.job_id,
             workflow_id,
             workflow_name,
             execution_mode,
         )
-        return job_id
+        return job.job_id
 
     except Exception as e:
         logger.error("Failed to enqueue job to database: {} - falling back to memory queue", e)
@@ -489,6 +502,7 @@ async def submit_workflow(
                 priority=request.priority,
                 execution_mode=request.execution_mode,
                 metadata=request.metadata,
+                tenant_id=current_user.tenant_id,
             )
             status_message = f"Workflow submitted and queued for {request.execution_mode} execution"
 
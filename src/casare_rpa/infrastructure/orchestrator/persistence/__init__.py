@@ -28,9 +28,19 @@ from casare_rpa.infrastructure.orchestrator.persistence.pg_robot_repository impo
     CREATE_ROBOTS_TABLE_SQL,
     PgRobotRepository,
 )
+from casare_rpa.infrastructure.orchestrator.persistence.sqlite_storage_repository import (
+    SqliteStorageRepository,
+)
+from casare_rpa.infrastructure.orchestrator.persistence.storage_factory import (
+    get_local_storage,
+    reset_local_storage,
+)
 
 __all__ = [
     "LocalStorageRepository",
+    "SqliteStorageRepository",
+    "get_local_storage",
+    "reset_local_storage",
     "LocalJobRepository",
     "LocalRobotRepository",
     "LocalWorkflowRepository",
@@ -5,21 +5,21 @@ from casare_rpa.domain.orchestrator.repositories import JobRepository
 from casare_rpa.infrastructure.orchestrator.persistence.local_storage_repository import (
     LocalStorageRepository,
 )
+from casare_rpa.infrastructure.orchestrator.persistence.sqlite_storage_repository import (
+    SqliteStorageRepository,
+)
 
 
 class LocalJobRepository(JobRepository):
     """Local storage implementation of JobRepository."""
 
-    def __init__(self, storage: LocalStorageRepository):
+    def __init__(self, storage: LocalStorageRepository | SqliteStorageRepository):
         self._storage = storage
 
     async def get_by_id(self, job_id: str) -> Job | None:
         """Get job by ID."""
-        jobs = self._storage.get_jobs(limit=1000)
-        for j in jobs:
-            if j["id"] == job_id:
-                return Job.from_dict(j)
-        return None
+        job = self._storage.get_job(job_id)
+        return Job.from_dict(job) if job else None
 
     async def get_all(self) -> list[Job]:
         """Get all jobs."""
@@ -33,19 +33,23 @@ class LocalJobRepository(JobRepository):
 
     async def get_by_robot(self, robot_id: str) -> list[Job]:
         """Get jobs assigned to robot."""
-        jobs = self._storage.get_jobs(limit=1000)
-        return [Job.from_dict(j) for j in jobs if j.get("robot_id") == robot_id]
+        jobs = self._storage.get_jobs(limit=1000, robot_id=robot_id)
+        return [Job.from_dict(j) for j in jobs]
 
     async def get_by_workflow(self, workflow_id: str) -> list[Job]:
         """Get jobs for workflow."""
-        jobs = self._storage.get_jobs(limit=1000)
-        return [Job.from_dict(j) for j in jobs if j.get("workflow_id") == workflow_id]
+        jobs = self._storage.get_jobs(limit=1000, workflow_id=workflow_id)
+        return [Job.from_dict(j) for j in jobs]
 
     async def save(self, job: Job) -> None:
         """Save or update job."""
         job_dict = job.to_dict()
         self._storage.save_job(job_dict)
 
+    async def save_many(self, jobs: list[Job]) -> None:
+        """Save or update jobs in one write."""
+        self._storage.save_jobs([job.to_dict() for job in jobs])
+
     async def delete(self, job_id: str) -> None:
         """Delete job by ID."""
         self._storage.delete_job(job_id)
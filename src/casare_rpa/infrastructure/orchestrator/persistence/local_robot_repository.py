@@ -5,12 +5,15 @@ from casare_rpa.domain.orchestrator.repositories import RobotRepository
 from casare_rpa.infrastructure.orchestrator.persistence.local_storage_repository import (
     LocalStorageRepository,
 )
+from casare_rpa.infrastructure.orchestrator.persistence.sqlite_storage_repository import (
+    SqliteStorageRepository,
+)
 
 
 class LocalRobotRepository(RobotRepository):
     """Local storage implementation of RobotRepository."""
 
-    def __init__(self, storage: LocalStorageRepository):
+    def __init__(self, storage: LocalStorageRepository | SqliteStorageRepository):
         self._storage = storage
 
     async def get_by_id(self, robot_id: str) -> Robot | None:
@@ -5,12 +5,15 @@ from casare_rpa.domain.orchestrator.repositories import ScheduleRepository
 from casare_rpa.infrastructure.orchestrator.persistence.local_storage_repository import (
     LocalStorageRepository,
 )
+from casare_rpa.infrastructure.orchestrator.persistence.sqlite_storage_repository import (
+    SqliteStorageRepository,
+)
 
 
 class LocalScheduleRepository(ScheduleRepository):
     """Local storage implementation of ScheduleRepository."""
 
-    def __init__(self, storage: LocalStorageRepository):
+    def __init__(self, storage: LocalStorageRepository | SqliteStorageRepository):
         self._storage = storage
 
     async def get_by_id(self, schedule_id: str) -> Schedule | None:
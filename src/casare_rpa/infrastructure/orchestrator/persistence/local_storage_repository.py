@@ -79,24 +79,48 @@ class LocalStorageRepository:
 
     # ==================== JOBS ====================
 
-    def get_jobs(self, limit: int = 100, status: str | None = None) -> list[dict[str, Any]]:
+    def get_jobs(
+        self,
+        limit: int = 100,
+        status: str | None = None,
+        robot_id: str | None = None,
+        workflow_id: str | None = None,
+    ) -> list[dict[str, Any]]:
         """Get jobs with optional filtering."""
         jobs = self._load_json(self._jobs_file)
         if status:
             jobs = [j for j in jobs if j.get("status") == status]
+        if robot_id:
+            jobs = [j for j in jobs if j.get("robot_id") == robot_id]
+        if workflow_id:
+            jobs = [j for j in jobs if j.get("workflow_id") == workflow_id]
         # Sort by created_at descending
         jobs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
         return jobs[:limit]
 
+    def get_job(self, job_id: str) -> dict[str, Any] | None:
+        """Get a single job by ID."""
+        for j in self._load_json(self._jobs_file):
+            if j["id"] == job_id:
+                return j
+        return None
+
     def save_job(self, job: dict[str, Any]) -> bool:
         """Save or update a job."""
-        jobs = self._load_json(self._jobs_file)
-        for i, j in enumerate(jobs):
-            if j["id"] == job["id"]:
-                jobs[i] = job
-                return self._save_json(self._jobs_file, jobs)
-        jobs.append(job)
-        return self._save_json(self._jobs_file, jobs)
+        return self.save_jobs([job])
+
+    def save_jobs(self, jobs: list[dict[str, Any]]) -> bool:
+        """Save or update many jobs with a single file rewrite."""
+        stored = self._load_json(self._jobs_file)
+        index = {j["id"]: i for i, j in enumerate(stored)}
+        for job in jobs:
+            i = index.get(job["id"])
+            if i is None:
+                index[job["id"]] = len(stored)
+                stored.append(job)
+            else:
+                stored[i] = job
+        return self._save_json(self._jobs_file, stored)
 
     def delete_job(self, job_id: str) -> bool:
         """Delete a job."""
@@ -4,13 +4,16 @@ from casare_rpa.domain.orchestrator.repositories import TriggerRepository
 from casare_rpa.infrastructure.orchestrator.persistence.local_storage_repository import (
     LocalStorageRepository,
 )
+from casare_rpa.infrastructure.orchestrator.persistence.sqlite_storage_repository import (
+    SqliteStorageRepository,
+)
 from casare_rpa.triggers.base import BaseTriggerConfig, TriggerType
 
 
 class LocalTriggerRepository(TriggerRepository):
     """Local storage implementation of TriggerRepository."""
 
-    def __init__(self, storage: LocalStorageRepository):
+    def __init__(self, storage: LocalStorageRepository | SqliteStorageRepository):
         self._storage = storage
 
     async def get_by_id(self, trigger_id: str) -> BaseTriggerConfig | None:
@@ -5,12 +5,15 @@ from casare_rpa.domain.orchestrator.repositories import WorkflowRepository
 from casare_rpa.infrastructure.orchestrator.persistence.local_storage_repository import (
     LocalStorageRepository,
 )
+from casare_rpa.infrastructure.orchestrator.persistence.sqlite_storage_repository import (
+    SqliteStorageRepository,
+)
 
 
 class LocalWorkflowRepository(WorkflowRepository):
     """Local storage implementation of WorkflowRepository."""
 
-    def __init__(self, storage: LocalStorageRepository):
+    def __init__(self, storage: LocalStorageRepository | SqliteStorageRepository):
         self._storage = storage
 
     async def get_by_id(self, workflow_id: str) -> Workflow | None:
@@ -0,0 +1,278 @@
+"""
+Local storage repository implementation using SQLite.
+Drop-in replacement for LocalStorageRepository that scales to large job
+histories: each record is a row, so saving one job no longer rewrites a file
+holding every job.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+# Tables holding one JSON document per row. Extra columns are copied out of
+# the document on write so they can be indexed and filtered in SQL.
+_TABLES: dict[str, tuple[str, ...]] = {
+    "robots": (),
+    "jobs": ("status", "robot_id", "workflow_id", "created_at"),
+    "workflows": (),
+    "schedules": (),
+    "triggers": ("scenario_id",),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS robots (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS workflows (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS schedules (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT,
+    robot_id TEXT,
+    workflow_id TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS triggers (
+    id TEXT PRIMARY KEY,
+    scenario_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_robot_created ON jobs(robot_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_workflow_created ON jobs(workflow_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_triggers_scenario ON triggers(scenario_id);
+"""
+
+
+class SqliteStorageRepository:
+    """
+    SQLite storage repository for offline/single-node mode.
+
+    Exposes the same methods as LocalStorageRepository, so the Local*Repository
+    adapters accept either. The database runs in WAL mode: readers never block
+    the writer, and each save is a single-row upsert in its own transaction.
+    """
+
+    DB_FILENAME = "orchestrator.db"
+
+    def __init__(self, storage_dir: Path | None = None, db_path: Path | None = None):
+        """
+        Initialize SQLite storage.
+
+        Args:
+            storage_dir: Directory for the database (default ~/.casare_rpa/orchestrator)
+            db_path: Explicit database file, overrides storage_dir
+        """
+        self.storage_dir = storage_dir or Path.home() / ".casare_rpa" / "orchestrator"
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path or self.storage_dir / self.DB_FILENAME
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ==================== GENERIC ====================
+
+    def _select(self, sql: str, params: Iterable[Any] = ()) -> list[dict[str, Any]]:
+        """Run a query returning data documents."""
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, tuple(params)).fetchall()
+            return [json.loads(row[0]) for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to query {self.db_path}: {e}")
+            return []
+
+    def _upsert_many(self, table: str, records: Iterable[dict[str, Any]]) -> bool:
+        """Insert or replace records in one transaction."""
+        columns = _TABLES[table]
+        all_columns = ("id", *columns, "data")
+        sql = (
+            f"INSERT INTO {table} ({', '.join(all_columns)}) "
+            f"VALUES ({', '.join('?' * len(all_columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET "
+            + ", ".join(f"{c} = excluded.{c}" for c in all_columns[1:])
+        )
+        rows = [
+            (
+                record["id"],
+                *(_column_value(record.get(c)) for c in columns),
+                json.dumps(record, default=str),
+            )
+            for record in records
+        ]
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(sql, rows)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save to {table}: {e}")
+            return False
+
+    def _delete_where(self, table: str, column: str, value: Any) -> int:
+        """Delete rows matching a column value. Returns -1 on failure."""
+        try:
+            with self._lock, self._conn:
+                cursor = self._conn.execute(f"DELETE FROM {table} WHERE {column} = ?", (value,))
+            return cursor.rowcount
+        except Exception as e:
+            logger.error(f"Failed to delete from {table}: {e}")
+            return -1
+
+    def _get_all(self, table: str) -> list[dict[str, Any]]:
+        return self._select(f"SELECT data FROM {table} ORDER BY rowid")
+
+    # ==================== ROBOTS ====================
+
+    def get_robots(self) -> list[dict[str, Any]]:
+        """Get all robots from local storage."""
+        return self._get_all("robots")
+
+    def save_robot(self, robot: dict[str, Any]) -> bool:
+        """Save or update a robot."""
+        return self._upsert_many("robots", [robot])
+
+    def delete_robot(self, robot_id: str) -> bool:
+        """Delete a robot."""
+        return self._delete_where("robots", "id", robot_id) >= 0
+
+    # ==================== JOBS ====================
+
+    def get_jobs(
+        self,
+        limit: int = 100,
+        status: str | None = None,
+        robot_id: str | None = None,
+        workflow_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get jobs with optional filtering, newest first."""
+        clauses = []
+        params: list[Any] = []
+        for column, value in (
+            ("status", status),
+            ("robot_id", robot_id),
+            ("workflow_id", workflow_id),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        params.append(limit)
+        return self._select(
+            f"SELECT data FROM jobs {where}ORDER BY created_at DESC LIMIT ?", params
+        )
+
+    def get_job(self, job_id: str) -> dict[str, Any] | None:
+        """Get a single job by ID."""
+        rows = self._select("SELECT data FROM jobs WHERE id = ?", (job_id,))
+        return rows[0] if rows else None
+
+    def save_job(self, job: dict[str, Any]) -> bool:
+        """Save or update a job."""
+        return self._upsert_many("jobs", [job])
+
+    def save_jobs(self, jobs: list[dict[str, Any]]) -> bool:
+        """Save or update many jobs in one transaction."""
+        return self._upsert_many("jobs", jobs)
+
+    def delete_job(self, job_id: str) -> bool:
+        """Delete a job."""
+        return self._delete_where("jobs", "id", job_id) >= 0
+
+    # ==================== WORKFLOWS ====================
+
+    def get_workflows(self) -> list[dict[str, Any]]:
+        """Get all workflows from local storage."""
+        return self._get_all("workflows")
+
+    def save_workflow(self, workflow: dict[str, Any]) -> bool:
+        """Save or update a workflow."""
+        return self._upsert_many("workflows", [workflow])
+
+    def delete_workflow(self, workflow_id: str) -> bool:
+        """Delete a workflow."""
+        return self._delete_where("workflows", "id", workflow_id) >= 0
+
+    # ==================== SCHEDULES ====================
+
+    def get_schedules(self) -> list[dict[str, Any]]:
+        """Get all schedules from local storage."""
+        return self._get_all("schedules")
+
+    def save_schedule(self, schedule: dict[str, Any]) -> bool:
+        """Save or update a schedule."""
+        return self._upsert_many("schedules", [schedule])
+
+    def delete_schedule(self, schedule_id: str) -> bool:
+        """Delete a schedule."""
+        return self._delete_where("schedules", "id", schedule_id) >= 0
+
+    # ==================== TRIGGERS ====================
+
+    def get_triggers(self) -> list[dict[str, Any]]:
+        """Get all triggers from local storage."""
+        return self._get_all("triggers")
+
+    def save_trigger(self, trigger: dict[str, Any]) -> bool:
+        """Save or update a trigger."""
+        return self._upsert_many("triggers", [trigger])
+
+    def delete_trigger(self, trigger_id: str) -> bool:
+        """Delete a trigger."""
+        return self._delete_where("triggers", "id", trigger_id) >= 0
+
+    def delete_triggers_by_scenario(self, scenario_id: str) -> int:
+        """Delete all triggers for a scenario. Returns count deleted."""
+        return max(self._delete_where("triggers", "scenario_id", scenario_id), 0)
+
+    # ==================== IMPORT ====================
+
+    def import_json(self, json_dir: Path | None = None) -> dict[str, int]:
+        """
+        Import records from LocalStorageRepository JSON files.
+
+        Existing rows with the same ID are overwritten, so the import can be
+        re-run safely. Missing or unreadable files are skipped.
+
+        Args:
+            json_dir: Directory holding robots.json, jobs.json, ... (default storage_dir)
+
+        Returns:
+            Number of records imported per table
+        """
+        json_dir = json_dir or self.storage_dir
+        counts: dict[str, int] = {}
+        for table in _TABLES:
+            file_path = json_dir / f"{table}.json"
+            if not file_path.exists():
+                continue
+            try:
+                records = [r for r in json.loads(file_path.read_text()) if r.get("id")]
+            except Exception as e:
+                logger.error(f"Failed to load {file_path}: {e}")
+                continue
+            if self._upsert_many(table, records):
+                counts[table] = len(records)
+        logger.info(f"Imported local storage JSON into {self.db_path}: {counts}")
+        return counts
+
+
+def _column_value(value: Any) -> Any:
+    """Coerce a document field to a value SQLite can index."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
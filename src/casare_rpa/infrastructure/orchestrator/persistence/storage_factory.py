@@ -0,0 +1,76 @@
+"""
+Local storage factory.
+
+Selects the storage backend for offline/single-node mode from the
+CASARE_LOCAL_STORAGE environment variable ("sqlite", the default, or "json")
+and migrates existing JSON files into SQLite the first time the database is
+created.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+from loguru import logger
+
+from casare_rpa.infrastructure.orchestrator.persistence.local_storage_repository import (
+    LocalStorageRepository,
+)
+from casare_rpa.infrastructure.orchestrator.persistence.sqlite_storage_repository import (
+    SqliteStorageRepository,
+)
+
+STORAGE_BACKEND_ENV = "CASARE_LOCAL_STORAGE"
+
+_instances: dict[tuple[str, Path], LocalStorageRepository | SqliteStorageRepository] = {}
+_instances_lock = threading.Lock()
+
+
+def get_local_storage(
+    storage_dir: Path | None = None,
+    backend: str | None = None,
+) -> LocalStorageRepository | SqliteStorageRepository:
+    """
+    Get the shared local storage repository for a directory.
+
+    Args:
+        storage_dir: Storage directory (default ~/.casare_rpa/orchestrator)
+        backend: "sqlite" or "json" (default from CASARE_LOCAL_STORAGE, else sqlite)
+
+    Returns:
+        Storage repository, one instance per backend and directory
+    """
+    backend = (backend or os.getenv(STORAGE_BACKEND_ENV) or "sqlite").strip().lower()
+    if backend not in ("sqlite", "json"):
+        logger.warning(f"Unknown {STORAGE_BACKEND_ENV}={backend!r}, using sqlite")
+        backend = "sqlite"
+    storage_dir = storage_dir or Path.home() / ".casare_rpa" / "orchestrator"
+
+    key = (backend, storage_dir)
+    with _instances_lock:
+        storage = _instances.get(key)
+        if storage is None:
+            if backend == "json":
+                storage = LocalStorageRepository(storage_dir=storage_dir)
+            else:
+                storage = _open_sqlite(storage_dir)
+            _instances[key] = storage
+    return storage
+
+
+def _open_sqlite(storage_dir: Path) -> SqliteStorageRepository:
+    """Open the SQLite store, importing legacy JSON files when it is new."""
+    first_use = not (storage_dir / SqliteStorageRepository.DB_FILENAME).exists()
+    storage = SqliteStorageRepository(storage_dir=storage_dir)
+    if first_use and any(storage_dir.glob("*.json")):
+        storage.import_json(storage_dir)
+    return storage
+
+
+def reset_local_storage() -> None:
+    """Close and forget the shared repositories (for tests and shutdown)."""
+    with _instances_lock:
+        for storage in _instances.values():
+            if isinstance(storage, SqliteStorageRepository):
+                storage.close()
+        _instances.clear()
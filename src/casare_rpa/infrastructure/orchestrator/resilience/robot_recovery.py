@@ -213,12 +213,16 @@ class RobotRecoveryManager:
         RETURNING id, name, status;
     """
 
+    # Blob-backed jobs store only workflow_hash; resolve the definition from workflow_blobs
     SQL_FIND_CLAIMED_JOBS = """
-        SELECT id, workflow_id, workflow_name, workflow_json, priority,
-               environment, variables, retry_count, max_retries, created_at, started_at
-        FROM {job_table}
-        WHERE robot_id = $1 AND status = 'running'
-        ORDER BY priority DESC, created_at ASC;
+        SELECT q.id, q.workflow_id, q.workflow_name,
+               COALESCE(b.workflow_json, q.workflow_json) AS workflow_json, q.priority,
+               q.environment, q.variables, q.retry_count, q.max_retries, q.created_at,
+               q.started_at
+        FROM {job_table} q
+        LEFT JOIN workflow_blobs b ON b.content_hash = q.workflow_hash
+        WHERE q.robot_id = $1 AND q.status = 'running'
+        ORDER BY q.priority DESC, q.created_at ASC;
     """
 
     SQL_RELEASE_JOB_TO_QUEUE = """
@@ -261,10 +265,12 @@ class RobotRecoveryManager:
             variables, error_message, retry_count, failed_at,
             original_created_at, robot_id
         )
-        SELECT id, workflow_id, workflow_name, workflow_json,
-               variables, $2, retry_count, NOW(), created_at, $3
-        FROM {job_table}
-        WHERE id = $1
+        SELECT q.id, q.workflow_id, q.workflow_name,
+               COALESCE(b.workflow_json, q.workflow_json),
+               q.variables, $2, q.retry_count, NOW(), q.created_at, $3
+        FROM {job_table} q
+        LEFT JOIN workflow_blobs b ON b.content_hash = q.workflow_hash
+        WHERE q.id = $1
         RETURNING job_id;
     """
 
@@ -38,6 +38,22 @@ class ClaimedJob:
     max_retries: int
 
 
+def _parse_claimed_job(data: dict[str, Any]) -> ClaimedJob:
+    return ClaimedJob(
+        job_id=data["job_id"],
+        workflow_id=data.get("workflow_id") or "",
+        workflow_name=data.get("workflow_name") or "",
+        workflow_json=data.get("workflow_json") or "",
+        priority=int(data.get("priority") or 0),
+        environment=data.get("environment") or "default",
+        variables=data.get("variables") or {},
+        created_at=datetime.fromisoformat(str(data["created_at"]).replace("Z", "+00:00")),
+        claimed_at=datetime.fromisoformat(str(data["claimed_at"]).replace("Z", "+00:00")),
+        retry_count=int(data.get("retry_count") or 0),
+        max_retries=int(data.get("max_retries") or 0),
+    )
+
+
 class OrchestratorJobConsumer:
     """Robot-side consumer that uses Orchestrator REST endpoints (no direct DB)."""
 
@@ -45,6 +61,9 @@ class OrchestratorJobConsumer:
         self._config = config
         self._client: UnifiedHttpClient | None = None
         self._lock = asyncio.Lock()
+        # Cleared when the orchestrator predates batched progress updates / claims
+        self._progress_supported = True
+        self._batch_claim_supported = True
 
     async def start(self) -> None:
         async with self._lock:
@@ -69,7 +88,7 @@ class OrchestratorJobConsumer:
             except Exception as e:
                 logger.debug(f"Error closing orchestrator consumer client: {e}")
 
-    async def claim_job(self) -> ClaimedJob | None:
+    async def claim_job(self, visibility_timeout_seconds: int | None = None) -> ClaimedJob | None:
         client = self._client
         if client is None:
             await self.start()
@@ -84,7 +103,8 @@ class OrchestratorJobConsumer:
                 json={
                     "environment": self._config.environment,
                     "limit": 1,
-                    "visibility_timeout_seconds": self._config.visibility_timeout_seconds,
+                    "visibility_timeout_seconds": visibility_timeout_seconds
+                    or self._config.visibility_timeout_seconds,
                 },
             )
             if response.status == 200:
@@ -92,23 +112,7 @@ class OrchestratorJobConsumer:
                 if not data:
                     return None
 
-                return ClaimedJob(
-                    job_id=data["job_id"],
-                    workflow_id=data.get("workflow_id") or "",
-                    workflow_name=data.get("workflow_name") or "",
-                    workflow_json=data.get("workflow_json") or "",
-                    priority=int(data.get("priority") or 0),
-                    environment=data.get("environment") or "default",
-                    variables=data.get("variables") or {},
-                    created_at=datetime.fromisoformat(
-                        str(data["created_at"]).replace("Z", "+00:00")
-                    ),
-                    claimed_at=datetime.fromisoformat(
-                        str(data["claimed_at"]).replace("Z", "+00:00")
-                    ),
-                    retry_count=int(data.get("retry_count") or 0),
-                    max_retries=int(data.get("max_retries") or 0),
-                )
+                return _parse_claimed_job(data)
 
             text = await response.text()
             logger.warning(f"Orchestrator claim_job failed: {response.status} {text[:200]}")
@@ -118,6 +122,48 @@ class OrchestratorJobConsumer:
             logger.warning(f"Orchestrator claim_job error: {e}")
             return None
 
+    async def claim_batch(
+        self, limit: int = 1, visibility_timeout_seconds: int | None = None
+    ) -> list[ClaimedJob]:
+        """Claim up to limit jobs in one request."""
+        if limit <= 1 or not self._batch_claim_supported:
+            job = await self.claim_job(visibility_timeout_seconds)
+            return [job] if job else []
+        client = self._client
+        if client is None:
+            await self.start()
+            client = self._client
+        if client is None:
+            return []
+
+        try:
+            url = urljoin(self._config.base_url, "/api/v1/jobs/claim-batch")
+            response = await client.post(
+                url,
+                json={
+                    "environment": self._config.environment,
+                    "limit": limit,
+                    "visibility_timeout_seconds": visibility_timeout_seconds
+                    or self._config.visibility_timeout_seconds,
+                },
+            )
+            if response.status == 200:
+                data = await response.json()
+                return [_parse_claimed_job(item) for item in data or []]
+            if response.status in (404, 405):
+                logger.info("Orchestrator does not support batch claims, claiming one at a time")
+                self._batch_claim_supported = False
+                job = await self.claim_job(visibility_timeout_seconds)
+                return [job] if job else []
+
+            text = await response.text()
+            logger.warning(f"Orchestrator claim_batch failed: {response.status} {text[:200]}")
+            return []
+
+        except Exception as e:
+            logger.warning(f"Orchestrator claim_batch error: {e}")
+            return []
+
     async def complete_job(self, job_id: str, result: dict[str, Any]) -> bool:
         client = self._client
         if client is None:
@@ -213,7 +259,78 @@ class OrchestratorJobConsumer:
             logger.warning(f"Orchestrator extend_lease error: {e}")
             return False
 
+    async def extend_leases(self, job_ids: list[str], extension_seconds: int = 30) -> list[str]:
+        """Extend several leases in one request; returns the job IDs whose lease was lost."""
+        if not job_ids:
+            return []
+        client = self._client
+        if client is None:
+            await self.start()
+            client = self._client
+        if client is None:
+            return []
+
+        try:
+            url = urljoin(self._config.base_url, "/api/v1/jobs/extend-leases")
+            response = await client.post(
+                url,
+                json={"job_ids": list(job_ids), "extension_seconds": int(extension_seconds)},
+            )
+            if response.status == 200:
+                data = await response.json()
+                return list(data.get("lost", []))
+            text = await response.text()
+            logger.warning(
+                f"Orchestrator extend_leases failed: {response.status} "
+                f"jobs={len(job_ids)} {text[:200]}"
+            )
+            return []
+
+        except Exception as e:
+            # Unknown outcome: don't report leases as lost on transport errors
+            logger.warning(f"Orchestrator extend_leases error: {e}")
+            return []
+
     async def update_progress(self, job_id: str, progress: int, current_node: str) -> bool:
         # Progress reporting is optional; keep robot execution robust even if
         # the orchestrator deployment doesn't support progress persistence yet.
         return True
+
+    async def update_progress_batch(self, updates: list[tuple[str, int, str]]) -> bool:
+        """Write the progress of several jobs in one request."""
+        if not updates or not self._progress_supported:
+            return self._progress_supported
+        client = self._client
+        if client is None:
+            await self.start()
+            client = self._client
+        if client is None:
+            return False
+
+        try:
+            url = urljoin(self._config.base_url, "/api/v1/jobs/progress")
+            response = await client.put(
+                url,
+                json={
+                    "updates": [
+                        {"job_id": job_id, "progress": progress, "current_node": node[:255] or None}
+                        for job_id, progress, node in updates
+                    ]
+                },
+            )
+            if response.status == 200:
+                return True
+            if response.status in (404, 405):
+                logger.info("Orchestrator does not support batched progress updates")
+                self._progress_supported = False
+                return False
+            text = await response.text()
+            logger.debug(
+                f"Orchestrator progress update failed: {response.status} "
+                f"jobs={len(updates)} {text[:200]}"
+            )
+            return False
+
+        except Exception as e:
+            logger.debug(f"Orchestrator progress update error: {e}")
+            return False
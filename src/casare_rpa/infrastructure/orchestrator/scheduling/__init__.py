@@ -36,6 +36,9 @@ from casare_rpa.infrastructure.orchestrator.scheduling.calendar import (
     HolidayType,
     WorkingHours,
 )
+from casare_rpa.infrastructure.orchestrator.scheduling.capability_index import (
+    RobotCapabilityIndex,
+)
 from casare_rpa.infrastructure.orchestrator.scheduling.job_assignment import (
     AssignmentResult,
     CapabilityType,
@@ -223,6 +226,7 @@ __all__ = [
     "RobotInfo",
     "AssignmentResult",
     "StateAffinityTracker",
+    "RobotCapabilityIndex",
     "NoCapableRobotError",
     "assign_job_to_robot",
     # State Affinity
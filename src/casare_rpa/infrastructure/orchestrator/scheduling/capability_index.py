@@ -0,0 +1,119 @@
+"""
+Robot Capability Index for CasareRPA Orchestrator.
+
+Interns robot capabilities to bit positions and keeps, for each capability,
+a bitmask of the robots that have it. The robots satisfying a job's hard
+capability and environment constraints are then a handful of integer ANDs
+instead of parsing and comparing every robot's capability dict per job.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from casare_rpa.infrastructure.orchestrator.scheduling.job_assignment import (
+        CapabilityType,
+        RobotCapability,
+        RobotInfo,
+    )
+
+
+class RobotCapabilityIndex:
+    """
+    Inverted index from capability to robot set over a fixed robot list.
+
+    Robot sets are Python ints where bit i stands for robots[i].
+    Capability dicts are parsed once per robot when the index is built.
+    """
+
+    def __init__(self, robots: list[RobotInfo]):
+        """
+        Build the index.
+
+        Args:
+            robots: Robots to index; bit positions follow this order
+        """
+        self.robots = robots
+        self.all_robots = (1 << len(robots)) - 1
+
+        self._cap_bits: dict[tuple[CapabilityType, str], int] = {}
+        self._robots_by_cap: list[int] = []  # capability bit -> robot set
+        self._robot_caps: list[list[RobotCapability]] = []
+        self._robots_by_env: dict[str, int] = defaultdict(int)
+
+        for i, robot in enumerate(robots):
+            robot_bit = 1 << i
+            caps = robot._parse_capabilities()
+            self._robot_caps.append(caps)
+            for cap in caps:
+                self._robots_by_cap[self._intern(cap)] |= robot_bit
+            self._robots_by_env[robot.environment] |= robot_bit
+
+    def _intern(self, capability: RobotCapability) -> int:
+        """Get (or assign) the bit position of a capability."""
+        key = (capability.capability_type, capability.name.lower())
+        bit = self._cap_bits.get(key)
+        if bit is None:
+            bit = self._cap_bits[key] = len(self._robots_by_cap)
+            self._robots_by_cap.append(0)
+        return bit
+
+    def robots_with(self, required: list[RobotCapability]) -> int:
+        """
+        Get the set of robots having all required capabilities.
+
+        Version constraints are checked only on robots that already have the
+        capability by type and name.
+
+        Args:
+            required: Required capabilities
+
+        Returns:
+            Robot set bitmask
+        """
+        mask = self.all_robots
+        for cap in required:
+            bit = self._cap_bits.get((cap.capability_type, cap.name.lower()))
+            if bit is None:
+                return 0
+            mask &= self._robots_by_cap[bit]
+            if cap.version and mask:
+                mask = self._filter(mask, cap)
+            if not mask:
+                return 0
+        return mask
+
+    def robots_for_environment(self, environment: str) -> int:
+        """
+        Get the set of robots allowed to run jobs targeting an environment.
+
+        Jobs for "default" may run anywhere; other jobs run on robots in the
+        same environment or in "default".
+        """
+        if environment == "default":
+            return self.all_robots
+        return self._robots_by_env.get(environment, 0) | self._robots_by_env.get("default", 0)
+
+    def _filter(self, mask: int, required: RobotCapability) -> int:
+        """Drop robots whose capability fails the version constraint."""
+        for i in iter_bits(mask):
+            if not any(cap.matches(required) for cap in self._robot_caps[i]):
+                mask &= ~(1 << i)
+        return mask
+
+    def __len__(self) -> int:
+        return len(self._robots_by_cap)
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the set bit positions of a mask in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+__all__ = ["RobotCapabilityIndex", "iter_bits"]
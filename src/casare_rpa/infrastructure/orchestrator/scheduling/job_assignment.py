@@ -5,6 +5,7 @@ Implements constraint-based robot selection with soft scoring for optimal job as
 Supports capability matching, load balancing, tag affinity, and state preferences.
 """
 
+import heapq
 import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -14,6 +15,11 @@ from typing import Any, Protocol
 
 from loguru import logger
 
+from casare_rpa.infrastructure.orchestrator.scheduling.capability_index import (
+    RobotCapabilityIndex,
+    iter_bits,
+)
+
 
 class NoCapableRobotError(Exception):
     """Raised when no robot can execute the requested job."""
@@ -435,6 +441,7 @@ class JobAssignmentEngine:
     - State affinity for workflow sessions
     - Load-based distribution
     - Tag matching preferences
+    - Batch assignment of a whole wave of jobs (assign_jobs)
     """
 
     def __init__(
@@ -538,6 +545,146 @@ class JobAssignmentEngine:
             assignment_time_ms=elapsed,
         )
 
+    def assign_jobs(
+        self,
+        jobs: list[JobRequirements],
+        available_robots: list[RobotInfo],
+        orchestrator_zone: str | None = None,
+    ) -> list[AssignmentResult | None]:
+        """
+        Assign a wave of jobs to robots in one pass.
+
+        Jobs are placed greedily, highest priority first (submission order
+        within a priority). Robots are filtered through a RobotCapabilityIndex
+        and scored once per distinct set of job requirements; each set keeps a
+        max-heap of candidates. Robot load is tracked incrementally across the
+        wave, and a robot whose load changed is re-scored lazily when it
+        reaches the top of a heap. Scores only drop as load grows, so stale
+        entries are upper bounds and the heap top is always the best fit.
+
+        Args:
+            jobs: Requirements of the jobs to assign
+            available_robots: List of available robots
+            orchestrator_zone: Network zone of orchestrator for proximity scoring
+
+        Returns:
+            One entry per job, in input order: the AssignmentResult, or None
+            if no capable robot had free capacity. Alternatives are not
+            collected for batch assignments.
+        """
+        start_time = datetime.now(UTC)
+        zone = orchestrator_zone or self._network_zone
+        robots = available_robots
+        index = RobotCapabilityIndex(robots)
+
+        extra_jobs = [0] * len(robots)  # jobs assigned to each robot in this wave
+        versions = [0] * len(robots)  # bumped whenever a robot's load changes
+        pools: dict[tuple, tuple[list[tuple[float, int, int]], set[str] | None]] = {}
+        placed: list[tuple[int, int, float, dict[str, float]]] = []
+
+        def has_room(i: int) -> bool:
+            robot = robots[i]
+            return (
+                robot.status == "online"
+                and robot.current_jobs + extra_jobs[i] < robot.max_concurrent_jobs
+            )
+
+        order = sorted(range(len(jobs)), key=lambda j: -jobs[j].priority)
+        for job_index in order:
+            requirements = jobs[job_index]
+            key = self._requirements_key(requirements)
+            pool = pools.get(key)
+            if pool is None:
+                state_robots = (
+                    set(self._state_tracker.get_robots_with_state(requirements.workflow_id))
+                    if requirements.requires_state
+                    else None
+                )
+                mask = index.robots_with(
+                    requirements.required_capabilities
+                ) & index.robots_for_environment(requirements.environment)
+                heap = []
+                for i in iter_bits(mask):
+                    if has_room(i) and self._meets_resource_requirements(requirements, robots[i]):
+                        score, _ = self._score_robot(
+                            requirements, robots[i], zone, extra_jobs[i], state_robots
+                        )
+                        heap.append((-score, i, versions[i]))
+                heapq.heapify(heap)
+                pool = pools[key] = (heap, state_robots)
+
+            heap, state_robots = pool
+            while heap:
+                _, i, version = heap[0]
+                if version == versions[i]:
+                    break
+                if has_room(i):
+                    score, _ = self._score_robot(
+                        requirements, robots[i], zone, extra_jobs[i], state_robots
+                    )
+                    heapq.heapreplace(heap, (-score, i, versions[i]))
+                else:
+                    heapq.heappop(heap)
+
+            if not heap:
+                continue
+
+            i = heap[0][1]
+            score, breakdown = self._score_robot(
+                requirements, robots[i], zone, extra_jobs[i], state_robots
+            )
+            placed.append((job_index, i, score, breakdown))
+            extra_jobs[i] += 1
+            versions[i] += 1
+
+        elapsed = (datetime.now(UTC) - start_time).total_seconds() * 1000
+        results: list[AssignmentResult | None] = [None] * len(jobs)
+        for job_index, i, score, breakdown in placed:
+            results[job_index] = AssignmentResult(
+                robot_id=robots[i].robot_id,
+                robot_name=robots[i].name,
+                score=score,
+                scores_breakdown=breakdown,
+                assignment_time_ms=elapsed,
+            )
+
+        unassigned = len(jobs) - len(placed)
+        if unassigned:
+            logger.warning(
+                f"{unassigned} of {len(jobs)} job(s) could not be assigned: "
+                f"no capable robot with free capacity"
+            )
+        logger.info(
+            f"Assigned {len(placed)}/{len(jobs)} jobs across {len(robots)} robots "
+            f"({len(pools)} requirement group(s), {len(index)} capabilities) "
+            f"in {elapsed:.1f}ms"
+        )
+        return results
+
+    @staticmethod
+    def _requirements_key(requirements: JobRequirements) -> tuple:
+        """
+        Group jobs whose candidate robots and scores are identical.
+
+        Args:
+            requirements: Job requirements
+
+        Returns:
+            Hashable key of everything that affects filtering and scoring
+        """
+        return (
+            tuple(
+                (cap.capability_type, cap.name.lower(), cap.version)
+                for cap in requirements.required_capabilities
+            ),
+            frozenset(requirements.required_tags),
+            frozenset(requirements.preferred_tags),
+            requirements.workflow_id if requirements.requires_state else None,
+            requirements.min_memory_gb,
+            requirements.min_cpu_cores,
+            requirements.environment,
+        )
+
     def _filter_by_hard_constraints(
         self,
         requirements: JobRequirements,
@@ -607,10 +754,13 @@ class JobAssignmentEngine:
         Returns:
             True if robot has all required capabilities
         """
-        for required_cap in requirements.required_capabilities:
-            if not robot.has_capability(required_cap):
-                return False
-        return True
+        if not requirements.required_capabilities:
+            return True
+        robot_caps = robot._parse_capabilities()
+        return all(
+            any(cap.matches(required_cap) for cap in robot_caps)
+            for required_cap in requirements.required_capabilities
+        )
 
     def _meets_resource_requirements(
         self,
@@ -660,41 +810,68 @@ class JobAssignmentEngine:
         Returns:
             List of (robot, total_score, breakdown) tuples
         """
-        scored = []
+        return [
+            (robot, *self._score_robot(requirements, robot, orchestrator_zone)) for robot in robots
+        ]
 
-        for robot in robots:
-            breakdown: dict[str, float] = {}
-            score = 100.0
+    def _score_robot(
+        self,
+        requirements: JobRequirements,
+        robot: RobotInfo,
+        orchestrator_zone: str,
+        extra_jobs: int = 0,
+        state_robots: set[str] | None = None,
+    ) -> tuple[float, dict[str, float]]:
+        """
+        Score one robot by soft preferences.
 
-            cpu_penalty = self._calculate_cpu_penalty(robot.cpu_percent)
-            breakdown["cpu_load"] = -cpu_penalty
-            score -= cpu_penalty * self._weights.cpu_load_weight
+        Args:
+            requirements: Job requirements
+            robot: Capable robot
+            orchestrator_zone: Network zone for proximity
+            extra_jobs: Jobs already assigned to the robot but not yet
+                reflected in its current_jobs
+            state_robots: Precomputed robots with state for the workflow
+                (looked up in the state tracker if None)
 
-            memory_penalty = self._calculate_memory_penalty(robot.memory_percent)
-            breakdown["memory_load"] = -memory_penalty
-            score -= memory_penalty * self._weights.memory_load_weight
+        Returns:
+            Tuple of (total_score, breakdown)
+        """
+        breakdown: dict[str, float] = {}
+        score = 100.0
 
-            job_penalty = self._calculate_job_count_penalty(robot)
-            breakdown["job_count"] = -job_penalty
-            score -= job_penalty * self._weights.job_count_weight
+        cpu_penalty = self._calculate_cpu_penalty(robot.cpu_percent)
+        breakdown["cpu_load"] = -cpu_penalty
+        score -= cpu_penalty * self._weights.cpu_load_weight
 
-            tag_bonus = self._calculate_tag_bonus(requirements, robot)
-            breakdown["tag_match"] = tag_bonus
-            score += tag_bonus * self._weights.tag_match_weight
+        memory_penalty = self._calculate_memory_penalty(robot.memory_percent)
+        breakdown["memory_load"] = -memory_penalty
+        score -= memory_penalty * self._weights.memory_load_weight
 
-            if requirements.requires_state:
-                affinity_bonus = self._calculate_state_affinity_bonus(requirements, robot)
-                breakdown["state_affinity"] = affinity_bonus
-                score += affinity_bonus * self._weights.state_affinity_weight
+        job_penalty = self._calculate_job_count_penalty(robot, robot.current_jobs + extra_jobs)
+        breakdown["job_count"] = -job_penalty
+        score -= job_penalty * self._weights.job_count_weight
+
+        tag_bonus = self._calculate_tag_bonus(requirements, robot)
+        breakdown["tag_match"] = tag_bonus
+        score += tag_bonus * self._weights.tag_match_weight
 
-            proximity_bonus = self._calculate_proximity_bonus(robot, orchestrator_zone)
-            breakdown["network_proximity"] = proximity_bonus
-            score += proximity_bonus * self._weights.network_proximity_weight
+        if requirements.requires_state:
+            if state_robots is None:
+                affinity_bonus = self._calculate_state_affinity_bonus(requirements, robot)
+            elif robot.robot_id in state_robots:
+                affinity_bonus = self._weights.state_affinity_bonus
+            else:
+                affinity_bonus = 0.0
+            breakdown["state_affinity"] = affinity_bonus
+            score += affinity_bonus * self._weights.state_affinity_weight
 
-            breakdown["total"] = score
-            scored.append((robot, score, breakdown))
+        proximity_bonus = self._calculate_proximity_bonus(robot, orchestrator_zone)
+        breakdown["network_proximity"] = proximity_bonus
+        score += proximity_bonus * self._weights.network_proximity_weight
 
-        return scored
+        breakdown["total"] = score
+        return score, breakdown
 
     def _calculate_cpu_penalty(self, cpu_percent: float) -> float:
         """
@@ -728,12 +905,17 @@ class JobAssignmentEngine:
             return self._weights.medium_load_penalty
         return 0.0
 
-    def _calculate_job_count_penalty(self, robot: RobotInfo) -> float:
+    def _calculate_job_count_penalty(
+        self,
+        robot: RobotInfo,
+        current_jobs: int | None = None,
+    ) -> float:
         """
         Calculate penalty based on current job count.
 
         Args:
             robot: Robot info
+            current_jobs: Job count to score with (default: robot.current_jobs)
 
         Returns:
             Penalty value based on utilization
@@ -741,7 +923,9 @@ class JobAssignmentEngine:
         if robot.max_concurrent_jobs == 0:
             return self._weights.high_load_penalty
 
-        utilization = robot.current_jobs / robot.max_concurrent_jobs
+        if current_jobs is None:
+            current_jobs = robot.current_jobs
+        utilization = current_jobs / robot.max_concurrent_jobs
         if utilization > 0.8:
             return self._weights.high_load_penalty
         elif utilization > 0.5:
@@ -19,6 +19,7 @@ from casare_rpa.infrastructure.orchestrator.api.routers import (
     dlq,
     health,
     jobs,
+    logs,
     metrics,
     robot_api_keys,
     robots,
@@ -141,6 +142,7 @@ def create_app() -> FastAPI:
     app.include_router(schedules.router, prefix="/api/v1", tags=["Schedules"])
     app.include_router(analytics.router, prefix="/api/v1", tags=["Analytics"])
     app.include_router(dlq.router, prefix="/api/v1", tags=["DLQ"])
+    app.include_router(logs.router, prefix="/api/v1", tags=["Logs"])
     app.include_router(websockets.router, prefix="/ws/monitoring", tags=["Dashboard WebSocket"])
 
     return app
@@ -238,6 +238,9 @@ async def log_stream_websocket(
 
         while True:
             data = await websocket.receive_text()
+            if not log_streaming_service.is_subscribed(websocket):
+                # Dropped as a slow consumer; the service closed the socket
+                break
             if data == "ping":
                 await websocket.send_text("pong")
 
@@ -285,6 +288,9 @@ async def all_logs_stream_websocket(
 
         while True:
             data = await websocket.receive_text()
+            if not log_streaming_service.is_subscribed(websocket):
+                # Dropped as a slow consumer; the service closed the socket
+                break
             if data == "ping":
                 await websocket.send_text("pong")
 
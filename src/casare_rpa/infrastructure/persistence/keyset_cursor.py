@@ -0,0 +1,53 @@
+"""
+CasareRPA - Keyset Pagination Cursors
+
+Opaque continuation tokens for keyset (seek) pagination over rows ordered by
+(timestamp DESC, id DESC). A page query filters with
+``(timestamp, id) < (cursor_timestamp, cursor_id)`` so the database seeks
+straight to the next page via an index instead of scanning and discarding
+OFFSET rows.
+"""
+
+import base64
+from datetime import datetime
+
+import orjson
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """
+    Encode the sort key of the last row of a page as a continuation token.
+
+    Args:
+        timestamp: Sort timestamp of the last row.
+        row_id: ID of the last row (tie-breaker).
+
+    Returns:
+        URL-safe opaque token.
+    """
+    raw = orjson.dumps([timestamp.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> tuple[datetime, str]:
+    """
+    Decode a continuation token.
+
+    Args:
+        token: Token from encode_cursor.
+
+    Returns:
+        Tuple of (timestamp, row_id).
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        timestamp, row_id = orjson.loads(raw)
+        return datetime.fromisoformat(timestamp), str(row_id)
+    except Exception as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+__all__ = ["encode_cursor", "decode_cursor"]
@@ -6,6 +6,7 @@ Provides efficient storage and retrieval of robot log entries with
 and leverages PostgreSQL partitioning for efficient cleanup.
 """
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 
@@ -19,6 +20,7 @@ from casare_rpa.domain.value_objects.log_entry import (
     LogQuery,
     LogStats,
 )
+from casare_rpa.infrastructure.persistence.keyset_cursor import decode_cursor, encode_cursor
 from casare_rpa.utils.pooling.database_pool import DatabasePoolManager
 
 
@@ -30,6 +32,21 @@ class LogRepository:
     Leverages PostgreSQL partitioning for automatic retention management.
     """
 
+    # Batches at least this large are written with COPY instead of executemany
+    COPY_MIN_BATCH = 200
+
+    _COPY_COLUMNS = (
+        "id",
+        "robot_id",
+        "tenant_id",
+        "timestamp",
+        "level",
+        "message",
+        "source",
+        "extra",
+        "created_at",
+    )
+
     def __init__(self, pool_manager: DatabasePoolManager | None = None) -> None:
         """
         Initialize repository with optional pool manager.
@@ -99,7 +116,10 @@ class LogRepository:
         """
         Save multiple log entries in a batch.
 
-        Uses COPY for efficient bulk insert.
+        Batches of at least COPY_MIN_BATCH entries are streamed with binary
+        COPY into a session temp table and moved into robot_logs with one
+        INSERT ... SELECT, which keeps ON CONFLICT semantics and lets
+        PostgreSQL route rows to partitions. Smaller batches use executemany.
 
         Args:
             entries: List of LogEntry objects to save.
@@ -113,6 +133,7 @@ class LogRepository:
         conn = await self._get_connection()
         try:
             # Prepare records for bulk insert
+            created_at = datetime.now(UTC)
             records = [
                 (
                     entry.id,
@@ -123,22 +144,24 @@ class LogRepository:
                     entry.message,
                     entry.source,
                     orjson.dumps(entry.extra or {}).decode(),
-                    datetime.now(UTC),
+                    created_at,
                 )
                 for entry in entries
             ]
 
-            # Use executemany for batch insert
-            await conn.executemany(
-                """
-                INSERT INTO robot_logs (
-                    id, robot_id, tenant_id, timestamp, level,
-                    message, source, extra, created_at
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8::jsonb, $9)
-                ON CONFLICT (id, timestamp) DO NOTHING
-                """,
-                records,
-            )
+            if len(records) >= self.COPY_MIN_BATCH:
+                await self._copy_records(conn, records)
+            else:
+                await conn.executemany(
+                    """
+                    INSERT INTO robot_logs (
+                        id, robot_id, tenant_id, timestamp, level,
+                        message, source, extra, created_at
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8::jsonb, $9)
+                    ON CONFLICT (id, timestamp) DO NOTHING
+                    """,
+                    records,
+                )
 
             logger.debug(f"Saved batch of {len(entries)} log entries")
             return len(entries)
@@ -148,6 +171,36 @@ class LogRepository:
         finally:
             await self._release_connection(conn)
 
+    async def _copy_records(self, conn, records: list[tuple]) -> None:
+        """
+        Bulk insert records through a binary COPY staging table.
+
+        The temp table lives for the pooled connection's session and is
+        emptied on commit, so it is created once per connection.
+
+        Args:
+            conn: Connection from the pool.
+            records: Tuples in _COPY_COLUMNS order.
+        """
+        async with conn.transaction():
+            await conn.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS robot_logs_staging
+                (LIKE robot_logs INCLUDING DEFAULTS) ON COMMIT DELETE ROWS
+                """
+            )
+            await conn.copy_records_to_table(
+                "robot_logs_staging", records=records, columns=self._COPY_COLUMNS
+            )
+            columns = ", ".join(self._COPY_COLUMNS)
+            await conn.execute(
+                f"""
+                INSERT INTO robot_logs ({columns})
+                SELECT {columns} FROM robot_logs_staging
+                ON CONFLICT (id, timestamp) DO NOTHING
+                """
+            )
+
     async def query(self, query: LogQuery) -> list[LogEntry]:
         """
         Query log entries with filtering.
@@ -186,6 +239,124 @@ class LogRepository:
         finally:
             await self._release_connection(conn)
 
+    async def query_page(
+        self, query: LogQuery, cursor: str | None = None
+    ) -> tuple[list[LogEntry], str | None]:
+        """
+        Query one page of log entries with keyset pagination.
+
+        Pages are ordered by (timestamp, id) descending. Instead of OFFSET,
+        each page seeks past the last row of the previous one, so deep pages
+        cost the same as the first. query.offset is ignored.
+
+        Args:
+            query: LogQuery with filter parameters; limit is the page size.
+            cursor: Continuation token from the previous page, or None.
+
+        Returns:
+            Tuple of (entries, next_cursor); next_cursor is None on the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        where, params = self._keyset_filter(query, cursor)
+        params.append(query.limit + 1)
+
+        conn = await self._get_connection()
+        try:
+            rows = await conn.fetch(
+                f"""
+                SELECT id, robot_id, tenant_id, timestamp, level, message, source, extra
+                FROM robot_logs
+                WHERE {where}
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ${len(params)}
+                """,
+                *params,
+            )
+        except Exception as e:
+            logger.error(f"Failed to query log page: {e}")
+            raise
+        finally:
+            await self._release_connection(conn)
+
+        entries = [self._row_to_entry(dict(row)) for row in rows[: query.limit]]
+        next_cursor = None
+        if len(rows) > query.limit:
+            last = entries[-1]
+            next_cursor = encode_cursor(last.timestamp, last.id)
+        return entries, next_cursor
+
+    async def iter_entries(
+        self, query: LogQuery, chunk_size: int = 1000
+    ) -> AsyncIterator[LogEntry]:
+        """
+        Stream all matching log entries through a server-side cursor.
+
+        Rows are fetched chunk_size at a time, so exports never materialize
+        the full result. query.limit and query.offset are ignored.
+
+        Args:
+            query: LogQuery with filter parameters.
+            chunk_size: Rows fetched per round trip.
+
+        Yields:
+            LogEntry objects, newest first.
+        """
+        where, params = self._keyset_filter(query, None)
+
+        conn = await self._get_connection()
+        try:
+            async with conn.transaction():
+                async for row in conn.cursor(
+                    f"""
+                    SELECT id, robot_id, tenant_id, timestamp, level, message, source, extra
+                    FROM robot_logs
+                    WHERE {where}
+                    ORDER BY timestamp DESC, id DESC
+                    """,
+                    *params,
+                    prefetch=chunk_size,
+                ):
+                    yield self._row_to_entry(dict(row))
+        finally:
+            await self._release_connection(conn)
+
+    @staticmethod
+    def _keyset_filter(query: LogQuery, cursor: str | None) -> tuple[str, list[Any]]:
+        """
+        Build the WHERE clause shared by paged and streamed log queries.
+
+        Mirrors the filters of the query_robot_logs function.
+
+        Returns:
+            Tuple of (where_sql, params).
+        """
+        levels = [level.value for level in LogLevel if level >= query.min_level]
+        clauses = ["tenant_id = $1::uuid", "level = ANY($2::varchar[])"]
+        params: list[Any] = [query.tenant_id, levels]
+
+        def add(sql: str, value: Any) -> None:
+            params.append(value)
+            clauses.append(sql.format(n=len(params)))
+
+        if query.robot_id:
+            add("robot_id = ${n}::uuid", query.robot_id)
+        if query.start_time:
+            add("timestamp >= ${n}", query.start_time)
+        if query.end_time:
+            add("timestamp <= ${n}", query.end_time)
+        if query.source:
+            add("source = ${n}", query.source)
+        if query.search_text:
+            add("message ILIKE '%' || ${n} || '%'", query.search_text)
+        if cursor:
+            timestamp, row_id = decode_cursor(cursor)
+            params.extend([timestamp, row_id])
+            clauses.append(f"(timestamp, id) < (${len(params) - 1}, ${len(params)}::uuid)")
+
+        return " AND ".join(clauses), params
+
     async def get_by_robot(
         self,
         robot_id: str,
@@ -8,6 +8,8 @@ Provides distributed queue implementations for job processing:
 Components:
 - PgQueuerConsumer: Robot-side job claiming with SKIP LOCKED
 - PgQueuerProducer: Orchestrator-side job enqueuing
+- job_notifications: LISTEN/NOTIFY channels that wake idle consumers
+- workflow_blobs: Content-addressed workflow storage referenced by jobs
 - DLQManager: Dead Letter Queue with exponential backoff retry
 - MemoryQueue: In-memory queue fallback for local development
 
@@ -27,6 +29,12 @@ from casare_rpa.infrastructure.queue.dlq_manager import (
     RetryAction,
     RetryResult,
 )
+from casare_rpa.infrastructure.queue.job_notifications import (
+    ALL_ENVIRONMENTS_CHANNEL,
+    job_channel,
+    listen_channels,
+    notify_channels,
+)
 from casare_rpa.infrastructure.queue.memory_queue import (
     JobStatus,
     MemoryJob,
@@ -79,6 +87,7 @@ from casare_rpa.infrastructure.queue.types import (
     Priority,
     ProducerConfigStats,
     ProducerStats,
+    ProgressUpdate,
     # Error Types
     QueueError,
     QueueMessage,
@@ -88,6 +97,10 @@ from casare_rpa.infrastructure.queue.types import (
     StateChangeCallback,
     WorkflowId,
 )
+from casare_rpa.infrastructure.queue.workflow_blobs import (
+    WORKFLOW_BLOBS_TABLE,
+    workflow_content_hash,
+)
 
 __all__ = [
     # Consumer (Robot-side)
@@ -101,6 +114,14 @@ __all__ = [
     "JobSubmission",
     "ProducerConfig",
     "ProducerConnectionState",
+    # Job Notifications (LISTEN/NOTIFY)
+    "ALL_ENVIRONMENTS_CHANNEL",
+    "job_channel",
+    "listen_channels",
+    "notify_channels",
+    # Workflow Blobs
+    "WORKFLOW_BLOBS_TABLE",
+    "workflow_content_hash",
     # DLQ Manager
     "DLQManager",
     "DLQManagerConfig",
@@ -152,6 +173,7 @@ __all__ = [
     "RobotId",
     "Environment",
     "Priority",
+    "ProgressUpdate",
     "DatabaseRecord",
     "DatabaseRecordList",
 ]
@@ -0,0 +1,70 @@
+"""
+CasareRPA Infrastructure Layer - Job Queue Notifications
+
+PostgreSQL LISTEN/NOTIFY channel naming shared by PgQueuerProducer (NOTIFY on
+enqueue) and PgQueuerConsumer (LISTEN to wake idle claimers).
+
+Channel routing mirrors the claim query's environment filter
+(environment = robot_env OR environment = 'default' OR robot_env = 'default'):
+- A job in environment E is announced on E's channel; jobs outside the
+  'default' environment are also announced on the all-environments channel
+- A robot in environment E listens on E's channel and the 'default' channel
+- A robot in the 'default' environment listens on the 'default' channel and
+  the all-environments channel (it may claim jobs from any environment)
+
+Notification payloads carry the number of jobs enqueued, as text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+DEFAULT_ENVIRONMENT = "default"
+JOB_CHANNEL_PREFIX = "casare_jobs"
+ALL_ENVIRONMENTS_CHANNEL = f"{JOB_CHANNEL_PREFIX}__all"
+
+# PostgreSQL truncates identifiers (and channel names) to NAMEDATALEN - 1 bytes
+_MAX_CHANNEL_BYTES = 63
+
+
+def job_channel(environment: str) -> str:
+    """
+    Get the NOTIFY channel for jobs in an environment.
+
+    Long environment names are replaced by a stable hash so the channel stays
+    within PostgreSQL's 63-byte limit without colliding.
+
+    Args:
+        environment: Job environment
+
+    Returns:
+        Channel name
+    """
+    channel = f"{JOB_CHANNEL_PREFIX}_{environment or DEFAULT_ENVIRONMENT}"
+    if len(channel.encode("utf-8")) <= _MAX_CHANNEL_BYTES:
+        return channel
+    digest = hashlib.sha1(environment.encode("utf-8")).hexdigest()[:16]
+    return f"{JOB_CHANNEL_PREFIX}_h{digest}"
+
+
+def notify_channels(environment: str) -> tuple[str, ...]:
+    """Get the channels to NOTIFY when a job is enqueued in environment."""
+    if not environment or environment == DEFAULT_ENVIRONMENT:
+        return (job_channel(DEFAULT_ENVIRONMENT),)
+    return (job_channel(environment), ALL_ENVIRONMENTS_CHANNEL)
+
+
+def listen_channels(environment: str) -> tuple[str, ...]:
+    """Get the channels a robot in environment should LISTEN on."""
+    if not environment or environment == DEFAULT_ENVIRONMENT:
+        return (job_channel(DEFAULT_ENVIRONMENT), ALL_ENVIRONMENTS_CHANNEL)
+    return (job_channel(environment), job_channel(DEFAULT_ENVIRONMENT))
+
+
+__all__ = [
+    "ALL_ENVIRONMENTS_CHANNEL",
+    "JOB_CHANNEL_PREFIX",
+    "job_channel",
+    "listen_channels",
+    "notify_channels",
+]
@@ -15,6 +15,8 @@ distributed coordination.
 """
 
 import asyncio
+import heapq
+import itertools
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -23,6 +25,8 @@ from typing import Any
 
 from loguru import logger
 
+from casare_rpa.utils.performance.deadline_heap import DeadlineHeap
+
 
 class JobStatus(Enum):
     """Job status enumeration."""
@@ -92,6 +96,11 @@ class MemoryQueue:
     Thread-safe, async-compatible queue for local development.
     Stores jobs in memory with priority support and visibility timeout.
 
+    Queued jobs are kept in one heap per execution mode, ordered by priority
+    and then enqueue order (FIFO within a priority). Claims pop straight from
+    the matching heap, and claimers can wait on a condition that is notified
+    whenever a job becomes available instead of polling.
+
     NOT suitable for production:
     - Jobs lost on restart
     - No distributed coordination
@@ -109,9 +118,14 @@ class MemoryQueue:
             visibility_timeout: Seconds before claimed job returns to queue
         """
         self._jobs: dict[str, MemoryJob] = {}  # job_id -> Job
-        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        # execution_mode -> heap of (priority, seq, job_id)
+        self._heaps: dict[str, list[tuple[int, int, str]]] = {}
+        self._queued_seq: dict[str, int] = {}  # job_id -> seq of its live heap entry
+        self._seq = itertools.count()
         self._claimed_jobs: dict[str, MemoryJob] = {}  # job_id -> Job
+        self._claim_deadlines = DeadlineHeap()  # job_id -> visibility deadline
         self._lock = asyncio.Lock()
+        self._job_available = asyncio.Condition(self._lock)
         self._visibility_timeout = visibility_timeout
         self._running = False
         self._cleanup_task: asyncio.Task | None = None
@@ -176,8 +190,7 @@ class MemoryQueue:
             )
 
             self._jobs[job_id] = job
-            # PriorityQueue: (priority, insertion_order, job_id)
-            await self._queue.put((priority, datetime.now(UTC), job_id))
+            self._push(job)
 
             logger.info(
                 "Job enqueued: {} (workflow={}, priority={}, mode={})",
@@ -189,58 +202,101 @@ class MemoryQueue:
 
             return job_id
 
-    async def claim(self, robot_id: str, execution_mode: str | None = None) -> MemoryJob | None:
+    async def claim(
+        self,
+        robot_id: str,
+        execution_mode: str | None = None,
+        wait_timeout: float = 0.0,
+    ) -> MemoryJob | None:
         """
         Claim next available job from queue.
 
         Args:
             robot_id: Robot identifier claiming the job
             execution_mode: Filter by execution mode (None = any)
+            wait_timeout: Seconds to wait for a job to be enqueued when none
+                is available (0 = return immediately)
 
         Returns:
             MemoryJob if available, None otherwise
         """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_timeout
+
         async with self._lock:
-            # Try to find matching job in queue
-            temp_items = []
-            claimed_job = None
+            job = self._pop(execution_mode)
+            while job is None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                try:
+                    await asyncio.wait_for(self._job_available.wait(), remaining)
+                except TimeoutError:
+                    return None
+                job = self._pop(execution_mode)
+
+            job.status = JobStatus.CLAIMED
+            job.robot_id = robot_id
+            job.claimed_at = datetime.now(UTC)
 
-            try:
-                while not self._queue.empty():
-                    priority, timestamp, job_id = await self._queue.get()
-
-                    job = self._jobs.get(job_id)
-                    if not job:
-                        continue  # Job was deleted
-
-                    # Check execution mode filter
-                    if execution_mode and job.execution_mode != execution_mode:
-                        temp_items.append((priority, timestamp, job_id))
-                        continue
-
-                    # Found matching job - claim it
-                    job.status = JobStatus.CLAIMED
-                    job.robot_id = robot_id
-                    job.claimed_at = datetime.now(UTC)
-
-                    self._claimed_jobs[job_id] = job
-                    claimed_job = job
-
-                    logger.info(
-                        "Job claimed: {} by robot {} (workflow={}, mode={})",
-                        job_id,
-                        robot_id,
-                        job.workflow_id,
-                        job.execution_mode,
-                    )
-                    break
-
-            finally:
-                # Return non-matching jobs to queue
-                for item in temp_items:
-                    await self._queue.put(item)
-
-            return claimed_job
+            self._claimed_jobs[job.job_id] = job
+            self._claim_deadlines.schedule_in(job.job_id, self._visibility_timeout)
+
+            logger.info(
+                "Job claimed: {} by robot {} (workflow={}, mode={})",
+                job.job_id,
+                robot_id,
+                job.workflow_id,
+                job.execution_mode,
+            )
+            return job
+
+    def _push(self, job: MemoryJob) -> None:
+        """Queue a job in its execution mode heap. Caller must hold the lock."""
+        seq = next(self._seq)
+        self._queued_seq[job.job_id] = seq
+        heapq.heappush(
+            self._heaps.setdefault(job.execution_mode, []), (job.priority, seq, job.job_id)
+        )
+        self._job_available.notify_all()
+
+    def _peek(self, execution_mode: str) -> tuple[int, int, str] | None:
+        """
+        Get the head of a mode heap, discarding entries of jobs that were
+        deleted, cancelled or re-queued since. Caller must hold the lock.
+        """
+        heap = self._heaps.get(execution_mode)
+        while heap:
+            _, seq, job_id = heap[0]
+            job = self._jobs.get(job_id)
+            if (
+                job is not None
+                and job.status == JobStatus.QUEUED
+                and self._queued_seq.get(job_id) == seq
+            ):
+                return heap[0]
+            heapq.heappop(heap)
+            if self._queued_seq.get(job_id) == seq:
+                del self._queued_seq[job_id]
+        return None
+
+    def _pop(self, execution_mode: str | None) -> MemoryJob | None:
+        """Take the best queued job for a mode (None = any). Caller must hold the lock."""
+        modes = [execution_mode] if execution_mode else list(self._heaps)
+        best_mode = None
+        best_entry = None
+        for mode in modes:
+            entry = self._peek(mode)
+            if entry is not None and (best_entry is None or entry < best_entry):
+                best_mode, best_entry = mode, entry
+
+        if best_entry is None:
+            return None
+
+        heapq.heappop(self._heaps[best_mode])
+        job_id = best_entry[2]
+        del self._queued_seq[job_id]
+        return self._jobs[job_id]
 
     async def update_status(
         self,
@@ -282,6 +338,7 @@ class MemoryQueue:
                 job.completed_at = datetime.now(UTC)
                 # Remove from claimed jobs
                 self._claimed_jobs.pop(job_id, None)
+                self._claim_deadlines.cancel(job_id)
 
             if result:
                 job.result = result
@@ -315,6 +372,7 @@ class MemoryQueue:
                 return False
 
             job.claimed_at = datetime.now(UTC)
+            self._claim_deadlines.schedule_in(job_id, self._visibility_timeout)
             logger.debug("Job claim extended: {}", job_id)
             return True
 
@@ -341,7 +399,8 @@ class MemoryQueue:
             job.result = None
             job.error = None
             self._claimed_jobs.pop(job_id, None)
-            await self._queue.put((job.priority, datetime.now(UTC), job.job_id))
+            self._claim_deadlines.cancel(job_id)
+            self._push(job)
             logger.info("Job requeued: {}", job_id)
             return True
 
@@ -401,53 +460,57 @@ class MemoryQueue:
             Number of jobs in queue
         """
         async with self._lock:
-            if execution_mode:
-                return sum(
-                    1
-                    for job in self._jobs.values()
-                    if job.status == JobStatus.QUEUED and job.execution_mode == execution_mode
-                )
-            else:
-                return sum(1 for job in self._jobs.values() if job.status == JobStatus.QUEUED)
+            queued = (self._jobs[job_id] for job_id in self._queued_seq)
+            return sum(
+                1
+                for job in queued
+                if job.status == JobStatus.QUEUED
+                and (not execution_mode or job.execution_mode == execution_mode)
+            )
 
     async def _cleanup_expired_claims(self) -> None:
         """Background task to return expired claims to queue."""
         while self._running:
             try:
                 await asyncio.sleep(5)  # Check every 5 seconds
-
-                async with self._lock:
-                    now = datetime.now(UTC)
-                    expired_jobs = []
-
-                    for _job_id, job in list(self._claimed_jobs.items()):
-                        if not job.claimed_at:
-                            continue
-
-                        elapsed = (now - job.claimed_at).total_seconds()
-                        if elapsed > self._visibility_timeout:
-                            expired_jobs.append(job)
-
-                    # Return expired jobs to queue
-                    for job in expired_jobs:
-                        job.status = JobStatus.QUEUED
-                        job.robot_id = None
-                        job.claimed_at = None
-                        self._claimed_jobs.pop(job.job_id, None)
-
-                        await self._queue.put((job.priority, datetime.now(UTC), job.job_id))
-
-                        logger.warning(
-                            "Job claim expired, returned to queue: {} (workflow={})",
-                            job.job_id,
-                            job.workflow_id,
-                        )
+                await self.expire_claims()
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Error in cleanup task: {}", e)
 
+    async def expire_claims(self) -> int:
+        """
+        Return claims past their visibility timeout to the queue.
+
+        Only claims whose deadline passed are touched; live claims are never
+        scanned.
+
+        Returns:
+            Number of jobs returned to the queue
+        """
+        async with self._lock:
+            expired = 0
+            for job_id in self._claim_deadlines.pop_expired():
+                job = self._claimed_jobs.pop(job_id, None)
+                if not job:
+                    continue
+
+                job.status = JobStatus.QUEUED
+                job.robot_id = None
+                job.claimed_at = None
+                self._push(job)
+                expired += 1
+
+                logger.warning(
+                    "Job claim expired, returned to queue: {} (workflow={})",
+                    job.job_id,
+                    job.workflow_id,
+                )
+
+            return expired
+
 
 # Global singleton instance
 _memory_queue: MemoryQueue | None = None
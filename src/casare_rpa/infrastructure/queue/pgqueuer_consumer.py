@@ -7,16 +7,21 @@ Uses SKIP LOCKED for concurrent, non-blocking job acquisition.
 Features:
 - Job claiming with SKIP LOCKED (no blocking, high concurrency)
 - Visibility timeout management (jobs return to queue if not completed)
-- Heartbeat/lease extension for long-running jobs
+- Heartbeat/lease extension for long-running jobs (batched, one round trip)
 - Job completion/failure reporting
 - Batch claiming support for throughput optimization
 - Automatic reconnection with exponential backoff
+- LISTEN/NOTIFY wakeups so idle robots claim new jobs immediately
+- Optional weighted fair-share claiming across tenants (and workflows)
 
 Architecture:
-- Robots poll for jobs via claim_job() or claim_batch()
+- Robots claim jobs via claim_job() or claim_batch(), and wait_for_jobs()
+  between empty claims (woken by NOTIFY, with a slow jittered fallback poll)
 - Jobs become invisible for visibility_timeout_seconds after claiming
 - Heartbeats extend the lease to prevent timeout during long execution
 - Jobs are marked complete/failed when finished
+- Jobs handed back (released, lease expired) are announced with NOTIFY so
+  idle robots claim them immediately
 
 Database Schema (expected):
     CREATE TABLE job_queue (
@@ -49,13 +54,17 @@ import asyncio
 import random
 import uuid
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
 from loguru import logger
 
+from casare_rpa.infrastructure.queue.job_notifications import (
+    listen_channels,
+    notify_channels,
+)
 from casare_rpa.infrastructure.queue.types import (
     ConsumerConfigStats,
     ConsumerStats,
@@ -63,6 +72,7 @@ from casare_rpa.infrastructure.queue.types import (
     DatabaseRecordList,
     JobId,
     JobStatusInfo,
+    ProgressUpdate,
     StateChangeCallback,
 )
 
@@ -95,6 +105,8 @@ class ClaimedJob:
     Represents a job claimed by a robot consumer.
 
     Contains all data needed to execute the workflow and report back.
+    Blob-backed jobs carry only workflow_hash (workflow_json is empty);
+    resolve it with fetch_workflow_blob() on a robot cache miss.
     """
 
     job_id: str
@@ -108,6 +120,7 @@ class ClaimedJob:
     claimed_at: datetime
     retry_count: int
     max_retries: int
+    workflow_hash: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -123,6 +136,7 @@ class ClaimedJob:
             "claimed_at": self.claimed_at.isoformat(),
             "retry_count": self.retry_count,
             "max_retries": self.max_retries,
+            "workflow_hash": self.workflow_hash,
         }
 
 
@@ -142,10 +156,34 @@ class ConsumerConfig:
     pool_min_size: int = 2
     pool_max_size: int = 10
     claim_poll_interval_seconds: float = 1.0
+    listen_for_notifications: bool = True
+    # LISTEN needs a session-level connection; set this to a direct (non-pgbouncer)
+    # URL when postgres_url points at a transaction-mode pooler
+    listen_url: str | None = None
+    fallback_poll_interval_seconds: float = 15.0
+    notify_jitter_seconds: float = 0.05
+    # Fair share: within a priority, claim from the tenant (or tenant workflow)
+    # with the lowest running-jobs-per-weight instead of strictly oldest first
+    fair_share: bool = False
+    fair_share_per_workflow: bool = False
+    tenant_weights: dict[str, float] = field(default_factory=dict)
+    tenant_max_running: dict[str, int] = field(default_factory=dict)  # 0 = no cap
+    default_tenant_weight: float = 1.0
+    default_tenant_max_running: int = 0
+    # Candidates kept per share before SKIP LOCKED, as a multiple of the claim
+    # limit, so robots claiming concurrently still find rows the others skipped
+    fair_share_overselect: int = 8
 
     def __post_init__(self) -> None:
         # Normalize URL to avoid accidental whitespace in .env or shell exports.
         self.postgres_url = self.postgres_url.strip()
+        if self.listen_url:
+            self.listen_url = self.listen_url.strip()
+        weights = [self.default_tenant_weight, *self.tenant_weights.values()]
+        if any(weight <= 0 for weight in weights):
+            raise ValueError("tenant weights must be positive")
+        if self.fair_share_overselect < 1:
+            raise ValueError("fair_share_overselect must be at least 1")
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -168,6 +206,17 @@ class ConsumerConfig:
             "pool_min_size": self.pool_min_size,
             "pool_max_size": self.pool_max_size,
             "claim_poll_interval_seconds": self.claim_poll_interval_seconds,
+            "listen_for_notifications": self.listen_for_notifications,
+            "listen_url": sanitize_log_value(self.listen_url) if self.listen_url else None,
+            "fallback_poll_interval_seconds": self.fallback_poll_interval_seconds,
+            "notify_jitter_seconds": self.notify_jitter_seconds,
+            "fair_share": self.fair_share,
+            "fair_share_per_workflow": self.fair_share_per_workflow,
+            "tenant_weights": dict(self.tenant_weights),
+            "tenant_max_running": dict(self.tenant_max_running),
+            "default_tenant_weight": self.default_tenant_weight,
+            "default_tenant_max_running": self.default_tenant_max_running,
+            "fair_share_overselect": self.fair_share_overselect,
         }
 
 
@@ -196,6 +245,8 @@ class PgQueuerConsumer:
                 await consumer.complete_job(job.job_id, result)
             except Exception as e:
                 await consumer.fail_job(job.job_id, str(e))
+        else:
+            await consumer.wait_for_jobs()
 
         await consumer.stop()
     """
@@ -224,6 +275,7 @@ class PgQueuerConsumer:
                   workflow_id,
                   workflow_name,
                   workflow_json,
+                  workflow_hash,
                   priority,
                   environment,
                   variables,
@@ -232,6 +284,101 @@ class PgQueuerConsumer:
                   max_retries;
     """
 
+    # Fair-share variant of SQL_CLAIM_JOB, still one SKIP LOCKED statement.
+    # Within a priority, each pending job gets a virtual time of
+    # (running jobs of its share + its rank in the share) / tenant weight and
+    # the lowest virtual times are claimed first, so a tenant with a huge
+    # backlog cannot starve small tenants. Jobs past their tenant's running
+    # cap are not candidates. {share_key} is tenant_id, or tenant_id plus
+    # workflow_id when fair_share_per_workflow is set. Each share keeps
+    # limit * $10 candidates so the SKIP LOCKED pick is not emptied by rows
+    # other robots have just locked.
+    # $5/$6/$7: per-tenant weight and cap overrides, $8/$9: defaults
+    SQL_CLAIM_JOB_FAIR_SHARE = """
+        WITH shares AS (
+            SELECT *
+            FROM unnest($5::text[], $6::float8[], $7::int[])
+                AS s(tenant_id, weight, max_running)
+        ),
+        share_running AS (
+            SELECT {share_key} AS share_key, COUNT(*) AS running
+            FROM job_queue
+            WHERE status = 'running'
+            GROUP BY 1
+        ),
+        tenant_running AS (
+            SELECT tenant_id, COUNT(*) AS running
+            FROM job_queue
+            WHERE status = 'running'
+            GROUP BY tenant_id
+        ),
+        pending AS (
+            SELECT id,
+                   tenant_id,
+                   {share_key} AS share_key,
+                   priority,
+                   created_at,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY {share_key} ORDER BY priority DESC, created_at ASC
+                   ) AS share_rank,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY tenant_id ORDER BY priority DESC, created_at ASC
+                   ) AS tenant_rank
+            FROM job_queue
+            WHERE status = 'pending'
+              AND visible_after <= NOW()
+              AND (environment = $1 OR environment = 'default' OR $1 = 'default')
+        ),
+        candidates AS (
+            SELECT p.id,
+                   p.priority,
+                   p.created_at,
+                   (COALESCE(sr.running, 0) + p.share_rank)
+                       / COALESCE(s.weight, $8::float8) AS virtual_time
+            FROM pending p
+            LEFT JOIN share_running sr ON sr.share_key = p.share_key
+            LEFT JOIN tenant_running tr ON tr.tenant_id = p.tenant_id
+            LEFT JOIN shares s ON s.tenant_id = p.tenant_id
+            WHERE p.share_rank <= $2 * $10
+              AND (
+                  COALESCE(s.max_running, $9::int) <= 0
+                  OR COALESCE(tr.running, 0) + p.tenant_rank
+                      <= COALESCE(s.max_running, $9::int)
+              )
+        )
+        UPDATE job_queue
+        SET status = 'running',
+            robot_id = $3,
+            started_at = NOW(),
+            visible_after = NOW() + INTERVAL '1 second' * $4
+        WHERE id IN (
+            SELECT q.id
+            FROM job_queue q
+            JOIN candidates c ON c.id = q.id
+            WHERE q.status = 'pending'
+            ORDER BY c.priority DESC, c.virtual_time ASC, c.created_at ASC
+            LIMIT $2
+            FOR UPDATE OF q SKIP LOCKED
+        )
+        RETURNING id,
+                  workflow_id,
+                  workflow_name,
+                  workflow_json,
+                  workflow_hash,
+                  priority,
+                  environment,
+                  variables,
+                  created_at,
+                  retry_count,
+                  max_retries;
+    """
+
+    SQL_GET_WORKFLOW_BLOB = """
+        SELECT workflow_json
+        FROM workflow_blobs
+        WHERE content_hash = $1;
+    """
+
     SQL_EXTEND_LEASE = """
         UPDATE job_queue
         SET visible_after = NOW() + INTERVAL '1 second' * $2
@@ -241,6 +388,26 @@ class PgQueuerConsumer:
         RETURNING id;
     """
 
+    SQL_EXTEND_LEASES = """
+        UPDATE job_queue
+        SET visible_after = NOW() + INTERVAL '1 second' * $2
+        WHERE id = ANY($1::uuid[])
+          AND status = 'running'
+          AND robot_id = $3
+        RETURNING id;
+    """
+
+    # Progress lives on the orchestrator's jobs row (same ID as the job_queue row)
+    SQL_UPDATE_PROGRESS_BATCH = """
+        UPDATE jobs AS j
+        SET progress = u.progress,
+            current_node = u.current_node,
+            updated_at = NOW()
+        FROM unnest($1::uuid[], $2::int[], $3::text[]) AS u(job_id, progress, current_node)
+        WHERE j.job_id = u.job_id
+          AND j.status = 'running';
+    """
+
     SQL_COMPLETE_JOB = """
         UPDATE job_queue
         SET status = 'completed',
@@ -287,7 +454,7 @@ class PgQueuerConsumer:
         WHERE id = $1
           AND status = 'running'
           AND robot_id = $2
-        RETURNING id;
+        RETURNING id, environment;
     """
 
     SQL_REQUEUE_TIMED_OUT = """
@@ -303,9 +470,11 @@ class PgQueuerConsumer:
         WHERE status = 'running'
           AND visible_after < NOW()
           AND robot_id = $1
-        RETURNING id, status;
+        RETURNING id, status, environment;
     """
 
+    SQL_NOTIFY_JOBS = "SELECT pg_notify($1, $2);"
+
     SQL_GET_JOB_STATUS = """
         SELECT id, status, robot_id, visible_after
         FROM job_queue
@@ -340,14 +509,44 @@ class PgQueuerConsumer:
         self._reconnect_attempts: int = 0
         self._active_jobs: dict[JobId, ClaimedJob] = {}
         self._heartbeat_task: asyncio.Task[None] | None = None
+        self._listen_task: asyncio.Task[None] | None = None
+        self._listening: bool = False
+        # Cleared when the orchestrator's jobs table is missing (queue-only deployments)
+        self._progress_supported: bool = True
+        self._jobs_available: asyncio.Event = asyncio.Event()
         self._state_callbacks: list[StateChangeCallback] = []
         self._lock: asyncio.Lock = asyncio.Lock()
+        self._claim_query, self._claim_share_args = self._build_claim_query(config)
 
         logger.info(
             f"PgQueuerConsumer initialized for robot '{config.robot_id}' "
             f"in environment '{config.environment}'"
         )
 
+    @classmethod
+    def _build_claim_query(cls, config: ConsumerConfig) -> tuple[str, tuple[Any, ...]]:
+        """
+        Pick the claim statement and its fair-share parameters ($5-$10).
+
+        Returns:
+            Tuple of (query, extra_args); extra_args is empty without fair share
+        """
+        if not config.fair_share:
+            return cls.SQL_CLAIM_JOB, ()
+
+        share_key = (
+            "tenant_id || '/' || workflow_id" if config.fair_share_per_workflow else "tenant_id"
+        )
+        tenants = sorted(set(config.tenant_weights) | set(config.tenant_max_running))
+        return cls.SQL_CLAIM_JOB_FAIR_SHARE.format(share_key=share_key), (
+            tenants,
+            [config.tenant_weights.get(t, config.default_tenant_weight) for t in tenants],
+            [config.tenant_max_running.get(t, config.default_tenant_max_running) for t in tenants],
+            config.default_tenant_weight,
+            config.default_tenant_max_running,
+            config.fair_share_overselect,
+        )
+
     @property
     def state(self) -> ConnectionState:
         """Get current connection state."""
@@ -368,6 +567,11 @@ class PgQueuerConsumer:
         """Check if consumer is connected and ready."""
         return self._state == ConnectionState.CONNECTED and self._pool is not None
 
+    @property
+    def is_listening(self) -> bool:
+        """Check if the LISTEN connection for job notifications is up."""
+        return self._listening
+
     def add_state_callback(self, callback: StateChangeCallback) -> None:
         """
         Add a callback for connection state changes.
@@ -415,6 +619,8 @@ class PgQueuerConsumer:
 
         if success:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            if self._config.listen_for_notifications:
+                self._listen_task = asyncio.create_task(self._listen_loop())
             logger.info(f"PgQueuerConsumer started for robot '{self._config.robot_id}'")
 
         return success
@@ -437,6 +643,17 @@ class PgQueuerConsumer:
                 pass
             self._heartbeat_task = None
 
+        # Cancel notification listener
+        if self._listen_task and not self._listen_task.done():
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+        self._listen_task = None
+        # Wake any claimer blocked in wait_for_jobs() so it sees _running=False
+        self._jobs_available.set()
+
         # Release active jobs back to queue
         await self._release_all_active_jobs()
 
@@ -596,27 +813,38 @@ class PgQueuerConsumer:
 
         raise last_error or ConnectionError("Query failed after retries")
 
-    async def claim_job(self) -> ClaimedJob | None:
+    async def claim_job(self, visibility_timeout_seconds: int | None = None) -> ClaimedJob | None:
         """
         Claim a single job from the queue.
 
         Uses SKIP LOCKED for non-blocking concurrent access.
 
+        Args:
+            visibility_timeout_seconds: Lease to take (defaults to config value)
+
         Returns:
             ClaimedJob if one was claimed, None if queue is empty
 
         Raises:
             ConnectionError: If database connection fails
         """
-        jobs = await self.claim_batch(limit=1)
+        jobs = await self.claim_batch(
+            limit=1, visibility_timeout_seconds=visibility_timeout_seconds
+        )
         return jobs[0] if jobs else None
 
-    async def claim_batch(self, limit: int | None = None) -> list[ClaimedJob]:
+    async def claim_batch(
+        self,
+        limit: int | None = None,
+        visibility_timeout_seconds: int | None = None,
+    ) -> list[ClaimedJob]:
         """
         Claim multiple jobs from the queue.
 
         Args:
             limit: Maximum jobs to claim (defaults to config.batch_size)
+            visibility_timeout_seconds: Lease to take (defaults to config value);
+                prefetching robots claim with a short lease and extend it on dequeue
 
         Returns:
             List of claimed jobs (may be empty)
@@ -625,14 +853,16 @@ class PgQueuerConsumer:
             ConnectionError: If database connection fails
         """
         batch_size = limit or self._config.batch_size
+        lease = visibility_timeout_seconds or self._config.visibility_timeout_seconds
 
         try:
             rows = await self._execute_with_retry(
-                self.SQL_CLAIM_JOB,
+                self._claim_query,
                 self._config.environment,
                 batch_size,
                 self._config.robot_id,
-                self._config.visibility_timeout_seconds,
+                lease,
+                *self._claim_share_args,
             )
         except Exception as e:
             logger.error(f"Failed to claim jobs: {e}")
@@ -668,6 +898,7 @@ class PgQueuerConsumer:
                 claimed_at=now,
                 retry_count=row["retry_count"],
                 max_retries=row["max_retries"],
+                workflow_hash=row["workflow_hash"],
             )
             claimed_jobs.append(job)
 
@@ -682,6 +913,32 @@ class PgQueuerConsumer:
 
         return claimed_jobs
 
+    async def fetch_workflow_blob(self, content_hash: str) -> str | None:
+        """
+        Fetch a workflow definition by content hash.
+
+        Called only when the robot's workflow cache has no entry for the hash.
+
+        Args:
+            content_hash: workflow_hash from a claimed job
+
+        Returns:
+            Serialized workflow, or None if the blob does not exist
+
+        Raises:
+            ConnectionError: If database connection fails
+        """
+        try:
+            rows = await self._execute_with_retry(self.SQL_GET_WORKFLOW_BLOB, content_hash)
+        except Exception as e:
+            logger.error(f"Failed to fetch workflow blob {content_hash[:12]}...: {e}")
+            raise
+
+        if not rows:
+            logger.warning(f"Workflow blob {content_hash[:12]}... not found")
+            return None
+        return rows[0]["workflow_json"]
+
     async def extend_lease(
         self,
         job_id: JobId,
@@ -726,6 +983,86 @@ class PgQueuerConsumer:
             logger.error(f"Failed to extend lease for job {job_id[:8]}...: {e}")
             raise
 
+    async def extend_leases(
+        self,
+        job_ids: Sequence[JobId],
+        extension_seconds: int | None = None,
+    ) -> list[JobId]:
+        """
+        Extend the leases of several jobs in a single statement.
+
+        Args:
+            job_ids: Job IDs to extend
+            extension_seconds: Seconds to extend (defaults to visibility_timeout_seconds)
+
+        Returns:
+            IDs whose lease was lost (finished, requeued or claimed by another
+            robot); the caller should stop executing those jobs
+
+        Raises:
+            ConnectionError: If database connection fails
+        """
+        if not job_ids:
+            return []
+
+        extension = extension_seconds or self._config.visibility_timeout_seconds
+
+        try:
+            rows = await self._execute_with_retry(
+                self.SQL_EXTEND_LEASES,
+                [uuid.UUID(job_id) for job_id in job_ids],
+                extension,
+                self._config.robot_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to extend leases for {len(job_ids)} jobs: {e}")
+            raise
+
+        renewed = {row["id"] for row in rows}
+        lost = [job_id for job_id in job_ids if uuid.UUID(job_id) not in renewed]
+        logger.debug(f"Extended leases for {len(renewed)} jobs by {extension}s")
+        if lost:
+            logger.warning(
+                f"Lost lease for {len(lost)} job(s): "
+                f"{', '.join(job_id[:8] + '...' for job_id in lost)}"
+            )
+        return lost
+
+    async def update_progress_batch(self, updates: Sequence[ProgressUpdate]) -> bool:
+        """
+        Write the progress of several jobs in a single statement.
+
+        Args:
+            updates: (job_id, progress_percent, current_node) per job
+
+        Returns:
+            True if the statement ran, False if progress is not persisted in
+            this deployment
+
+        Raises:
+            ConnectionError: If database connection fails
+        """
+        if not updates or not self._progress_supported:
+            return self._progress_supported
+
+        try:
+            await self._execute_with_retry(
+                self.SQL_UPDATE_PROGRESS_BATCH,
+                [uuid.UUID(job_id) for job_id, _, _ in updates],
+                [max(0, min(100, progress)) for _, progress, _ in updates],
+                [(current_node or "")[:255] for _, _, current_node in updates],
+            )
+        except asyncpg.exceptions.UndefinedTableError:
+            logger.info("No jobs table in this database, job progress will not be persisted")
+            self._progress_supported = False
+            return False
+        except Exception as e:
+            logger.error(f"Failed to update progress for {len(updates)} jobs: {e}")
+            raise
+
+        logger.debug(f"Updated progress for {len(updates)} jobs")
+        return True
+
     async def complete_job(
         self,
         job_id: JobId,
@@ -865,6 +1202,7 @@ class PgQueuerConsumer:
             success = len(rows) > 0
             if success:
                 logger.info(f"Released job {job_id[:8]}... back to queue")
+                await self._notify_jobs_available({rows[0]["environment"]: 1})
             else:
                 logger.warning(
                     f"Failed to release job {job_id[:8]}... "
@@ -910,6 +1248,11 @@ class PgQueuerConsumer:
             count = len(rows)
             if count > 0:
                 logger.info(f"Requeued {count} timed-out jobs")
+                counts: dict[str, int] = {}
+                for row in rows:
+                    if row["status"] == "pending":
+                        counts[row["environment"]] = counts.get(row["environment"], 0) + 1
+                await self._notify_jobs_available(counts)
 
             return count
 
@@ -917,6 +1260,25 @@ class PgQueuerConsumer:
             logger.error(f"Failed to requeue timed-out jobs: {e}")
             raise
 
+    async def _notify_jobs_available(self, counts: dict[str, int]) -> None:
+        """
+        NOTIFY listening consumers that jobs went back to the queue.
+
+        Best effort, like PgQueuerProducer's enqueue notifications: a lost
+        notification only delays the job until the fallback poll.
+
+        Args:
+            counts: Number of claimable jobs per environment
+        """
+        try:
+            for environment, count in counts.items():
+                for channel in notify_channels(environment):
+                    await self._execute_with_retry(
+                        self.SQL_NOTIFY_JOBS, channel, str(count), max_retries=1
+                    )
+        except Exception as e:
+            logger.warning(f"Failed to notify consumers of requeued jobs: {e}")
+
     async def get_job_status(self, job_id: JobId) -> JobStatusInfo | None:
         """
         Get current status of a job.
@@ -967,11 +1329,16 @@ class PgQueuerConsumer:
                 async with self._lock:
                     job_ids = list(self._active_jobs.keys())
 
-                for job_id in job_ids:
-                    try:
-                        await self.extend_lease(job_id)
-                    except Exception as e:
-                        logger.warning(f"Heartbeat failed for job {job_id[:8]}...: {e}")
+                try:
+                    lost = await self.extend_leases(job_ids)
+                except Exception as e:
+                    logger.warning(f"Heartbeat failed for {len(job_ids)} jobs: {e}")
+                    continue
+
+                if lost:
+                    async with self._lock:
+                        for job_id in lost:
+                            self._active_jobs.pop(job_id, None)
 
             except asyncio.CancelledError:
                 break
@@ -981,6 +1348,111 @@ class PgQueuerConsumer:
 
         logger.debug("Heartbeat loop stopped")
 
+    async def wait_for_jobs(self) -> bool:
+        """
+        Wait until new jobs may be claimable.
+
+        While the LISTEN connection is up, returns as soon as a matching NOTIFY
+        arrives, after a small random delay so robots woken by the same
+        notification do not all claim at once. Otherwise (or when nothing
+        arrives) falls back to a jittered poll interval.
+
+        Returns:
+            True if woken by a notification, False on poll timeout
+        """
+        if not self._listening:
+            interval = self._config.claim_poll_interval_seconds
+            await asyncio.sleep(interval * random.uniform(0.8, 1.2))
+            return False
+
+        # Jitter the fallback so idle robots don't poll in lockstep
+        timeout = self._config.fallback_poll_interval_seconds * random.uniform(0.75, 1.25)
+        try:
+            await asyncio.wait_for(self._jobs_available.wait(), timeout)
+        except TimeoutError:
+            return False
+
+        self._jobs_available.clear()
+        if self._config.notify_jitter_seconds > 0:
+            await asyncio.sleep(random.uniform(0, self._config.notify_jitter_seconds))
+        return True
+
+    def _on_job_notification(
+        self,
+        connection: Any,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        """asyncpg listener callback for job notifications."""
+        logger.debug(f"Job notification on '{channel}' (jobs={payload})")
+        self._jobs_available.set()
+
+    async def _listen_loop(self) -> None:
+        """
+        Background task holding a dedicated LISTEN connection.
+
+        The connection lives outside the pool because LISTEN registrations are
+        per-session. It is probed every fallback interval and re-established
+        with exponential backoff when lost; claimers keep polling meanwhile.
+        """
+        url = self._config.listen_url or self._config.postgres_url
+        channels = listen_channels(self._config.environment)
+        attempts = 0
+        logger.debug(f"Job notification listener started on {channels}")
+
+        while self._running:
+            conn = None
+            lost = asyncio.Event()
+            try:
+                conn = await asyncpg.connect(url, timeout=30, statement_cache_size=0)
+                conn.add_termination_listener(lambda _conn: lost.set())
+                for channel in channels:
+                    await conn.add_listener(channel, self._on_job_notification)
+
+                self._listening = True
+                attempts = 0
+                # Jobs enqueued while we were not listening got no wakeup
+                self._jobs_available.set()
+
+                while self._running and not lost.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            lost.wait(), self._config.fallback_poll_interval_seconds
+                        )
+                    except TimeoutError:
+                        # Detect half-open connections the server never closed
+                        await conn.execute("SELECT 1")
+
+                if lost.is_set():
+                    logger.warning("Job notification connection lost")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job notification listener error: {e}")
+            finally:
+                self._listening = False
+                if conn is not None and not conn.is_closed():
+                    try:
+                        await conn.close(timeout=5)
+                    except Exception:
+                        conn.terminate()
+
+            if not self._running:
+                break
+
+            attempts += 1
+            delay = min(
+                self._config.reconnect_base_delay_seconds * (2 ** min(attempts - 1, 16)),
+                self._config.reconnect_max_delay_seconds,
+            )
+            delay += delay * random.uniform(0.1, 0.3)
+            logger.info(f"Reconnecting job notification listener in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+        logger.debug("Job notification listener stopped")
+
     def get_stats(self) -> ConsumerStats:
         """
         Get consumer statistics.
@@ -998,6 +1470,7 @@ class PgQueuerConsumer:
             "environment": self._config.environment,
             "state": self._state.value,
             "is_connected": self.is_connected,
+            "is_listening": self._listening,
             "active_jobs": self.active_job_count,
             "active_job_ids": list(self._active_jobs.keys()),
             "reconnect_attempts": self._reconnect_attempts,
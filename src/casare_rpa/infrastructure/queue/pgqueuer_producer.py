@@ -10,12 +10,16 @@ Features:
 - Job cancellation and status queries
 - Automatic reconnection with exponential backoff
 - Connection pooling for high throughput
+- Content-addressed workflow blobs (each distinct workflow stored once)
 
 Architecture:
-- Orchestrator submits jobs via enqueue_job() or enqueue_batch()
+- Orchestrator submits jobs via enqueue_job() or enqueue_batch(); code that
+  already holds a pool connection uses enqueue_on_connection()
 - Jobs are inserted with pending status and become visible immediately
 - Priority-based ordering (higher priority = claimed first)
 - Environment filtering for multi-tenant deployments
+- Listening consumers are NOTIFYed on enqueue; a background sweep also
+  NOTIFYs when delayed or backed-off jobs reach their visible_after
 
 Database Schema (same as consumer):
     CREATE TABLE job_queue (
@@ -44,6 +48,7 @@ from __future__ import annotations
 import asyncio
 import random
 import uuid
+from collections import OrderedDict
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
@@ -52,6 +57,7 @@ from typing import Any
 
 from loguru import logger
 
+from casare_rpa.infrastructure.queue.job_notifications import notify_channels
 from casare_rpa.infrastructure.queue.types import (
     DatabaseRecord,
     DatabaseRecordList,
@@ -63,6 +69,7 @@ from casare_rpa.infrastructure.queue.types import (
     StateChangeCallback,
     WorkflowId,
 )
+from casare_rpa.infrastructure.queue.workflow_blobs import workflow_content_hash
 
 try:
     import asyncpg
@@ -132,6 +139,8 @@ class JobSubmission:
     variables: dict[str, Any] | None = None
     max_retries: int = 3
     delay_seconds: int = 0  # Delay before job becomes visible
+    tenant_id: str = "default"  # Owner used for fair-share claiming
+    metadata: dict[str, Any] | None = None
 
     def __post_init__(self) -> None:
         """Validate submission data."""
@@ -162,6 +171,11 @@ class ProducerConfig:
     reconnect_max_delay_seconds: float = 60.0
     pool_min_size: int = 2
     pool_max_size: int = 10
+    notify_on_enqueue: bool = True  # NOTIFY listening consumers of new jobs
+    # Seconds between sweeps that NOTIFY jobs whose visible_after has passed
+    # (delayed enqueues, retry backoff); 0 disables the sweep
+    claimable_sweep_interval_seconds: float = 1.0
+    use_workflow_blobs: bool = True  # Store workflow_json once in workflow_blobs
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -181,9 +195,25 @@ class ProducerConfig:
             "reconnect_max_delay_seconds": self.reconnect_max_delay_seconds,
             "pool_min_size": self.pool_min_size,
             "pool_max_size": self.pool_max_size,
+            "notify_on_enqueue": self.notify_on_enqueue,
+            "claimable_sweep_interval_seconds": self.claimable_sweep_interval_seconds,
+            "use_workflow_blobs": self.use_workflow_blobs,
         }
 
 
+def _enqueued_job(row: DatabaseRecord) -> EnqueuedJob:
+    """Build an EnqueuedJob from a RETURNING row of the enqueue queries."""
+    return EnqueuedJob(
+        job_id=str(row["id"]),
+        workflow_id=row["workflow_id"],
+        workflow_name=row["workflow_name"],
+        priority=row["priority"],
+        environment=row["environment"],
+        created_at=row["created_at"],
+        visible_after=row["visible_after"],
+    )
+
+
 class PgQueuerProducer:
     """
     PostgreSQL-based distributed queue producer for orchestrator job enqueuing.
@@ -224,16 +254,66 @@ class PgQueuerProducer:
         INSERT INTO job_queue (
             id, workflow_id, workflow_name, workflow_json,
             priority, status, environment, visible_after,
-            created_at, max_retries, variables
+            created_at, max_retries, variables, tenant_id, metadata
         ) VALUES (
             $1, $2, $3, $4, $5, 'pending', $6,
             NOW() + INTERVAL '1 second' * $7,
-            NOW(), $8, $9::jsonb
+            NOW(), $8, $9::jsonb, $10, $11::jsonb
+        )
+        RETURNING id, workflow_id, workflow_name, priority, environment,
+                  created_at, visible_after;
+    """
+
+    SQL_UPSERT_WORKFLOW_BLOB = """
+        INSERT INTO workflow_blobs (content_hash, workflow_json, size_bytes)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (content_hash) DO NOTHING;
+    """
+
+    SQL_ENQUEUE_JOB_BY_HASH = """
+        INSERT INTO job_queue (
+            id, workflow_id, workflow_name, workflow_json, workflow_hash,
+            priority, status, environment, visible_after,
+            created_at, max_retries, variables, tenant_id, metadata
+        ) VALUES (
+            $1, $2, $3, '', $4, $5, 'pending', $6,
+            NOW() + INTERVAL '1 second' * $7,
+            NOW(), $8, $9::jsonb, $10, $11::jsonb
         )
         RETURNING id, workflow_id, workflow_name, priority, environment,
                   created_at, visible_after;
     """
 
+    # Grace period covers blobs upserted just before their job insert
+    SQL_PURGE_UNREFERENCED_BLOBS = """
+        DELETE FROM workflow_blobs b
+        WHERE b.created_at < NOW() - INTERVAL '1 hour'
+          AND NOT EXISTS (
+              SELECT 1 FROM job_queue q WHERE q.workflow_hash = b.content_hash
+          )
+        RETURNING content_hash;
+    """
+
+    SQL_NOTIFY_JOBS = "SELECT pg_notify($1, $2);"
+
+    # Pending jobs whose visible_after passed since the previous sweep ($1).
+    # Jobs visible at insert (visible_after = created_at) were announced by
+    # their enqueue. The first sweep ($1 NULL) only records the sweep time.
+    SQL_SWEEP_CLAIMABLE = """
+        WITH sweep AS (SELECT NOW() AS swept_at)
+        SELECT s.swept_at, q.environment, COUNT(q.id) AS count
+        FROM sweep s
+        LEFT JOIN job_queue q
+          ON q.status = 'pending'
+         AND q.visible_after > COALESCE($1::timestamptz, s.swept_at)
+         AND q.visible_after <= s.swept_at
+         AND q.visible_after > q.created_at
+        GROUP BY s.swept_at, q.environment;
+    """
+
+    # Upper bound on blob hashes remembered as already stored
+    _MAX_KNOWN_BLOBS = 1024
+
     SQL_CANCEL_JOB = """
         UPDATE job_queue
         SET status = 'cancelled',
@@ -307,6 +387,10 @@ class PgQueuerProducer:
         self._state_callbacks: list[StateChangeCallback] = []
         self._lock: asyncio.Lock = asyncio.Lock()
 
+        # Blobs this producer has written (LRU); enqueues for these send only the hash
+        self._known_blob_hashes: OrderedDict[str, None] = OrderedDict()
+        self._sweep_task: asyncio.Task[None] | None = None
+
         # Statistics
         self._total_enqueued: int = 0
         self._total_cancelled: int = 0
@@ -381,6 +465,8 @@ class PgQueuerProducer:
         success = await self._connect()
 
         if success:
+            if self._config.notify_on_enqueue and self._config.claimable_sweep_interval_seconds > 0:
+                self._sweep_task = asyncio.create_task(self._sweep_claimable_loop())
             logger.info("PgQueuerProducer started")
 
         return success
@@ -394,6 +480,14 @@ class PgQueuerProducer:
         logger.info("Stopping PgQueuerProducer...")
         self._running = False
 
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
         # Close pool
         if self._pool:
             try:
@@ -559,6 +653,8 @@ class PgQueuerProducer:
         variables: dict[str, Any] | None = None,
         max_retries: int | None = None,
         delay_seconds: int = 0,
+        tenant_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
     ) -> EnqueuedJob:
         """
         Enqueue a single job to the queue.
@@ -572,6 +668,8 @@ class PgQueuerProducer:
             variables: Initial workflow variables
             max_retries: Maximum retry attempts on failure
             delay_seconds: Delay before job becomes visible
+            tenant_id: Owning tenant for fair-share claiming (default: "default")
+            metadata: Additional job metadata
 
         Returns:
             EnqueuedJob with confirmation data
@@ -592,6 +690,7 @@ class PgQueuerProducer:
         environment = environment or self._config.default_environment
         max_retries = max_retries if max_retries is not None else self._config.default_max_retries
         variables = variables or {}
+        tenant_id = tenant_id or "default"
 
         # Validate ranges
         if priority < 0 or priority > 100:
@@ -603,38 +702,51 @@ class PgQueuerProducer:
 
         job_id = uuid.uuid4()
         variables_json = orjson.dumps(variables).decode("utf-8")
+        metadata_json = orjson.dumps(metadata or {}).decode("utf-8")
 
         try:
-            rows = await self._execute_with_retry(
-                self.SQL_ENQUEUE_JOB,
-                job_id,
-                workflow_id,
-                workflow_name,
-                workflow_json,
-                priority,
-                environment,
-                delay_seconds,
-                max_retries,
-                variables_json,
-            )
+            if self._config.use_workflow_blobs:
+                rows = await self._enqueue_blob_backed(
+                    job_id,
+                    workflow_id,
+                    workflow_name,
+                    workflow_json,
+                    priority,
+                    environment,
+                    delay_seconds,
+                    max_retries,
+                    variables_json,
+                    tenant_id,
+                    metadata_json,
+                )
+            else:
+                rows = await self._execute_with_retry(
+                    self.SQL_ENQUEUE_JOB,
+                    job_id,
+                    workflow_id,
+                    workflow_name,
+                    workflow_json,
+                    priority,
+                    environment,
+                    delay_seconds,
+                    max_retries,
+                    variables_json,
+                    tenant_id,
+                    metadata_json,
+                )
 
             if not rows:
                 raise RuntimeError("Failed to enqueue job - no row returned")
 
-            row = rows[0]
-            enqueued_job = EnqueuedJob(
-                job_id=str(row["id"]),
-                workflow_id=row["workflow_id"],
-                workflow_name=row["workflow_name"],
-                priority=row["priority"],
-                environment=row["environment"],
-                created_at=row["created_at"],
-                visible_after=row["visible_after"],
-            )
+            enqueued_job = _enqueued_job(rows[0])
 
             async with self._lock:
                 self._total_enqueued += 1
 
+            # Delayed jobs are not claimable yet; the claimable sweep announces them
+            if delay_seconds == 0:
+                await self._notify_jobs_available({environment: 1})
+
             logger.info(
                 f"Enqueued job {enqueued_job.job_id[:8]}... "
                 f"workflow='{workflow_name}' priority={priority} env='{environment}'"
@@ -665,8 +777,6 @@ class PgQueuerProducer:
         if not submissions:
             return []
 
-        import orjson
-
         from casare_rpa.infrastructure.security.validators import validate_workflow_id
 
         # Validate all submissions first
@@ -676,43 +786,21 @@ class PgQueuerProducer:
         if not await self._ensure_connection():
             raise ConnectionError("Unable to establish database connection")
 
-        enqueued_jobs: list[EnqueuedJob] = []
+        content_hashes: list[str | None] = [
+            workflow_content_hash(sub.workflow_json) if self._config.use_workflow_blobs else None
+            for sub in submissions
+        ]
 
         try:
-            assert self._pool is not None  # Guaranteed by _ensure_connection()
-            async with self._pool.acquire() as conn:
-                async with conn.transaction():
-                    for sub in submissions:
-                        job_id = uuid.uuid4()
-                        variables = sub.variables or {}
-                        variables_json = orjson.dumps(variables).decode("utf-8")
-
-                        rows = await conn.fetch(
-                            self.SQL_ENQUEUE_JOB,
-                            job_id,
-                            sub.workflow_id,
-                            sub.workflow_name,
-                            sub.workflow_json,
-                            sub.priority,
-                            sub.environment,
-                            sub.delay_seconds,
-                            sub.max_retries,
-                            variables_json,
-                        )
-
-                        if rows:
-                            row = rows[0]
-                            enqueued_jobs.append(
-                                EnqueuedJob(
-                                    job_id=str(row["id"]),
-                                    workflow_id=row["workflow_id"],
-                                    workflow_name=row["workflow_name"],
-                                    priority=row["priority"],
-                                    environment=row["environment"],
-                                    created_at=row["created_at"],
-                                    visible_after=row["visible_after"],
-                                )
-                            )
+            for attempt in range(2):
+                try:
+                    enqueued_jobs = await self._insert_batch(submissions, content_hashes)
+                    break
+                except asyncpg.exceptions.ForeignKeyViolationError:
+                    # A blob we skipped as known was garbage-collected; write them all
+                    if attempt:
+                        raise
+                    self._forget_blobs(content_hashes)
 
             async with self._lock:
                 self._total_enqueued += len(enqueued_jobs)
@@ -724,6 +812,279 @@ class PgQueuerProducer:
             logger.error(f"Failed to batch enqueue jobs: {e}")
             raise
 
+    async def _insert_batch(
+        self,
+        submissions: list[JobSubmission],
+        content_hashes: list[str | None],
+    ) -> list[EnqueuedJob]:
+        """
+        Insert a batch of jobs (and any unknown workflow blobs) in one transaction.
+
+        Args:
+            submissions: Jobs to insert
+            content_hashes: Blob hash per submission, or None to store inline
+
+        Returns:
+            List of EnqueuedJob confirmations
+        """
+        import orjson
+
+        enqueued_jobs: list[EnqueuedJob] = []
+        visible_counts: dict[str, int] = {}
+        written_blobs: set[str] = set()
+
+        assert self._pool is not None  # Guaranteed by _ensure_connection()
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                for sub, content_hash in zip(submissions, content_hashes, strict=True):
+                    job_id = uuid.uuid4()
+                    variables = sub.variables or {}
+                    variables_json = orjson.dumps(variables).decode("utf-8")
+                    metadata_json = orjson.dumps(sub.metadata or {}).decode("utf-8")
+
+                    if content_hash is None:
+                        query, workflow_ref = self.SQL_ENQUEUE_JOB, sub.workflow_json
+                    else:
+                        if content_hash not in written_blobs and (
+                            content_hash not in self._known_blob_hashes
+                        ):
+                            await conn.execute(
+                                self.SQL_UPSERT_WORKFLOW_BLOB,
+                                content_hash,
+                                sub.workflow_json,
+                                len(sub.workflow_json.encode("utf-8")),
+                            )
+                            written_blobs.add(content_hash)
+                        query, workflow_ref = self.SQL_ENQUEUE_JOB_BY_HASH, content_hash
+
+                    rows = await conn.fetch(
+                        query,
+                        job_id,
+                        sub.workflow_id,
+                        sub.workflow_name,
+                        workflow_ref,
+                        sub.priority,
+                        sub.environment,
+                        sub.delay_seconds,
+                        sub.max_retries,
+                        variables_json,
+                        sub.tenant_id,
+                        metadata_json,
+                    )
+
+                    if rows:
+                        enqueued_jobs.append(_enqueued_job(rows[0]))
+                        if sub.delay_seconds == 0:
+                            visible_counts[sub.environment] = (
+                                visible_counts.get(sub.environment, 0) + 1
+                            )
+
+                # Inside the transaction: delivered on commit, one per environment
+                await self._notify_jobs_available(visible_counts, conn)
+
+        # Only remember blobs once their transaction has committed
+        for content_hash in written_blobs:
+            self._remember_blob(content_hash)
+        return enqueued_jobs
+
+    async def _enqueue_blob_backed(
+        self,
+        job_id: uuid.UUID,
+        workflow_id: WorkflowId,
+        workflow_name: str,
+        workflow_json: str,
+        priority: int,
+        environment: str,
+        delay_seconds: int,
+        max_retries: int,
+        variables_json: str,
+        tenant_id: str,
+        metadata_json: str,
+    ) -> DatabaseRecordList:
+        """
+        Insert a job that references its workflow by content hash.
+
+        The blob itself is only sent the first time this producer sees it.
+
+        Returns:
+            Rows returned by the job insert
+        """
+        content_hash = workflow_content_hash(workflow_json)
+        insert_args = (
+            job_id,
+            workflow_id,
+            workflow_name,
+            content_hash,
+            priority,
+            environment,
+            delay_seconds,
+            max_retries,
+            variables_json,
+            tenant_id,
+            metadata_json,
+        )
+
+        await self._ensure_blob(content_hash, workflow_json)
+        try:
+            return await self._execute_with_retry(self.SQL_ENQUEUE_JOB_BY_HASH, *insert_args)
+        except asyncpg.exceptions.ForeignKeyViolationError:
+            # Blob was garbage-collected since we wrote it; write it again
+            self._forget_blobs([content_hash])
+            await self._ensure_blob(content_hash, workflow_json)
+            return await self._execute_with_retry(self.SQL_ENQUEUE_JOB_BY_HASH, *insert_args)
+
+    async def _ensure_blob(self, content_hash: str, workflow_json: str) -> None:
+        """Upsert a workflow blob unless this producer already stored it."""
+        if content_hash in self._known_blob_hashes:
+            self._known_blob_hashes.move_to_end(content_hash)
+            return
+        await self._execute_with_retry(
+            self.SQL_UPSERT_WORKFLOW_BLOB,
+            content_hash,
+            workflow_json,
+            len(workflow_json.encode("utf-8")),
+        )
+        self._remember_blob(content_hash)
+
+    def _remember_blob(self, content_hash: str) -> None:
+        """Record a blob as stored, evicting the least recently used entry."""
+        self._known_blob_hashes[content_hash] = None
+        self._known_blob_hashes.move_to_end(content_hash)
+        if len(self._known_blob_hashes) > self._MAX_KNOWN_BLOBS:
+            self._known_blob_hashes.popitem(last=False)
+
+    def _forget_blobs(self, content_hashes: Sequence[str | None]) -> None:
+        """Drop blobs from the known set so the next enqueue rewrites them."""
+        for content_hash in content_hashes:
+            if content_hash is not None:
+                self._known_blob_hashes.pop(content_hash, None)
+
+    @classmethod
+    async def enqueue_on_connection(
+        cls,
+        conn: Any,
+        submission: JobSubmission,
+        job_id: str | None = None,
+        notify: bool = True,
+    ) -> EnqueuedJob:
+        """
+        Enqueue a job on a caller-owned connection, in one transaction.
+
+        For code that holds a pool connection but no producer (or must reuse
+        an existing job id). Upserts the workflow blob, inserts the job by
+        content hash and NOTIFYs consumers inside the transaction, so the
+        wakeup is delivered exactly when the job becomes visible.
+
+        Args:
+            conn: asyncpg connection
+            submission: Job to insert
+            job_id: Job ID to use (default: a new UUID)
+            notify: NOTIFY listening consumers of the job
+
+        Returns:
+            EnqueuedJob confirmation
+        """
+        import orjson
+
+        from casare_rpa.infrastructure.security.validators import validate_workflow_id
+
+        validate_workflow_id(submission.workflow_id)
+        content_hash = workflow_content_hash(submission.workflow_json)
+
+        async with conn.transaction():
+            await conn.execute(
+                cls.SQL_UPSERT_WORKFLOW_BLOB,
+                content_hash,
+                submission.workflow_json,
+                len(submission.workflow_json.encode("utf-8")),
+            )
+            rows = await conn.fetch(
+                cls.SQL_ENQUEUE_JOB_BY_HASH,
+                uuid.UUID(job_id) if job_id else uuid.uuid4(),
+                submission.workflow_id,
+                submission.workflow_name,
+                content_hash,
+                submission.priority,
+                submission.environment,
+                submission.delay_seconds,
+                submission.max_retries,
+                orjson.dumps(submission.variables or {}).decode("utf-8"),
+                submission.tenant_id,
+                orjson.dumps(submission.metadata or {}).decode("utf-8"),
+            )
+            if not rows:
+                raise RuntimeError("Failed to enqueue job - no row returned")
+            if notify and submission.delay_seconds == 0:
+                for channel in notify_channels(submission.environment):
+                    await conn.execute(cls.SQL_NOTIFY_JOBS, channel, "1")
+
+        return _enqueued_job(rows[0])
+
+    async def _sweep_claimable_loop(self) -> None:
+        """
+        Background task NOTIFYing consumers of jobs that became claimable.
+
+        Covers jobs that are not visible when written (delayed enqueues,
+        retry backoff, releases with a delay), which otherwise wait for the
+        consumers' slow fallback poll.
+        """
+        swept_at: datetime | None = None
+        interval = self._config.claimable_sweep_interval_seconds
+
+        while self._running:
+            try:
+                rows = await self._execute_with_retry(
+                    self.SQL_SWEEP_CLAIMABLE, swept_at, max_retries=1
+                )
+                if rows:
+                    swept_at = rows[0]["swept_at"]
+                    counts = {
+                        row["environment"]: row["count"]
+                        for row in rows
+                        if row["environment"] is not None and row["count"]
+                    }
+                    await self._notify_jobs_available(counts)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Claimable job sweep failed: {e}")
+
+            await asyncio.sleep(interval)
+
+    async def _notify_jobs_available(
+        self,
+        counts: dict[str, int],
+        conn: Any | None = None,
+    ) -> None:
+        """
+        NOTIFY listening consumers that jobs became claimable.
+
+        Best effort: a lost notification only delays the job until the
+        consumers' fallback poll, so errors are logged rather than raised.
+
+        Args:
+            counts: Number of visible jobs enqueued per environment
+            conn: Connection to notify on (inside its transaction), or None
+                to use a pooled connection
+        """
+        if not self._config.notify_on_enqueue or not counts:
+            return
+
+        try:
+            for environment, count in counts.items():
+                for channel in notify_channels(environment):
+                    if conn is not None:
+                        await conn.execute(self.SQL_NOTIFY_JOBS, channel, str(count))
+                    else:
+                        await self._execute_with_retry(
+                            self.SQL_NOTIFY_JOBS, channel, str(count), max_retries=1
+                        )
+        except Exception as e:
+            if conn is not None:
+                # The transaction is aborted; let enqueue_batch fail and roll back
+                raise
+            logger.warning(f"Failed to notify consumers of new jobs: {e}")
+
     async def cancel_job(
         self,
         job_id: JobId,
@@ -885,6 +1246,12 @@ class PgQueuerProducer:
             if count > 0:
                 logger.info(f"Purged {count} jobs older than {days_old} days")
 
+            if self._config.use_workflow_blobs:
+                blob_rows = await self._execute_with_retry(self.SQL_PURGE_UNREFERENCED_BLOBS)
+                self._forget_blobs([row["content_hash"] for row in blob_rows])
+                if blob_rows:
+                    logger.info(f"Purged {len(blob_rows)} unreferenced workflow blobs")
+
             return count
 
         except Exception as e:
@@ -244,6 +244,7 @@ class ConsumerStats(TypedDict):
     environment: str
     state: str
     is_connected: bool
+    is_listening: bool
     active_jobs: int
     active_job_ids: list[str]
     reconnect_attempts: int
@@ -390,6 +391,9 @@ RobotId = str
 Environment = str
 Priority = int
 
+# Job progress write: (job_id, progress_percent, current_node)
+ProgressUpdate = tuple[JobId, int, str]
+
 # Database record type (from asyncpg)
 DatabaseRecord = dict[str, Any]
 DatabaseRecordList = list[DatabaseRecord]
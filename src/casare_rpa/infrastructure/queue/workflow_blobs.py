@@ -0,0 +1,48 @@
+"""
+CasareRPA Infrastructure Layer - Workflow Blobs
+
+Content-addressed storage for workflow definitions shared by queued jobs.
+
+PgQueuerProducer upserts each distinct workflow_json once into workflow_blobs
+and jobs reference it by workflow_hash (job_queue.workflow_json is left empty).
+PgQueuerConsumer claims return only the hash; robots resolve it through their
+WorkflowCache and fetch the blob only on a cache miss.
+
+Database Schema (deploy/migrations/versions/012_workflow_blobs.sql):
+    CREATE TABLE workflow_blobs (
+        content_hash VARCHAR(64) PRIMARY KEY,
+        workflow_json TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        created_at TIMESTAMPTZ DEFAULT NOW()
+    );
+    ALTER TABLE job_queue ADD COLUMN workflow_hash VARCHAR(64)
+        REFERENCES workflow_blobs (content_hash);
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+WORKFLOW_BLOBS_TABLE = "workflow_blobs"
+
+
+def workflow_content_hash(workflow_json: str) -> str:
+    """
+    Compute the blob key for a serialized workflow.
+
+    Hashes the exact text that is stored, so a robot can verify a fetched
+    blob against the hash it claimed.
+
+    Args:
+        workflow_json: Serialized workflow definition
+
+    Returns:
+        64-character SHA-256 hex digest
+    """
+    return hashlib.sha256(workflow_json.encode("utf-8")).hexdigest()
+
+
+__all__ = [
+    "WORKFLOW_BLOBS_TABLE",
+    "workflow_content_hash",
+]
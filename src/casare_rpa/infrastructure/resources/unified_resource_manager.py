@@ -27,6 +27,8 @@ from loguru import logger
 if TYPE_CHECKING:
     from playwright.async_api import Browser, BrowserContext
 
+    from casare_rpa.domain.entities.workflow import WorkflowSchema
+
 
 class ResourceType(Enum):
     """Types of pooled resources."""
@@ -968,12 +970,13 @@ class UnifiedResourceManager:
         limit = limits.get(resource_type, 0)
         return count < limit
 
-    def analyze_workflow_needs(self, workflow_json: str | dict) -> dict[str, bool]:
+    def analyze_workflow_needs(self, workflow_json: str | dict | WorkflowSchema) -> dict[str, bool]:
         """
         Analyze workflow to determine required resources.
 
         Args:
-            workflow_json: Workflow definition as JSON string or dict
+            workflow_json: Workflow definition as JSON string, dict, or an
+                already loaded WorkflowSchema (nodes are node instances)
 
         Returns:
             Dict with needs_browser, needs_database, needs_http
@@ -986,7 +989,10 @@ class UnifiedResourceManager:
                 workflow = workflow_json
 
             # Handle both dict-format (keyed by node_id) and list-format nodes
-            nodes_data = workflow.get("nodes", {})
+            if isinstance(workflow, dict):
+                nodes_data = workflow.get("nodes", {})
+            else:
+                nodes_data = workflow.nodes
             if nodes_data is None:
                 nodes = []
             elif isinstance(nodes_data, dict):
@@ -1016,7 +1022,10 @@ class UnifiedResourceManager:
 
             for node in nodes:
                 # Support both "node_type" (our format) and "type" (legacy)
-                node_type = node.get("node_type") or node.get("type", "")
+                if isinstance(node, dict):
+                    node_type = node.get("node_type") or node.get("type", "")
+                else:
+                    node_type = getattr(node, "node_type", "")
                 if node_type in browser_node_types:
                     needs_browser = True
                 if node_type in http_node_types:
@@ -1038,7 +1047,7 @@ class UnifiedResourceManager:
     async def acquire_resources_for_job(
         self,
         job_id: str,
-        workflow_json: str | dict,
+        workflow_json: str | dict | WorkflowSchema,
         lease_duration: timedelta | None = None,
     ) -> JobResources:
         """
@@ -1049,7 +1058,7 @@ class UnifiedResourceManager:
 
         Args:
             job_id: Job identifier
-            workflow_json: Workflow definition (string or dict)
+            workflow_json: Workflow definition (string, dict or loaded WorkflowSchema)
             lease_duration: Custom lease duration (defaults to manager's lease_ttl)
 
         Returns:
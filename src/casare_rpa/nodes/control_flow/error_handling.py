@@ -63,14 +63,18 @@ class TryNode(BaseNode):
         try:
             # Initialize try state for error capture
             try_state_key = f"{self.node_id}_try_state"
-            context.variables[try_state_key] = {
-                "error": False,
-                "error_type": None,
-                "error_message": None,
-                "stack_trace": None,
-                "catch_id": self.paired_catch_id,
-                "finally_id": self.paired_finally_id,
-            }
+            context.set_variable(
+                try_state_key,
+                {
+                    "error": False,
+                    "error_type": None,
+                    "error_message": None,
+                    "stack_trace": None,
+                    "catch_id": self.paired_catch_id,
+                    "finally_id": self.paired_finally_id,
+                },
+                publish=False,
+            )
 
             logger.debug(f"Try block started: {self.node_id}")
             self.status = NodeStatus.SUCCESS
@@ -261,7 +265,7 @@ class FinallyNode(BaseNode):
 
             # Clean up try state
             if try_state_key in context.variables:
-                del context.variables[try_state_key]
+                context.delete_variable(try_state_key)
 
             # Set output
             self.set_output_value("had_error", had_error)
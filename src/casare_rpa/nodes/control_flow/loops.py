@@ -173,11 +173,11 @@ class ForLoopStartNode(BaseNode):
                         items = [items]
                         keys = None
 
-                context.variables[loop_state_key] = {
-                    "items": items,
-                    "keys": keys,
-                    "index": 0,
-                }
+                context.set_variable(
+                    loop_state_key,
+                    {"items": items, "keys": keys, "index": 0},
+                    publish=False,
+                )
 
             loop_state = context.variables[loop_state_key]
             index = loop_state["index"]
@@ -187,7 +187,7 @@ class ForLoopStartNode(BaseNode):
             # Check if break was requested
             if loop_state.get("break_requested"):
                 # Break - clean up and go to completed
-                del context.variables[loop_state_key]
+                context.delete_variable(loop_state_key)
                 self.status = NodeStatus.SUCCESS
                 logger.info(f"For loop exited via break after {index} iterations")
 
@@ -200,7 +200,7 @@ class ForLoopStartNode(BaseNode):
             # Check if loop is complete
             if index >= len(items_list):
                 # Loop finished - clean up and go to completed
-                del context.variables[loop_state_key]
+                context.delete_variable(loop_state_key)
                 self.status = NodeStatus.SUCCESS
                 logger.info(f"For loop completed after {index} iterations")
 
@@ -222,13 +222,14 @@ class ForLoopStartNode(BaseNode):
             # Store current item in context variable (item_var)
             item_var = self.get_parameter("item_var", "item")
             if item_var:
-                context.set_variable(item_var, current_item)
+                context.set_variable(item_var, current_item, publish=False)
                 if current_key is not None:
-                    context.set_variable(f"{item_var}_key", current_key)
-                context.set_variable(f"{item_var}_index", index)
+                    context.set_variable(f"{item_var}_key", current_key, publish=False)
+                context.set_variable(f"{item_var}_index", index, publish=False)
 
-            # Increment index for next iteration
+            # Increment index for next iteration (re-set so checkpoints see it)
             loop_state["index"] = index + 1
+            context.set_variable(loop_state_key, loop_state, publish=False)
 
             self.status = NodeStatus.RUNNING
             key_str = f", key={repr(current_key)}" if current_key is not None else ""
@@ -251,7 +252,7 @@ class ForLoopStartNode(BaseNode):
             logger.error(f"For loop start execution failed: {e}")
             loop_state_key = f"{self.node_id}_loop_state"
             if loop_state_key in context.variables:
-                del context.variables[loop_state_key]
+                context.delete_variable(loop_state_key)
             return {"success": False, "error": str(e), "next_nodes": []}
 
 
@@ -397,7 +398,7 @@ class WhileLoopStartNode(BaseNode):
 
             # Initialize or get loop state
             if loop_state_key not in context.variables:
-                context.variables[loop_state_key] = {"iteration": 0}
+                context.set_variable(loop_state_key, {"iteration": 0}, publish=False)
 
             loop_state = context.variables[loop_state_key]
             iteration = loop_state["iteration"]
@@ -405,7 +406,7 @@ class WhileLoopStartNode(BaseNode):
             # Check if break was requested
             if loop_state.get("break_requested"):
                 # Break - clean up and go to completed
-                del context.variables[loop_state_key]
+                context.delete_variable(loop_state_key)
                 self.status = NodeStatus.SUCCESS
                 logger.info(f"While loop exited via break after {iteration} iterations")
 
@@ -417,7 +418,7 @@ class WhileLoopStartNode(BaseNode):
 
             # Safety check for infinite loops
             if iteration >= max_iterations:
-                del context.variables[loop_state_key]
+                context.delete_variable(loop_state_key)
                 logger.warning(f"While loop hit max iterations limit: {max_iterations}")
                 self.status = NodeStatus.SUCCESS
                 return {
@@ -449,7 +450,7 @@ class WhileLoopStartNode(BaseNode):
 
             if not should_continue:
                 # Loop finished
-                del context.variables[loop_state_key]
+                context.delete_variable(loop_state_key)
                 self.status = NodeStatus.SUCCESS
                 logger.info(f"While loop completed after {iteration} iterations")
                 return {
@@ -461,6 +462,7 @@ class WhileLoopStartNode(BaseNode):
             # Continue loop
             self.set_output_value("current_iteration", iteration)
             loop_state["iteration"] = iteration + 1
+            context.set_variable(loop_state_key, loop_state, publish=False)
 
             self.status = NodeStatus.RUNNING
             logger.debug(f"While loop iteration {iteration}")
@@ -476,7 +478,7 @@ class WhileLoopStartNode(BaseNode):
             logger.error(f"While loop start execution failed: {e}")
             loop_state_key = f"{self.node_id}_loop_state"
             if loop_state_key in context.variables:
-                del context.variables[loop_state_key]
+                context.delete_variable(loop_state_key)
             return {"success": False, "error": str(e), "next_nodes": []}
 
 
@@ -614,7 +616,9 @@ class BreakNode(BaseNode):
             # Set break flag in loop state so ForLoopStart knows to exit
             loop_state_key = f"{loop_start_id}_loop_state"
             if loop_state_key in context.variables:
-                context.variables[loop_state_key]["break_requested"] = True
+                loop_state = context.get_variable(loop_state_key)
+                loop_state["break_requested"] = True
+                context.set_variable(loop_state_key, loop_state, publish=False)
 
             logger.info(f"Break executed - exiting loop {loop_start_id}")
 
@@ -13,7 +13,7 @@ from typing import Any
 from loguru import logger
 
 from casare_rpa.domain.decorators import node, properties
-from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.base_node import PURE, BaseNode
 from casare_rpa.domain.schemas import PropertyDef, PropertyType
 from casare_rpa.domain.value_objects.types import DataType, ExecutionResult
 from casare_rpa.infrastructure.execution import ExecutionContext
@@ -38,6 +38,8 @@ class JsonParseNode(BaseNode):
     # @requires: none
     # @ports: json_string -> data
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "JSON Parse", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -86,6 +88,8 @@ class GetPropertyNode(BaseNode):
     # @requires: none
     # @ports: object, property_path -> value
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Get Property", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -147,6 +151,8 @@ class DictGetNode(BaseNode):
     # @requires: none
     # @ports: dict, key, default -> value, found
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict Get", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -210,6 +216,8 @@ class DictSetNode(BaseNode):
     # @requires: none
     # @ports: dict, key, value -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict Set", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -267,6 +275,8 @@ class DictRemoveNode(BaseNode):
     # @requires: none
     # @ports: dict, key -> result, removed_value
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict Remove", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -315,6 +325,8 @@ class DictMergeNode(BaseNode):
     # @requires: none
     # @ports: dict_1, dict_2 -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict Merge", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -358,6 +370,8 @@ class DictKeysNode(BaseNode):
     # @requires: none
     # @ports: dict -> keys, count
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict Keys", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -403,6 +417,8 @@ class DictValuesNode(BaseNode):
     # @requires: none
     # @ports: dict -> values, count
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict Values", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -448,6 +464,8 @@ class DictHasKeyNode(BaseNode):
     # @requires: none
     # @ports: dict, key -> has_key
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict Has Key", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -489,6 +507,8 @@ class CreateDictNode(BaseNode):
     # @requires: none
     # @ports: key_1, value_1, key_2, value_2, key_3, value_3 -> dict
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Create Dict", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -558,6 +578,8 @@ class DictToJsonNode(BaseNode):
     # @requires: none
     # @ports: dict, indent -> json_string
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict to JSON", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -611,6 +633,8 @@ class DictItemsNode(BaseNode):
     # @requires: none
     # @ports: dict -> items, count
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Dict Items", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -74,10 +74,11 @@ class TryNode(BaseNode):
 
             if try_state_key not in context.variables:
                 # First execution - enter try block
-                context.variables[try_state_key] = {
-                    "in_try_block": True,
-                    "error_occurred": False,
-                }
+                context.set_variable(
+                    try_state_key,
+                    {"in_try_block": True, "error_occurred": False},
+                    publish=False,
+                )
                 logger.info(f"Entering try block: {self.node_id}")
 
                 self.status = NodeStatus.SUCCESS
@@ -85,7 +86,7 @@ class TryNode(BaseNode):
             else:
                 # Returning from try block
                 try_state = context.variables[try_state_key]
-                del context.variables[try_state_key]
+                context.delete_variable(try_state_key)
 
                 if try_state.get("error_occurred"):
                     # Error occurred - route to catch
@@ -191,17 +192,22 @@ class RetryNode(BaseNode):
 
             if retry_state_key not in context.variables:
                 # First attempt
-                context.variables[retry_state_key] = {
-                    "attempt": 0,
-                    "max_attempts": max_attempts,
-                    "initial_delay": initial_delay,
-                    "backoff_multiplier": backoff_multiplier,
-                    "last_error": None,
-                }
+                context.set_variable(
+                    retry_state_key,
+                    {
+                        "attempt": 0,
+                        "max_attempts": max_attempts,
+                        "initial_delay": initial_delay,
+                        "backoff_multiplier": backoff_multiplier,
+                        "last_error": None,
+                    },
+                    publish=False,
+                )
 
             retry_state = context.variables[retry_state_key]
             retry_state["attempt"] += 1
             current_attempt = retry_state["attempt"]
+            context.set_variable(retry_state_key, retry_state, publish=False)
 
             self.set_output_value("attempt", current_attempt)
 
@@ -231,7 +237,7 @@ class RetryNode(BaseNode):
                 logger.error(f"Retry failed after {max_attempts} attempts: {last_error}")
 
                 # Clean up state
-                del context.variables[retry_state_key]
+                context.delete_variable(retry_state_key)
 
                 self.status = NodeStatus.ERROR
                 return {
@@ -688,11 +694,15 @@ class OnErrorNode(BaseNode):
 
             if error_state_key not in context.variables:
                 # First execution - enter protected block
-                context.variables[error_state_key] = {
-                    "in_protected_block": True,
-                    "error_occurred": False,
-                    "finally_executed": False,
-                }
+                context.set_variable(
+                    error_state_key,
+                    {
+                        "in_protected_block": True,
+                        "error_occurred": False,
+                        "finally_executed": False,
+                    },
+                    publish=False,
+                )
                 logger.info(f"Entering protected block: {self.node_id}")
 
                 self.status = NodeStatus.SUCCESS
@@ -714,6 +724,7 @@ class OnErrorNode(BaseNode):
                     self.set_output_value("stack_trace", stack_trace)
 
                     error_state["error_handled"] = True
+                    context.set_variable(error_state_key, error_state, publish=False)
 
                     logger.warning(f"Error caught by OnError handler: {error_type}: {error_msg}")
 
@@ -730,6 +741,7 @@ class OnErrorNode(BaseNode):
                 elif not error_state.get("finally_executed"):
                     # Execute finally block
                     error_state["finally_executed"] = True
+                    context.set_variable(error_state_key, error_state, publish=False)
 
                     logger.info(f"Executing finally block: {self.node_id}")
 
@@ -737,7 +749,7 @@ class OnErrorNode(BaseNode):
                     return {"success": True, "next_nodes": ["finally"]}
                 else:
                     # Cleanup and exit
-                    del context.variables[error_state_key]
+                    context.delete_variable(error_state_key)
 
                     self.status = NodeStatus.SUCCESS
                     return {"success": True, "next_nodes": []}
@@ -819,8 +831,8 @@ class ErrorRecoveryNode(BaseNode):
                 strategy = "stop"
 
             # Store recovery config in context
-            context.variables["_error_recovery_strategy"] = strategy
-            context.variables["_error_recovery_max_retries"] = max_retries
+            context.set_variable("_error_recovery_strategy", strategy, publish=False)
+            context.set_variable("_error_recovery_max_retries", max_retries, publish=False)
 
             logger.info(
                 f"Error recovery configured: strategy={strategy}, max_retries={max_retries}"
@@ -79,6 +79,64 @@ def validate_zip_entry(zip_path: str, entry_name: str) -> Path:
     return target_path
 
 
+def _write_zip(zip_path: str, files: list[str], base_dir: str | None, compression: int) -> int:
+    """
+    Write files into a ZIP archive (runs in a CPU worker process).
+
+    Returns:
+        Number of files added
+    """
+    file_count = 0
+    base = Path(base_dir) if base_dir else None
+
+    with zipfile.ZipFile(zip_path, "w", compression=compression) as zf:
+        for file_path in files:
+            fp = Path(file_path)
+            if not fp.exists():
+                continue
+
+            if base and fp.is_relative_to(base):
+                arcname = str(fp.relative_to(base))
+            else:
+                arcname = fp.name
+
+            zf.write(fp, arcname)
+            file_count += 1
+
+    return file_count
+
+
+def _extract_zip(zip_path: str, dest: str) -> list[str]:
+    """
+    Extract a ZIP archive entry by entry (runs in a CPU worker process).
+
+    Returns:
+        Extracted file paths
+    """
+    extracted_files = []
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        # SECURITY: Do NOT use extractall() - vulnerable to Zip Slip!
+        # Instead, validate each entry and extract manually
+        for member in zf.namelist():
+            # SECURITY: Validate entry path to prevent Zip Slip
+            target_path = validate_zip_entry(dest, member)
+
+            # Extract the file safely
+            if member.endswith("/"):
+                # Directory entry
+                target_path.mkdir(parents=True, exist_ok=True)
+            else:
+                # File entry - ensure parent directory exists
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                with zf.open(member) as source, open(target_path, "wb") as target:
+                    target.write(source.read())
+
+            extracted_files.append(str(target_path))
+
+    return extracted_files
+
+
 @properties(
     FILE_PATH_INPUT,
     CSV_DELIMITER,
@@ -506,6 +564,8 @@ class ZipFilesNode(BaseNode):
     # @requires: none
     # @ports: zip_path, source_path, files, base_dir -> zip_path, attachment_file, file_count, success
 
+    cpu_bound = True
+
     def __init__(self, node_id: str, name: str = "Zip Files", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -597,22 +657,14 @@ class ZipFilesNode(BaseNode):
             if zip_validated_path.parent:
                 zip_validated_path.parent.mkdir(parents=True, exist_ok=True)
 
-            file_count = 0
-            base = Path(base_dir) if base_dir else None
-
-            with zipfile.ZipFile(zip_validated_path, "w", compression=zip_compression) as zf:
-                for file_path in files:
-                    fp = Path(file_path)
-                    if not fp.exists():
-                        continue
-
-                    if base and fp.is_relative_to(base):
-                        arcname = str(fp.relative_to(base))
-                    else:
-                        arcname = fp.name
-
-                    zf.write(fp, arcname)
-                    file_count += 1
+            # PERFORMANCE: compression is CPU-bound; run it off the event loop
+            file_count = await self.run_cpu_bound(
+                _write_zip,
+                str(zip_validated_path),
+                [str(f) for f in files],
+                base_dir,
+                zip_compression,
+            )
 
             self.set_output_value("zip_path", str(zip_validated_path))
             self.set_output_value("attachment_file", [str(zip_validated_path)])
@@ -664,6 +716,8 @@ class UnzipFilesNode(BaseNode):
     # @requires: none
     # @ports: zip_path, extract_to -> extract_to, files, file_count, success
 
+    cpu_bound = True
+
     def __init__(self, node_id: str, name: str = "Unzip Files", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -705,29 +759,8 @@ class UnzipFilesNode(BaseNode):
 
             dest.mkdir(parents=True, exist_ok=True)
 
-            extracted_files = []
-
-            with zipfile.ZipFile(zip_file, "r") as zf:
-                # SECURITY: Do NOT use extractall() - vulnerable to Zip Slip!
-                # Instead, validate each entry and extract manually
-                for member in zf.namelist():
-                    # SECURITY: Validate entry path to prevent Zip Slip
-                    target_path = validate_zip_entry(str(dest), member)
-
-                    # Extract the file safely
-                    if member.endswith("/"):
-                        # Directory entry
-                        target_path.mkdir(parents=True, exist_ok=True)
-                    else:
-                        # File entry - ensure parent directory exists
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        with (
-                            zf.open(member) as source,
-                            open(target_path, "wb") as target,  # noqa: ASYNC230
-                        ):
-                            target.write(source.read())
-
-                    extracted_files.append(str(target_path))
+            # PERFORMANCE: decompression is CPU-bound; run it off the event loop
+            extracted_files = await self.run_cpu_bound(_extract_zip, str(zip_file), str(dest))
 
             logger.info(f"Extracted {len(extracted_files)} files to {dest}")
 
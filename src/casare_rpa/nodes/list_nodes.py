@@ -13,7 +13,7 @@ from typing import Any
 from loguru import logger
 
 from casare_rpa.domain.decorators import node, properties
-from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.base_node import PURE, BaseNode
 from casare_rpa.domain.schemas import PropertyDef, PropertyType
 from casare_rpa.domain.value_objects.types import DataType, ExecutionResult
 from casare_rpa.infrastructure.execution import ExecutionContext
@@ -72,6 +72,8 @@ class CreateListNode(BaseNode):
     # @requires: none
     # @ports: item_1, item_2, item_3 -> list
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Create List", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -122,6 +124,8 @@ class ListGetItemNode(BaseNode):
     # @requires: none
     # @ports: list, index -> item
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Get Item", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -176,6 +180,8 @@ class ListLengthNode(BaseNode):
     # @requires: none
     # @ports: list -> length
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Length", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -211,6 +217,8 @@ class ListAppendNode(BaseNode):
     # @requires: none
     # @ports: list, item -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Append", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -259,6 +267,8 @@ class ListContainsNode(BaseNode):
     # @requires: none
     # @ports: list, item -> contains, index
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Contains", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -313,6 +323,8 @@ class ListSliceNode(BaseNode):
     # @requires: none
     # @ports: list, start, end -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Slice", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -383,6 +395,8 @@ class ListJoinNode(BaseNode):
     # @requires: none
     # @ports: list, separator -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Join", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -447,6 +461,8 @@ class ListSortNode(BaseNode):
     # @requires: none
     # @ports: list, reverse, key_path -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Sort", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -521,6 +537,8 @@ class ListReverseNode(BaseNode):
     # @requires: none
     # @ports: list -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Reverse", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -557,6 +575,8 @@ class ListUniqueNode(BaseNode):
     # @requires: none
     # @ports: list -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Unique", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -634,6 +654,8 @@ class ListFilterNode(BaseNode):
     # @requires: none
     # @ports: list, condition, value, key_path -> result, removed
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Filter", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -774,6 +796,8 @@ class ListMapNode(BaseNode):
     # @requires: none
     # @ports: list, transform, key_path -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Map", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -888,6 +912,8 @@ class ListReduceNode(BaseNode):
     # @requires: none
     # @ports: list, operation, key_path, initial -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Reduce", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -1011,6 +1037,8 @@ class ListFlattenNode(BaseNode):
     # @requires: none
     # @ports: list, depth -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "List Flatten", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -12,7 +12,7 @@ import math
 from loguru import logger
 
 from casare_rpa.domain.decorators import node, properties
-from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.base_node import PURE, VARIABLES_EFFECT, BaseNode
 from casare_rpa.domain.schemas import PropertyDef, PropertyType
 from casare_rpa.domain.value_objects.types import DataType, ExecutionResult
 from casare_rpa.infrastructure.execution import ExecutionContext
@@ -122,6 +122,8 @@ class MathOperationNode(BaseNode):
     # @requires: none
     # @ports: a, b -> result
 
+    side_effects = frozenset({VARIABLES_EFFECT})
+
     def __init__(self, node_id: str, name: str = "Math Operation", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -258,6 +260,8 @@ class ComparisonNode(BaseNode):
     # @requires: none
     # @ports: a, b -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Comparison", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -7,6 +7,9 @@ Provides nodes for concurrent/parallel execution:
 - ParallelForEachNode: Process list items concurrently in batches
 """
 
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
 from loguru import logger
 
 from casare_rpa.domain.decorators import node, properties
@@ -246,16 +249,26 @@ class JoinNode(BaseNode):
         PropertyType.LIST,
         required=True,
         label="Items",
-        tooltip="List of items to process",
+        tooltip="List of items to process (a generator or async iterator is consumed lazily)",
     ),
     PropertyDef(
-        "batch_size",
+        "max_concurrency",
         PropertyType.INTEGER,
         default=5,
+        # Workflows saved before max_concurrency used batch_size for the same knob
+        dynamic_default=lambda config: config.get("batch_size") or 5,
+        min_value=1,
+        max_value=256,
+        label="Max Concurrency",
+        tooltip="Maximum number of items processed at the same time (1-256)",
+    ),
+    PropertyDef(
+        "chunk_size",
+        PropertyType.INTEGER,
+        default=100,
         min_value=1,
-        max_value=50,
-        label="Batch Size",
-        tooltip="Number of items to process concurrently (1-50)",
+        label="Chunk Size",
+        tooltip="Number of items pulled from the source per pass before results are committed",
     ),
     PropertyDef(
         "fail_fast",
@@ -264,6 +277,14 @@ class JoinNode(BaseNode):
         label="Fail Fast",
         tooltip="If True, stop processing when one item fails. If False, continue with remaining items.",
     ),
+    PropertyDef(
+        "on_item_error",
+        PropertyType.CHOICE,
+        default="record",
+        choices=["record", "skip"],
+        label="On Item Error",
+        tooltip="'record': keep a None result for the failed item; 'skip': leave it out of results",
+    ),
     PropertyDef(
         "timeout_per_item",
         PropertyType.INTEGER,
@@ -279,29 +300,31 @@ class ParallelForEachNode(BaseNode):
     Parallel ForEach node that processes list items concurrently.
 
     Unlike regular ForLoop which processes items sequentially, this node
-    processes multiple items at the same time (up to batch_size).
+    processes multiple items at the same time (up to max_concurrency).
 
     Example:
         ParallelForEach ──→ ProcessItem ──→ Continue
             │
             ├─ items: [url1, url2, url3, url4, url5, ...]
-            ├─ batch_size: 3  (process 3 at a time)
-            └─ Outputs: current_item, current_index
+            ├─ max_concurrency: 3  (process 3 at a time)
+            └─ Outputs: current_item, current_index, results
 
     Inputs:
         - exec_in: Execution input
-        - items: List of items to process
+        - items: List of items to process (or an iterator/async iterator)
 
     Outputs:
-        - body: Execution flow for each item (runs batch_size times concurrently)
+        - body: Execution flow for each item (up to max_concurrency at once)
         - completed: Fires when all items processed
-        - current_item: Current item being processed
-        - current_index: Current item index
-        - results: List of results from all items
+        - current_item: Current item being processed (per item)
+        - current_index: Current item index (per item)
+        - results: Ordered list of per-item results
 
     Properties:
-        - batch_size: How many items to process concurrently
+        - max_concurrency: How many items to process concurrently
+        - chunk_size: How many items are pulled per pass
         - fail_fast: Stop on first error if True
+        - on_item_error: Keep ("record") or drop ("skip") failed item slots
         - timeout_per_item: Timeout for each item's processing
     """
 
@@ -325,102 +348,137 @@ class ParallelForEachNode(BaseNode):
         self.add_output_port("current_index", DataType.INTEGER)
         self.add_output_port("results", DataType.LIST)
 
+    @staticmethod
+    def _open_source(items: Any) -> tuple[Iterator[Any] | AsyncIterator[Any], int | None]:
+        """Turn the items input into an iterator plus its length when known."""
+        if items is None:
+            return iter(()), 0
+        if isinstance(items, list | tuple):
+            return iter(items), len(items)
+        if hasattr(items, "__aiter__"):
+            return items.__aiter__(), None
+        if isinstance(items, Iterator):
+            return items, None
+        return iter((items,)), 1
+
+    def _finish(self, context: ExecutionContext, state_key: str) -> None:
+        """Drop the loop progress variable and the open source of this run."""
+        if context.has_variable(state_key):
+            context.delete_variable(state_key)
+        self._runtime.pop(state_key, None)
+
     async def execute(self, context: ExecutionContext) -> ExecutionResult:
         """
-        Execute parallel foreach - process items in batches.
+        Execute parallel foreach - hand items to the executor chunk by chunk.
+
+        Returns special 'parallel_foreach_batch' key for the executor to run
+        the body for up to chunk_size items with at most max_concurrency in
+        flight; the executor appends ordered results to this node's run state
+        and re-runs this node, which then emits the next chunk or 'completed'.
 
-        Returns special 'parallel_foreach_batch' key for the executor
-        to handle concurrent item processing.
+        The workflow variable only holds a plain progress snapshot that the
+        executor replaces after each chunk. The open source and the results
+        live in the node's per-run state, so variables stay copyable and
+        are never mutated in place.
         """
         self.status = NodeStatus.RUNNING
+        state_key = f"{self.node_id}_parallel_foreach"
 
         try:
-            state_key = f"{self.node_id}_parallel_foreach"
-            batch_size = self.get_parameter("batch_size", 5)
+            max_concurrency = max(1, int(self.get_parameter("max_concurrency", 5)))
+            chunk_size = max(1, int(self.get_parameter("chunk_size", 100)))
             fail_fast = self.get_parameter("fail_fast", False)
+            on_item_error = self.get_parameter("on_item_error", "record")
             timeout_per_item = self.get_parameter("timeout_per_item", 60)
 
             # Initialize state on first call
             if not context.has_variable(state_key):
-                items = self.get_input_value("items")
-                if items is None:
-                    items = []
-                elif not isinstance(items, list | tuple):
-                    items = [items]
-                else:
-                    items = list(items)
-
+                source, total = self._open_source(self.get_input_value("items"))
+                self._runtime[state_key] = {"source": source, "results": [], "errors": []}
                 context.set_variable(
                     state_key,
                     {
-                        "items": items,
+                        "total": total,
                         "index": 0,
-                        "results": [],
-                        "errors": [],
+                        "exhausted": total == 0,
+                        "errors": 0,
+                        "failed": None,
                     },
+                    publish=False,
                 )
                 logger.info(
-                    f"ParallelForEach initialized: {len(items)} items, batch_size={batch_size}"
+                    f"ParallelForEach initialized: {total if total is not None else 'streamed'} "
+                    f"items, max_concurrency={max_concurrency}, chunk_size={chunk_size}"
                 )
 
-            state = context.get_variable(state_key)
-            items = state["items"]
-            index = state["index"]
-            results = state["results"]
+            progress = context.get_variable(state_key)
+            run = self._runtime.get(state_key)
+            if run is None:
+                raise RuntimeError(
+                    "ParallelForEach item source is no longer open "
+                    "(state was restored without the running iterator)"
+                )
+            results = run["results"]
+
+            if progress["failed"] is not None:
+                self._finish(context, state_key)
+                self.set_output_value("results", results)
+                self.status = NodeStatus.ERROR
+                return {
+                    "success": False,
+                    "error": f"ParallelForEach item failed: {progress['failed']}",
+                    "data": {"processed": progress["index"], "errors": progress["errors"]},
+                    "next_nodes": [],
+                }
 
             # Check if all items processed
-            if index >= len(items):
-                # Clean up state
-                context.delete_variable(state_key)
+            if progress["exhausted"]:
+                self._finish(context, state_key)
 
                 # Set final results
                 self.set_output_value("results", results)
 
                 logger.info(
-                    f"ParallelForEach completed: {len(results)} results, {len(state.get('errors', []))} errors"
+                    f"ParallelForEach completed: {len(results)} results, "
+                    f"{progress['errors']} errors"
                 )
 
                 self.status = NodeStatus.SUCCESS
                 return {
                     "success": True,
                     "data": {
-                        "total_items": len(items),
-                        "processed": len(results),
-                        "errors": len(state.get("errors", [])),
+                        "total_items": progress["index"],
+                        "processed": progress["index"] - progress["errors"],
+                        "errors": progress["errors"],
                     },
                     "next_nodes": ["completed"],
                 }
 
-            # Get current batch
-            batch_end = min(index + batch_size, len(items))
-            current_batch = items[index:batch_end]
-            batch_indices = list(range(index, batch_end))
-
-            # Update state for next iteration
-            state["index"] = batch_end
-            context.set_variable(state_key, state)
-
-            logger.info(f"ParallelForEach batch: items {index}-{batch_end - 1} of {len(items)}")
-
-            self.status = NodeStatus.RUNNING
+            logger.info(f"ParallelForEach chunk: up to {chunk_size} items from {progress['index']}")
 
             return {
                 "success": True,
                 "data": {
-                    "batch_size": len(current_batch),
-                    "batch_start": index,
-                    "batch_end": batch_end,
-                    "remaining": len(items) - batch_end,
+                    "chunk_size": chunk_size,
+                    "chunk_start": progress["index"],
+                    "remaining": (
+                        progress["total"] - progress["index"]
+                        if progress["total"] is not None
+                        else None
+                    ),
                 },
-                # Special key for executor to handle parallel batch processing
+                # Special key for executor to handle parallel chunk processing
                 "parallel_foreach_batch": {
-                    "items": current_batch,
-                    "indices": batch_indices,
+                    "progress": progress,
+                    "run": run,
+                    "chunk_size": chunk_size,
+                    "max_concurrency": max_concurrency,
                     "body_port": "body",
                     "state_key": state_key,
                 },
                 "foreach_id": self.node_id,
                 "fail_fast": fail_fast,
+                "on_item_error": on_item_error,
                 "timeout_per_item": timeout_per_item,
                 "next_nodes": [],  # Executor handles batching
             }
@@ -429,9 +487,7 @@ class ParallelForEachNode(BaseNode):
             self.status = NodeStatus.ERROR
             logger.error(f"ParallelForEach execution failed: {e}")
             # Clean up state on error
-            state_key = f"{self.node_id}_parallel_foreach"
-            if context.has_variable(state_key):
-                context.delete_variable(state_key)
+            self._finish(context, state_key)
             return {"success": False, "error": str(e), "next_nodes": []}
 
 
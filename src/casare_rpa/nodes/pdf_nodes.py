@@ -25,6 +25,44 @@ from casare_rpa.domain.value_objects.types import (
 from casare_rpa.infrastructure.execution import ExecutionContext
 
 
+def _extract_pdf_text(
+    file_path: str, password: str, start_page: int | None, end_page: int | None
+) -> dict:
+    """
+    Extract page texts from a PDF (runs in a CPU worker process).
+
+    Returns:
+        Dict with is_encrypted, page_count and pages
+    """
+    try:
+        from PyPDF2 import PdfReader
+    except ImportError:
+        raise ImportError("PyPDF2 is required for PDF operations. Install with: pip install PyPDF2")
+
+    reader = PdfReader(Path(file_path))
+
+    # Handle encrypted PDFs
+    is_encrypted = reader.is_encrypted
+    if is_encrypted:
+        if password:
+            if not reader.decrypt(password):
+                raise ValueError("Invalid password for encrypted PDF")
+        else:
+            raise ValueError("PDF is encrypted. Please provide a password.")
+    page_count = len(reader.pages)
+
+    # Handle page range
+    start_idx = (int(start_page) - 1) if start_page else 0
+    end_idx = int(end_page) if end_page else page_count
+
+    start_idx = max(0, min(start_idx, page_count))
+    end_idx = max(0, min(end_idx, page_count))
+
+    # Extract text from pages
+    pages = [reader.pages[i].extract_text() or "" for i in range(start_idx, end_idx)]
+    return {"is_encrypted": is_encrypted, "page_count": page_count, "pages": pages}
+
+
 @properties(
     PropertyDef(
         "file_path",
@@ -105,6 +143,8 @@ class ReadPDFTextNode(BaseNode):
     # @requires: none
     # @ports: file_path, start_page, end_page, password -> text, page_count, pages, is_encrypted, success
 
+    cpu_bound = True
+
     def __init__(self, node_id: str, name: str = "Read PDF Text", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -139,39 +179,13 @@ class ReadPDFTextNode(BaseNode):
             if not path.exists():
                 raise FileNotFoundError(f"PDF file not found: {file_path}")
 
-            try:
-                from PyPDF2 import PdfReader
-            except ImportError:
-                raise ImportError(
-                    "PyPDF2 is required for PDF operations. Install with: pip install PyPDF2"
-                )
-
-            reader = PdfReader(path)
-
-            # Handle encrypted PDFs
-            is_encrypted = reader.is_encrypted
-            self.set_output_value("is_encrypted", is_encrypted)
-
-            if is_encrypted:
-                if password:
-                    if not reader.decrypt(password):
-                        raise ValueError("Invalid password for encrypted PDF")
-                else:
-                    raise ValueError("PDF is encrypted. Please provide a password.")
-            page_count = len(reader.pages)
-
-            # Handle page range
-            start_idx = (int(start_page) - 1) if start_page else 0
-            end_idx = int(end_page) if end_page else page_count
-
-            start_idx = max(0, min(start_idx, page_count))
-            end_idx = max(0, min(end_idx, page_count))
-
-            # Extract text from pages
-            pages = []
-            for i in range(start_idx, end_idx):
-                page_text = reader.pages[i].extract_text() or ""
-                pages.append(page_text)
+            # PERFORMANCE: page extraction is CPU-bound; run it off the event loop
+            extracted = await self.run_cpu_bound(
+                _extract_pdf_text, str(path), password, start_page, end_page
+            )
+            page_count = extracted["page_count"]
+            pages = extracted["pages"]
+            self.set_output_value("is_encrypted", extracted["is_encrypted"])
 
             text = page_separator.join(pages)
 
@@ -12,7 +12,7 @@ import re
 from loguru import logger
 
 from casare_rpa.domain.decorators import node, properties
-from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.base_node import PURE, BaseNode
 from casare_rpa.domain.schemas import PropertyDef, PropertyType
 from casare_rpa.domain.value_objects.types import DataType, ExecutionResult
 from casare_rpa.infrastructure.execution import ExecutionContext
@@ -75,6 +75,8 @@ class ConcatenateNode(BaseNode):
     # @requires: none
     # @ports: string_1, string_2 -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Concatenate", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -128,6 +130,8 @@ class FormatStringNode(BaseNode):
     # @requires: none
     # @ports: template, variables -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Format String", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -187,6 +191,8 @@ class RegexMatchNode(BaseNode):
     # @requires: none
     # @ports: text, pattern -> match_found, first_match, all_matches, groups, match_count
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Regex Match", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -290,6 +296,8 @@ class RegexReplaceNode(BaseNode):
     # @requires: none
     # @ports: text, pattern, replacement -> result, count
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Regex Replace", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -369,6 +377,8 @@ class RegexReplaceNode(BaseNode):
 class FuzzyStringMatchNode(BaseNode):
     """Node that performs fuzzy string matching using similarity algorithms."""
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Fuzzy String Match", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -489,6 +499,8 @@ class FuzzyStringMatchNode(BaseNode):
 class FilterBySimilarityNode(BaseNode):
     """Node that filters a list of strings by similarity to a target string."""
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Filter by Similarity", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -302,7 +302,7 @@ class SubflowNode(BaseNode):
                 input_value = self.get_input_value(port_name)
                 if input_value is not None:
                     # Store as variable in subflow context
-                    subflow_context.variables[port_name] = input_value
+                    subflow_context.set_variable(port_name, input_value, publish=False)
 
             # Execute subflow nodes
             # Note: This requires the execution engine to handle subflow execution
@@ -453,7 +453,7 @@ class SubflowNode(BaseNode):
             if result.success:
                 # Store outputs in context
                 for name, value in result.outputs.items():
-                    context.variables[name] = value
+                    context.set_variable(name, value, publish=False)
                 return {"success": True, "data": result.outputs}
             else:
                 return {"success": False, "error": result.error}
@@ -16,7 +16,7 @@ import re
 from loguru import logger
 
 from casare_rpa.domain.decorators import node, properties
-from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.base_node import PURE, BaseNode
 from casare_rpa.domain.schemas import PropertyDef, PropertyType
 from casare_rpa.domain.value_objects.types import (
     DataType,
@@ -89,6 +89,8 @@ class TextSplitNode(BaseNode):
     # @requires: none
     # @ports: text, separator -> result, count
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Split", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -203,6 +205,8 @@ class TextReplaceNode(BaseNode):
     # @requires: none
     # @ports: text, old_value, new_value -> result, replacements
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Replace", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -309,6 +313,8 @@ class TextTrimNode(BaseNode):
     # @requires: none
     # @ports: text -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Trim", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -387,6 +393,8 @@ class TextCaseNode(BaseNode):
     # @requires: none
     # @ports: text -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Case", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -472,6 +480,8 @@ class TextPadNode(BaseNode):
     # @requires: none
     # @ports: text, length -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Pad", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -539,6 +549,8 @@ class TextReverseNode(BaseNode):
     # @requires: none
     # @ports: text -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Reverse", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -623,6 +635,8 @@ class TextLinesNode(BaseNode):
     # @requires: none
     # @ports: text/lines -> lines/text, count
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Lines", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -14,7 +14,7 @@ import re
 from loguru import logger
 
 from casare_rpa.domain.decorators import node, properties
-from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.base_node import PURE, BaseNode
 from casare_rpa.domain.schemas import PropertyDef, PropertyType
 from casare_rpa.domain.value_objects.types import (
     DataType,
@@ -45,6 +45,8 @@ class TextSubstringNode(BaseNode):
     # @requires: none
     # @ports: text, start, end -> result, length
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Substring", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -122,6 +124,8 @@ class TextContainsNode(BaseNode):
     # @requires: none
     # @ports: text, search -> contains, position, count
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Contains", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -206,6 +210,8 @@ class TextStartsWithNode(BaseNode):
     # @requires: none
     # @ports: text, prefix -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Starts With", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -280,6 +286,8 @@ class TextEndsWithNode(BaseNode):
     # @requires: none
     # @ports: text, suffix -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Ends With", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -387,6 +395,8 @@ class TextExtractNode(BaseNode):
     # @requires: none
     # @ports: text, pattern -> match, groups, found
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Extract", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
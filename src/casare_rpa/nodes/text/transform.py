@@ -10,7 +10,7 @@ This module provides nodes for transforming multiple texts:
 from loguru import logger
 
 from casare_rpa.domain.decorators import node, properties
-from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.base_node import PURE, BaseNode
 from casare_rpa.domain.schemas import PropertyDef, PropertyType
 from casare_rpa.domain.value_objects.types import (
     DataType,
@@ -55,6 +55,8 @@ class TextJoinNode(BaseNode):
     # @requires: none
     # @ports: items -> result
 
+    side_effects = PURE
+
     def __init__(self, node_id: str, name: str = "Text Join", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -31,6 +31,39 @@ from casare_rpa.infrastructure.execution import ExecutionContext
 from casare_rpa.utils import safe_int
 
 
+def _xml_to_json(xml_string: str, include_attributes: bool, text_key: str) -> tuple[dict, str]:
+    """Convert XML to (dict, JSON string) (runs in a CPU worker process)."""
+    root = DefusedET.fromstring(xml_string)
+
+    def element_to_dict(elem):
+        result = {}
+
+        # Add attributes
+        if include_attributes and elem.attrib:
+            result["@attributes"] = dict(elem.attrib)
+
+        # Add text content
+        if elem.text and elem.text.strip():
+            if len(list(elem)) == 0 and not result:
+                return elem.text.strip()
+            result[text_key] = elem.text.strip()
+
+        # Add children
+        for child in elem:
+            child_data = element_to_dict(child)
+            if child.tag in result:
+                if not isinstance(result[child.tag], list):
+                    result[child.tag] = [result[child.tag]]
+                result[child.tag].append(child_data)
+            else:
+                result[child.tag] = child_data
+
+        return result if result else ""
+
+    json_data = {root.tag: element_to_dict(root)}
+    return json_data, json.dumps(json_data, indent=2, ensure_ascii=False)
+
+
 @properties(
     PropertyDef(
         "xml_string",
@@ -703,6 +736,8 @@ class XMLToJsonNode(BaseNode):
     # @requires: xml
     # @ports: xml_string -> json_data, json_string, success
 
+    cpu_bound = True
+
     def __init__(self, node_id: str, name: str = "XML to JSON", **kwargs) -> None:
         config = kwargs.get("config", {})
         super().__init__(node_id, config)
@@ -726,35 +761,10 @@ class XMLToJsonNode(BaseNode):
             if not xml_string:
                 raise ValueError("xml_string is required")
 
-            root = DefusedET.fromstring(xml_string)
-
-            def element_to_dict(elem):
-                result = {}
-
-                # Add attributes
-                if include_attributes and elem.attrib:
-                    result["@attributes"] = dict(elem.attrib)
-
-                # Add text content
-                if elem.text and elem.text.strip():
-                    if len(list(elem)) == 0 and not result:
-                        return elem.text.strip()
-                    result[text_key] = elem.text.strip()
-
-                # Add children
-                for child in elem:
-                    child_data = element_to_dict(child)
-                    if child.tag in result:
-                        if not isinstance(result[child.tag], list):
-                            result[child.tag] = [result[child.tag]]
-                        result[child.tag].append(child_data)
-                    else:
-                        result[child.tag] = child_data
-
-                return result if result else ""
-
-            json_data = {root.tag: element_to_dict(root)}
-            json_string = json.dumps(json_data, indent=2, ensure_ascii=False)
+            # PERFORMANCE: parsing and conversion are CPU-bound on large documents
+            json_data, json_string = await self.run_cpu_bound(
+                _xml_to_json, xml_string, bool(include_attributes), text_key
+            )
 
             self.set_output_value("json_data", json_data)
             self.set_output_value("json_string", json_string)
@@ -828,11 +828,10 @@ class RobotController(BaseController):
         try:
             from casare_rpa.infrastructure.orchestrator.persistence import (
                 LocalRobotRepository,
-                LocalStorageRepository,
+                get_local_storage,
             )
 
-            storage = LocalStorageRepository()
-            repo = LocalRobotRepository(storage)
+            repo = LocalRobotRepository(get_local_storage())
             robots = await repo.get_all()
             logger.debug(f"Fetched {len(robots)} robots from local storage")
             return robots
@@ -585,6 +585,10 @@ class LogViewerPanel(QDockWidget):
 
         if msg_type == "log_entry":
             self._add_log_entry(data)
+        elif msg_type == "log_batch":
+            robot_id = data.get("robot_id", "")
+            for entry in data.get("logs", []):
+                self._add_log_entry({**entry, "robot_id": robot_id})
 
     def _add_log_entry(self, data: dict[str, Any]) -> None:
         """Add a log entry to the table."""
@@ -527,13 +527,13 @@ class VisualParallelForEachNode(VisualNode):
 
     Processes list items concurrently in batches. Unlike regular ForLoop
     which processes items one-by-one, this node processes multiple items
-    at the same time (up to batch_size).
+    at the same time (up to max_concurrency).
 
     Example:
         ParallelForEach ──→ ProcessURL ──→ SaveResult
             │
             ├─ items: [url1, url2, url3, ...]
-            ├─ batch_size: 5 (process 5 at a time)
+            ├─ max_concurrency: 5 (process 5 at a time)
             └─ Outputs: current_item, current_index, results
     """
 
@@ -545,7 +545,8 @@ class VisualParallelForEachNode(VisualNode):
     def __init__(self) -> None:
         """Initialize Parallel ForEach node."""
         super().__init__()
-        # Note: 'batch_size', 'fail_fast', 'timeout_per_item' properties
+        # Note: 'max_concurrency', 'chunk_size', 'fail_fast', 'on_item_error',
+        # 'timeout_per_item' properties
         # are auto-created from CasareRPA ParallelForEachNode schema
 
     def setup_ports(self) -> None:
@@ -52,6 +52,9 @@ from casare_rpa.robot.circuit_breaker import (
     get_circuit_breaker_registry,
 )
 
+# Job claiming
+from casare_rpa.robot.claim_buffer import ClaimBuffer
+
 # Metrics
 from casare_rpa.robot.metrics import (
     JobMetrics,
@@ -77,6 +80,8 @@ __all__ = [
     "CircuitState",
     "get_circuit_breaker",
     "get_circuit_breaker_registry",
+    # Job claiming
+    "ClaimBuffer",
     # Metrics
     "MetricsCollector",
     "JobMetrics",
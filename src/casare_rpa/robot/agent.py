@@ -39,17 +39,19 @@ Architecture:
 from __future__ import annotations
 
 import asyncio
+import math
 import os
 import signal
 import socket
 import sys
+import time
 import uuid
 from collections.abc import Callable
 from dataclasses import asdict, dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import orjson
@@ -66,9 +68,14 @@ from casare_rpa.robot.circuit_breaker import (
     CircuitBreakerOpenError,
     CircuitState,
 )
+from casare_rpa.robot.claim_buffer import ClaimBuffer
 from casare_rpa.robot.identity_store import RobotIdentity, RobotIdentityStore
 from casare_rpa.robot.metrics import MetricsCollector, get_metrics_collector
 
+if TYPE_CHECKING:
+    from casare_rpa.infrastructure.agent.progress_aggregator import ProgressAggregator
+    from casare_rpa.infrastructure.queue.types import ProgressUpdate
+
 try:
     import psutil
 
@@ -82,6 +89,9 @@ _SUPABASE_PROJECT_REF = "znaauaswqmurwfglantv"
 _SUPABASE_URL = f"https://{_SUPABASE_PROJECT_REF}.supabase.co"
 _SUPABASE_POOLER_REGION = "aws-1-eu-central-1"
 
+# Seconds a prefetch lease outlives the buffer age, covering the extend round trip
+_PREFETCH_LEASE_MARGIN_SECONDS = 5
+
 
 def _mask_url(url: str) -> str:
     """Mask password in database URL for logging."""
@@ -170,6 +180,7 @@ class RobotConfig:
 
     # Database connection
     postgres_url: str = ""
+    postgres_listen_url: str = ""  # Direct (non-pooler) URL for job notifications
     supabase_url: str = ""
     supabase_key: str = ""
 
@@ -180,6 +191,8 @@ class RobotConfig:
     # Job execution
     batch_size: int = 1
     max_concurrent_jobs: int = 1
+    prefetch_count: int = 0  # Jobs claimed ahead of free slots
+    prefetch_max_age_seconds: float = 10.0  # Buffered jobs older than this are released
     job_timeout_seconds: int = 3600
     node_timeout_seconds: float = 120.0
 
@@ -191,6 +204,10 @@ class RobotConfig:
     visibility_timeout_seconds: int = 30
     graceful_shutdown_seconds: int = 60
 
+    # Progress reporting (coalesced, one batched write per flush)
+    progress_flush_interval_seconds: float = 1.0
+    progress_flush_delta_percent: int = 10
+
     # Features
     enable_checkpointing: bool = True
     enable_realtime: bool = True
@@ -229,7 +246,24 @@ class RobotConfig:
         the robot ID persists across restarts.
         """
         # Robot ID/name will be resolved from identity store in RobotAgent.__init__
-        pass
+
+        # A buffered job must be dequeued (and its lease extended) before its
+        # short prefetch lease can lapse
+        if self.prefetch_max_age_seconds >= self.visibility_timeout_seconds:
+            clamped = self.visibility_timeout_seconds / 2
+            logger.warning(
+                f"prefetch_max_age_seconds={self.prefetch_max_age_seconds} must be below "
+                f"visibility_timeout_seconds={self.visibility_timeout_seconds}; using {clamped}"
+            )
+            self.prefetch_max_age_seconds = clamped
+
+    @property
+    def prefetch_lease_seconds(self) -> int:
+        """Lease taken on prefetched jobs; extended to the full lease on dequeue."""
+        return min(
+            self.visibility_timeout_seconds,
+            math.ceil(self.prefetch_max_age_seconds) + _PREFETCH_LEASE_MARGIN_SECONDS,
+        )
 
     @classmethod
     def from_env(cls) -> RobotConfig:
@@ -244,9 +278,7 @@ class RobotConfig:
 
         postgres_url = ""
         if not disable_db:
-            postgres_url = (
-                os.getenv("POSTGRES_URL") or os.getenv("DATABASE_URL") or ""
-            ).strip()
+            postgres_url = (os.getenv("POSTGRES_URL") or os.getenv("DATABASE_URL") or "").strip()
             if not postgres_url:
                 postgres_url = _get_default_postgres_url()
 
@@ -254,6 +286,7 @@ class RobotConfig:
             robot_id=os.getenv("CASARE_ROBOT_ID"),
             robot_name=os.getenv("CASARE_ROBOT_NAME"),
             postgres_url=postgres_url,
+            postgres_listen_url=os.getenv("POSTGRES_LISTEN_URL", "").strip(),
             supabase_url=os.getenv("SUPABASE_URL", "")
             or "https://znaauaswqmurwfglantv.supabase.co",
             supabase_key=os.getenv("SUPABASE_KEY", ""),
@@ -265,7 +298,13 @@ class RobotConfig:
             poll_interval_seconds=float(os.getenv("CASARE_POLL_INTERVAL", "1.0")),
             heartbeat_interval_seconds=float(os.getenv("CASARE_HEARTBEAT_INTERVAL", "10.0")),
             graceful_shutdown_seconds=int(os.getenv("CASARE_SHUTDOWN_GRACE", "60")),
+            progress_flush_interval_seconds=float(
+                os.getenv("CASARE_PROGRESS_FLUSH_INTERVAL", "1.0")
+            ),
+            progress_flush_delta_percent=int(os.getenv("CASARE_PROGRESS_FLUSH_DELTA", "10")),
             max_concurrent_jobs=int(os.getenv("CASARE_MAX_CONCURRENT_JOBS", "1")),
+            prefetch_count=int(os.getenv("CASARE_PREFETCH_COUNT", "0")),
+            prefetch_max_age_seconds=float(os.getenv("CASARE_PREFETCH_MAX_AGE", "10.0")),
             job_timeout_seconds=int(os.getenv("CASARE_JOB_TIMEOUT", "3600")),
             enable_checkpointing=os.getenv("CASARE_ENABLE_CHECKPOINTING", "true").lower() == "true",
             enable_realtime=os.getenv("CASARE_ENABLE_REALTIME", "true").lower() == "true",
@@ -294,12 +333,14 @@ class RobotConfig:
             "robot_name": self.robot_name,
             "hostname": self.hostname,
             "postgres_url": "***" if self.postgres_url else "",
+            "postgres_listen_url": "***" if self.postgres_listen_url else "",
             "supabase_url": self.supabase_url,
             "supabase_key": "***" if self.supabase_key else "",
             "environment": self.environment,
             "tags": self.tags,
             "batch_size": self.batch_size,
             "max_concurrent_jobs": self.max_concurrent_jobs,
+            "prefetch_count": self.prefetch_count,
             "job_timeout_seconds": self.job_timeout_seconds,
             "enable_checkpointing": self.enable_checkpointing,
             "enable_circuit_breaker": self.enable_circuit_breaker,
@@ -416,6 +457,15 @@ class RobotAgent:
         self._current_jobs: dict[str, Any] = {}
         self._job_progress: dict[str, dict[str, Any]] = {}
         self._cancelled_jobs: set[str] = set()
+        self._lost_leases: set[str] = set()
+        # Jobs whose execution finished and whose result is being reported;
+        # their leases are no longer renewed and they are never cancelled
+        self._reporting_jobs: set[str] = set()
+        self._job_tasks: dict[str, asyncio.Task] = {}
+        self._claim_buffer = ClaimBuffer(
+            capacity=self.config.prefetch_count,
+            max_age_seconds=self.config.prefetch_max_age_seconds,
+        )
         self._jobs_lock = asyncio.Lock()  # Protects _current_jobs, _job_progress, _cancelled_jobs
 
         # Callbacks
@@ -436,6 +486,7 @@ class RobotAgent:
         # Components (initialized on start)
         self._consumer = None
         self._executor = None
+        self._progress_aggregator: ProgressAggregator | None = None
         self._resource_manager = None
         self._realtime_manager = None
         self._metrics: MetricsCollector | None = None
@@ -633,6 +684,12 @@ class RobotAgent:
         # Save checkpoint before stopping
         await self._save_checkpoint()
 
+        # Hand prefetched jobs back so other robots can run them now
+        buffered = self._claim_buffer.drain()
+        if buffered:
+            logger.info(f"Releasing {len(buffered)} prefetched job(s)")
+            await self._release_jobs(buffered)
+
         # Cancel background tasks
         for task in [
             self._job_loop_task,
@@ -711,6 +768,7 @@ class RobotAgent:
         # Import here to avoid circular imports and allow lazy loading
         try:
             from casare_rpa.infrastructure.agent.job_executor import JobExecutor
+            from casare_rpa.infrastructure.agent.progress_aggregator import ProgressAggregator
             from casare_rpa.infrastructure.queue import ConsumerConfig, PgQueuerConsumer
             from casare_rpa.infrastructure.resources.unified_resource_manager import (
                 UnifiedResourceManager,
@@ -729,6 +787,7 @@ class RobotAgent:
                     visibility_timeout_seconds=self.config.visibility_timeout_seconds,
                     heartbeat_interval_seconds=self.config.heartbeat_interval_seconds,
                     environment=self.config.environment,
+                    listen_url=self.config.postgres_listen_url or None,
                 )
                 self._consumer = PgQueuerConsumer(consumer_config)
                 await self._consumer.start()
@@ -757,8 +816,17 @@ class RobotAgent:
                 continue_on_error=False,
                 job_timeout=self.config.job_timeout_seconds,
                 node_timeout=self.config.node_timeout_seconds,
+                workflow_blob_fetcher=self._fetch_workflow_blob,
             )
 
+            # Coalesce per-node progress into periodic batched writes
+            self._progress_aggregator = ProgressAggregator(
+                on_flush=self._write_progress_batch,
+                flush_interval=self.config.progress_flush_interval_seconds,
+                min_delta_percent=self.config.progress_flush_delta_percent,
+            )
+            await self._progress_aggregator.start()
+
             # Initialize resource manager
             self._resource_manager = UnifiedResourceManager(
                 browser_pool_size=self.config.browser_pool_size,
@@ -779,6 +847,12 @@ class RobotAgent:
 
     async def _stop_components(self) -> None:
         """Stop all agent components."""
+        if self._progress_aggregator:
+            try:
+                await self._progress_aggregator.stop()
+            except Exception as e:
+                logger.warning(f"Error flushing job progress: {e}")
+
         await self._disconnect_orchestrator_client()
 
         if self._realtime_manager:
@@ -794,6 +868,10 @@ class RobotAgent:
                 logger.warning(f"Error stopping resource manager: {e}")
 
         if self._executor:
+            try:
+                self._executor.shutdown()
+            except Exception as e:
+                logger.warning(f"Error shutting down executor: {e}")
             self._executor = None
 
         if self._consumer:
@@ -1181,8 +1259,9 @@ class RobotAgent:
                 if not self._running:
                     break
 
-                # Check capacity
-                if self.current_job_count >= self.config.max_concurrent_jobs:
+                # Check capacity (dispatched tasks count before they register as current)
+                free_slots = self.config.max_concurrent_jobs - len(self._job_tasks)
+                if free_slots <= 0:
                     await asyncio.sleep(self.config.poll_interval_seconds)
                     continue
 
@@ -1192,21 +1271,46 @@ class RobotAgent:
                     await asyncio.sleep(self.config.poll_interval_seconds)
                     continue
 
-                # Claim job
-                job = None
-                if self._consumer:
-                    if self._circuit_breaker:
-                        try:
-                            job = await self._circuit_breaker.call(self._consumer.claim_job)
-                        except CircuitBreakerOpenError:
-                            await asyncio.sleep(self.config.poll_interval_seconds)
-                            continue
-                    else:
-                        job = await self._consumer.claim_job()
-
-                if job:
-                    asyncio.create_task(self._execute_job_with_circuit_breaker(job))
+                fill_started = time.monotonic()
+
+                # Serve from the prefetch buffer first
+                jobs, expired = self._claim_buffer.take(free_slots)
+                if expired:
+                    await self._release_jobs(expired)
+
+                # Fill the remaining slots and top up the buffer in one claim.
+                # While prefetching, the claim takes a short lease that only
+                # jobs dequeued for execution get extended.
+                prefetching = self._claim_buffer.capacity > 0
+                wanted = free_slots - len(jobs) + self._claim_buffer.room
+                if wanted > 0 and self._consumer:
+                    lease = (
+                        self.config.prefetch_lease_seconds
+                        if prefetching
+                        else self.config.visibility_timeout_seconds
+                    )
+                    try:
+                        claimed = await self._claim_jobs(wanted, lease)
+                    except CircuitBreakerOpenError:
+                        claimed = []
+                    self._claim_buffer.record_claim(len(claimed))
+                    shortfall = free_slots - len(jobs)
+                    jobs.extend(claimed[:shortfall])
+                    self._claim_buffer.put(claimed[shortfall:])
+
+                if jobs and prefetching:
+                    jobs = await self._extend_prefetch_leases(jobs)
+
+                if jobs:
+                    for job in jobs:
+                        self._dispatch_job(job)
+                    self._claim_buffer.record_fill(fill_started)
                     backoff_delay = self.config.poll_interval_seconds
+                elif self._circuit_breaker and self._circuit_breaker.is_open:
+                    await asyncio.sleep(self.config.poll_interval_seconds)
+                elif getattr(self._consumer, "is_listening", False):
+                    # Woken by NOTIFY on enqueue; polls slowly as a fallback
+                    await self._consumer.wait_for_jobs()
                 else:
                     # Exponential backoff (max 2s)
                     await asyncio.sleep(backoff_delay)
@@ -1220,6 +1324,66 @@ class RobotAgent:
 
         logger.info("Job loop stopped")
 
+    async def _claim_jobs(self, limit: int, lease_seconds: int) -> list[Any]:
+        """Claim up to limit jobs in one round trip (through the circuit breaker)."""
+        claim_batch = getattr(self._consumer, "claim_batch", None)
+        if claim_batch is not None:
+            claim = claim_batch
+            args: tuple[Any, ...] = (limit,)
+        else:
+            claim = self._consumer.claim_job
+            args = ()
+        kwargs = {"visibility_timeout_seconds": lease_seconds}
+
+        if self._circuit_breaker:
+            result = await self._circuit_breaker.call(claim, *args, **kwargs)
+        else:
+            result = await claim(*args, **kwargs)
+
+        if claim_batch is None:
+            return [result] if result else []
+        return list(result)
+
+    async def _extend_prefetch_leases(self, jobs: list[Any]) -> list[Any]:
+        """
+        Extend the short prefetch lease of jobs about to run to the full lease.
+
+        Jobs whose lease was already lost are dropped; if the extension
+        fails the jobs are handed back instead of run on a short lease.
+        """
+        try:
+            lost = await self._consumer.extend_leases(
+                [job.job_id for job in jobs],
+                extension_seconds=self.config.visibility_timeout_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to extend leases of {len(jobs)} claimed job(s): {e}")
+            await self._release_jobs(jobs)
+            return []
+
+        if lost:
+            lost_ids = set(lost)
+            logger.warning(f"Dropping {len(lost_ids)} claimed job(s) whose lease lapsed")
+            jobs = [job for job in jobs if job.job_id not in lost_ids]
+        return jobs
+
+    def _dispatch_job(self, job: Any) -> None:
+        """Start executing a claimed job in its own task."""
+        task = asyncio.create_task(self._execute_job_with_circuit_breaker(job))
+        self._job_tasks[job.job_id] = task
+        task.add_done_callback(lambda _t, job_id=job.job_id: self._job_tasks.pop(job_id, None))
+
+    async def _release_jobs(self, jobs: list[Any]) -> None:
+        """Hand claimed but unstarted jobs back to the queue."""
+        if not self._consumer:
+            return
+        for job in jobs:
+            try:
+                await self._consumer.release_job(job.job_id)
+                logger.debug(f"Released unstarted job {job.job_id[:8]}")
+            except Exception as e:
+                logger.warning(f"Failed to release job {job.job_id[:8]}: {e}")
+
     async def _execute_job_with_circuit_breaker(self, job: Any) -> None:
         """Execute job with circuit breaker protection."""
         job_id = job.job_id
@@ -1256,23 +1420,29 @@ class RobotAgent:
         if self._audit:
             self._audit.job_started(job_id, total_nodes=0)
 
-        await self._update_registration_status("busy")
-
         if self._metrics:
             self._metrics.start_job(job_id, job.workflow_name)
 
         try:
+            await self._update_registration_status("busy")
+
             # Check cancellation
             async with self._jobs_lock:
                 is_cancelled = job_id in self._cancelled_jobs
             if is_cancelled:
                 raise asyncio.CancelledError("Job cancelled by user")
 
+            # Blob-backed jobs carry only the workflow's content hash
+            workflow_hash = getattr(job, "workflow_hash", None)
+
             # Acquire resources
             resources = None
             if self._resource_manager:
+                workflow_definition: Any = job.workflow_json
+                if workflow_hash and not workflow_definition:
+                    workflow_definition, _ = await self._executor.load_workflow(None, workflow_hash)
                 resources = await self._resource_manager.acquire_resources_for_job(
-                    job_id, job.workflow_json
+                    job_id, workflow_definition
                 )
 
             # Execute with DBOS
@@ -1282,8 +1452,17 @@ class RobotAgent:
                 initial_variables=job.variables,
                 wait_for_result=True,
                 on_progress=lambda p, n: self._on_job_progress(job_id, p, n),
+                workflow_hash=workflow_hash,
             )
 
+            # Past this point a "lost" lease is our own completion, not a requeue
+            async with self._jobs_lock:
+                self._reporting_jobs.add(job_id)
+
+            # Final progress goes out before the job leaves the running state
+            if self._progress_aggregator:
+                await self._progress_aggregator.flush_job(job_id)
+
             # Report result
             if result.success:
                 await self._consumer.complete_job(
@@ -1332,9 +1511,15 @@ class RobotAgent:
                 await self._resource_manager.release_resources(resources)
 
         except asyncio.CancelledError:
-            logger.info(f"Job {job_id[:8]} was cancelled")
-            if self._consumer:
-                await self._consumer.fail_job(job_id, error_message="Job cancelled")
+            async with self._jobs_lock:
+                lease_lost = job_id in self._lost_leases
+            if lease_lost:
+                # The job was requeued or claimed elsewhere; it's no longer ours to report
+                logger.warning(f"Job {job_id[:8]} abandoned after losing its lease")
+            else:
+                logger.info(f"Job {job_id[:8]} was cancelled")
+                if self._consumer:
+                    await self._consumer.fail_job(job_id, error_message="Job cancelled")
             self._stats["jobs_failed"] += 1
 
             if self._audit:
@@ -1358,10 +1543,14 @@ class RobotAgent:
                     logger.error(f"Job complete callback error: {callback_error}")
 
         finally:
+            if self._progress_aggregator:
+                self._progress_aggregator.forget(job_id)
             async with self._jobs_lock:
                 self._current_jobs.pop(job_id, None)
                 self._job_progress.pop(job_id, None)
                 self._cancelled_jobs.discard(job_id)
+                self._lost_leases.discard(job_id)
+                self._reporting_jobs.discard(job_id)
                 has_jobs = bool(self._current_jobs)
 
             if not has_jobs:
@@ -1376,11 +1565,19 @@ class RobotAgent:
                 "updated_at": datetime.now(UTC).isoformat(),
             }
 
-        try:
-            if self._consumer:
-                await self._consumer.update_progress(job_id, progress, node_id)
-        except Exception as e:
-            logger.debug(f"Failed to update progress for {job_id}: {e}")
+        if self._progress_aggregator:
+            self._progress_aggregator.record(job_id, progress, node_id)
+
+    async def _write_progress_batch(self, updates: list[ProgressUpdate]) -> None:
+        """Write coalesced progress updates through the job consumer."""
+        if not self._consumer:
+            return
+        update_batch = getattr(self._consumer, "update_progress_batch", None)
+        if update_batch is not None:
+            await update_batch(updates)
+            return
+        for job_id, progress, node_id in updates:
+            await self._consumer.update_progress(job_id, progress, node_id)
 
     async def _wait_for_jobs_complete(self) -> None:
         """Wait for all current jobs to complete."""
@@ -1400,18 +1597,23 @@ class RobotAgent:
         while self._running:
             try:
                 async with self._jobs_lock:
-                    job_ids = list(self._current_jobs.keys())
-                for job_id in job_ids:
+                    job_ids = [
+                        job_id
+                        for job_id in self._current_jobs
+                        if job_id not in self._reporting_jobs
+                    ]
+                if job_ids and self._consumer:
                     try:
-                        if self._consumer:
-                            success = await self._consumer.extend_lease(
-                                job_id,
-                                extension_seconds=self.config.visibility_timeout_seconds,
-                            )
-                            if not success:
-                                logger.warning(f"Failed to extend lease for job {job_id[:8]}")
+                        # One round trip renews every lease this robot holds
+                        lost = await self._consumer.extend_leases(
+                            job_ids,
+                            extension_seconds=self.config.visibility_timeout_seconds,
+                        )
                     except Exception as e:
-                        logger.error(f"Heartbeat error for job {job_id[:8]}: {e}")
+                        logger.error(f"Heartbeat error for {len(job_ids)} jobs: {e}")
+                    else:
+                        if lost:
+                            await self._abandon_lost_jobs(lost)
 
                 await asyncio.sleep(self.config.heartbeat_interval_seconds)
 
@@ -1692,6 +1894,13 @@ class RobotAgent:
         if self._circuit_breaker:
             status["circuit_breaker"] = self._circuit_breaker.get_status()
 
+        # Job claiming (prefetch buffer and slot fill latency)
+        status["claiming"] = self._claim_buffer.get_stats()
+
+        # Progress reporting (suppressed = updates coalesced away before a write)
+        if self._progress_aggregator:
+            status["progress_reporting"] = self._progress_aggregator.get_stats()
+
         # Resource metrics
         if PSUTIL_AVAILABLE:
             try:
@@ -1702,6 +1911,32 @@ class RobotAgent:
 
         return status
 
+    async def _abandon_lost_jobs(self, job_ids: list[str]) -> None:
+        """
+        Cancel executions whose lease was lost to another robot or a requeue.
+
+        The heartbeat renews a snapshot of the running jobs, so a job that
+        finished and reported its result meanwhile comes back as "lost".
+        Only jobs that are still executing are cancelled.
+        """
+        async with self._jobs_lock:
+            for job_id in job_ids:
+                if job_id not in self._current_jobs or job_id in self._reporting_jobs:
+                    continue
+                self._lost_leases.add(job_id)
+                self._cancelled_jobs.add(job_id)
+                task = self._job_tasks.get(job_id)
+                if task is not None and not task.done():
+                    logger.warning(f"Lease lost for job {job_id[:8]}, cancelling execution")
+                    task.cancel()
+
+    async def _fetch_workflow_blob(self, content_hash: str) -> str | None:
+        """Fetch a content-addressed workflow blob through the job consumer."""
+        fetch = getattr(self._consumer, "fetch_workflow_blob", None)
+        if fetch is None:
+            return None
+        return await fetch(content_hash)
+
     async def cancel_job(self, job_id: str) -> bool:
         """Request cancellation of a job."""
         async with self._jobs_lock:
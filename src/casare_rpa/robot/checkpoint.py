@@ -5,18 +5,35 @@ Provides per-node checkpointing for crash recovery:
 - Save execution state after each node completes
 - Resume execution from last checkpoint after crash
 - Track variables, executed nodes, and browser state
+
+PERFORMANCE: Checkpoints are incremental. The first checkpoint of a job
+(and every compaction_interval-th one after it) is a full base snapshot;
+the others are deltas holding only the path entries, errors and variables
+changed since the previous checkpoint. Changed variables come from the
+context's dirty set (ExecutionContext.consume_variable_changes), so a delta
+costs O(changed variables) rather than O(all variables). Writes that bypass
+set_variable()/delete_variable() are picked up by the next base snapshot.
+Restore replays the last base + the deltas after it; queues that cannot
+list a job's history get a full base snapshot every time.
 """
 
 import asyncio
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field, fields
 from datetime import UTC, datetime
 from typing import Any
 
 import orjson
 from loguru import logger
 
-from casare_rpa.robot.offline_queue import OfflineQueue
+CHECKPOINT_KIND_BASE = "base"
+CHECKPOINT_KIND_DELTA = "delta"
+
+# Deltas written before the next checkpoint is compacted into a base snapshot
+DEFAULT_COMPACTION_INTERVAL = 50
+
+# Fast-path for common serializable types (avoid test serialization)
+_SAFE_TYPES = (str, int, float, bool, type(None))
 
 
 @dataclass
@@ -44,14 +61,103 @@ class CheckpointState:
     active_page_name: str | None = None
     page_count: int = 0
 
+    # Position in the job's checkpoint log (base snapshots and deltas)
+    sequence: int = 0
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {**asdict(self), "kind": CHECKPOINT_KIND_BASE}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CheckpointState":
-        """Create from dictionary."""
-        return cls(**data)
+        """Create from dictionary (unknown keys such as 'kind' are ignored)."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+@dataclass
+class CheckpointDelta:
+    """Changes since the previous checkpoint of the same job."""
+
+    checkpoint_id: str
+    job_id: str
+    base_checkpoint_id: str
+    sequence: int
+    created_at: str
+    current_node_id: str
+
+    # Appended since the previous checkpoint
+    path_entries: list[str] = field(default_factory=list)
+    new_errors: list[dict[str, str]] = field(default_factory=list)
+
+    # Variables set (serialized) or deleted since the previous checkpoint
+    set_variables: dict[str, Any] = field(default_factory=dict)
+    deleted_variables: list[str] = field(default_factory=list)
+
+    has_browser: bool = False
+    active_page_name: str | None = None
+    page_count: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {**asdict(self), "kind": CHECKPOINT_KIND_DELTA}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CheckpointDelta":
+        """Create from dictionary (unknown keys such as 'kind' are ignored)."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def apply_to(self, state: CheckpointState) -> None:
+        """Replay this delta onto a checkpoint state (in place)."""
+        for key in self.deleted_variables:
+            state.variables.pop(key, None)
+        state.variables.update(self.set_variables)
+
+        executed = set(state.executed_nodes)
+        for node_id in self.path_entries:
+            state.execution_path.append(node_id)
+            if node_id not in executed:
+                executed.add(node_id)
+                state.executed_nodes.append(node_id)
+        state.errors.extend(self.new_errors)
+
+        state.checkpoint_id = self.checkpoint_id
+        state.sequence = self.sequence
+        state.created_at = self.created_at
+        state.current_node_id = self.current_node_id
+        state.has_browser = self.has_browser
+        state.active_page_name = self.active_page_name
+        state.page_count = self.page_count
+
+
+def replay_checkpoint_log(records: list[dict[str, Any]]) -> CheckpointState | None:
+    """
+    Rebuild the latest state from a job's checkpoint records.
+
+    Args:
+        records: Stored checkpoint states (base and delta dicts), any order
+
+    Returns:
+        Latest base snapshot with its deltas applied, or None if no base exists
+    """
+    ordered = sorted(records, key=lambda r: r.get("sequence", 0))
+    base_index = None
+    for index, record in enumerate(ordered):
+        if record.get("kind", CHECKPOINT_KIND_BASE) == CHECKPOINT_KIND_BASE:
+            base_index = index
+    if base_index is None:
+        return None
+
+    state = CheckpointState.from_dict(ordered[base_index])
+    base_id = state.checkpoint_id
+    for record in ordered[base_index + 1 :]:
+        if record.get("kind") != CHECKPOINT_KIND_DELTA:
+            continue
+        if record.get("base_checkpoint_id") != base_id:
+            continue
+        CheckpointDelta.from_dict(record).apply_to(state)
+    return state
 
 
 class CheckpointManager:
@@ -60,22 +166,36 @@ class CheckpointManager:
 
     Saves execution state after each node completes, allowing
     recovery from crashes or interruptions.
+
+    The offline queue is used as an append-only log: save_checkpoint()
+    appends base or delta records. Deltas are only written when the queue
+    provides get_checkpoints(job_id), which restore needs to replay them,
+    and the context tracks its variable changes; otherwise every checkpoint
+    is a base snapshot and restore reads get_latest_checkpoint(). After a
+    compaction, older records are pruned via delete_checkpoints_before()
+    when the queue supports it.
     """
 
     def __init__(
         self,
-        offline_queue: OfflineQueue,
+        offline_queue: Any,
         auto_save: bool = True,
+        compaction_interval: int = DEFAULT_COMPACTION_INTERVAL,
     ):
         """
         Initialize checkpoint manager.
 
         Args:
-            offline_queue: OfflineQueue instance for persistence
+            offline_queue: Checkpoint queue providing save_checkpoint(),
+                get_latest_checkpoint() and clear_checkpoints(), plus the
+                optional hooks described above
             auto_save: Whether to auto-save after each node
+            compaction_interval: Deltas written before the next base snapshot
+                (0 writes a full snapshot every time)
         """
         self.offline_queue = offline_queue
         self.auto_save = auto_save
+        self.compaction_interval = max(0, compaction_interval)
 
         # Current state
         self._current_job_id: str | None = None
@@ -86,8 +206,27 @@ class CheckpointManager:
         self._errors: list[dict[str, str]] = []
         self._browser_state: dict[str, Any] = {}
 
+        # Delta log position for the current job
+        self._sequence = 0
+        self._base_checkpoint_id: str | None = None
+        self._deltas_since_base = 0
+        self._path_flushed = 0
+        self._errors_flushed = 0
+
         logger.info("Checkpoint manager initialized")
 
+    @property
+    def supports_deltas(self) -> bool:
+        """Whether the queue can return a job's full checkpoint log."""
+        return callable(getattr(self.offline_queue, "get_checkpoints", None))
+
+    def _reset_log(self) -> None:
+        self._sequence = 0
+        self._base_checkpoint_id = None
+        self._deltas_since_base = 0
+        self._path_flushed = 0
+        self._errors_flushed = 0
+
     def start_job(self, job_id: str, workflow_name: str):
         """
         Start tracking a new job.
@@ -103,6 +242,7 @@ class CheckpointManager:
         self._variables.clear()
         self._errors.clear()
         self._browser_state.clear()
+        self._reset_log()
 
         logger.debug(f"Checkpoint tracking started for job {job_id}")
 
@@ -133,79 +273,113 @@ class CheckpointManager:
         self._executed_nodes.add(node_id)
         self._execution_path.append(node_id)
 
-        # Capture serializable variables
-        serializable_vars = self._extract_serializable_variables(context)
-
         # Capture browser state hints
         browser_state = self._capture_browser_state(context)
 
-        # Create checkpoint
+        self._sequence += 1
         checkpoint_id = str(uuid.uuid4())[:8]
-        state = CheckpointState(
-            checkpoint_id=checkpoint_id,
-            job_id=self._current_job_id,
-            workflow_name=self._current_workflow_name or "unknown",
-            created_at=datetime.now(UTC).isoformat(),
-            current_node_id=node_id,
-            executed_nodes=list(self._executed_nodes),
-            execution_path=self._execution_path.copy(),
-            variables=serializable_vars,
-            errors=self._errors.copy(),
-            has_browser=browser_state.get("has_browser", False),
-            active_page_name=browser_state.get("active_page_name"),
-            page_count=browser_state.get("page_count", 0),
+        # Always drained, so the next delta only holds changes after this one
+        consume = getattr(context, "consume_variable_changes", None)
+        changes = consume() if callable(consume) else None
+        is_base = (
+            changes is None
+            or not self.supports_deltas
+            or self._base_checkpoint_id is None
+            or self._deltas_since_base >= self.compaction_interval
         )
+        current = getattr(context, "variables", {})
+
+        if is_base:
+            record: CheckpointState | CheckpointDelta = CheckpointState(
+                checkpoint_id=checkpoint_id,
+                job_id=self._current_job_id,
+                workflow_name=self._current_workflow_name or "unknown",
+                created_at=datetime.now(UTC).isoformat(),
+                current_node_id=node_id,
+                executed_nodes=list(self._executed_nodes),
+                execution_path=self._execution_path.copy(),
+                variables={
+                    key: self._encode_variable(key, value) for key, value in current.items()
+                },
+                errors=self._errors.copy(),
+                has_browser=browser_state.get("has_browser", False),
+                active_page_name=browser_state.get("active_page_name"),
+                page_count=browser_state.get("page_count", 0),
+                sequence=self._sequence,
+            )
+        else:
+            dirty, deleted = changes
+            record = CheckpointDelta(
+                checkpoint_id=checkpoint_id,
+                job_id=self._current_job_id,
+                base_checkpoint_id=self._base_checkpoint_id,
+                sequence=self._sequence,
+                created_at=datetime.now(UTC).isoformat(),
+                current_node_id=node_id,
+                path_entries=self._execution_path[self._path_flushed :],
+                new_errors=self._errors[self._errors_flushed :],
+                set_variables={
+                    name: self._encode_variable(name, current[name])
+                    for name in sorted(dirty)
+                    if name in current
+                },
+                deleted_variables=sorted(name for name in deleted if name not in current),
+                has_browser=browser_state.get("has_browser", False),
+                active_page_name=browser_state.get("active_page_name"),
+                page_count=browser_state.get("page_count", 0),
+            )
 
-        # Save to offline queue
+        # Append to the offline queue's checkpoint log
         success = await self.offline_queue.save_checkpoint(
             job_id=self._current_job_id,
             checkpoint_id=checkpoint_id,
             node_id=node_id,
-            state=state.to_dict(),
+            state=record.to_dict(),
         )
 
-        if success:
-            logger.debug(f"Checkpoint {checkpoint_id} saved at node {node_id}")
-            return checkpoint_id
-        else:
+        if not success:
+            # The delta chain is broken - next one must be a base
+            self._base_checkpoint_id = None
             logger.warning(f"Failed to save checkpoint at node {node_id}")
             return None
 
-    def _extract_serializable_variables(
-        self,
-        context: Any,
-    ) -> dict[str, Any]:
-        """Extract only JSON-serializable variables from context."""
-        result = {}
-
-        if not hasattr(context, "variables"):
-            return result
-
-        # PERFORMANCE: Fast-path for common serializable types (avoid test serialization)
-        _SAFE_TYPES = (str, int, float, bool, type(None))
-
-        for key, value in context.variables.items():
-            # Fast path: primitives are always serializable
-            if isinstance(value, _SAFE_TYPES):
-                result[key] = value
-            elif isinstance(value, list | dict):
-                # Lists and dicts need full check (may contain non-serializable items)
-                try:
-                    orjson.dumps(value)
-                    result[key] = value
-                except (TypeError, ValueError):
-                    logger.debug(f"Skipping non-serializable variable: {key}")
-                    result[key] = f"<non-serializable: {type(value).__name__}>"
-            else:
-                # Other types: test serializability
-                try:
-                    orjson.dumps(value)
-                    result[key] = value
-                except (TypeError, ValueError):
-                    logger.debug(f"Skipping non-serializable variable: {key}")
-                    result[key] = f"<non-serializable: {type(value).__name__}>"
-
-        return result
+        self._path_flushed = len(self._execution_path)
+        self._errors_flushed = len(self._errors)
+        if is_base:
+            self._base_checkpoint_id = checkpoint_id
+            self._deltas_since_base = 0
+            await self._prune_before(checkpoint_id)
+        else:
+            self._deltas_since_base += 1
+
+        logger.debug(
+            f"Checkpoint {checkpoint_id} ({'base' if is_base else 'delta'}) saved at node {node_id}"
+        )
+        return checkpoint_id
+
+    async def _prune_before(self, checkpoint_id: str) -> None:
+        """Drop records superseded by a new base snapshot, if the queue supports it."""
+        prune = getattr(self.offline_queue, "delete_checkpoints_before", None)
+        if prune is None or self._current_job_id is None:
+            return
+        try:
+            await prune(self._current_job_id, checkpoint_id)
+        except Exception as e:
+            logger.debug(f"Checkpoint compaction prune failed: {e}")
+
+    @staticmethod
+    def _encode_variable(key: str, value: Any) -> Any:
+        """Get the stored form of a variable (a placeholder if not serializable)."""
+        # Fast path: primitives are always serializable
+        if isinstance(value, _SAFE_TYPES):
+            return value
+        # Lists, dicts and other types need a full check
+        try:
+            orjson.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug(f"Skipping non-serializable variable: {key}")
+            return f"<non-serializable: {type(value).__name__}>"
+        return value
 
     def _capture_browser_state(self, context: Any) -> dict[str, Any]:
         """Capture browser state hints from context."""
@@ -239,13 +413,23 @@ class CheckpointManager:
         Returns:
             CheckpointState if found
         """
-        checkpoint_data = await self.offline_queue.get_latest_checkpoint(job_id)
-        if checkpoint_data and "state" in checkpoint_data:
-            try:
-                return CheckpointState.from_dict(checkpoint_data["state"])
-            except Exception as e:
-                logger.error(f"Failed to parse checkpoint: {e}")
-        return None
+        if self.supports_deltas:
+            entries = await self.offline_queue.get_checkpoints(job_id)
+        else:
+            latest = await self.offline_queue.get_latest_checkpoint(job_id)
+            entries = [latest] if latest else []
+
+        records = [entry["state"] for entry in entries if entry and "state" in entry]
+        if not records:
+            return None
+        try:
+            state = replay_checkpoint_log(records)
+        except Exception as e:
+            logger.error(f"Failed to parse checkpoint: {e}")
+            return None
+        if state is None:
+            logger.warning(f"No base checkpoint available to replay for job {job_id}")
+        return state
 
     async def restore_from_checkpoint(
         self,
@@ -265,7 +449,7 @@ class CheckpointManager:
         try:
             # Restore variables
             for key, value in checkpoint.variables.items():
-                if not value.startswith("<non-serializable"):
+                if not (isinstance(value, str) and value.startswith("<non-serializable")):
                     context.variables[key] = value
 
             # Restore tracking state
@@ -274,6 +458,9 @@ class CheckpointManager:
             self._executed_nodes = set(checkpoint.executed_nodes)
             self._execution_path = checkpoint.execution_path.copy()
             self._errors = checkpoint.errors.copy()
+            # Continue the log with a fresh base snapshot
+            self._reset_log()
+            self._sequence = checkpoint.sequence
 
             logger.info(
                 f"Restored checkpoint {checkpoint.checkpoint_id} "
@@ -0,0 +1,132 @@
+"""
+Claim Buffer for Robot Agent.
+
+Holds jobs claimed ahead of free execution slots so a robot can start the
+next job without a queue round trip. Buffered jobs keep their claim only for
+a short time: entries older than max_age_seconds are handed back for release
+instead of execution, so a job whose lease may have lapsed is never run.
+
+Also records fill metrics: how many claim round trips were made, how many
+jobs were served from the buffer, and how long it took to fill free slots.
+"""
+
+import time
+from collections import deque
+from typing import Any
+
+
+class ClaimBuffer:
+    """
+    FIFO buffer of prefetched jobs with bounded age.
+
+    Attributes:
+        capacity: Maximum number of jobs held beyond the free slots
+        max_age_seconds: Age after which a buffered job is released instead of run
+    """
+
+    def __init__(self, capacity: int = 0, max_age_seconds: float = 10.0):
+        """
+        Initialize claim buffer.
+
+        Args:
+            capacity: Jobs to prefetch beyond free slots (0 disables prefetching)
+            max_age_seconds: Seconds a job may wait in the buffer (default: 10)
+        """
+        self.capacity = capacity
+        self.max_age_seconds = max_age_seconds
+
+        self._jobs: deque[tuple[float, Any]] = deque()
+
+        # Metrics
+        self._claim_calls = 0
+        self._jobs_claimed = 0
+        self._buffer_hits = 0
+        self._expired = 0
+        self._fills = 0
+        self._fill_total_ms = 0.0
+        self._fill_last_ms = 0.0
+        self._fill_max_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def room(self) -> int:
+        """Number of jobs the buffer can still take."""
+        return max(0, self.capacity - len(self._jobs))
+
+    def take(self, count: int) -> tuple[list[Any], list[Any]]:
+        """
+        Take up to count jobs, oldest first.
+
+        Args:
+            count: Maximum jobs to take
+
+        Returns:
+            Tuple of (jobs to run, expired jobs to release)
+        """
+        ready: list[Any] = []
+        expired: list[Any] = []
+        deadline = time.monotonic() - self.max_age_seconds
+        while self._jobs and len(ready) < count:
+            claimed_at, job = self._jobs.popleft()
+            if claimed_at < deadline:
+                expired.append(job)
+            else:
+                ready.append(job)
+        # Expired jobs behind the ones taken would only age further
+        while self._jobs and self._jobs[0][0] < deadline:
+            expired.append(self._jobs.popleft()[1])
+
+        self._buffer_hits += len(ready)
+        self._expired += len(expired)
+        return ready, expired
+
+    def put(self, jobs: list[Any]) -> None:
+        """Buffer freshly claimed jobs."""
+        now = time.monotonic()
+        self._jobs.extend((now, job) for job in jobs)
+
+    def drain(self) -> list[Any]:
+        """Remove and return every buffered job (for release on shutdown)."""
+        jobs = [job for _, job in self._jobs]
+        self._jobs.clear()
+        return jobs
+
+    def record_claim(self, jobs_claimed: int) -> None:
+        """Record one claim round trip."""
+        self._claim_calls += 1
+        self._jobs_claimed += jobs_claimed
+
+    def record_fill(self, started_at: float) -> None:
+        """
+        Record the time taken to fill free slots.
+
+        Args:
+            started_at: time.monotonic() when free capacity was detected
+        """
+        elapsed_ms = (time.monotonic() - started_at) * 1000
+        self._fills += 1
+        self._fill_total_ms += elapsed_ms
+        self._fill_last_ms = elapsed_ms
+        self._fill_max_ms = max(self._fill_max_ms, elapsed_ms)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get claim and fill statistics.
+
+        Returns:
+            Dictionary with buffer size, claim counts and fill latencies (ms)
+        """
+        return {
+            "buffered": len(self._jobs),
+            "capacity": self.capacity,
+            "claim_calls": self._claim_calls,
+            "jobs_claimed": self._jobs_claimed,
+            "buffer_hits": self._buffer_hits,
+            "expired": self._expired,
+            "fills": self._fills,
+            "fill_last_ms": round(self._fill_last_ms, 3),
+            "fill_avg_ms": round(self._fill_total_ms / self._fills, 3) if self._fills else 0.0,
+            "fill_max_ms": round(self._fill_max_ms, 3),
+        }
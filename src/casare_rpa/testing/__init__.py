@@ -6,6 +6,7 @@ Provides utilities for testing workflows and nodes:
 - MockExecutionContext: Mock context for isolated testing
 - NodeTestGenerator: Generate test stubs for nodes
 - VisualRegressionTester: Test UI components for regressions
+- engine_benchmark: Engine overhead benchmarks with JSON baselines
 
 Usage:
     from casare_rpa.testing import WorkflowTester, MockExecutionContext
@@ -21,6 +22,12 @@ Usage:
     assert result.success
 """
 
+from casare_rpa.testing.engine_benchmark import (
+    SCENARIOS,
+    ScenarioResult,
+    compare_to_baseline,
+    run_suite,
+)
 from casare_rpa.testing.mocks import (
     MockBrowserPool,
     MockExecutionContext,
@@ -50,4 +57,9 @@ __all__ = [
     "MockService",
     # Test generation
     "NodeTestGenerator",
+    # Engine benchmarks
+    "SCENARIOS",
+    "ScenarioResult",
+    "run_suite",
+    "compare_to_baseline",
 ]
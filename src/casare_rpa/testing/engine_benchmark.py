@@ -0,0 +1,467 @@
+"""
+CasareRPA - Engine Overhead Benchmarks.
+
+Measures what the execution engine itself costs per node (event publishing,
+metrics, validation, timeout wrapper, routing, input transfer) by running
+synthetic workflows made of trivial nodes through ExecuteWorkflowUseCase.
+
+Scenarios:
+    - linear_chain: Start -> N SetVariable nodes
+    - loop: ForLoopStart/End around one SetVariable node, N iterations
+    - fork_join: ForkNode with 10 branches of N/10 nodes each, then JoinNode
+    - nested_subflows: Subflows nested N levels deep (SubflowExecutor per level)
+    - template_heavy: N SetVariable nodes resolving 20 {{variable}} references
+
+Each result reports nodes/sec, p50/p99 per-node step time (interval between
+consecutive NodeStarted events) and peak RSS. Results can be stored as a JSON
+baseline and compared against it with a relative threshold.
+
+Usage:
+    results = await run_suite(quick=True)
+    regressions = compare_to_baseline(results, load_baseline(path), threshold=0.25)
+
+Related:
+    - CLI: casare bench run [--output results.json] /
+      casare bench compare results.json [--baseline PATH]
+    - Tests: tests/performance/test_engine_overhead.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.node_connection import NodeConnection
+from casare_rpa.domain.entities.workflow import WorkflowSchema
+from casare_rpa.domain.entities.workflow_metadata import WorkflowMetadata
+from casare_rpa.domain.events import EventBus, NodeStarted
+from casare_rpa.domain.value_objects.types import ExecutionResult, NodeStatus
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+BASELINE_VERSION = 1
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_BASELINE_PATH = Path(".benchmarks") / "engine_overhead.json"
+
+# Sample RSS every N node starts (psutil calls are too slow for every node)
+_RSS_SAMPLE_EVERY = 256
+_FORK_WIDTH = 10
+_TEMPLATE_REFS = 20
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements for one benchmark scenario."""
+
+    name: str
+    size: int
+    nodes_executed: int
+    duration_s: float
+    nodes_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_rss_mb: float
+    success: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON storage."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ScenarioResult:
+        """Create from a stored dictionary."""
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+
+@dataclass
+class BenchmarkScenario:
+    """A synthetic workflow family measured by the suite."""
+
+    name: str
+    description: str
+    build: Callable[[int, EventBus], WorkflowSchema]
+    size: int
+    quick_size: int
+    initial_variables: dict[str, Any] = field(default_factory=dict)
+
+
+# =============================================================================
+# Workflow builders
+# =============================================================================
+
+
+class _WorkflowBuilder:
+    """Builds a WorkflowSchema of node instances wired by exec connections."""
+
+    def __init__(self, name: str) -> None:
+        from casare_rpa.nodes import get_node_class
+
+        self._get_node_class = get_node_class
+        self.workflow = WorkflowSchema(WorkflowMetadata(name=name))
+
+    def add(self, node_type: str, node_id: str, **config: Any) -> Any:
+        node = self._get_node_class(node_type)(node_id, config=config)
+        self.workflow.nodes[node_id] = node
+        return node
+
+    def add_instance(self, node: Any) -> Any:
+        self.workflow.nodes[node.node_id] = node
+        return node
+
+    def connect(self, source: str, target: str, port: str = "exec_out") -> None:
+        self.workflow.connections.append(NodeConnection(source, port, target, "exec_in"))
+
+    def chain(self, source: str, prefix: str, count: int, port: str = "exec_out", **config):
+        """Append count SetVariable nodes after source; returns the last node id."""
+        previous = source
+        for i in range(count):
+            node_id = f"{prefix}{i}"
+            self.add(
+                "SetVariableNode",
+                node_id,
+                variable_name=config.get("variable_name", node_id),
+                default_value=config.get("default_value", i),
+            )
+            self.connect(previous, node_id, port if previous == source else "exec_out")
+            previous = node_id
+        return previous
+
+
+def build_linear_chain(size: int, event_bus: EventBus) -> WorkflowSchema:
+    """Start -> size SetVariable nodes."""
+    builder = _WorkflowBuilder("bench_linear_chain")
+    builder.add("StartNode", "start")
+    builder.chain("start", "set_", size)
+    return builder.workflow
+
+
+def build_loop(size: int, event_bus: EventBus) -> WorkflowSchema:
+    """ForLoopStart/End around one SetVariable node, size iterations."""
+    builder = _WorkflowBuilder("bench_loop")
+    builder.add("StartNode", "start")
+    builder.add("ForLoopStartNode", "loop_start", mode="range", start=0, end=size, step=1)
+    builder.add("SetVariableNode", "body", variable_name="last", default_value="{{item}}")
+    builder.add("ForLoopEndNode", "loop_end", paired_start_id="loop_start")
+    builder.connect("start", "loop_start")
+    builder.connect("loop_start", "body", "body")
+    builder.connect("body", "loop_end")
+    builder.connect("loop_end", "loop_start")
+    builder.chain("loop_start", "done_", 1, port="completed")
+    return builder.workflow
+
+
+def build_fork_join(size: int, event_bus: EventBus) -> WorkflowSchema:
+    """ForkNode with ten branches of size // 10 nodes each, joined by JoinNode."""
+    builder = _WorkflowBuilder("bench_fork_join")
+    builder.add("StartNode", "start")
+    fork = builder.add("ForkNode", "fork", branch_count=_FORK_WIDTH)
+    join = builder.add("JoinNode", "join")
+    fork.set_paired_join(join.node_id)
+    join.set_paired_fork(fork.node_id)
+    builder.connect("start", "fork")
+    per_branch = max(1, size // _FORK_WIDTH)
+    for branch in range(1, _FORK_WIDTH + 1):
+        last = builder.chain("fork", f"b{branch}_", per_branch, port=f"branch_{branch}")
+        builder.connect(last, "join")
+    return builder.workflow
+
+
+class BenchNestedSubflowNode(BaseNode):
+    """Runs an inner subflow through SubflowExecutor (benchmark-only node)."""
+
+    def __init__(self, node_id: str, subflow: Any, event_bus: EventBus) -> None:
+        super().__init__(node_id, {})
+        self.node_type = "BenchNestedSubflowNode"
+        self._subflow = subflow
+        self._event_bus = event_bus
+
+    def _define_ports(self) -> None:
+        self.add_exec_input()
+        self.add_exec_output()
+
+    async def execute(self, context: Any) -> ExecutionResult:
+        from casare_rpa.application.use_cases.subflow_executor import SubflowExecutor
+
+        result = await SubflowExecutor(event_bus=self._event_bus).execute(
+            self._subflow, {}, context
+        )
+        self.status = NodeStatus.SUCCESS if result.success else NodeStatus.ERROR
+        return {
+            "success": result.success,
+            "error": result.error,
+            "next_nodes": ["exec_out"] if result.success else [],
+        }
+
+
+def build_nested_subflows(size: int, event_bus: EventBus) -> WorkflowSchema:
+    """Subflows nested size levels deep; each level runs one node and the next level."""
+    from casare_rpa.application.use_cases.subflow_executor import Subflow
+
+    inner: WorkflowSchema | None = None
+    for depth in range(size, -1, -1):
+        builder = _WorkflowBuilder(f"bench_subflow_{depth}")
+        builder.add("StartNode", "start")
+        last = builder.chain("start", f"set_{depth}_", 1)
+        if inner is not None:
+            nested = BenchNestedSubflowNode(
+                f"nested_{depth}", Subflow(workflow=inner, name=f"level_{depth + 1}"), event_bus
+            )
+            builder.add_instance(nested)
+            builder.connect(last, nested.node_id)
+        inner = builder.workflow
+    return inner
+
+
+def build_template_heavy(size: int, event_bus: EventBus) -> WorkflowSchema:
+    """size SetVariable nodes, each resolving twenty {{variable}} references."""
+    template = "-".join(f"{{{{v{i}}}}}" for i in range(_TEMPLATE_REFS))
+    builder = _WorkflowBuilder("bench_template_heavy")
+    builder.add("StartNode", "start")
+    builder.chain("start", "tpl_", size, variable_name="rendered", default_value=template)
+    return builder.workflow
+
+
+SCENARIOS: dict[str, BenchmarkScenario] = {
+    scenario.name: scenario
+    for scenario in (
+        BenchmarkScenario(
+            "linear_chain", "Linear chain of trivial nodes", build_linear_chain, 2000, 200
+        ),
+        BenchmarkScenario("loop", "10k-iteration ForLoop", build_loop, 10000, 300),
+        BenchmarkScenario("fork_join", "Ten-branch fork/join", build_fork_join, 2000, 200),
+        BenchmarkScenario(
+            "nested_subflows", "Deeply nested subflows", build_nested_subflows, 50, 10
+        ),
+        BenchmarkScenario(
+            "template_heavy",
+            "Nodes resolving many {{variable}} templates",
+            build_template_heavy,
+            2000,
+            200,
+            initial_variables={f"v{i}": f"value_{i}" for i in range(_TEMPLATE_REFS)},
+        ),
+    )
+}
+
+
+# =============================================================================
+# Running
+# =============================================================================
+
+
+def _rss_mb() -> float:
+    if not PSUTIL_AVAILABLE:
+        return 0.0
+    return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class _StepRecorder:
+    """Records NodeStarted timestamps and samples RSS."""
+
+    def __init__(self) -> None:
+        self.starts: list[float] = []
+        self.peak_rss_mb = _rss_mb()
+
+    def on_node_started(self, event: NodeStarted) -> None:
+        self.starts.append(time.perf_counter())
+        if len(self.starts) % _RSS_SAMPLE_EVERY == 0:
+            self.sample_rss()
+
+    def sample_rss(self) -> None:
+        self.peak_rss_mb = max(self.peak_rss_mb, _rss_mb())
+
+
+async def run_scenario(scenario: BenchmarkScenario, size: int | None = None) -> ScenarioResult:
+    """
+    Run one scenario and measure it.
+
+    Args:
+        scenario: Scenario to run
+        size: Override the scenario size (nodes, iterations or depth)
+
+    Returns:
+        ScenarioResult for this run
+    """
+    from casare_rpa.application.use_cases.execute_workflow import (
+        ExecuteWorkflowUseCase,
+        ExecutionSettings,
+    )
+
+    size = size or scenario.size
+    event_bus = EventBus()
+    workflow = scenario.build(size, event_bus)
+    recorder = _StepRecorder()
+    event_bus.subscribe(NodeStarted, recorder.on_node_started)
+
+    use_case = ExecuteWorkflowUseCase(
+        workflow=workflow,
+        event_bus=event_bus,
+        settings=ExecutionSettings(),
+        initial_variables=dict(scenario.initial_variables),
+    )
+
+    began = time.perf_counter()
+    success = await use_case.execute()
+    duration = time.perf_counter() - began
+    recorder.sample_rss()
+
+    steps = sorted(
+        (b - a) * 1_000_000 for a, b in zip(recorder.starts, recorder.starts[1:], strict=False)
+    )
+    nodes = len(recorder.starts)
+    return ScenarioResult(
+        name=scenario.name,
+        size=size,
+        nodes_executed=nodes,
+        duration_s=duration,
+        nodes_per_sec=nodes / duration if duration > 0 else 0.0,
+        p50_us=_percentile(steps, 50),
+        p99_us=_percentile(steps, 99),
+        peak_rss_mb=recorder.peak_rss_mb,
+        success=bool(success),
+    )
+
+
+async def run_suite(
+    names: Iterable[str] | None = None, quick: bool = False
+) -> list[ScenarioResult]:
+    """
+    Run the selected scenarios (all by default).
+
+    Args:
+        names: Scenario names to run
+        quick: Use the small sizes meant for CI and pytest
+
+    Returns:
+        One ScenarioResult per scenario, in order
+
+    Raises:
+        KeyError: If a scenario name is unknown
+    """
+    selected = [SCENARIOS[name] for name in (names or SCENARIOS)]
+    return [
+        await run_scenario(scenario, scenario.quick_size if quick else scenario.size)
+        for scenario in selected
+    ]
+
+
+# =============================================================================
+# Baselines
+# =============================================================================
+
+
+def save_baseline(results: list[ScenarioResult], path: Path = DEFAULT_BASELINE_PATH) -> None:
+    """Write results as a JSON baseline."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": BASELINE_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scenarios": {r.name: r.to_dict() for r in results},
+    }
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE_PATH) -> dict[str, ScenarioResult]:
+    """
+    Load a JSON baseline.
+
+    Returns:
+        Baseline results by scenario name (empty if the file does not exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        name: ScenarioResult.from_dict(entry) for name, entry in data.get("scenarios", {}).items()
+    }
+
+
+def compare_to_baseline(
+    results: list[ScenarioResult],
+    baseline: dict[str, ScenarioResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """
+    Find regressions past a relative threshold.
+
+    Throughput regresses when it drops below (1 - threshold) of the baseline;
+    latencies and peak RSS regress when they exceed (1 + threshold) of it.
+    Scenarios run at a different size than their baseline are skipped.
+
+    Returns:
+        Human-readable regression messages (empty when within threshold)
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if not result.success:
+            regressions.append(f"{result.name}: workflow failed")
+            continue
+        if base is None or base.size != result.size:
+            continue
+        if result.nodes_per_sec < base.nodes_per_sec * (1 - threshold):
+            regressions.append(
+                f"{result.name}: nodes/sec {result.nodes_per_sec:.0f} "
+                f"< baseline {base.nodes_per_sec:.0f}"
+            )
+        for metric in ("p50_us", "p99_us", "peak_rss_mb"):
+            value, reference = getattr(result, metric), getattr(base, metric)
+            if reference > 0 and value > reference * (1 + threshold):
+                regressions.append(
+                    f"{result.name}: {metric} {value:.1f} > baseline {reference:.1f}"
+                )
+    return regressions
+
+
+def format_results(results: list[ScenarioResult]) -> str:
+    """Format results as a plain-text table."""
+    lines = [
+        f"{'scenario':<18}{'nodes':>8}{'nodes/s':>10}{'p50 us':>10}{'p99 us':>10}{'rss MB':>9}",
+    ]
+    for r in results:
+        lines.append(
+            f"{r.name:<18}{r.nodes_executed:>8}{r.nodes_per_sec:>10.0f}"
+            f"{r.p50_us:>10.1f}{r.p99_us:>10.1f}{r.peak_rss_mb:>9.1f}"
+            + ("" if r.success else "  FAILED")
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "BenchmarkScenario",
+    "ScenarioResult",
+    "SCENARIOS",
+    "DEFAULT_BASELINE_PATH",
+    "DEFAULT_THRESHOLD",
+    "run_scenario",
+    "run_suite",
+    "save_baseline",
+    "load_baseline",
+    "compare_to_baseline",
+    "format_results",
+]
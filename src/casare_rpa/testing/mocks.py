@@ -136,10 +136,19 @@ class MockExecutionContext:
         """Get variable value."""
         return self.variables.get(name)
 
-    def set_variable(self, name: str, value: Any) -> None:
-        """Set variable value."""
+    def set_variable(self, name: str, value: Any, *, publish: bool = True) -> None:
+        """Set variable value (publish mirrors IExecutionContext; no events are emitted)."""
         self.variables[name] = value
-        self.call_log.append(("set_variable", (name, value), {}))
+        self.call_log.append(("set_variable", (name, value), {"publish": publish}))
+
+    def has_variable(self, name: str) -> bool:
+        """Check if a variable exists."""
+        return name in self.variables
+
+    def delete_variable(self, name: str) -> None:
+        """Delete a variable."""
+        self.variables.pop(name, None)
+        self.call_log.append(("delete_variable", (name,), {}))
 
     def get_service(self, name: str) -> Any:
         """Get a mock service by name."""
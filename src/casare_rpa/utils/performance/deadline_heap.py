@@ -0,0 +1,154 @@
+"""
+Deadline Heap for CasareRPA.
+
+PERFORMANCE: Tracks many expiring items (job timeouts, claim visibility
+timeouts, leases) without scanning all of them on every sweep.
+
+A min-heap ordered by deadline with lazy deletion:
+- schedule/reschedule: O(log n) push, the superseded entry becomes a tombstone
+- cancel: O(1), the heap entry is skipped when it reaches the top
+- pop_expired: cost proportional to the items actually expiring
+  (plus any tombstones that surface on the way)
+
+The heap is compacted once tombstones outnumber live entries, so frequent
+reschedules (heartbeats extending a lease) cannot grow it without bound.
+
+Not thread-safe; callers guard it with their own lock.
+
+Usage:
+    from casare_rpa.utils.performance.deadline_heap import DeadlineHeap
+
+    deadlines = DeadlineHeap()
+    deadlines.schedule_in("job-1", 30)
+    deadlines.schedule_in("job-1", 30)  # heartbeat: push the deadline out
+    for job_id in deadlines.pop_expired():
+        ...
+"""
+
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class DeadlineHeap:
+    """
+    Min-heap of (deadline, key) with O(1) cancellation.
+
+    Deadlines are floats on the heap's clock (time.monotonic by default).
+    Each key has at most one live deadline; scheduling it again replaces it.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize deadline heap.
+
+        Args:
+            clock: Function returning the current time in seconds
+        """
+        self._clock = clock
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._live: dict[Hashable, tuple[float, int]] = {}  # key -> (deadline, seq)
+        self._seq = itertools.count()
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """
+        Set the absolute deadline of a key, replacing any previous one.
+
+        Args:
+            key: Item identifier
+            deadline: Expiry time on the heap's clock
+        """
+        seq = next(self._seq)
+        self._live[key] = (deadline, seq)
+        heapq.heappush(self._heap, (deadline, seq, key))
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._compact()
+
+    def schedule_in(self, key: Hashable, delay_seconds: float) -> float:
+        """
+        Set a key to expire delay_seconds from now.
+
+        Returns:
+            The absolute deadline
+        """
+        deadline = self._clock() + delay_seconds
+        self.schedule(key, deadline)
+        return deadline
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Stop tracking a key.
+
+        Returns:
+            True if the key had a live deadline
+        """
+        return self._live.pop(key, None) is not None
+
+    def deadline(self, key: Hashable) -> float | None:
+        """Get the live deadline of a key, or None if not tracked."""
+        entry = self._live.get(key)
+        return entry[0] if entry else None
+
+    def remaining(self, key: Hashable) -> float | None:
+        """Get seconds until a key expires (never negative), or None if not tracked."""
+        entry = self._live.get(key)
+        if entry is None:
+            return None
+        return max(0.0, entry[0] - self._clock())
+
+    def next_deadline(self) -> float | None:
+        """Get the earliest live deadline, or None if empty."""
+        self._discard_stale_top()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_expired(self, now: float | None = None) -> list[Any]:
+        """
+        Remove and return every key whose deadline has passed.
+
+        Args:
+            now: Current time on the heap's clock (default: clock())
+
+        Returns:
+            Expired keys, earliest deadline first
+        """
+        if now is None:
+            now = self._clock()
+
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, seq, key = heapq.heappop(heap)
+            if self._live.get(key) == (deadline, seq):
+                del self._live[key]
+                expired.append(key)
+        return expired
+
+    def clear(self) -> None:
+        """Drop all deadlines."""
+        self._heap.clear()
+        self._live.clear()
+
+    def _discard_stale_top(self) -> None:
+        """Pop cancelled or superseded entries off the top of the heap."""
+        heap = self._heap
+        while heap:
+            deadline, seq, key = heap[0]
+            if self._live.get(key) == (deadline, seq):
+                return
+            heapq.heappop(heap)
+
+    def _compact(self) -> None:
+        """Rebuild the heap from live entries only."""
+        self._heap = [(deadline, seq, key) for key, (deadline, seq) in self._live.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._live
+
+
+__all__ = ["DeadlineHeap"]
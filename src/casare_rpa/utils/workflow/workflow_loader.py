@@ -21,6 +21,7 @@ from casare_rpa.domain.entities.base_node import BaseNode
 from casare_rpa.domain.entities.node_connection import NodeConnection
 from casare_rpa.domain.entities.workflow import WorkflowSchema
 from casare_rpa.domain.entities.workflow_metadata import WorkflowMetadata
+from casare_rpa.domain.services.execution_plan import compile_execution_plan
 from casare_rpa.domain.validation import (
     validate_workflow_json,
 )
@@ -251,10 +252,11 @@ def load_workflow_from_dict(
 
     # PERFORMANCE: Check workflow cache first
     cache_fingerprint = None
+    cache_size_bytes = 0
     if use_cache:
         cache = get_workflow_cache()
         fingerprint_data = dict(workflow_data)
-        cache_fingerprint = cache.compute_fingerprint(fingerprint_data)
+        cache_fingerprint, cache_size_bytes = cache.fingerprint_with_size(fingerprint_data)
         cached_workflow = cache.get(cache_fingerprint)
         if cached_workflow is not None:
             load_elapsed = (time.perf_counter() - load_start) * 1000
@@ -376,8 +378,13 @@ def load_workflow_from_dict(
         f"and {len(workflow.connections)} connections in {load_elapsed:.1f}ms"
     )
 
-    # PERFORMANCE: Cache the parsed workflow for future loads
+    # PERFORMANCE: Cache the parsed workflow (and its compiled routing plan) for future loads
     if use_cache and cache_fingerprint:
-        cache.put(cache_fingerprint, workflow)
+        cache.put(
+            cache_fingerprint,
+            workflow,
+            plan=compile_execution_plan(workflow),
+            size_bytes=cache_size_bytes,
+        )
 
     return workflow
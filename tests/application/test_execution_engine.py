@@ -1,8 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from casare_rpa.application.use_cases.execution_engine import WorkflowExecutionEngine
+from casare_rpa.application.use_cases.execution_state_manager import ExecutionStateManager
+from casare_rpa.domain.events import WorkflowPaused, WorkflowResumed
 
 
 @pytest.mark.asyncio
@@ -78,3 +81,223 @@ async def test_execution_engine_stop():
 
     # Should stop immediately
     assert node_executor.execute.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_execution_engine_routes_with_compiled_plan():
+    plan = MagicMock()
+    plan.is_control_flow.return_value = False
+    plan.next_nodes.side_effect = lambda nid, res: ["Node2"] if nid == "Node1" else []
+
+    orchestrator = MagicMock()
+    node_executor = AsyncMock()
+    state_manager = MagicMock()
+    state_manager.is_stopped = False
+    state_manager.executed_nodes = set()
+    state_manager.should_execute_node.return_value = True
+    state_manager.mark_target_reached.return_value = False
+    state_manager.pause_checkpoint = AsyncMock()
+
+    node = MagicMock()
+    node.output_ports = {}
+    exec_result = MagicMock()
+    exec_result.success = True
+    exec_result.result = {"next": "ok"}
+    node_executor.execute.return_value = exec_result
+
+    engine = WorkflowExecutionEngine(
+        orchestrator=orchestrator,
+        node_executor=node_executor,
+        variable_resolver=MagicMock(),
+        state_manager=state_manager,
+        node_getter=MagicMock(return_value=node),
+        context=MagicMock(),
+        plan=plan,
+    )
+
+    await engine.run_from_node("Node1")
+
+    assert node_executor.execute.call_count == 2
+    orchestrator.get_next_nodes.assert_not_called()
+    orchestrator.is_control_flow_node.assert_not_called()
+
+
+def _dataflow_engine(affinities, routes, dependencies, effects=None):
+    """Engine over mock nodes whose executor records concurrency (pure by default)."""
+    effects = effects or {}
+    orchestrator = MagicMock()
+    orchestrator.is_control_flow_node.return_value = False
+    orchestrator.get_next_nodes.side_effect = lambda nid, res: routes.get(nid, [])
+    orchestrator.build_dependency_graph.return_value = dependencies
+
+    executed = set()
+    state_manager = MagicMock()
+    state_manager.is_stopped = False
+    state_manager.executed_nodes = executed
+    state_manager.mark_node_executed.side_effect = executed.add
+    state_manager.should_execute_node.return_value = True
+    state_manager.mark_target_reached.return_value = False
+    state_manager.pause_checkpoint = AsyncMock()
+
+    nodes = {}
+    for node_id, affinity in affinities.items():
+        node = MagicMock()
+        node.node_id = node_id
+        node.output_ports = {}
+        node.get_resource_affinity.return_value = affinity
+        node.get_side_effects.return_value = effects.get(node_id, frozenset())
+        nodes[node_id] = node
+
+    trace = {"active": 0, "peak": 0, "order": []}
+
+    async def _execute(node):
+        trace["active"] += 1
+        trace["peak"] = max(trace["peak"], trace["active"])
+        await asyncio.sleep(0.01)
+        trace["active"] -= 1
+        trace["order"].append(node.node_id)
+        result = MagicMock()
+        result.success = True
+        result.result = {}
+        return result
+
+    node_executor = MagicMock()
+    node_executor.execute.side_effect = _execute
+
+    engine = WorkflowExecutionEngine(
+        orchestrator=orchestrator,
+        node_executor=node_executor,
+        variable_resolver=MagicMock(),
+        state_manager=state_manager,
+        node_getter=nodes.__getitem__,
+        context=MagicMock(),
+    )
+    return engine, trace
+
+
+async def test_dataflow_runs_independent_branches_concurrently():
+    routes = {"start": ["a", "b"], "a": ["join"], "b": ["join"]}
+    dependencies = {"start": set(), "a": {"start"}, "b": {"start"}, "join": {"a", "b"}}
+    engine, trace = _dataflow_engine(
+        {"start": None, "a": None, "b": None, "join": None}, routes, dependencies
+    )
+
+    await engine.run_dataflow_from_node("start")
+
+    assert trace["peak"] == 2
+    assert trace["order"][0] == "start"
+    assert trace["order"][-1] == "join"
+    assert trace["order"].count("join") == 1
+
+
+async def test_dataflow_serializes_shared_resource_affinity():
+    routes = {"start": ["a", "b"]}
+    dependencies = {"start": set(), "a": {"start"}, "b": {"start"}}
+    engine, trace = _dataflow_engine(
+        {"start": None, "a": "browser", "b": "browser"}, routes, dependencies
+    )
+
+    await engine.run_dataflow_from_node("start")
+
+    assert trace["peak"] == 1
+    assert trace["order"] == ["start", "a", "b"]
+
+
+@pytest.mark.parametrize(
+    ("effects", "peak"),
+    [
+        ({"a": None}, 1),
+        ({"a": frozenset({"file"}), "b": frozenset({"file", "http"})}, 1),
+        ({"a": frozenset({"variables"})}, 1),
+        ({"a": frozenset({"file"}), "b": frozenset({"http"})}, 2),
+    ],
+)
+async def test_dataflow_respects_declared_side_effects(effects, peak):
+    routes = {"start": ["a", "b"]}
+    dependencies = {"start": set(), "a": {"start"}, "b": {"start"}}
+    engine, trace = _dataflow_engine(
+        {"start": None, "a": None, "b": None}, routes, dependencies, effects
+    )
+
+    await engine.run_dataflow_from_node("start")
+
+    assert trace["peak"] == peak
+    assert sorted(trace["order"]) == ["a", "b", "start"]
+
+
+def _tracked_engine(on_execute):
+    """Engine over a real ExecutionStateManager for an A -> B -> C chain."""
+    routes = {"A": ["B"], "B": ["C"]}
+    orchestrator = MagicMock()
+    orchestrator.is_control_flow_node.return_value = False
+    orchestrator.get_next_nodes.side_effect = lambda nid, res: routes.get(nid, [])
+    orchestrator.build_dependency_graph.return_value = {"A": set(), "B": {"A"}, "C": {"B"}}
+
+    event_bus = MagicMock()
+    state_manager = ExecutionStateManager(
+        workflow=MagicMock(), orchestrator=orchestrator, event_bus=event_bus
+    )
+
+    async def _execute(node):
+        await on_execute(node.node_id, state_manager)
+        result = MagicMock()
+        result.success = True
+        result.result = {}
+        return result
+
+    node_executor = MagicMock()
+    node_executor.execute.side_effect = _execute
+
+    def _node(node_id):
+        node = MagicMock()
+        node.node_id = node_id
+        node.output_ports = {}
+        node.get_resource_affinity.return_value = None
+        node.get_side_effects.return_value = frozenset()
+        return node
+
+    engine = WorkflowExecutionEngine(
+        orchestrator=orchestrator,
+        node_executor=node_executor,
+        variable_resolver=MagicMock(),
+        state_manager=state_manager,
+        node_getter=_node,
+        context=MagicMock(),
+    )
+    return engine, state_manager, event_bus
+
+
+def _run(engine, mode):
+    if mode == "dataflow":
+        return engine.run_dataflow_from_node("A")
+    return engine.run_from_node("A")
+
+
+@pytest.mark.parametrize("mode", ["sequential", "dataflow"])
+async def test_stop_records_current_node(mode):
+    async def on_execute(node_id, state_manager):
+        if node_id == "B":
+            state_manager.stop()
+
+    engine, state_manager, _ = _tracked_engine(on_execute)
+
+    await _run(engine, mode)
+
+    assert state_manager.current_node_id == "B"
+    assert "C" not in state_manager.executed_nodes
+
+
+@pytest.mark.parametrize("mode", ["sequential", "dataflow"])
+async def test_pause_and_resume_events_carry_node_id(mode):
+    async def on_execute(node_id, state_manager):
+        if node_id == "B":
+            state_manager.pause_event.clear()
+            asyncio.get_running_loop().call_later(0.01, state_manager.pause_event.set)
+
+    engine, _, event_bus = _tracked_engine(on_execute)
+
+    await _run(engine, mode)
+
+    events = {type(call.args[0]): call.args[0] for call in event_bus.publish.call_args_list}
+    assert events[WorkflowPaused].paused_at_node_id == "B"
+    assert events[WorkflowResumed].resume_from_node_id == "B"
@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+from casare_rpa.application.use_cases.execution_handlers import ExecutionResultHandler
+from casare_rpa.application.use_cases.execution_state_manager import ExecutedNodeSet
+
+
+def test_executed_node_set_scope_reset():
+    executed = ExecutedNodeSet()
+    executed.add("start")
+    executed.add("a")
+    executed.add("b")
+
+    executed.reset_scope(("loop", "end"), {"a", "b"})
+
+    assert "start" in executed
+    assert "a" not in executed
+    assert "b" not in executed
+    # len() keeps counting nodes executed at least once
+    assert len(executed) == 3
+
+    executed.add("a")
+    assert "a" in executed
+    assert "b" not in executed
+
+
+def test_executed_node_set_nested_scopes():
+    executed = ExecutedNodeSet()
+    for node_id in ("inner_start", "x", "inner_end", "outer_tail"):
+        executed.add(node_id)
+
+    executed.reset_scope(("inner_start", "inner_end"), {"x"})
+    executed.add("x")
+    executed.reset_scope(
+        ("outer_start", "outer_end"), {"inner_start", "x", "inner_end", "outer_tail"}
+    )
+
+    assert "x" not in executed
+    assert "outer_tail" not in executed
+
+    executed.add("x")
+    executed.reset_scope(("inner_start", "inner_end"), {"x"})
+    assert "x" not in executed
+    executed.add("x")
+    assert "x" in executed
+
+
+def test_loop_back_uses_memoized_body_and_generation_reset():
+    orchestrator = MagicMock()
+    orchestrator.find_loop_body_nodes.return_value = frozenset({"a", "b"})
+    state_manager = MagicMock()
+    state_manager.executed_nodes = ExecutedNodeSet(["loop", "a", "b"])
+    handler = ExecutionResultHandler(
+        orchestrator=orchestrator,
+        state_manager=state_manager,
+        error_handler=MagicMock(),
+        settings=MagicMock(),
+        parallel_strategy=None,
+    )
+
+    queue: list[str] = []
+    handler._handle_loop_back("loop", "end", queue)
+
+    assert queue == ["loop"]
+    assert "loop" not in state_manager.executed_nodes
+    assert "a" not in state_manager.executed_nodes
+    assert "b" not in state_manager.executed_nodes
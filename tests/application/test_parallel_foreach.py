@@ -0,0 +1,214 @@
+import asyncio
+import copy
+import pickle
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from casare_rpa.application.use_cases.execution_strategies_parallel import (
+    ParallelExecutionStrategy,
+)
+from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.value_objects.types import DataType
+from casare_rpa.nodes.parallel_nodes import ParallelForEachNode
+
+
+class _Context:
+    """Dict-backed stand-in for the execution context."""
+
+    def __init__(self):
+        self.variables = {}
+        self.published = []
+
+    def has_variable(self, name):
+        return name in self.variables
+
+    def get_variable(self, name, default=None):
+        return self.variables.get(name, default)
+
+    def set_variable(self, name, value, *, publish=True):
+        self.variables[name] = value
+        if publish:
+            self.published.append(name)
+
+    def delete_variable(self, name):
+        self.variables.pop(name, None)
+
+    def clone_for_branch(self, name):
+        return _Context()
+
+
+class ScratchNode(BaseNode):
+    """Records what an item sees of a variable the previous item wrote."""
+
+    seen: list = []
+
+    def _define_ports(self):
+        self.add_exec_input()
+        self.add_exec_output()
+
+    async def execute(self, context):
+        self.seen.append(context.get_variable("scratch"))
+        context.set_variable("scratch", context.get_variable("index"))
+        return {"success": True}
+
+
+class SquareNode(BaseNode):
+    def _define_ports(self):
+        self.add_exec_input()
+        self.add_input_port("value", DataType.ANY)
+        self.add_output_port("squared", DataType.ANY)
+        self.add_exec_output()
+
+    async def execute(self, context):
+        value = self.get_input_value("value")
+        if value == "boom":
+            return {"success": False, "error": "boom"}
+        self.set_output_value("squared", value * value)
+        return {"success": True}
+
+
+def _harness(max_concurrency=3, chunk_size=4, body=None, **config):
+    loop = ParallelForEachNode(
+        "loop", config={"max_concurrency": max_concurrency, "chunk_size": chunk_size, **config}
+    )
+    body = body or SquareNode("body")
+    nodes = {"loop": loop, "body": body}
+    stats = {"active": 0, "peak": 0}
+
+    class _Executor:
+        def __init__(self, ctx):
+            self.ctx = ctx
+
+        async def execute(self, node):
+            stats["active"] += 1
+            stats["peak"] = max(stats["peak"], stats["active"])
+            await asyncio.sleep(0.001)
+            result = await node.execute(self.ctx)
+            stats["active"] -= 1
+            return SimpleNamespace(success=result["success"], result=result)
+
+    resolver = MagicMock()
+    resolver.transfer_inputs_to_node.side_effect = lambda node_id, context_override=None: (
+        body.set_input_value("value", loop.get_output_value("current_item"))
+        if "value" in body.input_ports
+        else None
+    )
+    orchestrator = MagicMock()
+    orchestrator.find_target_node.return_value = "body"
+    orchestrator.get_next_nodes.return_value = []
+    state_manager = MagicMock()
+    state_manager.is_stopped = False
+
+    strategy = ParallelExecutionStrategy(
+        context=_Context(),
+        event_bus=None,
+        node_getter=nodes.__getitem__,
+        state_manager=state_manager,
+        variable_resolver=resolver,
+        node_executor_factory=_Executor,
+        orchestrator=orchestrator,
+    )
+    return loop, strategy, stats
+
+
+async def _drive(loop, strategy, items):
+    context = strategy.context
+    loop.set_input_value("items", items)
+    passes = 0
+    result = await loop.execute(context)
+    while "parallel_foreach_batch" in result:
+        passes += 1
+        await strategy.execute_parallel_foreach_batch(result, "loop")
+        result = await loop.execute(context)
+    return result, passes
+
+
+async def test_bounded_concurrency_and_ordered_results():
+    loop, strategy, stats = _harness(max_concurrency=3, chunk_size=4)
+
+    result, passes = await _drive(loop, strategy, list(range(10)))
+
+    assert result["success"]
+    assert result["next_nodes"] == ["completed"]
+    assert passes == 3
+    assert stats["peak"] == 3
+    assert loop.get_output_value("results") == [{"squared": i * i} for i in range(10)]
+    # Per-chunk progress writes do not publish VARIABLE_SET
+    assert strategy.context.published == []
+
+
+async def test_async_iterator_source_is_consumed_lazily():
+    loop, strategy, _ = _harness(max_concurrency=2, chunk_size=3)
+    pulled = []
+
+    async def _items():
+        for i in range(5):
+            pulled.append(i)
+            yield i
+
+    source = _items()
+    loop.set_input_value("items", source)
+    first = await loop.execute(strategy.context)
+    await strategy.execute_parallel_foreach_batch(first, "loop")
+    assert pulled == [0, 1, 2]
+
+    result, _ = await _drive(loop, strategy, source)
+    # The state survives between passes, so the same source keeps streaming
+    assert result["success"]
+    assert [r["squared"] for r in loop.get_output_value("results")] == [0, 1, 4, 9, 16]
+
+
+async def test_item_error_policies():
+    loop, strategy, _ = _harness(on_item_error="skip")
+    result, _ = await _drive(loop, strategy, [1, "boom", 3])
+    assert result["success"]
+    assert result["data"]["errors"] == 1
+    assert loop.get_output_value("results") == [{"squared": 1}, {"squared": 9}]
+
+    loop, strategy, _ = _harness()
+    await _drive(loop, strategy, [1, "boom", 3])
+    assert loop.get_output_value("results") == [{"squared": 1}, None, {"squared": 9}]
+
+    loop, strategy, _ = _harness(max_concurrency=1, chunk_size=1, fail_fast=True)
+    result, passes = await _drive(loop, strategy, [1, "boom", 3, 4])
+    assert not result["success"]
+    assert passes == 2
+    assert loop.get_output_value("results") == [{"squared": 1}, None]
+
+
+def test_legacy_batch_size_maps_to_max_concurrency():
+    node = ParallelForEachNode("loop", config={"batch_size": 7})
+    assert node.config["max_concurrency"] == 7
+
+
+async def test_open_source_stays_out_of_variables():
+    loop, strategy, _ = _harness(max_concurrency=2, chunk_size=2)
+
+    loop.set_input_value("items", iter(range(5)))
+    first = await loop.execute(strategy.context)
+
+    # Loop state in variables must survive checkpoints, snapshots and branch clones
+    copy.deepcopy(strategy.context.variables)
+    pickle.dumps(strategy.context.variables)
+    progress = strategy.context.variables["loop_parallel_foreach"]
+    assert "source" not in progress and "results" not in progress
+
+    await strategy.execute_parallel_foreach_batch(first, "loop")
+    # The progress variable is replaced, never mutated in place
+    assert progress["index"] == 0
+    assert strategy.context.variables["loop_parallel_foreach"]["index"] == 2
+
+    result, _ = await _drive(loop, strategy, None)
+    assert result["success"]
+    assert [r["squared"] for r in loop.get_output_value("results")] == [0, 1, 4, 9, 16]
+    assert not loop._runtime
+
+
+async def test_item_variables_do_not_leak_between_items():
+    ScratchNode.seen = []
+    loop, strategy, _ = _harness(max_concurrency=1, chunk_size=2, body=ScratchNode("body"))
+
+    result, _ = await _drive(loop, strategy, list(range(4)))
+
+    assert result["success"]
+    assert ScratchNode.seen == [None, None, None, None]
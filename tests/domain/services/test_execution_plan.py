@@ -0,0 +1,95 @@
+"""
+Tests for the compiled ExecutionPlan.
+"""
+
+from casare_rpa.domain.entities.node_connection import NodeConnection
+from casare_rpa.domain.entities.workflow import WorkflowSchema
+from casare_rpa.domain.services.execution_orchestrator import ExecutionOrchestrator
+from casare_rpa.domain.services.execution_plan import compile_execution_plan
+
+
+def _node(node_id: str, node_type: str, **config) -> dict:
+    return {"node_id": node_id, "node_type": node_type, "config": config}
+
+
+def _loop_workflow() -> WorkflowSchema:
+    """start -> loop_start -body-> a -> b -> loop_end ; loop_start -completed-> done."""
+    workflow = WorkflowSchema()
+    for node in (
+        _node("start", "StartNode"),
+        _node("loop_start", "ForLoopStartNode"),
+        _node("a", "LogNode"),
+        _node("b", "LogNode"),
+        _node("loop_end", "ForLoopEndNode", paired_start_id="loop_start"),
+        _node("done", "LogNode"),
+        _node("try", "TryNode"),
+    ):
+        workflow.add_node(node)
+    for source, port, target, target_port in (
+        ("start", "exec_out", "loop_start", "exec_in"),
+        ("loop_start", "body", "a", "exec_in"),
+        ("loop_start", "completed", "done", "exec_in"),
+        ("a", "exec_out", "b", "exec_in"),
+        ("a", "result", "b", "value"),
+        ("b", "exec_out", "loop_end", "exec_in"),
+        ("done", "exec_out", "try", "exec_in"),
+        ("try", "try_body", "a", "exec_in"),
+    ):
+        workflow.add_connection(NodeConnection(source, port, target, target_port))
+    return workflow
+
+
+class TestExecutionPlan:
+    """Test plan compilation and routing lookups."""
+
+    def test_default_routing_skips_data_connections(self):
+        plan = compile_execution_plan(_loop_workflow())
+
+        assert plan.next_nodes("a") == ["b"]
+        assert plan.next_nodes("start", {"success": True}) == ["loop_start"]
+
+    def test_dynamic_routing_uses_selected_ports(self):
+        plan = compile_execution_plan(_loop_workflow())
+
+        assert plan.next_nodes("loop_start", {"next_nodes": ["body"]}) == ["a"]
+        assert plan.next_nodes("loop_start", {"next_nodes": ["completed"]}) == ["done"]
+        assert plan.next_nodes("loop_start", {"next_nodes": ["body", "completed"]}) == [
+            "a",
+            "done",
+        ]
+        assert plan.next_nodes("loop_end", {"next_nodes": []}) == []
+
+    def test_control_flow_classification(self):
+        plan = compile_execution_plan(_loop_workflow())
+
+        assert plan.is_control_flow("loop_start")
+        assert plan.is_control_flow("loop_end")
+        assert not plan.is_control_flow("a")
+        assert not plan.is_control_flow("missing")
+
+    def test_loop_and_try_bodies_precomputed(self):
+        plan = compile_execution_plan(_loop_workflow())
+
+        assert plan.get_loop_body("loop_start", "loop_end") == frozenset({"a", "b"})
+        assert plan.get_try_body("try") == frozenset({"a", "b", "loop_end"})
+
+    def test_orchestrator_matches_plan(self):
+        workflow = _loop_workflow()
+        plan = compile_execution_plan(workflow)
+        orchestrator = ExecutionOrchestrator(workflow, plan=plan)
+
+        assert orchestrator.plan is plan
+        assert orchestrator.find_loop_body_nodes("loop_start", "loop_end") == {"a", "b"}
+        assert orchestrator.get_next_nodes("loop_start", {"next_nodes": ["body"]}) == ["a"]
+        assert orchestrator.is_control_flow_node("loop_start")
+
+    def test_orchestrator_memoizes_uncompiled_loop_bodies(self):
+        workflow = _loop_workflow()
+        orchestrator = ExecutionOrchestrator(workflow)
+
+        # "b" is not a paired loop-back node, so the pair is not pre-compiled
+        first = orchestrator.find_loop_body_nodes("loop_start", "b")
+        second = orchestrator.find_loop_body_nodes("loop_start", "b")
+
+        assert first == {"a"}
+        assert first is second
@@ -0,0 +1,45 @@
+"""
+Tests for compiled variable templates.
+"""
+
+from casare_rpa.domain.services.variable_resolver import (
+    compile_template,
+    resolve_variables,
+)
+
+
+class TestCompiledTemplate:
+    """Test template compilation and rendering."""
+
+    def test_compile_is_memoized_by_string(self):
+        assert compile_template("Hello {{name}}") is compile_template("Hello {{name}}")
+
+    def test_single_variable_preserves_type(self):
+        template = compile_template(" {{ row.items[1] }} ")
+        variables = {"row": {"items": [1, [2, 3]]}}
+
+        assert template.single is not None
+        assert template.single.root == "row"
+        assert template.single.segments == ("items", 1)
+        assert template.render(variables) == [2, 3]
+
+    def test_interpolation_mixes_syntaxes(self):
+        template = compile_template("{{a}}-${b}-%c%-{{missing}}")
+
+        assert template.variable_paths == ["a", "b", "c", "missing"]
+        assert template.render({"a": 1, "b": None, "c": "x"}) == "1--x-{{missing}}"
+
+    def test_render_reflects_current_values(self):
+        variables = {"state": {"count": 1}}
+        template = compile_template("n={{state.count}}")
+
+        assert template.render(variables) == "n=1"
+        variables["state"]["count"] = 2
+        assert template.render(variables) == "n=2"
+
+    def test_plain_strings_have_no_variables(self):
+        assert not compile_template("50% done").has_variables
+        assert resolve_variables("50% done", {}) == "50% done"
+
+    def test_missing_single_variable_returns_original(self):
+        assert resolve_variables("{{nope}}", {}) == "{{nope}}"
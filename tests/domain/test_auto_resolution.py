@@ -11,6 +11,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.services.variable_resolver import compile_template
 from casare_rpa.domain.value_objects.types import DataType
 
 
@@ -136,6 +137,21 @@ class TestGetParameterAutoResolution:
         assert result is None
         mock_context.resolve_value.assert_not_called()
 
+    def test_plain_strings_skip_template_cache(self):
+        """Marker-free strings should neither compile nor reach resolve_value."""
+        node = AutoResolutionTestNode("test-node", {"message": "plain-value-without-markers"})
+
+        mock_context = MagicMock()
+        mock_context.resolve_value = MagicMock()
+        node.set_execution_context(mock_context)
+
+        compile_template.cache_clear()
+        result = node.get_parameter("message")
+
+        assert result == "plain-value-without-markers"
+        assert compile_template.cache_info().currsize == 0
+        mock_context.resolve_value.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_with_auto_resolution(self):
         """Full integration: execute() should get auto-resolved values."""
@@ -0,0 +1,99 @@
+"""
+Tests for copy-on-write layered variable scopes.
+"""
+
+from casare_rpa.domain.entities.layered_variables import LayeredVariables, MergePolicy
+
+
+class TestLayeredVariables:
+    """Test overlay reads, local writes and tombstones."""
+
+    def test_reads_parent_without_copying(self):
+        rows = list(range(1000))
+        parent = {"rows": rows, "name": "main"}
+        layer = LayeredVariables(parent)
+
+        assert layer["rows"] is rows
+        assert layer.get("name") == "main"
+        assert layer.local == {}
+        assert len(layer) == 2
+
+    def test_writes_and_deletes_stay_local(self):
+        parent = {"a": 1, "b": 2}
+        layer = LayeredVariables(parent)
+
+        layer["a"] = 10
+        layer["c"] = 3
+        del layer["b"]
+
+        assert dict(layer) == {"a": 10, "c": 3}
+        assert "b" not in layer
+        assert layer.get("b", "gone") == "gone"
+        assert parent == {"a": 1, "b": 2}
+        assert layer.deleted == frozenset({"b"})
+
+        layer["b"] = 5
+        assert layer["b"] == 5
+        assert layer.deleted == frozenset()
+
+    def test_nested_layers(self):
+        parent = {"a": 1}
+        outer = LayeredVariables(parent)
+        outer["b"] = 2
+        inner = outer.new_child()
+        del inner["a"]
+
+        assert dict(inner) == {"b": 2}
+        assert dict(outer) == {"a": 1, "b": 2}
+
+    def test_copy_and_clear(self):
+        layer = LayeredVariables({"a": 1})
+        layer["b"] = 2
+
+        snapshot = layer.copy()
+        assert type(snapshot) is dict
+        assert snapshot == {"a": 1, "b": 2}
+
+        layer.clear()
+        assert len(layer) == 0
+        assert layer.parent == {"a": 1}
+
+
+class TestMergePolicy:
+    """Test folding a layer back into its parent."""
+
+    def _layer(self):
+        parent = {"keep": 1, "shared": "parent", "drop": True}
+        layer = LayeredVariables(parent)
+        layer["shared"] = "branch"
+        layer["new"] = 42
+        layer["_branch_name"] = "b1"
+        del layer["drop"]
+        return parent, layer
+
+    def test_overwrite_applies_writes_and_deletes(self):
+        parent, layer = self._layer()
+
+        assert layer.merge_into(parent, MergePolicy.OVERWRITE) == 3
+        assert parent == {"keep": 1, "shared": "branch", "new": 42}
+
+    def test_keep_existing_only_adds_new_keys(self):
+        parent, layer = self._layer()
+
+        layer.merge_into(parent, MergePolicy.KEEP_EXISTING)
+        assert parent == {"keep": 1, "shared": "parent", "drop": True, "new": 42}
+
+    def test_namespaced_merges_only_branch_writes(self):
+        parent, layer = self._layer()
+        target = {}
+
+        layer.merge_into(target, MergePolicy.NAMESPACED, prefix="b1")
+        assert target == {"b1_shared": "branch", "b1_new": 42}
+
+    def test_merge_changes_does_not_touch_target(self):
+        parent, layer = self._layer()
+
+        writes, deletes = layer.merge_changes(parent, MergePolicy.OVERWRITE)
+        assert writes == {"shared": "branch", "new": 42}
+        assert deletes == ["drop"]
+        assert parent == {"keep": 1, "shared": "parent", "drop": True}
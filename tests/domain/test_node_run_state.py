@@ -0,0 +1,74 @@
+"""
+Tests for per-run node state isolation.
+"""
+
+import asyncio
+
+from casare_rpa.domain.entities.base_node import BaseNode
+from casare_rpa.domain.entities.node_run_state import isolated_node_state
+from casare_rpa.domain.value_objects.types import DataType, NodeStatus
+
+
+class RunStateTestNode(BaseNode):
+    """Node that records its input on its output port."""
+
+    def _define_ports(self):
+        self.add_exec_input()
+        self.add_input_port("value", DataType.ANY)
+        self.add_output_port("result", DataType.ANY)
+        self.add_exec_output()
+
+    async def execute(self, context):
+        await asyncio.sleep(0)
+        self.set_output_value("result", self.get_input_value("value"))
+        return {"success": True}
+
+
+class TestNodeRunState:
+    """Test that node run state is kept per execution."""
+
+    def test_without_store_uses_local_state(self):
+        node = RunStateTestNode("n1")
+        node.set_input_value("value", 1)
+        node.set_status(NodeStatus.SUCCESS)
+
+        assert node.get_input_value("value") == 1
+        assert node.input_ports["value"].value == 1
+        assert node.status == NodeStatus.SUCCESS
+
+        node.reset()
+        assert node.get_input_value("value") is None
+        assert node.status == NodeStatus.IDLE
+
+    def test_isolated_store_leaves_definition_untouched(self):
+        node = RunStateTestNode("n1")
+        node.set_input_value("value", "default")
+
+        with isolated_node_state() as store:
+            assert node.get_input_value("value") == "default"
+            node.set_input_value("value", "run")
+            node.status = NodeStatus.RUNNING
+            node.execution_count += 1
+            assert len(store) == 1
+            assert node.get_input_value("value") == "run"
+
+        assert node.get_input_value("value") == "default"
+        assert node.status == NodeStatus.IDLE
+        assert node.execution_count == 0
+
+    async def test_concurrent_runs_share_one_node(self):
+        node = RunStateTestNode("shared")
+
+        async def run(value):
+            with isolated_node_state():
+                node.set_input_value("value", value)
+                node.status = NodeStatus.RUNNING
+                await node.execute(None)
+                await asyncio.sleep(0)
+                return node.get_output_value("result"), node.status
+
+        results = await asyncio.gather(*(asyncio.create_task(run(i)) for i in range(5)))
+
+        assert [value for value, _ in results] == list(range(5))
+        assert all(status == NodeStatus.RUNNING for _, status in results)
+        assert node.get_output_value("result") is None
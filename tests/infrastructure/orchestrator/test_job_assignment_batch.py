@@ -0,0 +1,156 @@
+"""
+Tests for batch job assignment and the robot capability index.
+"""
+
+from casare_rpa.infrastructure.orchestrator.scheduling.capability_index import (
+    RobotCapabilityIndex,
+    iter_bits,
+)
+from casare_rpa.infrastructure.orchestrator.scheduling.job_assignment import (
+    CapabilityType,
+    JobAssignmentEngine,
+    JobRequirements,
+    RobotCapability,
+    RobotInfo,
+)
+
+BROWSER = RobotCapability(CapabilityType.BROWSER, "browser")
+OCR = RobotCapability(CapabilityType.OCR, "ocr")
+
+
+def _robot(n: int, **kwargs) -> RobotInfo:
+    kwargs.setdefault("capabilities", {"browser": True})
+    kwargs.setdefault("max_concurrent_jobs", 2)
+    return RobotInfo(robot_id=f"robot-{n}", name=f"Robot {n}", **kwargs)
+
+
+def _job(n: int, **kwargs) -> JobRequirements:
+    return JobRequirements(workflow_id=f"wf-{n}", workflow_name=f"Workflow {n}", **kwargs)
+
+
+class TestRobotCapabilityIndex:
+    """Test capability interning and robot set lookups."""
+
+    def test_robot_sets_by_capability_and_environment(self):
+        robots = [
+            _robot(0, capabilities={"browser": True, "ocr": True}),
+            _robot(1, capabilities={"browser": True}, environment="prod"),
+            _robot(2, capabilities={"ocr": "5.1"}, environment="staging"),
+        ]
+        index = RobotCapabilityIndex(robots)
+
+        assert list(iter_bits(index.robots_with([BROWSER, OCR]))) == [0]
+        assert list(iter_bits(index.robots_with([OCR]))) == [0, 2]
+        assert index.robots_with([RobotCapability(CapabilityType.GPU, "gpu")]) == 0
+        assert list(iter_bits(index.robots_for_environment("prod"))) == [0, 1]
+        assert index.robots_for_environment("default") == index.all_robots
+
+    def test_version_constraints_filter_candidates(self):
+        robots = [_robot(0, capabilities={"ocr": "4.0"}), _robot(1, capabilities={"ocr": "5.2"})]
+        index = RobotCapabilityIndex(robots)
+
+        required = RobotCapability(CapabilityType.OCR, "ocr", version=">=5.0")
+        assert list(iter_bits(index.robots_with([required]))) == [1]
+
+
+class TestAssignJobs:
+    """Test that batch assignment honors constraints, load and affinity."""
+
+    def test_single_job_matches_assign_job(self):
+        engine = JobAssignmentEngine()
+        robots = [
+            _robot(0, cpu_percent=90),
+            _robot(1, tags=["finance"]),
+            _robot(2, current_jobs=1),
+        ]
+        job = _job(1, preferred_tags=["finance"])
+
+        single = engine.assign_job(job, robots)
+        [batch] = engine.assign_jobs([job], robots)
+
+        assert batch.robot_id == single.robot_id
+        assert batch.score == single.score
+        assert batch.scores_breakdown == single.scores_breakdown
+
+    def test_load_is_spread_and_capacity_respected(self):
+        engine = JobAssignmentEngine()
+        robots = [_robot(n) for n in range(3)]
+
+        results = engine.assign_jobs([_job(1) for _ in range(7)], robots)
+
+        assigned = [r.robot_id for r in results if r is not None]
+        assert len(assigned) == 6
+        assert results[6] is None
+        assert {rid: assigned.count(rid) for rid in assigned} == {
+            "robot-0": 2,
+            "robot-1": 2,
+            "robot-2": 2,
+        }
+        # The first wave of jobs goes to idle robots before doubling up
+        assert sorted(assigned[:3]) == ["robot-0", "robot-1", "robot-2"]
+
+    def test_priority_capabilities_and_environment(self):
+        engine = JobAssignmentEngine()
+        robots = [
+            _robot(0, capabilities={"ocr": True}, max_concurrent_jobs=1),
+            _robot(1, environment="prod", max_concurrent_jobs=1),
+            _robot(2, environment="staging", max_concurrent_jobs=5),
+        ]
+        jobs = [
+            _job(1, required_capabilities=[OCR], priority=0),
+            _job(2, required_capabilities=[OCR], priority=3),
+            _job(3, environment="prod"),
+            _job(4, required_capabilities=[BROWSER], environment="dev"),
+        ]
+
+        results = engine.assign_jobs(jobs, robots)
+
+        assert results[0] is None  # lower priority lost the only OCR slot
+        assert results[1].robot_id == "robot-0"
+        assert results[2].robot_id == "robot-1"
+        assert results[3] is None
+
+    def test_state_affinity_is_preferred(self):
+        engine = JobAssignmentEngine()
+        robots = [_robot(n) for n in range(4)]
+        engine.record_job_completion("wf-stateful", "robot-3", success=True)
+
+        [result] = engine.assign_jobs(
+            [JobRequirements("wf-stateful", "Stateful", requires_state=True)], robots
+        )
+
+        assert result.robot_id == "robot-3"
+        assert result.scores_breakdown["state_affinity"] > 0
+
+    def test_large_wave(self):
+        engine = JobAssignmentEngine()
+        robots = [
+            _robot(
+                n,
+                capabilities={"browser": True, "ocr": n % 2 == 0},
+                environment="prod" if n % 4 == 0 else "default",
+                max_concurrent_jobs=6,
+                cpu_percent=(n * 7) % 100,
+            )
+            for n in range(400)
+        ]
+        jobs = [
+            _job(
+                n % 50,
+                required_capabilities=[BROWSER, OCR] if n % 3 == 0 else [BROWSER],
+                environment="prod" if n % 5 == 0 else "default",
+                priority=n % 4,
+            )
+            for n in range(2000)
+        ]
+
+        results = engine.assign_jobs(jobs, robots)
+
+        assert all(r is not None for r in results)
+        load: dict[str, int] = {}
+        for job, result in zip(jobs, results, strict=True):
+            load[result.robot_id] = load.get(result.robot_id, 0) + 1
+            robot = robots[int(result.robot_id.split("-")[1])]
+            if OCR in job.required_capabilities:
+                assert robot.capabilities["ocr"]
+        assert max(load.values()) <= 6
@@ -132,3 +132,68 @@ async def test_extend_lease_posts_correct_payload(monkeypatch):
 
     await consumer.stop()
     assert fake_client.closed is True
+
+
+@pytest.mark.asyncio
+async def test_extend_leases_posts_batch_and_returns_lost(monkeypatch):
+    monkeypatch.setattr(job_consumer_module, "UnifiedHttpClient", _FakeHttpClient)
+
+    consumer = OrchestratorJobConsumer(
+        OrchestratorJobConsumerConfig(base_url="https://orch.example", api_key="crpa_test_key")
+    )
+    await consumer.start()
+
+    fake_client = consumer._client
+    assert fake_client is not None
+
+    job_ids = ["11111111-1111-1111-1111-111111111111", "22222222-2222-2222-2222-222222222222"]
+    url = "https://orch.example/api/v1/jobs/extend-leases"
+    fake_client.set_response(
+        url, _FakeResponse(200, {"extended": [job_ids[0]], "lost": [job_ids[1]]})
+    )
+
+    lost = await consumer.extend_leases(job_ids, extension_seconds=60)
+
+    assert lost == [job_ids[1]]
+    assert fake_client.post_calls == [(url, {"job_ids": job_ids, "extension_seconds": 60})]
+
+    # Errors leave the outcome unknown, so nothing is reported lost
+    fake_client.set_response(url, _FakeResponse(500, {}, "boom"))
+    assert await consumer.extend_leases(job_ids) == []
+
+    await consumer.stop()
+
+
+@pytest.mark.asyncio
+async def test_claim_batch_posts_limit_and_parses_all(monkeypatch):
+    monkeypatch.setattr(job_consumer_module, "UnifiedHttpClient", _FakeHttpClient)
+
+    consumer = OrchestratorJobConsumer(
+        OrchestratorJobConsumerConfig(base_url="https://orch.example", api_key="crpa_test_key")
+    )
+    await consumer.start()
+
+    fake_client = consumer._client
+    assert fake_client is not None
+
+    rows = [
+        {
+            "job_id": f"{n}{n}{n}{n}{n}{n}{n}{n}-1111-1111-1111-111111111111",
+            "workflow_json": "{}",
+            "created_at": "2025-01-01T00:00:00Z",
+            "claimed_at": "2025-01-01T00:00:01Z",
+        }
+        for n in (1, 2, 3)
+    ]
+    url = "https://orch.example/api/v1/jobs/claim-batch"
+    fake_client.set_response(url, _FakeResponse(200, rows))
+
+    jobs = await consumer.claim_batch(limit=5)
+
+    assert [job.job_id for job in jobs] == [row["job_id"] for row in rows]
+    assert fake_client.post_calls[0] == (
+        url,
+        {"environment": "default", "limit": 5, "visibility_timeout_seconds": 30},
+    )
+
+    await consumer.stop()
@@ -0,0 +1,143 @@
+"""
+Tests for the SQLite-backed local storage repository.
+"""
+
+import json
+
+import pytest
+
+from casare_rpa.domain.orchestrator.entities import Job, JobStatus
+from casare_rpa.infrastructure.orchestrator.persistence import (
+    LocalJobRepository,
+    LocalStorageRepository,
+    SqliteStorageRepository,
+    get_local_storage,
+    reset_local_storage,
+)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    repo = SqliteStorageRepository(storage_dir=tmp_path)
+    yield repo
+    repo.close()
+
+
+def _job(n: int, status: str = "pending", robot_id: str = "robot-1") -> dict:
+    return {
+        "id": f"job-{n}",
+        "workflow_id": f"wf-{n % 2}",
+        "status": status,
+        "robot_id": robot_id,
+        "created_at": f"2026-01-01T00:00:{n:02d}",
+    }
+
+
+class TestSqliteStorageRepository:
+    """Test that SQLite storage matches the JSON storage interface."""
+
+    def test_wal_mode(self, storage):
+        mode = storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_upsert_keeps_order_and_updates_in_place(self, storage):
+        storage.save_robot({"id": "r1", "name": "one"})
+        storage.save_robot({"id": "r2", "name": "two"})
+        storage.save_robot({"id": "r1", "name": "renamed"})
+
+        assert storage.get_robots() == [
+            {"id": "r1", "name": "renamed"},
+            {"id": "r2", "name": "two"},
+        ]
+        assert storage.delete_robot("r1")
+        assert [r["id"] for r in storage.get_robots()] == ["r2"]
+
+    def test_job_filters_and_ordering(self, storage):
+        assert storage.save_jobs([_job(n, robot_id=f"robot-{n % 3}") for n in range(10)])
+        storage.save_job(_job(4, status="completed", robot_id="robot-1"))
+
+        assert [j["id"] for j in storage.get_jobs(limit=3)] == ["job-9", "job-8", "job-7"]
+        assert [j["id"] for j in storage.get_jobs(status="completed")] == ["job-4"]
+        assert [j["id"] for j in storage.get_jobs(robot_id="robot-0")] == [
+            "job-9",
+            "job-6",
+            "job-3",
+            "job-0",
+        ]
+        assert len(storage.get_jobs(workflow_id="wf-1")) == 5
+        assert storage.get_job("job-4")["status"] == "completed"
+        assert storage.get_job("missing") is None
+
+    def test_delete_triggers_by_scenario(self, storage):
+        for n in range(3):
+            storage.save_trigger({"id": f"t{n}", "scenario_id": "s1" if n else "s0"})
+
+        assert storage.delete_triggers_by_scenario("s1") == 2
+        assert [t["id"] for t in storage.get_triggers()] == ["t0"]
+
+    def test_import_json(self, tmp_path, storage):
+        json_dir = tmp_path / "legacy"
+        legacy = LocalStorageRepository(storage_dir=json_dir)
+        legacy.save_jobs([_job(n) for n in range(5)])
+        legacy.save_workflow({"id": "wf-0", "name": "Flow"})
+        (json_dir / "schedules.json").write_text("not json")
+
+        counts = storage.import_json(json_dir)
+        # Re-running the import is idempotent
+        storage.import_json(json_dir)
+
+        assert counts == {"robots": 0, "jobs": 5, "workflows": 1, "triggers": 0}
+        assert len(storage.get_jobs()) == 5
+        assert storage.get_workflows() == [{"id": "wf-0", "name": "Flow"}]
+        assert json.loads((json_dir / "jobs.json").read_text())[0]["id"] == "job-0"
+
+
+class TestGetLocalStorage:
+    """Test backend selection and the first-use JSON migration."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch):
+        monkeypatch.delenv("CASARE_LOCAL_STORAGE", raising=False)
+        yield
+        reset_local_storage()
+
+    def test_sqlite_by_default_and_migrates_json_once(self, tmp_path):
+        legacy = LocalStorageRepository(storage_dir=tmp_path)
+        legacy.save_jobs([_job(n) for n in range(3)])
+
+        storage = get_local_storage(tmp_path)
+
+        assert isinstance(storage, SqliteStorageRepository)
+        assert get_local_storage(tmp_path) is storage
+        assert len(storage.get_jobs()) == 3
+
+        # Later JSON writes are not re-imported over the database
+        legacy.save_jobs([_job(n) for n in range(5)])
+        reset_local_storage()
+        assert len(get_local_storage(tmp_path).get_jobs()) == 3
+
+    def test_json_backend_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CASARE_LOCAL_STORAGE", "json")
+
+        storage = get_local_storage(tmp_path)
+
+        assert isinstance(storage, LocalStorageRepository)
+        assert not (tmp_path / SqliteStorageRepository.DB_FILENAME).exists()
+
+
+class TestLocalJobRepositoryOnSqlite:
+    """Test the job repository adapter over SQLite storage."""
+
+    async def test_round_trip(self, storage):
+        repo = LocalJobRepository(storage)
+        jobs = [
+            Job(id=f"job-{n}", workflow_id="wf-1", workflow_name="Flow", robot_id="robot-1")
+            for n in range(3)
+        ]
+        await repo.save_many(jobs)
+        jobs[0].status = JobStatus.RUNNING
+        await repo.save(jobs[0])
+
+        assert (await repo.get_by_id("job-0")).status == JobStatus.RUNNING
+        assert len(await repo.get_by_robot("robot-1")) == 3
+        assert [j.id for j in await repo.get_by_status(JobStatus.RUNNING)] == ["job-0"]
@@ -0,0 +1,71 @@
+"""
+Tests for merging parallel branch variables back into the main context.
+"""
+
+import pytest
+
+from casare_rpa.domain.entities.layered_variables import MergePolicy
+from casare_rpa.domain.events import VariableSet, get_event_bus
+from casare_rpa.infrastructure.execution.execution_context import ExecutionContext
+
+
+@pytest.fixture
+def published():
+    events: list[VariableSet] = []
+    bus = get_event_bus()
+    bus.subscribe(VariableSet, events.append)
+    yield events
+    bus.unsubscribe(VariableSet, events.append)
+
+
+class TestMergeBranchResults:
+    """Test that merged branch writes go through set_variable/delete_variable."""
+
+    def test_namespaced_merge_publishes_and_marks_dirty(self, published):
+        context = ExecutionContext(workflow_name="wf", initial_variables={"base": 1})
+        branch = context.clone_for_branch("b1")
+        branch.set_variable("result", 42)
+        context.consume_variable_changes()
+        published.clear()
+
+        context.merge_branch_results("b1", branch._state.variables)
+
+        assert context.get_variable("b1_result") == 42
+        assert [e.variable_name for e in published] == ["b1_result"]
+        assert context.consume_variable_changes() == ({"b1_result"}, set())
+
+    def test_overwrite_merge_tracks_deletes(self, published):
+        context = ExecutionContext(workflow_name="wf", initial_variables={"base": 1, "old": 2})
+        branch = context.clone_for_branch("b1")
+        branch.set_variable("base", 10)
+        branch.delete_variable("old")
+        context.consume_variable_changes()
+
+        context.merge_branch_results("b1", branch._state.variables, MergePolicy.OVERWRITE)
+
+        assert context.get_variable("base") == 10
+        assert not context.has_variable("old")
+        assert context.consume_variable_changes() == ({"base"}, {"old"})
+
+
+class TestVariableSetPublishing:
+    """Test that VARIABLE_SET is only built for observers and non-iteration writes."""
+
+    def test_iteration_writes_are_not_published(self, published):
+        context = ExecutionContext(workflow_name="wf")
+
+        context.set_variable("item", 1, publish=False)
+        context.set_variable("total", 3)
+
+        assert [e.variable_name for e in published] == ["total"]
+        assert context.get_variable("item") == 1
+
+    def test_no_event_without_subscribers(self):
+        bus = get_event_bus()
+        bus.clear_history()
+        context = ExecutionContext(workflow_name="wf")
+
+        context.set_variable("total", 3)
+
+        assert not bus.has_subscribers(VariableSet)
+        assert bus.get_history(VariableSet) == []
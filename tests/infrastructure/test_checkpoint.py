@@ -0,0 +1,252 @@
+"""
+Tests for incremental robot checkpoints: dirty-set deltas, restore and compaction.
+"""
+
+import orjson
+import pytest
+
+from casare_rpa.infrastructure.execution.execution_context import ExecutionContext
+from casare_rpa.nodes.control_flow.loops import ForLoopStartNode
+from casare_rpa.robot.checkpoint import (
+    CHECKPOINT_KIND_BASE,
+    CHECKPOINT_KIND_DELTA,
+    CheckpointManager,
+)
+
+JOB_ID = "job-1"
+
+
+class _LatestOnlyQueue:
+    """Queue that can only return the most recent checkpoint."""
+
+    def __init__(self) -> None:
+        self.records: list[dict] = []
+
+    async def save_checkpoint(self, job_id, checkpoint_id, node_id, state):
+        # Serialize like a real queue so later mutation cannot leak in
+        self.records.append(
+            {"checkpoint_id": checkpoint_id, "state": orjson.loads(orjson.dumps(state))}
+        )
+        return True
+
+    async def get_latest_checkpoint(self, job_id):
+        return self.records[-1] if self.records else None
+
+    async def clear_checkpoints(self, job_id):
+        self.records.clear()
+
+
+class _LogQueue(_LatestOnlyQueue):
+    """Queue that exposes the job's whole checkpoint log."""
+
+    async def get_checkpoints(self, job_id):
+        return list(self.records)
+
+
+class _PruningQueue(_LogQueue):
+    """Log queue that also drops records superseded by a new base."""
+
+    async def delete_checkpoints_before(self, job_id, checkpoint_id):
+        ids = [r["checkpoint_id"] for r in self.records]
+        del self.records[: ids.index(checkpoint_id)]
+
+
+def _context(**variables) -> ExecutionContext:
+    context = ExecutionContext(initial_variables=variables)
+    context.consume_variable_changes()
+    return context
+
+
+def _kinds(queue) -> list[str]:
+    return [r["state"]["kind"] for r in queue.records]
+
+
+async def _run(manager, context, steps):
+    """Apply each mutation to the context and checkpoint after it."""
+    manager.start_job(JOB_ID, "wf")
+    for node_id, mutate in steps:
+        mutate(context)
+        await manager.save_checkpoint(node_id, context)
+
+
+def _set(**values):
+    def mutate(context):
+        for name, value in values.items():
+            context.set_variable(name, value)
+
+    return mutate
+
+
+STEPS = [
+    ("n1", _set(rows=[1], name="a")),
+    ("n2", lambda c: c.merge_branch_results("b1", {"merged": 1})),
+    ("n3", _set(rows=[1, 2])),
+    ("n4", lambda c: c.delete_variable("name")),
+    ("n5", lambda c: None),
+]
+
+
+class TestDeltaCheckpoints:
+    """Test delta content and base + delta replay."""
+
+    async def test_round_trip_through_deltas(self):
+        queue = _LogQueue()
+        manager = CheckpointManager(queue)
+        context = _context()
+
+        await _run(manager, context, STEPS)
+
+        assert _kinds(queue) == [CHECKPOINT_KIND_BASE] + [CHECKPOINT_KIND_DELTA] * 4
+        deltas = [r["state"] for r in queue.records[1:]]
+        assert deltas[0]["set_variables"] == {"b1_merged": 1}
+        assert deltas[1]["set_variables"] == {"rows": [1, 2]}
+        assert deltas[2]["deleted_variables"] == ["name"]
+        assert deltas[3]["set_variables"] == {}
+
+        state = await manager.get_checkpoint(JOB_ID)
+        assert state.variables == {"rows": [1, 2], "b1_merged": 1}
+        assert state.execution_path == ["n1", "n2", "n3", "n4", "n5"]
+        assert state.current_node_id == "n5"
+
+        restored = _context()
+        assert await manager.restore_from_checkpoint(state, restored)
+        assert restored.variables == context.variables
+        assert manager.get_executed_nodes() == {"n1", "n2", "n3", "n4", "n5"}
+
+    async def test_compaction_writes_periodic_base(self):
+        queue = _LogQueue()
+        manager = CheckpointManager(queue, compaction_interval=2)
+
+        await _run(manager, _context(), STEPS)
+
+        assert _kinds(queue) == ["base", "delta", "delta", "base", "delta"]
+        state = await manager.get_checkpoint(JOB_ID)
+        assert state.variables == {"rows": [1, 2], "b1_merged": 1}
+
+    async def test_untracked_writes_wait_for_next_base(self):
+        queue = _LogQueue()
+        manager = CheckpointManager(queue, compaction_interval=2)
+        context = _context(rows=[1])
+        manager.start_job(JOB_ID, "wf")
+        await manager.save_checkpoint("n1", context)
+
+        # In-place mutation bypasses set_variable(), so deltas skip it
+        context.variables["rows"].append(2)
+        await manager.save_checkpoint("n2", context)
+        assert queue.records[-1]["state"]["set_variables"] == {}
+
+        await manager.save_checkpoint("n3", context)
+        await manager.save_checkpoint("n4", context)
+        assert _kinds(queue) == ["base", "delta", "delta", "base"]
+        assert (await manager.get_checkpoint(JOB_ID)).variables == {"rows": [1, 2]}
+
+    async def test_cleared_variables_force_base(self):
+        queue = _LogQueue()
+        manager = CheckpointManager(queue)
+        context = _context(a=1)
+        manager.start_job(JOB_ID, "wf")
+        await manager.save_checkpoint("n1", context)
+
+        context.clear_variables()
+        context.set_variable("b", 2)
+        await manager.save_checkpoint("n2", context)
+
+        assert _kinds(queue) == ["base", "base"]
+        assert (await manager.get_checkpoint(JOB_ID)).variables == {"b": 2}
+
+    async def test_non_serializable_values_are_placeholders(self):
+        queue = _LogQueue()
+        manager = CheckpointManager(queue)
+        manager.start_job(JOB_ID, "wf")
+        context = _context(handle=object(), count=1)
+
+        await manager.save_checkpoint("n1", context)
+        context.set_variable("handle", object())
+        await manager.save_checkpoint("n2", context)
+
+        assert queue.records[0]["state"]["variables"]["handle"] == "<non-serializable: object>"
+        assert queue.records[1]["state"]["set_variables"] == {
+            "handle": "<non-serializable: object>"
+        }
+
+
+class TestLatestOnlyQueue:
+    """Test that queues without history always get restorable base snapshots."""
+
+    async def test_every_checkpoint_is_a_base(self):
+        queue = _LatestOnlyQueue()
+        manager = CheckpointManager(queue)
+        context = _context()
+
+        await _run(manager, context, STEPS)
+
+        assert not manager.supports_deltas
+        assert set(_kinds(queue)) == {CHECKPOINT_KIND_BASE}
+
+        state = await manager.get_checkpoint(JOB_ID)
+        assert state is not None
+        assert state.variables == context.variables
+        assert state.execution_path == ["n1", "n2", "n3", "n4", "n5"]
+
+    @pytest.mark.parametrize("queue_cls", [_LatestOnlyQueue, _LogQueue])
+    async def test_failed_save_restarts_with_base(self, queue_cls):
+        queue = queue_cls()
+        manager = CheckpointManager(queue)
+        context = _context(a=1)
+        manager.start_job(JOB_ID, "wf")
+        await manager.save_checkpoint("n1", context)
+
+        async def fail(**kwargs):
+            return False
+
+        save = queue.save_checkpoint
+        queue.save_checkpoint = fail
+        context.set_variable("a", 2)
+        assert await manager.save_checkpoint("n2", context) is None
+
+        queue.save_checkpoint = save
+        await manager.save_checkpoint("n3", context)
+        assert _kinds(queue) == ["base", "base"]
+        assert (await manager.get_checkpoint(JOB_ID)).variables == {"a": 2}
+
+
+class TestCompaction:
+    """Test pruning and restore against a queue that supports pruning."""
+
+    async def test_round_trip_and_compaction_prune(self):
+        queue = _PruningQueue()
+        manager = CheckpointManager(queue, compaction_interval=2)
+        context = _context()
+
+        await _run(manager, context, STEPS)
+
+        assert manager.supports_deltas
+        # The first base and its deltas were pruned by the second base
+        assert _kinds(queue) == ["base", "delta"]
+        state = await manager.get_checkpoint(JOB_ID)
+        assert state.variables == context.variables
+        assert state.execution_path == ["n1", "n2", "n3", "n4", "n5"]
+
+    async def test_restore_mid_loop_resumes_next_item(self):
+        queue = _PruningQueue()
+        manager = CheckpointManager(queue)
+        manager.start_job(JOB_ID, "wf")
+        context = _context()
+        loop = ForLoopStartNode("loop", config={"mode": "items"})
+        loop.set_input_value("items", ["a", "b", "c"])
+
+        # Two iterations, each checkpointed as a delta after the base
+        for _ in range(2):
+            assert (await loop.execute(context))["next_nodes"] == ["body"]
+            await manager.save_checkpoint("loop", context)
+        assert _kinds(queue) == ["base", "delta"]
+
+        restored = _context()
+        assert await manager.restore_from_checkpoint(await manager.get_checkpoint(JOB_ID), restored)
+        assert restored.variables["loop_loop_state"]["index"] == 2
+
+        resumed = ForLoopStartNode("loop", config={"mode": "items"})
+        assert (await resumed.execute(restored))["next_nodes"] == ["body"]
+        assert restored.get_variable("item") == "c"
+        assert (await resumed.execute(restored))["next_nodes"] == ["completed"]
+        assert "loop_loop_state" not in restored.variables
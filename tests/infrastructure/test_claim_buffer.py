@@ -0,0 +1,163 @@
+"""
+Tests for slot-filling batch claims and the robot prefetch buffer.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from casare_rpa.robot.agent import RobotAgent, RobotConfig
+from casare_rpa.robot.claim_buffer import ClaimBuffer
+
+
+def _job(n: int) -> SimpleNamespace:
+    return SimpleNamespace(job_id=f"{n:08d}-0000-0000-0000-000000000000")
+
+
+class _FakeConsumer:
+    def __init__(self, available: int) -> None:
+        self.available = [_job(n) for n in range(available)]
+        self.claim_limits: list[int] = []
+        self.claim_leases: list[int] = []
+        self.extended: list[tuple[list[str], int]] = []
+        self.lost: set[str] = set()
+        self.released: list[str] = []
+
+    async def claim_batch(self, limit: int, visibility_timeout_seconds: int):
+        self.claim_limits.append(limit)
+        self.claim_leases.append(visibility_timeout_seconds)
+        claimed, self.available = self.available[:limit], self.available[limit:]
+        return claimed
+
+    async def extend_leases(self, job_ids, extension_seconds: int):
+        self.extended.append((list(job_ids), extension_seconds))
+        return [job_id for job_id in job_ids if job_id in self.lost]
+
+    async def release_job(self, job_id: str) -> bool:
+        self.released.append(job_id)
+        return True
+
+
+class TestClaimBuffer:
+    """Test FIFO serving, expiry and fill metrics."""
+
+    def test_take_serves_oldest_first(self):
+        buffer = ClaimBuffer(capacity=3)
+        buffer.put([_job(1), _job(2), _job(3)])
+
+        ready, expired = buffer.take(2)
+
+        assert [j.job_id for j in ready] == [_job(1).job_id, _job(2).job_id]
+        assert expired == []
+        assert len(buffer) == 1
+        assert buffer.room == 2
+
+    def test_stale_jobs_are_expired(self):
+        buffer = ClaimBuffer(capacity=2, max_age_seconds=0.0)
+        buffer.put([_job(1), _job(2)])
+
+        ready, expired = buffer.take(1)
+
+        assert ready == []
+        assert len(expired) == 2
+        assert buffer.get_stats()["expired"] == 2
+
+    def test_fill_metrics(self):
+        buffer = ClaimBuffer()
+        buffer.record_claim(4)
+        buffer.record_fill(0.0)
+
+        stats = buffer.get_stats()
+        assert stats["claim_calls"] == 1
+        assert stats["jobs_claimed"] == 4
+        assert stats["fills"] == 1
+        assert stats["fill_max_ms"] >= stats["fill_last_ms"] > 0
+
+
+class TestAgentSlotFilling:
+    """Test that the job loop fills every free slot with one claim."""
+
+    @pytest.fixture
+    def agent(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CASARE_ROBOT_IDENTITY_PATH", str(tmp_path / "identity.json"))
+        config = RobotConfig(
+            robot_id="robot-test",
+            max_concurrent_jobs=4,
+            prefetch_count=2,
+            poll_interval_seconds=0.01,
+            enable_circuit_breaker=False,
+            log_dir=tmp_path / "logs",
+            checkpoint_path=tmp_path / "checkpoints",
+        )
+        return RobotAgent(config)
+
+    async def test_one_claim_fills_slots_and_prefetches(self, agent):
+        consumer = _FakeConsumer(available=10)
+        agent._consumer = consumer
+        release = asyncio.Event()
+
+        async def fake_execute(job):
+            await release.wait()
+
+        agent._execute_job_with_circuit_breaker = fake_execute
+        agent._running = True
+        loop_task = asyncio.create_task(agent._job_loop())
+        await asyncio.sleep(0.05)
+
+        assert consumer.claim_limits == [6]
+        assert len(agent._job_tasks) == 4
+        assert len(agent._claim_buffer) == 2
+        # Claimed on the short prefetch lease; only dispatched jobs get the full lease
+        assert consumer.claim_leases == [agent.config.prefetch_lease_seconds]
+        assert consumer.extended == [(list(agent._job_tasks), 30)]
+
+        # Freed slots take the 2 buffered jobs; one claim covers the other 2 plus the refill
+        release.set()
+        await asyncio.sleep(0.05)
+        assert consumer.claim_limits[1] == 4
+        assert agent._claim_buffer.get_stats()["buffer_hits"] >= 2
+
+        agent._running = False
+        loop_task.cancel()
+        await asyncio.gather(loop_task, return_exceptions=True)
+
+        buffered = agent._claim_buffer.drain()
+        await agent._release_jobs(buffered)
+        assert consumer.released == [job.job_id for job in buffered]
+
+    async def test_jobs_with_lapsed_lease_are_not_run(self, agent):
+        consumer = _FakeConsumer(available=6)
+        consumer.lost = {_job(0).job_id}
+        agent._consumer = consumer
+        dispatched = []
+
+        async def fake_execute(job):
+            dispatched.append(job.job_id)
+
+        agent._execute_job_with_circuit_breaker = fake_execute
+        agent._running = True
+        loop_task = asyncio.create_task(agent._job_loop())
+        await asyncio.sleep(0.02)
+        agent._running = False
+        loop_task.cancel()
+        await asyncio.gather(loop_task, return_exceptions=True)
+
+        assert _job(0).job_id not in dispatched
+        assert _job(1).job_id in dispatched
+
+
+class TestPrefetchConfig:
+    """Test that prefetched jobs cannot outlive their lease in the buffer."""
+
+    def test_prefetch_age_is_clamped_below_visibility_timeout(self):
+        config = RobotConfig(prefetch_max_age_seconds=60.0, visibility_timeout_seconds=30)
+
+        assert config.prefetch_max_age_seconds == 15.0
+        assert config.prefetch_max_age_seconds < config.prefetch_lease_seconds <= 30
+
+    def test_prefetch_lease_covers_buffer_age(self):
+        config = RobotConfig(prefetch_max_age_seconds=10.0, visibility_timeout_seconds=300)
+
+        assert config.prefetch_max_age_seconds == 10.0
+        assert config.prefetch_lease_seconds == 15
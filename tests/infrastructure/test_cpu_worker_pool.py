@@ -0,0 +1,106 @@
+"""
+Tests for the CPU worker pool and cpu_bound node offload.
+"""
+
+import asyncio
+import math
+import operator
+import time
+
+import pytest
+
+from casare_rpa.domain.services.cpu_offload import (
+    bind_cpu_offloader,
+    get_cpu_offloader,
+    run_cpu_bound,
+)
+from casare_rpa.infrastructure.agent.job_executor import JobExecutor
+from casare_rpa.infrastructure.execution.cpu_worker_pool import (
+    CpuWorkerPool,
+    get_cpu_worker_pool,
+    reset_cpu_worker_pool,
+)
+
+
+@pytest.fixture
+def pool():
+    pool = CpuWorkerPool(max_workers=1)
+    yield pool
+    pool.shutdown(wait=False)
+
+
+class TestCpuWorkerPool:
+    """Test running, timeouts and metrics."""
+
+    async def test_runs_in_worker_and_records_stats(self, pool):
+        assert await pool.run(operator.add, 2, 3) == 5
+        assert await pool.run(math.factorial, 10) == 3628800
+
+        stats = pool.get_stats()
+        assert stats["submitted"] == 2
+        assert stats["completed"] == 2
+        assert stats["in_flight"] == 0
+        assert stats["max_workers"] == 1
+        assert 0.0 <= stats["utilization"] <= 1.0
+
+    async def test_worker_exception_propagates(self, pool):
+        with pytest.raises(ValueError):
+            await pool.run(int, "not a number")
+        assert pool.stats.failed == 1
+
+    async def test_timeout_while_waiting_for_worker(self, pool):
+        await pool.run(operator.add, 0, 0)  # warm the single worker
+        running = asyncio.ensure_future(pool.run(time.sleep, 1.0))
+        await asyncio.sleep(0.1)
+
+        with pytest.raises(TimeoutError):
+            await pool.run(operator.add, 1, 1, timeout=0.05)
+        assert pool.stats.timed_out == 1
+
+        await running
+
+
+class TestCpuOffloadBinding:
+    """Test how nodes reach the offloader."""
+
+    async def test_unbound_runs_in_thread(self):
+        assert get_cpu_offloader() is None
+        assert await run_cpu_bound(operator.mul, 6, 7) == 42
+
+    async def test_bound_offloader_is_used(self):
+        calls = []
+
+        class RecordingOffloader:
+            async def run(self, func, *args, timeout=None):
+                calls.append((func, args, timeout))
+                return func(*args)
+
+        offloader = RecordingOffloader()
+        with bind_cpu_offloader(offloader):
+            assert get_cpu_offloader() is offloader
+            assert await run_cpu_bound(operator.add, 1, 2, timeout=5) == 3
+        assert get_cpu_offloader() is None
+        assert calls == [(operator.add, (1, 2), 5)]
+
+
+class TestExecutorTeardown:
+    """Test that executor shutdown releases the shared pool."""
+
+    def test_shutdown_resets_shared_pool(self):
+        executor = JobExecutor()
+        shared = executor._get_cpu_offloader()
+        assert shared is get_cpu_worker_pool()
+
+        executor.shutdown()
+
+        assert get_cpu_worker_pool() is not shared
+        reset_cpu_worker_pool()
+
+    def test_injected_offloader_is_left_running(self, pool):
+        shared = get_cpu_worker_pool()
+        executor = JobExecutor(cpu_offloader=pool)
+
+        executor.shutdown()
+
+        assert get_cpu_worker_pool() is shared
+        reset_cpu_worker_pool()
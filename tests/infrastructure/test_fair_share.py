@@ -0,0 +1,172 @@
+"""
+Tests for weighted fair-share claiming across tenants.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from casare_rpa.application.orchestrator.services.job_queue_manager import JobQueue
+from casare_rpa.domain.orchestrator.entities import Job, Robot, RobotStatus
+
+POSTGRES_URL = "postgresql://localhost/test"
+
+
+def _robot() -> Robot:
+    return Robot(
+        id="robot-1",
+        name="robot-1",
+        status=RobotStatus.ONLINE,
+        max_concurrent_jobs=100,
+    )
+
+
+def _enqueue(queue: JobQueue, tenant_id: str, workflow_id: str = "wf-1") -> Job:
+    job = Job(
+        id=str(uuid4()),
+        workflow_id=workflow_id,
+        workflow_name=workflow_id,
+        robot_id="unassigned",
+        tenant_id=tenant_id,
+    )
+    job.robot_id = ""
+    queue.enqueue(job, check_duplicate=False)
+    return job
+
+
+def _claim_tenants(queue: JobQueue, count: int) -> list[str]:
+    robot = _robot()
+    tenants = []
+    for _ in range(count):
+        job = queue.dequeue(robot)
+        tenants.append(job.tenant_id if job else None)
+    return tenants
+
+
+class TestJobQueueFairShare:
+    """Test tenant interleaving, weights and running caps in JobQueue."""
+
+    def test_without_fair_share_backlog_is_fifo(self):
+        queue = JobQueue()
+        for _ in range(3):
+            _enqueue(queue, "big")
+        _enqueue(queue, "small")
+
+        assert _claim_tenants(queue, 4) == ["big", "big", "big", "small"]
+
+    def test_tenants_are_interleaved(self):
+        queue = JobQueue(fair_share=True)
+        for _ in range(3):
+            _enqueue(queue, "big")
+        _enqueue(queue, "small")
+
+        assert _claim_tenants(queue, 4) == ["big", "small", "big", "big"]
+
+    def test_weights_skew_the_share(self):
+        queue = JobQueue(fair_share=True, tenant_weights={"gold": 3.0})
+        for _ in range(6):
+            _enqueue(queue, "gold")
+            _enqueue(queue, "bronze")
+
+        claimed = _claim_tenants(queue, 8)
+
+        assert claimed.count("gold") == 6
+        assert claimed.count("bronze") == 2
+
+    def test_running_cap_and_release(self):
+        queue = JobQueue(fair_share=True, tenant_max_running={"capped": 1})
+        _enqueue(queue, "capped")
+        _enqueue(queue, "capped")
+
+        first = queue.dequeue(_robot())
+        assert first.tenant_id == "capped"
+        assert queue.dequeue(_robot()) is None
+
+        queue.complete(first.id)
+        assert queue.dequeue(_robot()).tenant_id == "capped"
+
+    def test_per_workflow_shares(self):
+        queue = JobQueue(fair_share=True, fair_share_per_workflow=True)
+        for _ in range(2):
+            _enqueue(queue, "acme", "wf-a")
+        _enqueue(queue, "acme", "wf-b")
+
+        robot = _robot()
+        workflows = [queue.dequeue(robot).workflow_id for _ in range(3)]
+        assert workflows == ["wf-a", "wf-b", "wf-a"]
+
+
+class TestConsumerFairShareQuery:
+    """Test that PgQueuerConsumer picks the fair-share claim statement."""
+
+    @pytest.fixture(autouse=True)
+    def _require_asyncpg(self):
+        pytest.importorskip("asyncpg")
+
+    def test_config_rejects_non_positive_weights(self):
+        from casare_rpa.infrastructure.queue.pgqueuer_consumer import ConsumerConfig
+
+        with pytest.raises(ValueError):
+            ConsumerConfig(POSTGRES_URL, robot_id="robot-1", tenant_weights={"acme": 0})
+
+    async def test_claim_batch_passes_share_parameters(self):
+        from casare_rpa.infrastructure.queue.pgqueuer_consumer import (
+            ConsumerConfig,
+            PgQueuerConsumer,
+        )
+
+        consumer = PgQueuerConsumer(
+            ConsumerConfig(
+                postgres_url=POSTGRES_URL,
+                robot_id="robot-1",
+                fair_share=True,
+                tenant_weights={"gold": 3.0},
+                tenant_max_running={"bronze": 2},
+            )
+        )
+        calls = []
+
+        async def fake_execute(query, *args, max_retries=3):
+            calls.append((query, args))
+            return []
+
+        consumer._execute_with_retry = fake_execute
+
+        assert await consumer.claim_batch(limit=5) == []
+
+        query, args = calls[0]
+        assert "PARTITION BY tenant_id ORDER BY" in query
+        assert args[1:] == (5, "robot-1", 30, ["bronze", "gold"], [1.0, 3.0], [2, 0], 1.0, 0, 8)
+
+    def test_candidates_are_overselected_before_locking(self):
+        from casare_rpa.infrastructure.queue.pgqueuer_consumer import (
+            ConsumerConfig,
+            PgQueuerConsumer,
+        )
+
+        config = ConsumerConfig(
+            POSTGRES_URL, robot_id="robot-1", fair_share=True, fair_share_overselect=4
+        )
+        query, args = PgQueuerConsumer._build_claim_query(config)
+
+        # One tenant, limit 1: concurrent robots must see more than the single
+        # row ranked first, or the ones that skip its lock claim nothing
+        assert "share_rank <= $2 * $10" in query
+        assert args[-1] == 4
+        with pytest.raises(ValueError):
+            ConsumerConfig(POSTGRES_URL, robot_id="robot-1", fair_share_overselect=0)
+
+    def test_query_selection(self):
+        from casare_rpa.infrastructure.queue.pgqueuer_consumer import (
+            ConsumerConfig,
+            PgQueuerConsumer,
+        )
+
+        plain = ConsumerConfig(POSTGRES_URL, robot_id="robot-1")
+        per_workflow = ConsumerConfig(
+            POSTGRES_URL, robot_id="robot-1", fair_share=True, fair_share_per_workflow=True
+        )
+
+        assert PgQueuerConsumer._build_claim_query(plain) == (PgQueuerConsumer.SQL_CLAIM_JOB, ())
+        query, _ = PgQueuerConsumer._build_claim_query(per_workflow)
+        assert "tenant_id || '/' || workflow_id" in query
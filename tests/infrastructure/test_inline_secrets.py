@@ -192,6 +192,28 @@ class TestExecutionContextSecretResolution:
 
         assert resolved == f"https://api.example.com/auth?key={plaintext}"
 
+    def test_decrypted_secrets_not_cached(self, temp_store, execution_context, monkeypatch):
+        """Test that templates containing decrypted secrets bypass the template cache."""
+        from casare_rpa.domain.services.variable_resolver import compile_template
+
+        credential_id = temp_store.encrypt_inline_secret("apikey123")
+        execution_context.set_variable("host", "api.example.com")
+
+        monkeypatch.setattr(
+            "casare_rpa.infrastructure.security.credential_store.get_credential_store",
+            lambda: temp_store,
+        )
+
+        compile_template.cache_clear()
+        value = f"https://{{{{host}}}}/auth?key={{{{$secret:{credential_id}}}}}"
+        assert (
+            execution_context.resolve_value(value) == "https://api.example.com/auth?key=apikey123"
+        )
+        assert compile_template.cache_info().currsize == 0
+
+        assert execution_context.resolve_value("{{host}}") == "api.example.com"
+        assert compile_template.cache_info().currsize == 1
+
 
 @pytest.mark.skipif(
     "CI" in os.environ or os.environ.get("QT_QPA_PLATFORM") == "offscreen",
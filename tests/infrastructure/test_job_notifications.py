@@ -0,0 +1,268 @@
+"""
+Tests for LISTEN/NOTIFY job wakeups between PgQueuerProducer and PgQueuerConsumer.
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from casare_rpa.infrastructure.queue.job_notifications import (
+    ALL_ENVIRONMENTS_CHANNEL,
+    job_channel,
+    listen_channels,
+    notify_channels,
+)
+from casare_rpa.infrastructure.queue.pgqueuer_consumer import (
+    ConsumerConfig,
+    PgQueuerConsumer,
+)
+from casare_rpa.infrastructure.queue.pgqueuer_producer import (
+    JobSubmission,
+    PgQueuerProducer,
+    ProducerConfig,
+)
+
+WORKFLOW_JSON = '{"nodes": {}, "connections": []}'
+
+
+def _consumer(**overrides) -> PgQueuerConsumer:
+    values = {
+        "postgres_url": "postgresql://localhost/test",
+        "robot_id": "robot-001",
+        "claim_poll_interval_seconds": 0.01,
+        "fallback_poll_interval_seconds": 0.05,
+        "notify_jitter_seconds": 0.0,
+    }
+    values.update(overrides)
+    return PgQueuerConsumer(ConsumerConfig(**values))
+
+
+class TestChannels:
+    """Test environment to channel routing."""
+
+    def test_channel_name_is_bounded(self):
+        assert job_channel("production") == "casare_jobs_production"
+        long_channel = job_channel("x" * 100)
+        assert len(long_channel) <= 63
+        assert long_channel == job_channel("x" * 100)
+        assert long_channel != job_channel("y" * 100)
+
+    @pytest.mark.parametrize(
+        ("job_env", "robot_env", "woken"),
+        [
+            ("default", "default", True),
+            ("default", "production", True),
+            ("production", "production", True),
+            ("production", "default", True),
+            ("production", "staging", False),
+        ],
+    )
+    def test_routing_matches_claim_filter(self, job_env, robot_env, woken):
+        overlap = set(notify_channels(job_env)) & set(listen_channels(robot_env))
+        assert bool(overlap) is woken
+
+    def test_default_jobs_skip_all_environments_channel(self):
+        assert ALL_ENVIRONMENTS_CHANNEL not in notify_channels("default")
+
+
+class TestProducerNotify:
+    """Test NOTIFY emission on enqueue."""
+
+    async def test_notifies_each_channel_with_count(self):
+        producer = PgQueuerProducer(ProducerConfig(postgres_url="postgresql://localhost/test"))
+        sent = []
+
+        async def fake_execute(query, *args, max_retries=3):
+            sent.append(args)
+            return []
+
+        producer._execute_with_retry = fake_execute
+        await producer._notify_jobs_available({"production": 3, "default": 1})
+
+        assert sent == [
+            ("casare_jobs_production", "3"),
+            (ALL_ENVIRONMENTS_CHANNEL, "3"),
+            ("casare_jobs_default", "1"),
+        ]
+
+    async def test_notify_failure_does_not_raise(self):
+        producer = PgQueuerProducer(ProducerConfig(postgres_url="postgresql://localhost/test"))
+
+        async def failing_execute(query, *args, max_retries=3):
+            raise ConnectionError("down")
+
+        producer._execute_with_retry = failing_execute
+        await producer._notify_jobs_available({"default": 1})
+
+    async def test_disabled_sends_nothing(self):
+        producer = PgQueuerProducer(
+            ProducerConfig(postgres_url="postgresql://localhost/test", notify_on_enqueue=False)
+        )
+
+        async def fail_if_called(*args, **kwargs):
+            raise AssertionError("notify should be disabled")
+
+        producer._execute_with_retry = fail_if_called
+        await producer._notify_jobs_available({"default": 1})
+
+
+class _Connection:
+    """asyncpg connection stand-in recording statements per transaction."""
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, tuple, bool]] = []
+        self.in_transaction = False
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+    async def execute(self, query, *args):
+        self.statements.append((query, args, self.in_transaction))
+
+    async def fetch(self, query, *args):
+        self.statements.append((query, args, self.in_transaction))
+        now = datetime.now(UTC)
+        return [
+            {
+                "id": args[0],
+                "workflow_id": args[1],
+                "workflow_name": args[2],
+                "priority": args[4],
+                "environment": args[5],
+                "created_at": now,
+                "visible_after": now,
+            }
+        ]
+
+
+class TestEnqueueOnConnection:
+    """Test enqueues made on caller-owned connections (API routers)."""
+
+    async def test_notifies_inside_the_insert_transaction(self):
+        conn = _Connection()
+        job_id = str(uuid.uuid4())
+        submission = JobSubmission(
+            workflow_id="wf-1",
+            workflow_name="Retry",
+            workflow_json=WORKFLOW_JSON,
+            environment="production",
+        )
+
+        job = await PgQueuerProducer.enqueue_on_connection(conn, submission, job_id=job_id)
+
+        assert job.job_id == job_id
+        notifies = [args for query, args, _ in conn.statements if "pg_notify" in query]
+        assert notifies == [("casare_jobs_production", "1"), (ALL_ENVIRONMENTS_CHANNEL, "1")]
+        assert all(in_transaction for _, _, in_transaction in conn.statements)
+
+    async def test_delayed_job_is_left_to_the_sweep(self):
+        conn = _Connection()
+        submission = JobSubmission(
+            workflow_id="wf-1", workflow_name="Later", workflow_json=WORKFLOW_JSON, delay_seconds=30
+        )
+
+        await PgQueuerProducer.enqueue_on_connection(conn, submission)
+
+        assert not [query for query, _, _ in conn.statements if "pg_notify" in query]
+
+
+class TestClaimableSweep:
+    """Test NOTIFY for jobs whose visible_after passed (delays, backoff)."""
+
+    async def test_sweep_notifies_newly_visible_jobs(self):
+        producer = PgQueuerProducer(
+            ProducerConfig(
+                postgres_url="postgresql://localhost/test",
+                claimable_sweep_interval_seconds=0.001,
+            )
+        )
+        producer._running = True
+        swept_at = datetime.now(UTC)
+        sweeps = []
+        sent = []
+
+        async def fake_execute(query, *args, max_retries=3):
+            if query == producer.SQL_NOTIFY_JOBS:
+                sent.append(args)
+                return []
+            sweeps.append(args[0])
+            if len(sweeps) == 2:
+                producer._running = False
+                return [{"swept_at": swept_at, "environment": "default", "count": 2}]
+            return [{"swept_at": swept_at, "environment": None, "count": 0}]
+
+        producer._execute_with_retry = fake_execute
+        await asyncio.wait_for(producer._sweep_claimable_loop(), 1.0)
+
+        assert sweeps == [None, swept_at]
+        assert sent == [("casare_jobs_default", "2")]
+
+
+class TestConsumerRequeueNotify:
+    """Test NOTIFY when jobs go back to the queue from a robot."""
+
+    async def test_release_and_lease_expiry_notify(self):
+        consumer = _consumer(environment="production")
+        sent = []
+
+        async def fake_execute(query, *args, max_retries=3):
+            if query == consumer.SQL_NOTIFY_JOBS:
+                sent.append(args)
+                return []
+            if query == consumer.SQL_RELEASE_JOB:
+                return [{"id": args[0], "environment": "default"}]
+            return [
+                {"id": uuid.uuid4(), "status": "pending", "environment": "production"},
+                {"id": uuid.uuid4(), "status": "failed", "environment": "production"},
+            ]
+
+        consumer._execute_with_retry = fake_execute
+
+        assert await consumer.release_job(str(uuid.uuid4()))
+        assert await consumer.requeue_timed_out_jobs() == 2
+
+        assert sent == [
+            ("casare_jobs_default", "1"),
+            ("casare_jobs_production", "1"),
+            (ALL_ENVIRONMENTS_CHANNEL, "1"),
+        ]
+
+
+class TestConsumerWait:
+    """Test wait_for_jobs wakeups and fallback polling."""
+
+    async def test_notification_wakes_waiter(self):
+        consumer = _consumer(fallback_poll_interval_seconds=5.0)
+        consumer._listening = True
+
+        waiter = asyncio.ensure_future(consumer.wait_for_jobs())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        consumer._on_job_notification(None, 1, "casare_jobs_default", "1")
+
+        assert await asyncio.wait_for(waiter, 1.0) is True
+        assert not consumer._jobs_available.is_set()
+
+    async def test_listening_falls_back_to_slow_poll(self):
+        consumer = _consumer()
+        consumer._listening = True
+
+        assert await consumer.wait_for_jobs() is False
+
+    async def test_not_listening_polls(self):
+        consumer = _consumer()
+        consumer._on_job_notification(None, 1, "casare_jobs_default", "1")
+
+        assert await consumer.wait_for_jobs() is False
+        assert consumer.get_stats()["is_listening"] is False
@@ -0,0 +1,250 @@
+"""
+Tests for keyset pagination cursors, paged queries and streaming exports.
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+import orjson
+import pytest
+
+from casare_rpa.domain.value_objects.log_entry import LogLevel, LogQuery
+from casare_rpa.infrastructure.orchestrator.api.adapters import MonitoringDataAdapter
+from casare_rpa.infrastructure.orchestrator.api.export import streaming_export
+from casare_rpa.infrastructure.persistence.keyset_cursor import decode_cursor, encode_cursor
+from casare_rpa.infrastructure.persistence.repositories.log_repository import LogRepository
+
+NOW = datetime(2026, 10, 16, 12, 0, tzinfo=UTC)
+TENANT = str(uuid.uuid4())
+
+
+class _FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeConnection:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.calls: list[tuple[str, tuple]] = []
+
+    async def fetch(self, query, *params):
+        self.calls.append((query, params))
+        limit = params[-1]
+        return self.rows[:limit]
+
+    def transaction(self):
+        return _FakeTransaction()
+
+    async def cursor(self, query, *params, prefetch):
+        self.calls.append((query, params))
+        for row in self.rows:
+            yield row
+
+
+class _FakePool:
+    def __init__(self, conn) -> None:
+        self.conn = conn
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+
+def _log_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "robot_id": str(uuid.uuid4()),
+            "tenant_id": TENANT,
+            "timestamp": NOW - timedelta(seconds=n),
+            "level": "INFO",
+            "message": f"log {n}",
+            "source": None,
+            "extra": "{}",
+        }
+        for n in range(count)
+    ]
+
+
+def _job_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "job_id": str(uuid.uuid4()),
+            "workflow_id": "wf-1",
+            "workflow_name": "Flow",
+            "robot_id": "robot-1",
+            "status": "completed",
+            "created_at": NOW - timedelta(seconds=n),
+            "completed_at": None,
+            "duration_ms": None,
+        }
+        for n in range(count)
+    ]
+
+
+class TestCursor:
+    """Test the opaque continuation token."""
+
+    def test_round_trip(self):
+        row_id = str(uuid.uuid4())
+        token = encode_cursor(NOW, row_id)
+
+        assert "=" not in token
+        assert decode_cursor(token) == (NOW, row_id)
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", encode_cursor(NOW, "x")[:-3]])
+    def test_malformed_token(self, token):
+        with pytest.raises(ValueError):
+            decode_cursor(token)
+
+
+class TestLogQueryPage:
+    """Test keyset paging in LogRepository."""
+
+    @pytest.fixture
+    def repo(self):
+        repo = LogRepository(pool_manager=cast(Any, object()))
+        repo.conn = _FakeConnection(_log_rows(5))
+
+        async def get_connection():
+            return repo.conn
+
+        async def release_connection(conn):
+            pass
+
+        repo._get_connection = get_connection
+        repo._release_connection = release_connection
+        return repo
+
+    async def test_pages_until_exhausted(self, repo):
+        query = LogQuery(tenant_id=TENANT, min_level=LogLevel.INFO, limit=3)
+
+        entries, cursor = await repo.query_page(query)
+        assert [e.message for e in entries] == ["log 0", "log 1", "log 2"]
+        assert decode_cursor(cursor) == (entries[-1].timestamp, entries[-1].id)
+
+        sql, params = repo.conn.calls[0]
+        assert "OFFSET" not in sql
+        assert "ORDER BY timestamp DESC, id DESC" in sql
+        assert params[1] == ["INFO", "WARNING", "ERROR", "CRITICAL"]
+        assert params[-1] == 4
+
+        repo.conn.rows = repo.conn.rows[3:]
+        entries, cursor = await repo.query_page(query, cursor=cursor)
+        assert [e.message for e in entries] == ["log 3", "log 4"]
+        assert cursor is None
+
+        sql, params = repo.conn.calls[1]
+        assert "(timestamp, id) < ($3, $4::uuid)" in sql
+
+    async def test_filters_are_parameterized(self, repo):
+        query = LogQuery(
+            tenant_id=TENANT,
+            robot_id=str(uuid.uuid4()),
+            source="agent",
+            search_text="boom'; --",
+        )
+
+        await repo.query_page(query)
+
+        sql, params = repo.conn.calls[0]
+        assert "boom" not in sql
+        assert params[2:5] == (query.robot_id, "agent", "boom'; --")
+
+    async def test_iter_entries_streams_all_rows(self, repo):
+        query = LogQuery(tenant_id=TENANT, limit=2)
+
+        messages = [entry.message async for entry in repo.iter_entries(query)]
+
+        assert len(messages) == 5
+        assert "LIMIT" not in repo.conn.calls[0][0]
+
+
+class TestJobHistoryPage:
+    """Test keyset paging and streaming of job history."""
+
+    def _adapter(self, conn):
+        return MonitoringDataAdapter(
+            metrics_collector=cast(Any, object()),
+            analytics_aggregator=cast(Any, object()),
+            db_pool=cast(Any, _FakePool(conn)),
+        )
+
+    async def test_next_cursor_and_seek(self):
+        conn = _FakeConnection(_job_rows(3))
+        adapter = self._adapter(conn)
+
+        jobs, cursor = await adapter.get_job_history_page(limit=2)
+        assert len(jobs) == 2
+        assert decode_cursor(cursor) == (jobs[-1]["created_at"], jobs[-1]["job_id"])
+
+        await adapter.get_job_history_page(limit=2, status="completed", cursor=cursor)
+        sql, params = conn.calls[1]
+        assert "AND (created_at, id) < ($2, $3::uuid)" in sql
+        assert params == ("completed", jobs[-1]["created_at"], jobs[-1]["job_id"], 3)
+
+    async def test_invalid_cursor_raises(self):
+        adapter = self._adapter(_FakeConnection([]))
+
+        with pytest.raises(ValueError):
+            await adapter.get_job_history_page(cursor="garbage")
+
+    async def test_iter_job_history(self):
+        adapter = self._adapter(_FakeConnection(_job_rows(4)))
+
+        jobs = [job async for job in adapter.iter_job_history(robot_id="robot-1")]
+
+        assert len(jobs) == 4
+
+
+class TestStreamingExport:
+    """Test NDJSON and CSV encoding of streamed rows."""
+
+    @staticmethod
+    async def _body(response) -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    @staticmethod
+    async def _rows():
+        for row in _job_rows(3):
+            yield row
+
+    async def test_ndjson(self):
+        response = streaming_export(self._rows(), "ndjson", "jobs", ["job_id"])
+
+        lines = (await self._body(response)).splitlines()
+        assert response.media_type == "application/x-ndjson"
+        assert len(lines) == 3
+        assert orjson.loads(lines[0])["status"] == "completed"
+
+    async def test_csv(self):
+        response = streaming_export(self._rows(), "csv", "jobs", ["job_id", "created_at"])
+
+        lines = (await self._body(response)).decode().splitlines()
+        assert response.headers["content-disposition"] == 'attachment; filename="jobs.csv"'
+        assert lines[0] == "job_id,created_at"
+        assert len(lines) == 4
+        assert lines[1].endswith(NOW.isoformat())
+
+    async def test_mid_stream_error_aborts(self):
+        async def failing_rows():
+            yield _job_rows(1)[0]
+            raise ConnectionError("connection lost")
+
+        response = streaming_export(failing_rows(), "ndjson", "jobs", ["job_id"])
+
+        with pytest.raises(ConnectionError):
+            await self._body(response)
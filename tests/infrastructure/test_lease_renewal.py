@@ -0,0 +1,165 @@
+"""
+Tests for batched lease renewal in PgQueuerConsumer and lost-lease handling
+in RobotAgent.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from casare_rpa.infrastructure.queue.pgqueuer_consumer import (
+    ConsumerConfig,
+    PgQueuerConsumer,
+)
+from casare_rpa.robot.agent import RobotAgent, RobotConfig
+
+JOB_A = "11111111-1111-1111-1111-111111111111"
+JOB_B = "22222222-2222-2222-2222-222222222222"
+
+
+@pytest.fixture
+def consumer():
+    return PgQueuerConsumer(
+        ConsumerConfig(postgres_url="postgresql://localhost/test", robot_id="robot-001")
+    )
+
+
+class TestExtendLeases:
+    """Test one-statement lease renewal and lost-lease reporting."""
+
+    async def test_single_statement_reports_lost(self, consumer):
+        calls = []
+
+        async def fake_execute(query, *args, max_retries=3):
+            calls.append((query, args))
+            return [{"id": uuid.UUID(JOB_A)}]
+
+        consumer._execute_with_retry = fake_execute
+
+        lost = await consumer.extend_leases([JOB_A, JOB_B], extension_seconds=45)
+
+        assert lost == [JOB_B]
+        assert len(calls) == 1
+        query, args = calls[0]
+        assert query == PgQueuerConsumer.SQL_EXTEND_LEASES
+        assert args == ([uuid.UUID(JOB_A), uuid.UUID(JOB_B)], 45, "robot-001")
+
+    async def test_empty_batch_skips_database(self, consumer):
+        async def fail_if_called(*args, **kwargs):
+            raise AssertionError("no query expected")
+
+        consumer._execute_with_retry = fail_if_called
+
+        assert await consumer.extend_leases([]) == []
+
+
+class _ReportingConsumer:
+    """Consumer whose complete_job blocks until released, like a slow write."""
+
+    def __init__(self) -> None:
+        self.reporting = asyncio.Event()
+        self.finish = asyncio.Event()
+        self.completed: list[str] = []
+        self.failed: list[str] = []
+        self.renewed: list[list[str]] = []
+
+    async def complete_job(self, job_id, result):
+        self.reporting.set()
+        await self.finish.wait()
+        self.completed.append(job_id)
+        return True
+
+    async def fail_job(self, job_id, error_message):
+        self.failed.append(job_id)
+        return True, False
+
+    async def extend_leases(self, job_ids, extension_seconds=None):
+        self.renewed.append(list(job_ids))
+        # The job already left the running state, so its lease is "lost"
+        return list(job_ids)
+
+
+class TestAgentLostLeases:
+    """Test that completion racing the heartbeat is not treated as a lost lease."""
+
+    @pytest.fixture
+    def agent(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CASARE_ROBOT_IDENTITY_PATH", str(tmp_path / "identity.json"))
+        config = RobotConfig(
+            robot_id="robot-test",
+            enable_circuit_breaker=False,
+            log_dir=tmp_path / "logs",
+            checkpoint_path=tmp_path / "checkpoints",
+        )
+        agent = RobotAgent(config)
+
+        async def no_status(status):
+            return None
+
+        agent._update_registration_status = no_status
+        return agent
+
+    async def test_completion_during_heartbeat_is_reported_once(self, agent):
+        consumer = _ReportingConsumer()
+        released = []
+        finished = []
+        agent._consumer = consumer
+        agent._on_job_complete = lambda job_id, success, error: finished.append(success)
+        agent._resource_manager = SimpleNamespace(
+            acquire_resources_for_job=lambda job_id, workflow: _resolved("resources"),
+            release_resources=lambda resources: _resolved(released.append(resources)),
+        )
+        agent._executor = SimpleNamespace(
+            execute_workflow=lambda **kwargs: _resolved(
+                SimpleNamespace(
+                    success=True, executed_nodes=3, duration_ms=5, recovered=False, error=None
+                )
+            )
+        )
+        job = SimpleNamespace(
+            job_id=JOB_A,
+            workflow_name="wf",
+            workflow_json="{}",
+            variables={},
+            priority=10,
+            retry_count=0,
+        )
+        task = asyncio.create_task(agent._execute_job(job))
+        agent._job_tasks[JOB_A] = task
+        await asyncio.wait_for(consumer.reporting.wait(), 1.0)
+
+        # Heartbeat snapshot taken before completion reports the job as lost
+        await agent._abandon_lost_jobs([JOB_A])
+        consumer.finish.set()
+        await asyncio.wait_for(task, 1.0)
+
+        assert consumer.completed == [JOB_A]
+        assert consumer.failed == []
+        assert agent._stats["jobs_completed"] == 1
+        assert agent._stats["jobs_failed"] == 0
+        assert finished == [True]
+        assert released == ["resources"]
+
+    async def test_reporting_jobs_are_not_renewed(self, agent):
+        consumer = _ReportingConsumer()
+        agent._consumer = consumer
+        agent._current_jobs = {JOB_A: object(), JOB_B: object()}
+        agent._reporting_jobs.add(JOB_A)
+        agent._running = True
+        agent.config.heartbeat_interval_seconds = 0.01
+
+        heartbeat = asyncio.create_task(agent._heartbeat_loop())
+        await asyncio.sleep(0.005)
+        agent._running = False
+        await asyncio.wait_for(heartbeat, 1.0)
+
+        assert consumer.renewed[0] == [JOB_B]
+        assert agent._lost_leases == {JOB_B}
+
+
+async def _resolved(value):
+    return value
@@ -0,0 +1,155 @@
+"""
+Tests for serialize-once, concurrent fan-out in LogStreamingService.
+"""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+
+from casare_rpa.domain.value_objects.log_entry import LogEntry, LogLevel
+from casare_rpa.infrastructure.logging import log_streaming_service
+from casare_rpa.infrastructure.logging.log_streaming_service import LogStreamingService
+
+ROBOT = str(uuid.uuid4())
+TENANT = str(uuid.uuid4())
+
+
+def _entries(*levels: LogLevel, source: str | None = None) -> list[LogEntry]:
+    now = datetime.now(UTC)
+    return [
+        LogEntry(
+            robot_id=ROBOT,
+            tenant_id=TENANT,
+            timestamp=now,
+            level=level,
+            message=f"log {n}",
+            source=source,
+        )
+        for n, level in enumerate(levels)
+    ]
+
+
+class _FakeWebSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.frames: list[dict] = []
+        self.close_codes: list[int] = []
+        self.gate = asyncio.Event()
+        if not delay:
+            self.gate.set()
+
+    async def send_text(self, frame: str) -> None:
+        if self.fail:
+            raise ConnectionError("closed")
+        await self.gate.wait()
+        self.frames.append(orjson.loads(frame))
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_codes.append(code)
+
+    @property
+    def messages(self) -> list[str]:
+        return [e["message"] for f in self.frames for e in f["logs"]]
+
+
+@pytest.fixture
+async def service():
+    service = LogStreamingService(persist_logs=False, subscriber_queue_size=3)
+    yield service
+    await service.stop()
+
+
+class TestSerializeOnce:
+    """Test that frames are built once per filter group."""
+
+    async def test_one_frame_per_group(self, service, monkeypatch):
+        calls = []
+        dumps = orjson.dumps
+
+        def counting_dumps(obj, *args, **kwargs):
+            calls.append(obj)
+            return dumps(obj, *args, **kwargs)
+
+        monkeypatch.setattr(log_streaming_service.orjson, "dumps", counting_dumps)
+
+        debug = [_FakeWebSocket() for _ in range(3)]
+        errors = [_FakeWebSocket() for _ in range(2)]
+        for ws in debug:
+            await service.subscribe(ws, robot_ids=[ROBOT])
+        for ws in errors:
+            await service.subscribe(ws, tenant_id=TENANT, min_level=LogLevel.ERROR)
+
+        await service._broadcast_logs(ROBOT, TENANT, _entries(LogLevel.INFO, LogLevel.ERROR))
+        await asyncio.sleep(0.01)
+
+        assert len(calls) == 2
+        assert all(ws.messages == ["log 0", "log 1"] for ws in debug)
+        assert all(ws.messages == ["log 1"] for ws in errors)
+        assert debug[0].frames[0]["type"] == "log_batch"
+        assert debug[0].frames[0]["robot_id"] == ROBOT
+        assert service.get_metrics()["logs_broadcast"] == 3 * 2 + 2 * 1
+
+    async def test_filtered_out_group_gets_nothing(self, service):
+        ws = _FakeWebSocket()
+        await service.subscribe(ws, robot_ids=[ROBOT], sources=["agent"])
+
+        await service._broadcast_logs(ROBOT, TENANT, _entries(LogLevel.INFO, source="other"))
+        await asyncio.sleep(0.01)
+
+        assert ws.frames == []
+
+
+class TestConcurrentDelivery:
+    """Test that a slow subscriber only delays itself."""
+
+    async def test_slow_subscriber_does_not_block_fast(self, service):
+        slow = _FakeWebSocket(delay=1)
+        fast = _FakeWebSocket()
+        await service.subscribe(slow, robot_ids=[ROBOT])
+        await service.subscribe(fast, robot_ids=[ROBOT])
+
+        for _ in range(5):
+            await service._broadcast_logs(ROBOT, TENANT, _entries(LogLevel.INFO))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        assert len(fast.frames) == 5
+        assert slow.frames == []
+
+        metrics = service.get_metrics()
+        # One frame is in flight; the remaining four overflowed a queue of three
+        assert metrics["logs_broadcast_dropped"] == 1
+        assert metrics["subscriber_pending_frames"] == 3
+        assert metrics["subscriber_max_lag_seconds"] > 0
+
+        slow.gate.set()
+        await asyncio.sleep(0.01)
+        assert len(slow.frames) == 4
+        assert service.get_metrics()["subscriber_pending_frames"] == 0
+
+    async def test_failed_send_unsubscribes(self, service):
+        broken = _FakeWebSocket(fail=True)
+        await service.subscribe(broken, robot_ids=[ROBOT])
+
+        await service._broadcast_logs(ROBOT, TENANT, _entries(LogLevel.INFO))
+        await asyncio.sleep(0.01)
+
+        assert service.get_metrics()["subscribers"] == 0
+        assert not service.is_subscribed(broken)
+        assert broken.close_codes == [1013]
+
+    async def test_send_timeout_unsubscribes(self):
+        service = LogStreamingService(persist_logs=False, send_timeout=0.01)
+        stuck = _FakeWebSocket(delay=1)
+        await service.subscribe(stuck, robot_ids=[ROBOT])
+
+        await service._broadcast_logs(ROBOT, TENANT, _entries(LogLevel.INFO))
+        await asyncio.sleep(0.05)
+
+        assert service.get_metrics()["subscribers"] == 0
+        assert stuck.close_codes == [1013]
+        await service.stop()
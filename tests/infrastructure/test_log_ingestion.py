@@ -0,0 +1,183 @@
+"""
+Tests for bulk log ingestion: COPY path selection and the bounded buffer.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from casare_rpa.domain.value_objects.log_entry import LogEntry, LogLevel
+from casare_rpa.infrastructure.logging.log_ingestion_buffer import LogIngestionBuffer
+from casare_rpa.infrastructure.persistence.repositories.log_repository import LogRepository
+
+
+def _entries(count: int, start: int = 0) -> list[LogEntry]:
+    robot_id = str(uuid.uuid4())
+    tenant_id = str(uuid.uuid4())
+    now = datetime.now(UTC)
+    return [
+        LogEntry(
+            robot_id=robot_id,
+            tenant_id=tenant_id,
+            timestamp=now,
+            level=LogLevel.DEBUG,
+            message=f"log {n}",
+            extra={"n": n},
+        )
+        for n in range(start, start + count)
+    ]
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def transaction(self):
+        conn = self
+
+        class _Tx:
+            async def __aenter__(self):
+                conn.calls.append("begin")
+
+            async def __aexit__(self, *exc):
+                conn.calls.append("commit")
+
+        return _Tx()
+
+    async def execute(self, query, *args):
+        self.calls.append(" ".join(query.split()[:3]))
+
+    async def executemany(self, query, records):
+        self.calls.append(f"executemany:{len(records)}")
+
+    async def copy_records_to_table(self, table, records, columns):
+        assert columns == LogRepository._COPY_COLUMNS
+        assert all(len(r) == len(columns) for r in records)
+        self.calls.append(f"copy:{table}:{len(records)}")
+
+
+class TestSaveBatchPaths:
+    """Test that save_batch picks COPY for large batches only."""
+
+    @pytest.fixture
+    def repo(self):
+        repo = LogRepository(pool_manager=object())
+        repo.conn = _FakeConnection()
+
+        async def get_connection():
+            return repo.conn
+
+        async def release_connection(conn):
+            pass
+
+        repo._get_connection = get_connection
+        repo._release_connection = release_connection
+        return repo
+
+    async def test_small_batch_uses_executemany(self, repo):
+        assert await repo.save_batch(_entries(5)) == 5
+        assert repo.conn.calls == ["executemany:5"]
+
+    async def test_large_batch_copies_through_staging(self, repo):
+        count = LogRepository.COPY_MIN_BATCH
+        assert await repo.save_batch(_entries(count)) == count
+        assert repo.conn.calls == [
+            "begin",
+            "CREATE TEMP TABLE",
+            f"copy:robot_logs_staging:{count}",
+            "INSERT INTO robot_logs",
+            "commit",
+        ]
+
+
+class TestLogIngestionBuffer:
+    """Test size/time flush triggers and the capacity bound."""
+
+    async def test_size_trigger_flushes_in_batches(self):
+        batches: list[int] = []
+
+        async def flush(entries):
+            batches.append(len(entries))
+
+        buffer = LogIngestionBuffer(flush, flush_size=10, flush_interval=60, max_entries=100)
+        await buffer.start()
+        buffer.add(_entries(25))
+        await asyncio.sleep(0.05)
+
+        assert batches == [10, 10, 5]
+        assert len(buffer) == 0
+        await buffer.stop()
+
+    async def test_interval_trigger_and_final_flush(self):
+        flushed: list[LogEntry] = []
+
+        async def flush(entries):
+            flushed.extend(entries)
+
+        buffer = LogIngestionBuffer(flush, flush_size=100, flush_interval=0.02, max_entries=100)
+        await buffer.start()
+        buffer.add(_entries(3))
+        await asyncio.sleep(0.1)
+        assert len(flushed) == 3
+
+        buffer.add(_entries(2))
+        await buffer.stop()
+        assert len(flushed) == 5
+
+    async def test_overflow_drops_oldest(self):
+        async def flush(entries):
+            pass
+
+        buffer = LogIngestionBuffer(flush, flush_size=5, max_entries=10)
+        assert buffer.add(_entries(8)) == 0
+        assert buffer.add(_entries(4, start=8)) == 2
+
+        assert len(buffer) == 10
+        assert buffer._entries[0].message == "log 2"
+        assert buffer.get_stats()["dropped"] == 2
+
+    def test_rejects_flush_size_above_capacity(self):
+        async def flush(entries):
+            pass
+
+        with pytest.raises(ValueError):
+            LogIngestionBuffer(flush, flush_size=10, max_entries=5)
+
+
+POSTGRES_URL = os.environ.get("CASARE_TEST_POSTGRES_URL")
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="CASARE_TEST_POSTGRES_URL not set")
+class TestSaveBatchThroughput:
+    """
+    Throughput of save_batch against a local PostgreSQL with robot_logs
+    (migration 011) applied.
+    """
+
+    async def test_copy_vs_executemany(self):
+        asyncpg = pytest.importorskip("asyncpg")
+        pool = await asyncpg.create_pool(POSTGRES_URL, min_size=1, max_size=2)
+
+        class _PoolManager:
+            async def get_pool(self, name, db_type):
+                return pool
+
+        repo = LogRepository(pool_manager=_PoolManager())
+        rates = {}
+        try:
+            for name, copy_min in (("executemany", 10**9), ("copy", 1)):
+                repo.COPY_MIN_BATCH = copy_min
+                entries = _entries(20_000)
+                started = time.perf_counter()
+                for i in range(0, len(entries), 2000):
+                    await repo.save_batch(entries[i : i + 2000])
+                rates[name] = len(entries) / (time.perf_counter() - started)
+        finally:
+            await pool.close()
+
+        print(f"\nrobot_logs rows/s: {rates}")
+        assert rates["copy"] > rates["executemany"]
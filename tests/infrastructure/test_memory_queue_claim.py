@@ -0,0 +1,66 @@
+"""
+Tests for MemoryQueue per-execution-mode heaps and waiting claimers.
+"""
+
+import asyncio
+
+from casare_rpa.infrastructure.queue.memory_queue import JobStatus, MemoryQueue
+
+
+class TestClaimOrdering:
+    """Test priority, FIFO and execution mode filtering."""
+
+    async def test_fifo_within_priority_across_requeues(self):
+        queue = MemoryQueue()
+        ids = [await queue.enqueue(f"wf-{n}", {}, priority=5) for n in range(5)]
+        urgent = await queue.enqueue("wf-urgent", {}, priority=1)
+
+        assert (await queue.claim("robot-1")).job_id == urgent
+        claimed = [(await queue.claim("robot-1")).job_id for _ in range(5)]
+        assert claimed == ids
+
+    async def test_mode_filter_leaves_other_modes_untouched(self):
+        queue = MemoryQueue()
+        lan = [await queue.enqueue("wf-lan", {}, execution_mode="lan") for _ in range(3)]
+        internet = await queue.enqueue("wf-net", {}, priority=0, execution_mode="internet")
+
+        assert (await queue.claim("robot-1", execution_mode="lan")).job_id == lan[0]
+        assert (await queue.claim("robot-1")).job_id == internet
+        assert await queue.claim("robot-1", execution_mode="internet") is None
+        assert await queue.get_queue_depth("lan") == 2
+        assert await queue.get_queue_depth() == 2
+
+    async def test_cancelled_and_requeued_jobs_are_not_claimed_twice(self):
+        queue = MemoryQueue()
+        cancelled = await queue.enqueue("wf-1", {})
+        requeued = await queue.enqueue("wf-2", {})
+        await queue.update_status(cancelled, JobStatus.CANCELLED)
+
+        assert (await queue.claim("robot-1")).job_id == requeued
+        await queue.requeue(requeued)
+        assert (await queue.claim("robot-2")).job_id == requeued
+        assert await queue.claim("robot-3") is None
+        assert await queue.get_queue_depth() == 0
+
+
+class TestWaitingClaimers:
+    """Test that claimers block on enqueue notifications instead of polling."""
+
+    async def test_waiting_claim_wakes_on_enqueue(self):
+        queue = MemoryQueue()
+        waiter = asyncio.create_task(queue.claim("robot-1", wait_timeout=5))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        job_id = await queue.enqueue("wf-1", {})
+        job = await asyncio.wait_for(waiter, timeout=1)
+        assert job.job_id == job_id
+        assert job.robot_id == "robot-1"
+
+    async def test_waiting_claim_times_out(self):
+        queue = MemoryQueue()
+        assert await queue.claim("robot-1", execution_mode="lan", wait_timeout=0.02) is None
+
+        # The lock is released after a timed-out wait
+        await queue.enqueue("wf-1", {}, execution_mode="internet")
+        assert await queue.get_queue_depth() == 1
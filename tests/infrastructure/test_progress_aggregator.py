@@ -0,0 +1,94 @@
+"""
+Tests for ProgressAggregator coalescing and batched flushing.
+"""
+
+import asyncio
+
+from casare_rpa.infrastructure.agent.progress_aggregator import ProgressAggregator
+
+
+class _Sink:
+    def __init__(self, fail: int = 0) -> None:
+        self.batches: list[list[tuple[str, int, str]]] = []
+        self.fail = fail
+
+    async def __call__(self, updates):
+        if self.fail:
+            self.fail -= 1
+            raise ConnectionError("down")
+        self.batches.append(list(updates))
+
+
+class TestCoalescing:
+    """Test that only the latest progress per job is written."""
+
+    async def test_latest_value_wins_in_one_batch(self):
+        sink = _Sink()
+        aggregator = ProgressAggregator(sink, flush_interval=60, min_delta_percent=100)
+
+        for progress in range(1, 6):
+            aggregator.record("job-1", progress, f"node-{progress}")
+        aggregator.record("job-2", 3, "node-a")
+
+        assert await aggregator.flush() == 2
+        assert sink.batches == [[("job-1", 5, "node-5"), ("job-2", 3, "node-a")]]
+        stats = aggregator.get_stats()
+        assert stats["recorded"] == 6
+        assert stats["written"] == 2
+        assert stats["suppressed"] == 4
+        assert stats["flushes"] == 1
+
+    async def test_flush_job_writes_final_state(self):
+        sink = _Sink()
+        aggregator = ProgressAggregator(sink, flush_interval=60, min_delta_percent=100)
+        aggregator.record("job-1", 100, "Job completed successfully")
+
+        await aggregator.flush_job("job-1")
+        await aggregator.flush_job("job-1")
+
+        assert sink.batches == [[("job-1", 100, "Job completed successfully")]]
+
+    async def test_failed_flush_keeps_newer_updates(self):
+        sink = _Sink(fail=1)
+        aggregator = ProgressAggregator(sink, flush_interval=60)
+        aggregator.record("job-1", 10, "a")
+
+        assert await aggregator.flush() == 0
+        aggregator.record("job-1", 20, "b")
+        assert await aggregator.flush() == 1
+
+        assert sink.batches == [[("job-1", 20, "b")]]
+        assert aggregator.get_stats()["failures"] == 1
+
+
+class TestFlushLoop:
+    """Test interval and delta-triggered flushing."""
+
+    async def test_delta_threshold_flushes_early(self):
+        sink = _Sink()
+        aggregator = ProgressAggregator(sink, flush_interval=60, min_delta_percent=10)
+        await aggregator.start()
+        try:
+            aggregator.record("job-1", 5, "a")
+            await asyncio.sleep(0.05)
+            assert sink.batches == []
+
+            aggregator.record("job-1", 15, "b")
+            await asyncio.sleep(0.05)
+            assert sink.batches == [[("job-1", 15, "b")]]
+        finally:
+            await aggregator.stop()
+
+    async def test_interval_flush_and_stop_drains(self):
+        sink = _Sink()
+        aggregator = ProgressAggregator(sink, flush_interval=0.02, min_delta_percent=100)
+        await aggregator.start()
+        aggregator.record("job-1", 1, "a")
+        await asyncio.sleep(0.1)
+        assert sink.batches == [[("job-1", 1, "a")]]
+
+        aggregator.record("job-1", 2, "b")
+        aggregator.flush_interval = 60
+        await aggregator.stop()
+
+        assert sink.batches[-1] == [("job-1", 2, "b")]
@@ -0,0 +1,154 @@
+"""
+Tests for structural-sharing debug variable snapshots.
+"""
+
+import threading
+from types import SimpleNamespace
+
+from casare_rpa.infrastructure.execution.debug_executor import DebugExecutor, DebugSession
+from casare_rpa.infrastructure.execution.variable_snapshots import VariableSnapshotStore
+
+
+class TestVariableSnapshotStore:
+    """Test diff capture, sharing and on-demand reconstruction."""
+
+    def test_snapshots_are_isolated_from_later_mutation(self):
+        store = VariableSnapshotStore()
+        variables = {"rows": [1, 2], "meta": {"page": 1}}
+        first = store.capture(variables)
+
+        variables["rows"].append(3)
+        variables["meta"]["page"] = 2
+        second = store.capture(variables)
+
+        assert store.materialize(first) == {"rows": [1, 2], "meta": {"page": 1}}
+        assert store.materialize(second) == {"rows": [1, 2, 3], "meta": {"page": 2}}
+        store.materialize(second)["rows"].append(4)
+        assert store.get(second, "rows") == [1, 2, 3]
+
+    def test_unchanged_scope_reuses_version(self):
+        store = VariableSnapshotStore()
+        variables = {"a": 1, "items": list(range(100))}
+
+        assert store.capture(variables) == store.capture(dict(variables)) == 0
+        variables["a"] = 2
+        assert store.capture(variables) == 1
+        assert store.changes(0, 1) == ({"a": 2}, set())
+        assert len(store) == 2
+
+    def test_types_stay_distinct(self):
+        store = VariableSnapshotStore()
+        first = store.capture({"v": 1, "t": (1, [2])})
+        second = store.capture({"v": True, "t": (1, [2])})
+        third = store.capture({"v": 1.0, "t": (1, [2])})
+
+        assert first != second != third
+        assert store.get(second, "v") is True
+        assert type(store.get(third, "v")) is float
+        assert store.get(third, "t") == (1, [2])
+
+    def test_removed_and_replayed_across_keyframes(self):
+        store = VariableSnapshotStore(keyframe_interval=3)
+        versions = [store.capture({"i": i, **({"odd": True} if i % 2 else {})}) for i in range(10)]
+
+        for i, version in enumerate(versions):
+            expected = {"i": i, **({"odd": True} if i % 2 else {})}
+            assert store.materialize(version) == expected
+            assert store.get(version, "odd", "missing") == expected.get("odd", "missing")
+
+    def test_in_place_object_mutation_is_detected(self):
+        store = VariableSnapshotStore()
+        handle = SimpleNamespace(url="a")
+        cyclic = []
+        cyclic.append(cyclic)
+        first = store.capture({"page": handle, "cyclic": cyclic})
+        assert store.capture({"page": handle, "cyclic": cyclic}) == first
+
+        handle.url = "b"
+        second = store.capture({"page": handle, "cyclic": cyclic})
+        assert second != first
+        assert store.get(first, "page").url == "a"
+        assert store.get(second, "page").url == "b"
+        assert list(store.changes(first, second)[0]) == ["page"]
+
+    def test_unpicklable_values_kept_by_reference(self):
+        store = VariableSnapshotStore()
+        lock = threading.Lock()
+        first = store.capture({"lock": lock})
+
+        assert store.capture({"lock": lock}) == first
+        assert store.get(first, "lock") is lock
+        assert store.capture({"lock": threading.Lock()}) != first
+
+    def test_only_rebound_or_mutable_values_are_encoded(self, monkeypatch):
+        from casare_rpa.infrastructure.execution import variable_snapshots
+
+        encoded = []
+        dumps = variable_snapshots.pickle.dumps
+
+        def counting_dumps(value, protocol):
+            encoded.append(value)
+            return dumps(value, protocol)
+
+        monkeypatch.setattr(variable_snapshots.pickle, "dumps", counting_dumps)
+        store = VariableSnapshotStore()
+        variables = {"name": "x" * 100, "count": 10**6, "rows": [1]}
+        store.capture(variables)
+        encoded.clear()
+
+        store.capture(variables)
+        assert encoded == [[1]]
+
+        encoded.clear()
+        variables["count"] = 10**6 + 1
+        store.capture(variables)
+        assert encoded == [10**6 + 1, [1]]
+
+    def test_pool_is_bounded(self):
+        store = VariableSnapshotStore(pool_size=2)
+        versions = [store.capture({"rows": [i]}) for i in range(5)]
+
+        assert len(store._pool) == 2
+        assert [store.get(v, "rows") for v in versions] == [[i] for i in range(5)]
+
+    def test_objects_without_value_equality_are_not_copied(self):
+        store = VariableSnapshotStore()
+        lock = threading.Lock()
+        handle = SimpleNamespace()
+        handle.__dict__["gen"] = (i for i in range(3))
+
+        first = store.capture({"handle": handle, "lock": lock})
+        assert store.capture({"handle": handle, "lock": lock}) == first
+        assert store.get(first, "handle") is handle
+
+
+async def test_debug_executor_history_from_snapshots():
+    executor = DebugExecutor(SimpleNamespace(nodes={}), None, None)
+    executor._session = DebugSession(session_id="s", workflow_name="wf")
+    executor.context = SimpleNamespace(variables={})
+    executor.debug_controller = SimpleNamespace(
+        push_call_stack=lambda **kwargs: None, pop_call_stack=lambda: None
+    )
+
+    class _Node:
+        config = {}
+
+        def __init__(self, value):
+            self.value = value
+
+        def validate(self):
+            return True
+
+        async def execute(self, context):
+            context.variables["counter"] = self.value
+            return {"success": True}
+
+    for node_id, value in (("n1", 1), ("n2", 1), ("n3", 5)):
+        await executor._execute_node(_Node(value), node_id)
+
+    records = executor.get_execution_records()
+    assert records[0].variables_before == {}
+    assert records[1].variables_before == {"counter": 1}
+    assert records[2].variables_after == {"counter": 5}
+    assert records[2].get_variable_changes() == ({"counter": 5}, set())
+    assert executor.get_variable_history("counter") == [("n1", 1), ("n2", 1), ("n3", 5)]
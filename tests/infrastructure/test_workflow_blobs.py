@@ -0,0 +1,256 @@
+"""
+Tests for content-addressed workflow blobs: producer upserts, robot-side
+WorkflowCache lookups by content hash, and JobExecutor blob resolution.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+
+asyncpg = pytest.importorskip("asyncpg")
+
+from casare_rpa.infrastructure.agent.job_executor import JobExecutionError, JobExecutor
+from casare_rpa.infrastructure.caching.workflow_cache import (
+    WorkflowCache,
+    get_workflow_cache,
+)
+from casare_rpa.infrastructure.orchestrator.api.routers import workflows
+from casare_rpa.infrastructure.queue.pgqueuer_producer import (
+    PgQueuerProducer,
+    ProducerConfig,
+)
+from casare_rpa.infrastructure.queue.workflow_blobs import workflow_content_hash
+
+WORKFLOW_JSON = (
+    '{"metadata": {"name": "Blob Test"}, "nodes": {"start": '
+    '{"node_id": "start", "node_type": "StartNode", "config": {}}}, '
+    '"connections": []}'
+)
+
+
+def _producer() -> PgQueuerProducer:
+    return PgQueuerProducer(
+        ProducerConfig(postgres_url="postgresql://localhost/test", notify_on_enqueue=False)
+    )
+
+
+def _job_row(args) -> dict:
+    return {
+        "id": args[0],
+        "workflow_id": args[1],
+        "workflow_name": args[2],
+        "priority": args[4],
+        "environment": args[5],
+        "created_at": datetime.now(UTC),
+        "visible_after": datetime.now(UTC),
+    }
+
+
+class TestProducerBlobs:
+    """Test that workflow blobs are written once and jobs reference them."""
+
+    async def test_blob_written_once_per_workflow(self):
+        producer = _producer()
+        queries = []
+
+        async def fake_execute(query, *args, max_retries=3):
+            queries.append((query, args))
+            if query == producer.SQL_ENQUEUE_JOB_BY_HASH:
+                return [_job_row(args)]
+            return []
+
+        producer._execute_with_retry = fake_execute
+        for _ in range(3):
+            await producer.enqueue_job("wf-1", "Blob Test", WORKFLOW_JSON)
+
+        content_hash = workflow_content_hash(WORKFLOW_JSON)
+        upserts = [args for query, args in queries if query == producer.SQL_UPSERT_WORKFLOW_BLOB]
+        inserts = [args for query, args in queries if query == producer.SQL_ENQUEUE_JOB_BY_HASH]
+        assert upserts == [(content_hash, WORKFLOW_JSON, len(WORKFLOW_JSON))]
+        assert [args[3] for args in inserts] == [content_hash] * 3
+
+    async def test_purged_blob_is_rewritten(self):
+        producer = _producer()
+        producer._remember_blob(workflow_content_hash(WORKFLOW_JSON))
+        upserts = []
+        inserts = 0
+
+        async def fake_execute(query, *args, max_retries=3):
+            nonlocal inserts
+            if query == producer.SQL_UPSERT_WORKFLOW_BLOB:
+                upserts.append(args[0])
+                return []
+            inserts += 1
+            if not upserts:
+                raise asyncpg.exceptions.ForeignKeyViolationError("blob missing")
+            return [_job_row(args)]
+
+        producer._execute_with_retry = fake_execute
+        job = await producer.enqueue_job("wf-1", "Blob Test", WORKFLOW_JSON)
+
+        assert job.workflow_id == "wf-1"
+        assert upserts == [workflow_content_hash(WORKFLOW_JSON)]
+        assert inserts == 2
+
+    async def test_disabled_stores_inline(self):
+        producer = PgQueuerProducer(
+            ProducerConfig(
+                postgres_url="postgresql://localhost/test",
+                notify_on_enqueue=False,
+                use_workflow_blobs=False,
+            )
+        )
+        queries = []
+
+        async def fake_execute(query, *args, max_retries=3):
+            queries.append(query)
+            return [_job_row(args)]
+
+        producer._execute_with_retry = fake_execute
+        await producer.enqueue_job("wf-1", "Blob Test", WORKFLOW_JSON)
+
+        assert queries == [producer.SQL_ENQUEUE_JOB]
+
+
+class _Connection:
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, tuple]] = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, *args):
+        self.queries.append((query, args))
+
+    async def fetch(self, query, *args):
+        self.queries.append((query, args))
+        return [_job_row(args)]
+
+
+class _Pool:
+    def __init__(self, conn) -> None:
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+class TestRouterEnqueue:
+    """Test that API submissions are stored as content-addressed blobs."""
+
+    @pytest.fixture(autouse=True)
+    def _queue_env(self, monkeypatch):
+        monkeypatch.delenv("USE_MEMORY_QUEUE", raising=False)
+        yield
+        workflows.set_db_pool(None)
+
+    async def test_pool_fallback_writes_blob_and_hash(self, monkeypatch):
+        monkeypatch.setattr(workflows, "get_job_producer", lambda: None)
+        conn = _Connection()
+        workflows.set_db_pool(_Pool(conn))
+        workflow = orjson.loads(WORKFLOW_JSON)
+
+        job_id = await workflows.enqueue_job(
+            "wf-1", workflow, 5, "lan", {"source": "api"}, tenant_id="acme"
+        )
+
+        content_hash = workflow_content_hash(orjson.dumps(workflow).decode())
+        by_query = {query: args for query, args in conn.queries}
+        assert by_query[PgQueuerProducer.SQL_UPSERT_WORKFLOW_BLOB][0] == content_hash
+        insert = by_query[PgQueuerProducer.SQL_ENQUEUE_JOB_BY_HASH]
+        assert (str(insert[0]), insert[2], insert[3]) == (job_id, "Blob Test", content_hash)
+        assert insert[-2] == "acme"
+        assert orjson.loads(insert[-1]) == {"source": "api"}
+
+    async def test_running_producer_is_used(self, monkeypatch):
+        producer = _producer()
+        calls = []
+
+        async def fake_execute(query, *args, max_retries=3):
+            calls.append((query, args))
+            return [_job_row(args)] if query == producer.SQL_ENQUEUE_JOB_BY_HASH else []
+
+        producer._execute_with_retry = fake_execute
+        producer._state = producer.state.CONNECTED
+        producer._pool = object()
+        monkeypatch.setattr(workflows, "get_job_producer", lambda: producer)
+        workflows.set_db_pool(_Pool(_Connection()))
+
+        await workflows.enqueue_job(
+            "wf-1", orjson.loads(WORKFLOW_JSON), 5, "lan", {}, tenant_id="acme"
+        )
+
+        queries = [query for query, _ in calls]
+        assert queries == [producer.SQL_UPSERT_WORKFLOW_BLOB, producer.SQL_ENQUEUE_JOB_BY_HASH]
+        assert calls[1][1][-2] == "acme"
+
+
+class TestWorkflowCacheContentHash:
+    """Test content hash links and byte-bounded eviction."""
+
+    def test_link_and_lookup(self):
+        cache = WorkflowCache()
+        workflow = object()
+        cache.put("fp1", workflow, plan="plan", size_bytes=10)
+
+        assert cache.get_by_content_hash("abc") is None
+        assert cache.link_content_hash("abc", workflow) is True
+        assert cache.get_by_content_hash("abc") is workflow
+        assert cache.get_plan_for(workflow) == "plan"
+        assert cache.link_content_hash("def", object()) is False
+
+    def test_eviction_drops_links_and_bytes(self):
+        cache = WorkflowCache(max_size=10, max_bytes=100)
+        first, second = object(), object()
+        cache.put("fp1", first, size_bytes=60)
+        cache.link_content_hash("h1", first)
+        cache.put("fp2", second, size_bytes=60)
+
+        assert cache.get_by_content_hash("h1") is None
+        stats = cache.get_stats()
+        assert stats["size"] == 1
+        assert stats["bytes"] == 60
+        assert stats["content_hashes"] == 0
+
+
+class TestJobExecutorBlobs:
+    """Test workflow resolution for blob-backed jobs."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        get_workflow_cache().clear()
+        yield
+        get_workflow_cache().clear()
+
+    async def test_fetches_once_then_hits_cache(self):
+        fetched = []
+
+        async def fetcher(content_hash):
+            fetched.append(content_hash)
+            return WORKFLOW_JSON
+
+        executor = JobExecutor(workflow_blob_fetcher=fetcher)
+        content_hash = workflow_content_hash(WORKFLOW_JSON)
+
+        first, _ = await executor.load_workflow("", content_hash)
+        second, _ = await executor.load_workflow("", content_hash)
+
+        assert fetched == [content_hash]
+        assert second is first
+
+    async def test_hash_mismatch_is_rejected(self):
+        async def fetcher(content_hash):
+            return WORKFLOW_JSON + " "
+
+        executor = JobExecutor(workflow_blob_fetcher=fetcher)
+
+        with pytest.raises(JobExecutionError, match="hash verification"):
+            await executor.load_workflow("", workflow_content_hash(WORKFLOW_JSON))
+
+    async def test_missing_fetcher_is_an_error(self):
+        with pytest.raises(JobExecutionError, match="no blob fetcher"):
+            await JobExecutor().load_workflow("", workflow_content_hash(WORKFLOW_JSON))
@@ -0,0 +1,26 @@
+"""
+Tests for running ForLoopStartNode against the public MockExecutionContext.
+
+Loop item/index writes pass publish=False, which the test double must accept.
+"""
+
+from casare_rpa.nodes.control_flow.loops import ForLoopStartNode
+from casare_rpa.testing.mocks import MockExecutionContext
+
+
+async def test_for_loop_runs_on_mock_context() -> None:
+    node = ForLoopStartNode("loop", config={"mode": "items"})
+    node.set_input_value("items", ["a", "b"])
+    context = MockExecutionContext()
+
+    seen = []
+    result = await node.execute(context)
+    while result["next_nodes"] == ["body"]:
+        assert result["success"], result
+        seen.append(context.get_variable("item"))
+        result = await node.execute(context)
+
+    assert result["success"]
+    assert result["next_nodes"] == ["completed"]
+    assert seen == ["a", "b"]
+    assert ("set_variable", ("item", "a"), {"publish": False}) in context.call_log
@@ -0,0 +1,139 @@
+"""
+Engine overhead benchmarks.
+
+Runs every scenario at its quick size. Set CASARE_BENCH_BASELINE to a baseline
+JSON (written by `casare bench run --quick --save-baseline`) to also fail on
+regressions past CASARE_BENCH_THRESHOLD (default 0.25).
+"""
+
+import os
+
+import pytest
+
+from casare_rpa.testing.engine_benchmark import (
+    SCENARIOS,
+    ScenarioResult,
+    compare_to_baseline,
+    format_results,
+    load_baseline,
+    run_scenario,
+    run_suite,
+    save_baseline,
+)
+
+# Nodes executed at a given size: start + body nodes (+ control nodes)
+EXPECTED_NODES = {
+    "linear_chain": lambda n: 1 + n,
+    "loop": lambda n: 1 + 3 * n + 2,
+    "fork_join": lambda n: 1 + 1 + n + 1,
+    "nested_subflows": lambda n: 2 * (n + 1) + n,
+    "template_heavy": lambda n: 1 + n,
+}
+
+
+def _result(name="linear_chain", **overrides) -> ScenarioResult:
+    values = {
+        "name": name,
+        "size": 100,
+        "nodes_executed": 101,
+        "duration_s": 0.01,
+        "nodes_per_sec": 10000.0,
+        "p50_us": 100.0,
+        "p99_us": 300.0,
+        "peak_rss_mb": 200.0,
+    }
+    values.update(overrides)
+    return ScenarioResult(**values)
+
+
+@pytest.mark.parametrize("name", list(SCENARIOS))
+async def test_scenario_executes_every_node(name):
+    scenario = SCENARIOS[name]
+    size = min(scenario.quick_size, 20)
+
+    result = await run_scenario(scenario, size)
+
+    assert result.success
+    assert result.nodes_executed == EXPECTED_NODES[name](size)
+    assert result.nodes_per_sec > 0
+    assert 0 < result.p50_us <= result.p99_us
+
+
+@pytest.mark.slow
+async def test_quick_suite_against_baseline():
+    results = await run_suite(quick=True)
+    print("\n" + format_results(results))
+
+    assert all(r.success for r in results)
+    baseline_path = os.environ.get("CASARE_BENCH_BASELINE")
+    if baseline_path:
+        threshold = float(os.environ.get("CASARE_BENCH_THRESHOLD", "0.25"))
+        regressions = compare_to_baseline(results, load_baseline(baseline_path), threshold)
+        assert not regressions, "\n".join(regressions)
+
+
+class TestBaselineComparison:
+    """Test regression detection against stored baselines."""
+
+    def test_within_threshold_passes(self):
+        baseline = {"linear_chain": _result()}
+        current = _result(nodes_per_sec=8000.0, p50_us=120.0, p99_us=370.0)
+
+        assert compare_to_baseline([current], baseline, threshold=0.25) == []
+
+    def test_throughput_and_latency_regressions(self):
+        baseline = {"linear_chain": _result()}
+        current = _result(nodes_per_sec=5000.0, p99_us=900.0)
+
+        regressions = compare_to_baseline([current], baseline, threshold=0.25)
+
+        assert len(regressions) == 2
+        assert "nodes/sec" in regressions[0]
+        assert "p99_us" in regressions[1]
+
+    def test_size_mismatch_and_missing_baseline_are_skipped(self):
+        baseline = {"linear_chain": _result(size=2000)}
+        current = [_result(nodes_per_sec=1.0), _result("loop", nodes_per_sec=1.0)]
+
+        assert compare_to_baseline(current, baseline) == []
+
+    def test_failed_workflow_is_a_regression(self):
+        assert compare_to_baseline([_result(success=False)], {}) == [
+            "linear_chain: workflow failed"
+        ]
+
+    def test_baseline_round_trip(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        results = [_result(), _result("loop", size=300)]
+
+        save_baseline(results, path)
+
+        assert load_baseline(path) == {r.name: r for r in results}
+        assert load_baseline(tmp_path / "missing.json") == {}
+
+
+class TestBenchCompareCli:
+    """Test `casare bench compare` on stored results."""
+
+    def test_compare_exit_codes(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from casare_rpa.cli.main import app
+
+        baseline = tmp_path / "baseline.json"
+        current = tmp_path / "current.json"
+        save_baseline([_result()], baseline)
+        runner = CliRunner()
+
+        save_baseline([_result(nodes_per_sec=9500.0)], current)
+        ok = runner.invoke(app, ["bench", "compare", str(current), "-b", str(baseline)])
+        assert ok.exit_code == 0, ok.output
+
+        save_baseline([_result(nodes_per_sec=1000.0)], current)
+        regressed = runner.invoke(app, ["bench", "compare", str(current), "-b", str(baseline)])
+        assert regressed.exit_code == 1
+
+        missing = runner.invoke(
+            app, ["bench", "compare", str(current), "-b", str(tmp_path / "none.json")]
+        )
+        assert missing.exit_code == 2
@@ -131,6 +131,90 @@ class TestJobClaimThroughput:
                 assert elapsed < 15.0, f"50 concurrent claims took {elapsed:.2f}s (max 15s)"
 
 
+class TestJobQueueTargetedDequeue:
+    """Tests for in-memory JobQueue dequeue under heavy robot targeting."""
+
+    @staticmethod
+    def _robot(robot_id: str, environment: str = "default"):
+        from casare_rpa.domain.orchestrator.entities import Robot, RobotStatus
+
+        return Robot(
+            id=robot_id,
+            name=robot_id,
+            status=RobotStatus.ONLINE,
+            environment=environment,
+            max_concurrent_jobs=1,
+        )
+
+    @staticmethod
+    def _enqueue(queue, robot_id: str = "", environment: str = "default", priority=None):
+        from casare_rpa.domain.orchestrator.entities import Job, JobPriority
+
+        job = Job(
+            id=str(uuid4()),
+            workflow_id="wf-load",
+            workflow_name="Load Test",
+            robot_id=robot_id or "unassigned",
+            environment=environment,
+            priority=priority or JobPriority.NORMAL,
+        )
+        # Untargeted jobs carry an empty robot_id once queued
+        job.robot_id = robot_id
+        queue.enqueue(job, check_duplicate=False)
+        return job
+
+    @pytest.fixture
+    def queue(self):
+        from casare_rpa.application.orchestrator.services.job_queue_manager import JobQueue
+
+        return JobQueue()
+
+    def test_dequeue_skips_jobs_pinned_to_other_robots(self, queue, benchmark):
+        """Dequeue stays cheap with thousands of jobs targeted elsewhere."""
+        for i in range(5000):
+            self._enqueue(queue, robot_id=f"robot-{i % 50}")
+        mine = [self._enqueue(queue, robot_id="robot-me") for _ in range(200)]
+
+        claimed = []
+
+        def dequeue():
+            job = queue.dequeue(self._robot("robot-me"))
+            claimed.append(job.id)
+
+        benchmark.pedantic(dequeue, rounds=len(mine), iterations=1)
+
+        assert claimed == [job.id for job in mine]
+        assert queue.get_queue_depth() == 5000
+
+    def test_targeting_environment_and_priority_are_respected(self, queue):
+        """Partitioned heaps keep the original dequeue semantics."""
+        from casare_rpa.domain.orchestrator.entities import JobPriority
+
+        other = self._enqueue(queue, robot_id="robot-other", priority=JobPriority.CRITICAL)
+        prod_low = self._enqueue(queue, environment="prod", priority=JobPriority.LOW)
+        prod_high = self._enqueue(queue, environment="prod", priority=JobPriority.HIGH)
+        staging = self._enqueue(queue, environment="staging", priority=JobPriority.CRITICAL)
+        pinned = self._enqueue(queue, robot_id="robot-prod", environment="prod")
+
+        cancelled = self._enqueue(queue, environment="prod", priority=JobPriority.CRITICAL)
+        queue.cancel(cancelled.id)
+
+        prod_robot = self._robot("robot-prod", environment="prod")
+        assert [queue.dequeue(prod_robot).id for _ in range(3)] == [
+            prod_high.id,
+            pinned.id,
+            prod_low.id,
+        ]
+        assert queue.dequeue(prod_robot) is None
+
+        # Robots in "default" accept any environment but never foreign targets
+        default_robot = self._robot("robot-default")
+        assert queue.dequeue(default_robot).id == staging.id
+        assert queue.dequeue(default_robot) is None
+        assert queue.dequeue(self._robot("robot-other")).id == other.id
+        assert queue.get_queue_depth() == 0
+
+
 class TestWebSocketFanout:
     """Tests for WebSocket broadcast performance."""
 
@@ -0,0 +1,100 @@
+"""
+Tests for DeadlineHeap and the timeout/claim expiry paths built on it.
+"""
+
+from casare_rpa.application.orchestrator.services.job_queue_manager import (
+    JobTimeoutManager,
+)
+from casare_rpa.infrastructure.queue.memory_queue import JobStatus, MemoryQueue
+from casare_rpa.utils.performance.deadline_heap import DeadlineHeap
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeadlineHeap:
+    """Test scheduling, cancellation and expiry."""
+
+    def test_pop_expired_returns_only_due_keys_in_order(self):
+        clock = _Clock()
+        heap = DeadlineHeap(clock)
+        heap.schedule_in("b", 20)
+        heap.schedule_in("a", 10)
+        heap.schedule_in("c", 30)
+
+        clock.now = 25
+        assert heap.pop_expired() == ["a", "b"]
+        assert len(heap) == 1
+        assert heap.next_deadline() == 30
+
+    def test_reschedule_and_cancel_are_lazy(self):
+        clock = _Clock()
+        heap = DeadlineHeap(clock)
+        heap.schedule_in("lease", 10)
+        heap.schedule_in("lease", 50)
+        heap.schedule_in("gone", 5)
+        assert heap.cancel("gone") is True
+        assert heap.cancel("gone") is False
+
+        clock.now = 20
+        assert heap.pop_expired() == []
+        assert heap.remaining("lease") == 30
+        assert "lease" in heap
+
+    def test_heartbeats_do_not_grow_heap_unbounded(self):
+        clock = _Clock()
+        heap = DeadlineHeap(clock)
+        for _ in range(10_000):
+            heap.schedule_in("job-1", 30)
+
+        assert len(heap) == 1
+        assert len(heap._heap) < 200
+
+
+class TestJobTimeoutManager:
+    """Test that timeouts are reported once and only when due."""
+
+    def test_reports_expired_jobs_once(self):
+        manager = JobTimeoutManager(default_timeout_seconds=3600)
+        manager.start_tracking("job-fast", timeout_seconds=1)
+        manager.start_tracking("job-slow")
+        manager._deadlines.schedule("job-fast", 0.0)
+
+        assert manager.get_timed_out_jobs() == ["job-fast"]
+        assert manager.get_timed_out_jobs() == []
+        assert manager.get_remaining_time("job-fast") is None
+        assert manager.get_remaining_time("job-slow").total_seconds() > 3500
+
+
+class TestMemoryQueueClaimExpiry:
+    """Test visibility timeouts and claim extension."""
+
+    async def test_expired_claim_returns_to_queue(self):
+        queue = MemoryQueue(visibility_timeout=0)
+        job_id = await queue.enqueue("wf-1", {})
+        await queue.claim("robot-1")
+
+        assert await queue.expire_claims() == 1
+        job = await queue.get_job(job_id)
+        assert job.status == JobStatus.QUEUED
+        assert job.robot_id is None
+        assert (await queue.claim("robot-2")).job_id == job_id
+
+    async def test_extended_and_finished_claims_do_not_expire(self):
+        queue = MemoryQueue(visibility_timeout=60)
+        extended = await queue.enqueue("wf-1", {})
+        finished = await queue.enqueue("wf-2", {})
+        await queue.claim("robot-1")
+        await queue.claim("robot-1")
+
+        await queue.update_status(finished, JobStatus.COMPLETED)
+        assert await queue.extend_claim(extended) is True
+
+        assert await queue.expire_claims() == 0
+        assert finished not in queue._claim_deadlines
+        assert extended in queue._claim_deadlines